@@ -0,0 +1,64 @@
+"""
+============================================================
+TARJETA CRC (Class / Responsibilities / Collaborators)
+============================================================
+Class: 011_chunk_content_hash (Alembic Migration)
+
+Responsibilities:
+  - Agregar chunks.content_hash (SHA-256 del contenido normalizado del chunk).
+  - Indexar el hash para reutilizar embeddings al reprocesar documentos.
+
+Collaborators:
+  - PostgreSQL 16+
+  - Alembic (framework de migraciones)
+  - Ingesta (embed_chunks_with_reuse consulta por hash antes del provider)
+
+Policy:
+  - Columna NULLable: los chunks existentes se embeben una vez más en su
+    próximo reprocess y desde ahí quedan reutilizables (sin backfill).
+  - Índice parcial: sólo filas con hash.
+============================================================
+"""
+
+from alembic import op
+
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Agrega content_hash a chunks + índice parcial para lookup por hash.
+    """
+    op.execute(
+        """
+        ALTER TABLE chunks
+        ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64) DEFAULT NULL;
+    """
+    )
+
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_chunks_content_hash
+        ON chunks (content_hash)
+        WHERE content_hash IS NOT NULL;
+    """
+    )
+
+
+def downgrade() -> None:
+    """
+    Remueve content_hash de chunks.
+    """
+    op.execute(
+        """
+        DROP INDEX IF EXISTS ix_chunks_content_hash;
+    """
+    )
+    op.execute(
+        """
+        ALTER TABLE chunks DROP COLUMN IF EXISTS content_hash;
+    """
+    )
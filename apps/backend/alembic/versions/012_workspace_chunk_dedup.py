@@ -0,0 +1,111 @@
+"""
+============================================================
+TARJETA CRC (Class / Responsibilities / Collaborators)
+============================================================
+Class: 012_workspace_chunk_dedup (Alembic Migration)
+
+Responsibilities:
+  - Agregar workspaces.chunk_dedup_enabled (modo dedup opt-in por workspace).
+  - Crear chunk_embeddings: un embedding por (workspace_id, content_hash),
+    compartido por todos los chunks con el mismo contenido normalizado.
+  - Referenciar el embedding compartido desde chunks (chunk_embedding_id)
+    y permitir chunks.embedding NULL cuando la referencia existe.
+  - Indexar chunk_embeddings con HNSW (mismos parámetros que 002).
+
+Collaborators:
+  - PostgreSQL 16+ / pgvector
+  - Alembic (framework de migraciones)
+  - PostgresDocumentRepository (save/search/delete de chunks)
+
+Policy:
+  - Default false: workspaces existentes no cambian de comportamiento.
+  - CHECK: cada chunk tiene embedding propio o referencia compartida.
+  - FK sin CASCADE: un embedding compartido solo se borra sin referencias.
+  - Downgrade re-materializa el embedding en cada chunk antes de borrar.
+============================================================
+"""
+
+from alembic import op
+
+revision = "012"
+down_revision = "011"
+branch_labels = None
+depends_on = None
+
+_HNSW_INDEX = "ix_chunk_embeddings_embedding_hnsw"
+_CHECK_CONSTRAINT = "ck_chunks_embedding_source"
+
+
+def upgrade() -> None:
+    """
+    Habilita dedup de chunks por workspace (embedding compartido por hash).
+    """
+    op.execute(
+        """
+        ALTER TABLE workspaces
+        ADD COLUMN IF NOT EXISTS chunk_dedup_enabled BOOLEAN NOT NULL DEFAULT false;
+    """
+    )
+
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS chunk_embeddings (
+            id UUID PRIMARY KEY,
+            workspace_id UUID NOT NULL REFERENCES workspaces(id) ON DELETE CASCADE,
+            content_hash VARCHAR(64) NOT NULL,
+            embedding vector(768) NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            CONSTRAINT uq_chunk_embeddings_workspace_hash
+                UNIQUE (workspace_id, content_hash)
+        );
+    """
+    )
+
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS {_HNSW_INDEX} "
+        "ON chunk_embeddings USING hnsw (embedding vector_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+    op.execute(
+        """
+        ALTER TABLE chunks
+        ADD COLUMN IF NOT EXISTS chunk_embedding_id UUID
+            REFERENCES chunk_embeddings(id);
+    """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_chunks_chunk_embedding_id
+        ON chunks (chunk_embedding_id)
+        WHERE chunk_embedding_id IS NOT NULL;
+    """
+    )
+
+    op.execute("ALTER TABLE chunks ALTER COLUMN embedding DROP NOT NULL")
+    op.execute(
+        f"ALTER TABLE chunks ADD CONSTRAINT {_CHECK_CONSTRAINT} "
+        "CHECK (embedding IS NOT NULL OR chunk_embedding_id IS NOT NULL)"
+    )
+
+
+def downgrade() -> None:
+    """
+    Re-materializa embeddings compartidos en chunks y elimina el modo dedup.
+    """
+    op.execute(
+        """
+        UPDATE chunks c
+        SET embedding = ce.embedding
+        FROM chunk_embeddings ce
+        WHERE c.chunk_embedding_id = ce.id
+          AND c.embedding IS NULL;
+    """
+    )
+    op.execute(f"ALTER TABLE chunks DROP CONSTRAINT IF EXISTS {_CHECK_CONSTRAINT}")
+    op.execute("ALTER TABLE chunks ALTER COLUMN embedding SET NOT NULL")
+    op.execute("DROP INDEX IF EXISTS ix_chunks_chunk_embedding_id")
+    op.execute("ALTER TABLE chunks DROP COLUMN IF EXISTS chunk_embedding_id")
+    op.execute(f"DROP INDEX IF EXISTS {_HNSW_INDEX}")
+    op.execute("DROP TABLE IF EXISTS chunk_embeddings")
+    op.execute("ALTER TABLE workspaces DROP COLUMN IF EXISTS chunk_dedup_enabled")
@@ -0,0 +1,64 @@
+"""
+============================================================
+TARJETA CRC (Class / Responsibilities / Collaborators)
+============================================================
+Class: 013_document_processing_checkpoint (Alembic Migration)
+
+Responsibilities:
+  - Agregar a documents el checkpoint de procesamiento:
+      processing_run_id, processing_owner,
+      processing_chunks_done, processing_chunks_total,
+      processing_updated_at
+  - Permitir que un retry del worker reanude desde el último lote
+    comprometido y exponer progreso real (done/total).
+
+Collaborators:
+  - PostgreSQL 16+
+  - Alembic (framework de migraciones)
+  - ProcessUploadedDocumentUseCase (modo checkpoint)
+  - PostgresDocumentRepository (save_chunks + save_processing_checkpoint)
+
+Policy:
+  - Columnas NULLables: documentos existentes quedan "sin progreso".
+  - Sin índices: siempre se leen por id de documento.
+============================================================
+"""
+
+from alembic import op
+
+revision = "013"
+down_revision = "012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Agrega columnas de checkpoint/progreso a documents.
+    """
+    op.execute(
+        """
+        ALTER TABLE documents
+        ADD COLUMN IF NOT EXISTS processing_run_id UUID DEFAULT NULL,
+        ADD COLUMN IF NOT EXISTS processing_owner VARCHAR(255) DEFAULT NULL,
+        ADD COLUMN IF NOT EXISTS processing_chunks_done INTEGER DEFAULT NULL,
+        ADD COLUMN IF NOT EXISTS processing_chunks_total INTEGER DEFAULT NULL,
+        ADD COLUMN IF NOT EXISTS processing_updated_at TIMESTAMPTZ DEFAULT NULL;
+    """
+    )
+
+
+def downgrade() -> None:
+    """
+    Remueve columnas de checkpoint/progreso de documents.
+    """
+    op.execute(
+        """
+        ALTER TABLE documents
+        DROP COLUMN IF EXISTS processing_updated_at,
+        DROP COLUMN IF EXISTS processing_chunks_total,
+        DROP COLUMN IF EXISTS processing_chunks_done,
+        DROP COLUMN IF EXISTS processing_owner,
+        DROP COLUMN IF EXISTS processing_run_id;
+    """
+    )
@@ -0,0 +1,54 @@
+"""
+============================================================
+TARJETA CRC (Class / Responsibilities / Collaborators)
+============================================================
+Class: 014_document_processing_fingerprint (Alembic Migration)
+
+Responsibilities:
+  - Agregar documents.processing_fingerprint: huella de las entradas de
+    la corrida con checkpoint (hash del archivo + chunker + modelo de
+    embeddings).
+  - Permitir descartar un checkpoint obsoleto en lugar de reanudarlo
+    sobre chunks cortados con otra configuración.
+
+Collaborators:
+  - PostgreSQL 16+
+  - Alembic (framework de migraciones)
+  - ProcessUploadedDocumentUseCase (modo checkpoint)
+  - PostgresDocumentRepository (save_processing_checkpoint)
+
+Policy:
+  - Columna NULLable: checkpoints previos (sin huella) no se reanudan.
+============================================================
+"""
+
+from alembic import op
+
+revision = "014"
+down_revision = "013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Agrega la huella del checkpoint a documents.
+    """
+    op.execute(
+        """
+        ALTER TABLE documents
+        ADD COLUMN IF NOT EXISTS processing_fingerprint VARCHAR(64) DEFAULT NULL;
+    """
+    )
+
+
+def downgrade() -> None:
+    """
+    Remueve la huella del checkpoint de documents.
+    """
+    op.execute(
+        """
+        ALTER TABLE documents
+        DROP COLUMN IF EXISTS processing_fingerprint;
+    """
+    )
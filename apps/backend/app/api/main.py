@@ -39,7 +39,7 @@ from fastapi.openapi.utils import get_openapi
 
 from ..application.dev_seed_admin import ensure_dev_admin
 from ..application.dev_seed_demo import ensure_dev_demo
-from ..container import get_document_repository
+from ..container import get_document_repository, get_document_status_broadcaster
 from ..crosscutting.config import get_settings
 from ..crosscutting.logger import logger
 from ..crosscutting.middleware import BodyLimitMiddleware, RequestContextMiddleware
@@ -66,7 +66,7 @@ async def lifespan(app: FastAPI):
     - Valida settings (seguridad en producción).
     - Inicializa el pool de BD antes de que se use cualquier repositorio.
     - Ejecuta seed de desarrollo si está habilitado.
-    - Cierra el pool al apagar el proceso.
+    - Cierra el pool (y el LISTEN de status, si arrancó) al apagar el proceso.
     """
     settings = get_settings()
 
@@ -89,6 +89,9 @@ async def lifespan(app: FastAPI):
         )
         yield
     finally:
+        broadcaster = get_document_status_broadcaster()
+        if broadcaster is not None:
+            broadcaster.close()
         close_pool()
         logger.info("Backend detenido")
 
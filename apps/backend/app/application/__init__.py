@@ -22,6 +22,7 @@ from .prompt_injection_detector import (
     Mode,
     apply_injection_filter,
     detect,
+    detect_many,
     is_flagged,
 )
 from .query_rewriter import QueryRewriter, RewriteResult, get_query_rewriter
@@ -42,6 +43,7 @@ __all__ = [
     "Mode",
     "apply_injection_filter",
     "detect",
+    "detect_many",
     "is_flagged",
     # Rate Limiting
     "RateLimiter",
@@ -6,14 +6,18 @@ MÓDULO: Content Hash — Utilidades de normalización y hash para deduplicació
 Responsabilidades:
   - Normalizar texto para hashing determinístico (NFC, trim, collapse whitespace).
   - Computar SHA-256 sobre contenido normalizado, scopeado por workspace.
+  - Computar el hash de chunks para reuso/dedup de embeddings (+ modelo).
   - Computar SHA-256 sobre bytes crudos de archivo, scopeado por workspace.
+  - Variante streaming del hash de archivo (memoria O(chunk), mismo digest).
 
 Colaboradores:
-  - application/usecases/ingestion: consume compute_content_hash y compute_file_hash
+  - application/usecases/ingestion: consume compute_content_hash,
+    compute_chunk_hash y compute_file_hash
   - domain/entities.Document: almacena el hash resultante (content_hash)
 
 Decisiones de diseño:
-  - Funciones puras (sin IO, sin side effects).
+  - Funciones puras (sin IO, sin side effects); la variante streaming solo lee
+    del stream recibido.
   - NFC unicode (canonical decomposition + canonical composition).
   - NO lowercase: preserva case original para hash fiel al contenido.
   - Whitespace collapse: normaliza tabs, newlines, espacios múltiples a un solo espacio.
@@ -26,8 +30,11 @@ from __future__ import annotations
 import hashlib
 import re
 import unicodedata
+from typing import BinaryIO, Final
 from uuid import UUID
 
+_HASH_CHUNK_BYTES: Final[int] = 1024 * 1024
+
 
 def normalize_text(text: str) -> str:
     """
@@ -58,6 +65,21 @@ def compute_content_hash(workspace_id: UUID, content: str) -> str:
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
+def compute_chunk_hash(
+    workspace_id: UUID, content: str, *, embedding_model: str
+) -> str:
+    """
+    SHA-256 de un chunk para reuso/dedup de embeddings (chunks.content_hash).
+
+    Formato del payload: "{workspace_id}:{embedding_model}:{normalized_content}"
+    El modelo es parte de la clave: un vector de otro modelo no se reutiliza.
+    Retorna: hex digest de 64 caracteres.
+    """
+    normalized = normalize_text(content)
+    payload = f"{workspace_id}:{embedding_model}:{normalized}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 def compute_file_hash(workspace_id: UUID, file_bytes: bytes) -> str:
     """
     SHA-256 sobre workspace_id + bytes crudos del archivo.
@@ -70,3 +92,19 @@ def compute_file_hash(workspace_id: UUID, file_bytes: bytes) -> str:
     h.update(b":")
     h.update(file_bytes)
     return h.hexdigest()
+
+
+def compute_file_hash_stream(
+    workspace_id: UUID, stream: BinaryIO, *, chunk_size: int = _HASH_CHUNK_BYTES
+) -> str:
+    """
+    Igual que compute_file_hash, leyendo el archivo por bloques desde `stream`.
+
+    Lee desde la posición actual hasta EOF; el caller decide si rebobinar.
+    """
+    h = hashlib.sha256()
+    h.update(str(workspace_id).encode("utf-8"))
+    h.update(b":")
+    while chunk := stream.read(chunk_size):
+        h.update(chunk)
+    return h.hexdigest()
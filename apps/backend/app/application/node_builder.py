@@ -6,39 +6,55 @@ MÓDULO: Node Builder (Generación de nodos para 2-tier retrieval)
 Responsabilidades:
   - Agrupar chunks consecutivos en nodos (secciones).
   - Concatenar texto de chunks agrupados (truncado a max_chars).
-  - Generar embeddings batch para los nodos resultantes.
+  - Obtener el embedding de cada nodo según la estrategia:
+      * provider: embed_batch del node_text (una llamada extra al proveedor)
+      * mean: media normalizada de los embeddings de sus chunks
+      * length_weighted: centroide ponderado por largo de chunk, normalizado
   - Calcular span_start/span_end por nodo (rango de chunk_index).
 
 Colaboradores:
   - domain.entities: Chunk, Node
-  - domain.services: EmbeddingService (embed_batch)
+  - domain.services: EmbeddingService (embed_batch, solo estrategia provider)
 
 Invariantes:
   - Función pura (sin IO directo, sin estado mutable).
   - Compatible con FakeEmbeddingService (sin API keys).
   - Si chunks es vacío → retorna lista vacía (no invoca embedding).
+  - Estrategias de centroide: requieren chunk.embedding en todos los chunks
+    (ValueError si falta); nunca llaman al proveedor.
 ===============================================================================
 """
 
 from __future__ import annotations
 
 import logging
-from typing import List
+from typing import Final, List
 from uuid import UUID
 
+import numpy as np
+
 from ..domain.entities import Chunk, Node
 from ..domain.services import EmbeddingService
 
 logger = logging.getLogger(__name__)
 
+NODE_EMBEDDING_PROVIDER: Final[str] = "provider"
+NODE_EMBEDDING_MEAN: Final[str] = "mean"
+NODE_EMBEDDING_LENGTH_WEIGHTED: Final[str] = "length_weighted"
+NODE_EMBEDDING_STRATEGIES: Final[frozenset[str]] = frozenset(
+    {NODE_EMBEDDING_PROVIDER, NODE_EMBEDDING_MEAN, NODE_EMBEDDING_LENGTH_WEIGHTED}
+)
+
 
 def build_nodes(
     document_id: UUID,
     workspace_id: UUID,
     chunks: List[Chunk],
-    embedding_service: EmbeddingService,
+    embedding_service: EmbeddingService | None,
     group_size: int = 5,
     max_chars: int = 2000,
+    *,
+    embedding_strategy: str = NODE_EMBEDDING_PROVIDER,
 ) -> List[Node]:
     """
     Genera nodos (secciones) a partir de una lista de chunks.
@@ -47,13 +63,20 @@ def build_nodes(
       - document_id: ID del documento fuente.
       - workspace_id: ID del workspace (scope).
       - chunks: Lista de Chunk entities (deben tener chunk_index).
-      - embedding_service: Servicio de embeddings (embed_batch).
+      - embedding_service: Servicio de embeddings (embed_batch). Puede ser
+        None con estrategias de centroide.
       - group_size: Cantidad de chunks por nodo.
       - max_chars: Longitud máxima de node_text (truncado).
+      - embedding_strategy: provider | mean | length_weighted.
 
     Retorna:
       Lista de Node entities (sin node_id, se asigna al persistir).
     """
+    if embedding_strategy not in NODE_EMBEDDING_STRATEGIES:
+        raise ValueError(f"Unknown node embedding strategy: {embedding_strategy}")
+    if embedding_strategy == NODE_EMBEDDING_PROVIDER and embedding_service is None:
+        raise ValueError("embedding_service is required for the provider strategy")
+
     if not chunks:
         return []
 
@@ -82,13 +105,21 @@ def build_nodes(
         span_end = group[-1].chunk_index if group[-1].chunk_index is not None else 0
         node_spans.append((span_start, span_end))
 
-    # Embeddings batch (una sola llamada para eficiencia)
-    embeddings = embedding_service.embed_batch(node_texts)
+    if embedding_strategy == NODE_EMBEDDING_PROVIDER:
+        # Embeddings batch (una sola llamada para eficiencia)
+        embeddings = embedding_service.embed_batch(node_texts)
+    else:
+        embeddings = [
+            centroid_embedding(
+                group, weighted=embedding_strategy == NODE_EMBEDDING_LENGTH_WEIGHTED
+            )
+            for group in groups
+        ]
 
     # Construir entidades Node
     nodes: list[Node] = []
     for idx, (text, embedding, (span_start, span_end)) in enumerate(
-        zip(node_texts, embeddings, node_spans)
+        zip(node_texts, embeddings, node_spans, strict=True)
     ):
         nodes.append(
             Node(
@@ -109,7 +140,33 @@ def build_nodes(
             "chunks": len(chunks),
             "nodes": len(nodes),
             "group_size": group_size,
+            "embedding_strategy": embedding_strategy,
         },
     )
 
     return nodes
+
+
+def centroid_embedding(chunks: List[Chunk], *, weighted: bool = False) -> List[float]:
+    """
+    Vector de un nodo derivado de los embeddings de sus chunks (sin proveedor).
+
+    - weighted=False: media simple.
+    - weighted=True: media ponderada por largo de contenido (los chunks cortos,
+      p.ej. la cola de una sección, pesan menos).
+    - Se normaliza a norma 1 (la búsqueda de nodos es por coseno).
+    - Acepta listas o np.ndarray (pgvector devuelve ndarray al leer de BD).
+    """
+    if not chunks or any(c.embedding is None or len(c.embedding) == 0 for c in chunks):
+        raise ValueError("All chunks need an embedding to derive a node vector")
+
+    vectors = np.asarray([c.embedding for c in chunks], dtype=np.float64)
+    weights = None
+    if weighted:
+        weights = np.asarray([max(len(c.content or ""), 1) for c in chunks])
+    centroid = np.average(vectors, axis=0, weights=weights)
+
+    norm = np.linalg.norm(centroid)
+    if norm > 0:
+        centroid = centroid / norm
+    return centroid.tolist()
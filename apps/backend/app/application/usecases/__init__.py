@@ -56,9 +56,11 @@ from .documents import (
     DocumentErrorCode,
     GetDocumentResult,
     GetDocumentUseCase,
+    IngestDocumentBatchResult,
     IngestDocumentResult,
     ListDocumentsResult,
     ListDocumentsUseCase,
+    PresignedUploadResult,
     ReprocessDocumentResult,
     SearchChunksResult,
     UploadDocumentResult,
@@ -66,6 +68,17 @@ from .documents import (
 
 # Ingestion
 from .ingestion import (
+    BackfillNodesInput,
+    BackfillNodesUseCase,
+    CompletePresignedUploadInput,
+    CompletePresignedUploadUseCase,
+    CreatePresignedUploadInput,
+    CreatePresignedUploadUseCase,
+    GetDocumentProcessingStatusInput,
+    GetDocumentProcessingStatusUseCase,
+    IngestBatchItem,
+    IngestDocumentBatchInput,
+    IngestDocumentBatchUseCase,
     IngestDocumentInput,
     IngestDocumentUseCase,
     ProcessUploadedDocumentInput,
@@ -102,12 +115,23 @@ __all__ = [
     # Ingestion
     "IngestDocumentInput",
     "IngestDocumentUseCase",
+    "IngestBatchItem",
+    "IngestDocumentBatchInput",
+    "IngestDocumentBatchUseCase",
     "UploadDocumentInput",
     "UploadDocumentUseCase",
+    "CreatePresignedUploadInput",
+    "CreatePresignedUploadUseCase",
+    "CompletePresignedUploadInput",
+    "CompletePresignedUploadUseCase",
     "ProcessUploadedDocumentInput",
     "ProcessUploadedDocumentUseCase",
+    "GetDocumentProcessingStatusInput",
+    "GetDocumentProcessingStatusUseCase",
     "ReprocessDocumentInput",
     "ReprocessDocumentUseCase",
+    "BackfillNodesInput",
+    "BackfillNodesUseCase",
     # Documents
     "GetDocumentUseCase",
     "GetDocumentResult",
@@ -116,8 +140,10 @@ __all__ = [
     "DeleteDocumentUseCase",
     "DeleteDocumentResult",
     "UploadDocumentResult",
+    "PresignedUploadResult",
     "ReprocessDocumentResult",
     "IngestDocumentResult",
+    "IngestDocumentBatchResult",
     "AnswerQueryResult",
     "SearchChunksResult",
     "DocumentError",
@@ -8,7 +8,7 @@ Name:
 
 Business Goal:
     Responder una pregunta del usuario usando RAG:
-      1) Embed del query
+      1) Embed del query (especulativo, en paralelo con la resolución de acceso)
       2) Retrieval de chunks (similarity o MMR)
       3) Construcción de contexto con grounding (metadata)
       4) Generación con LLM basada únicamente en el contexto
@@ -70,6 +70,8 @@ Inputs:
       - llm_query: Optional[str]
       - top_k: int (default 5)
       - use_mmr: bool
+      - workspace: Workspace ya resuelto por el caller (opcional)
+      - query_embedding: QueryEmbeddingPrefetch en vuelo (opcional)
 
 Outputs:
     AnswerQueryResult:
@@ -103,7 +105,7 @@ from ....crosscutting.metrics import (
     record_policy_refusal,
 )
 from ....crosscutting.timing import StageTimings
-from ....domain.entities import QueryResult
+from ....domain.entities import QueryResult, Workspace
 from ....domain.repositories import (
     DocumentRepository,
     WorkspaceAclRepository,
@@ -121,6 +123,7 @@ from ..documents.document_results import (
     DocumentErrorCode,
 )
 from ..workspace.workspace_access import resolve_workspace_for_read
+from .query_embedding_prefetch import QueryEmbeddingPrefetch
 
 # -----------------------------------------------------------------------------
 # Constantes: consistencia y evita strings mágicos.
@@ -154,6 +157,7 @@ _META_HYBRID_USED: Final[str] = "hybrid_used"
 _META_2TIER_USED: Final[str] = "2tier_used"
 
 # Stage names para StageTimings (evita typos).
+_STAGE_ACCESS: Final[str] = "access"
 _STAGE_EMBED: Final[str] = "embed"
 _STAGE_RETRIEVE: Final[str] = "retrieve"
 _STAGE_LLM: Final[str] = "llm"
@@ -171,6 +175,8 @@ class AnswerQueryInput:
         llm_query: Override opcional del query para el prompt (si se quiere)
         top_k: Cantidad de chunks a recuperar (default: 5)
         use_mmr: True para retrieval diverso (MMR), False para similarity estándar
+        workspace: Workspace ya autorizado para `actor` (evita re-resolverlo)
+        query_embedding: Embedding especulativo ya lanzado por el caller
     """
 
     query: str
@@ -179,6 +185,8 @@ class AnswerQueryInput:
     llm_query: Optional[str] = None
     top_k: int = _DEFAULT_TOP_K
     use_mmr: bool = False
+    workspace: Workspace | None = None
+    query_embedding: QueryEmbeddingPrefetch | None = None
 
 
 class AnswerQueryUseCase:
@@ -231,10 +239,28 @@ class AnswerQueryUseCase:
         self._enable_2tier_retrieval = enable_2tier_retrieval
         self._node_top_k = node_top_k
 
+    def prefetch_query_embedding(
+        self, query: str, *, top_k: int
+    ) -> QueryEmbeddingPrefetch | None:
+        """
+        Lanza el embedding del query en background.
+
+        Permite al caller (ej: router) solaparlo con su propia resolución de
+        acceso y luego pasarlo en `AnswerQueryInput.query_embedding`.
+
+        Sólo arranca tras la validación barata (query no vacío, top_k > 0):
+        un request inválido no paga embedding. Un request con acceso denegado
+        sí puede pagarlo (discard() no corta un embed ya en curso); es el
+        costo aceptado de la especulación.
+        """
+        if not (query or "").strip() or self._sanitize_top_k(top_k) <= 0:
+            return None
+        return QueryEmbeddingPrefetch.start(self._embeddings, query)
+
     def execute(self, input_data: AnswerQueryInput) -> AnswerQueryResult:
         """
         Ejecuta el flujo RAG:
-          1) validar -> 2) policy -> 3) embed -> 4) retrieve -> 5) context -> 6) LLM
+          1) validar -> 2) policy (|| embed) -> 3) retrieve -> 4) context -> 5) LLM
 
         Retorna:
           - AnswerQueryResult(result=QueryResult(...)) en éxito (incluso sin chunks)
@@ -246,40 +272,54 @@ class AnswerQueryUseCase:
         # ---------------------------------------------------------------------
         validation_error = self._validate_input(input_data)
         if validation_error is not None:
+            if input_data.query_embedding is not None:
+                input_data.query_embedding.discard()
             return AnswerQueryResult(error=validation_error)
 
         # ---------------------------------------------------------------------
-        # 2) Enforce acceso de lectura al workspace (policy centralizada).
+        # 2) Inicializar observabilidad y sanitizar top_k (regla de performance).
         # ---------------------------------------------------------------------
-        workspace, workspace_error = resolve_workspace_for_read(
-            workspace_id=input_data.workspace_id,
-            actor=input_data.actor,
-            workspace_repository=self._workspaces,
-            acl_repository=self._acls,
-        )
-        if workspace_error is not None:
-            return AnswerQueryResult(error=workspace_error)
-
-        # Extraer fts_language del workspace para hybrid search.
-        from ....domain.entities import validate_fts_language
+        timings = StageTimings()
+        prompt_version = getattr(self._llm, "prompt_version", "unknown")
 
-        fts_language = validate_fts_language(getattr(workspace, "fts_language", None))
+        top_k = self._sanitize_top_k(input_data.top_k)
+        candidate_top_k = self._compute_candidate_top_k(top_k)
 
         # ---------------------------------------------------------------------
-        # 3) Inicializar observabilidad.
+        # 3) Embedding especulativo: arranca antes de resolver acceso.
         # ---------------------------------------------------------------------
-        timings = StageTimings()
-        prompt_version = getattr(self._llm, "prompt_version", "unknown")
+        # Sólo depende del texto del query; si el acceso se deniega se descarta.
+        prefetch = input_data.query_embedding
+        if prefetch is None:
+            prefetch = self.prefetch_query_embedding(input_data.query, top_k=top_k)
 
         # ---------------------------------------------------------------------
-        # 4) Sanitizar top_k (regla defensiva de performance).
+        # 4) Enforce acceso de lectura al workspace (una vez por request).
         # ---------------------------------------------------------------------
-        top_k = self._sanitize_top_k(input_data.top_k)
-        candidate_top_k = self._compute_candidate_top_k(top_k)
+        workspace = input_data.workspace
+        if workspace is None or workspace.id != input_data.workspace_id:
+            with timings.measure(_STAGE_ACCESS):
+                workspace, workspace_error = resolve_workspace_for_read(
+                    workspace_id=input_data.workspace_id,
+                    actor=input_data.actor,
+                    workspace_repository=self._workspaces,
+                    acl_repository=self._acls,
+                )
+            if workspace_error is not None:
+                if prefetch is not None:
+                    prefetch.discard()
+                return AnswerQueryResult(error=workspace_error)
+
+        # Extraer fts_language del workspace para hybrid search.
+        from ....domain.entities import validate_fts_language
+
+        fts_language = validate_fts_language(getattr(workspace, "fts_language", None))
 
         # Si top_k no permite retrieval, devolvemos fallback de forma explícita.
         # (No es un error de servicio/policy: es una configuración inválida.)
-        if top_k <= 0:
+        if top_k <= 0 or prefetch is None:
+            if prefetch is not None:
+                prefetch.discard()
             timing_data = timings.to_dict()
             return AnswerQueryResult(
                 result=self._fallback_result(
@@ -294,11 +334,11 @@ class AnswerQueryUseCase:
             )
 
         # ---------------------------------------------------------------------
-        # 5) STEP: Embed query.
+        # 5) STEP: Embed query (espera sólo lo que falte del prefetch).
         # ---------------------------------------------------------------------
         try:
             with timings.measure(_STAGE_EMBED):
-                query_embedding = self._embeddings.embed_query(input_data.query)
+                query_embedding = prefetch.result()
         except Exception:
             return AnswerQueryResult(
                 error=self._service_unavailable(_RESOURCE_EMBEDDINGS)
@@ -0,0 +1,113 @@
+# =============================================================================
+# FILE: application/usecases/chat/query_embedding_prefetch.py
+# =============================================================================
+"""
+===============================================================================
+MODULE: Query Embedding Prefetch (Speculative Embedding)
+===============================================================================
+
+Name:
+    Query Embedding Prefetch
+
+Responsibility:
+    - Lanzar `embed_query` en background ANTES de resolver acceso al workspace.
+    - Entregar el embedding cuando el pipeline lo necesita (o re-lanzar el error).
+    - Descartar el resultado si el acceso es denegado.
+
+Why:
+    - Resolver workspace/ACL (DB) y embeber el query (HTTP externo) son
+      independientes: hacerlos en serie suma ambas latencias.
+    - El embedding especulativo no filtra datos: sólo depende del texto del query
+      y se descarta si la policy deniega acceso.
+
+Costo:
+    - Se lanza después de la validación barata (requests inválidos no pagan).
+    - discard() sólo cancela si el embed aún no arrancó: un request denegado
+      puede pagar una llamada al proveedor. Acotado por el executor compartido.
+
+Arquitectura:
+    - Capa: Application (utility)
+    - Dependencias: solo domain.services.EmbeddingService
+
+-------------------------------------------------------------------------------
+CRC (Class Card)
+-------------------------------------------------------------------------------
+Class: QueryEmbeddingPrefetch
+Responsibilities:
+  - Ejecutar embed_query en un executor compartido (propaga ContextVars)
+  - Exponer result() bloqueante y discard() idempotente
+Collaborators:
+  - domain.services.EmbeddingService
+  - concurrent.futures.ThreadPoolExecutor
+Constraints:
+  - Executor acotado y compartido por proceso (no un thread por request)
+===============================================================================
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Final
+
+from ....domain.services import EmbeddingService
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+_MAX_WORKERS: Final[int] = 8
+_THREAD_PREFIX: Final[str] = "query-embed"
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Executor lazy y compartido (evita crear threads en import-time)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_MAX_WORKERS, thread_name_prefix=_THREAD_PREFIX
+                )
+    return _executor
+
+
+class QueryEmbeddingPrefetch:
+    """
+    Embedding de query en vuelo.
+
+    Uso:
+        prefetch = QueryEmbeddingPrefetch.start(embeddings, query)
+        ...resolver acceso...
+        if denied: prefetch.discard()
+        else: embedding = prefetch.result()
+    """
+
+    def __init__(self, future: Future[list[float]]) -> None:
+        self._future = future
+
+    @classmethod
+    def start(
+        cls,
+        embedding_service: EmbeddingService,
+        query: str,
+        *,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> "QueryEmbeddingPrefetch":
+        """Dispara embed_query en background copiando el contexto del request."""
+        ctx = contextvars.copy_context()
+        future = (executor or _get_executor()).submit(
+            ctx.run, embedding_service.embed_query, query
+        )
+        return cls(future)
+
+    def result(self) -> list[float]:
+        """Espera el embedding; re-lanza la excepción original si falló."""
+        return self._future.result()
+
+    def discard(self) -> None:
+        """Descarta el resultado (cancela si aún no arrancó)."""
+        self._future.cancel()
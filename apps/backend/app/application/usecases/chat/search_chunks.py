@@ -66,6 +66,7 @@ from typing import Final
 from uuid import UUID
 
 from ....crosscutting.logger import logger
+from ....domain.entities import Workspace
 from ....domain.repositories import (
     DocumentRepository,
     WorkspaceAclRepository,
@@ -119,6 +120,7 @@ class SearchChunksInput:
       - actor: actor para policy de lectura
       - top_k: cantidad de resultados
       - use_mmr: retrieval diverso (MMR) vs similarity estándar
+      - workspace: workspace ya autorizado para `actor` (evita re-resolverlo)
     """
 
     query: str
@@ -126,6 +128,7 @@ class SearchChunksInput:
     actor: WorkspaceActor | None
     top_k: int = _DEFAULT_TOP_K
     use_mmr: bool = False
+    workspace: Workspace | None = None
 
 
 class SearchChunksUseCase:
@@ -193,16 +196,18 @@ class SearchChunksUseCase:
             return SearchChunksResult(matches=[], error=validation_error)
 
         # ---------------------------------------------------------------------
-        # 2) Enforce workspace read access.
+        # 2) Enforce workspace read access (salvo que el caller ya lo resolvió).
         # ---------------------------------------------------------------------
-        workspace, workspace_error = resolve_workspace_for_read(
-            workspace_id=input_data.workspace_id,
-            actor=input_data.actor,
-            workspace_repository=self._workspaces,
-            acl_repository=self._acls,
-        )
-        if workspace_error is not None:
-            return SearchChunksResult(matches=[], error=workspace_error)
+        workspace = input_data.workspace
+        if workspace is None or workspace.id != input_data.workspace_id:
+            workspace, workspace_error = resolve_workspace_for_read(
+                workspace_id=input_data.workspace_id,
+                actor=input_data.actor,
+                workspace_repository=self._workspaces,
+                acl_repository=self._acls,
+            )
+            if workspace_error is not None:
+                return SearchChunksResult(matches=[], error=workspace_error)
 
         # Extraer fts_language del workspace para hybrid search.
         from ....domain.entities import validate_fts_language
@@ -15,6 +15,10 @@ Responsibilities:
   - Si el archivo existe y no cambió: skip (idempotente).
   - Mantener workspace-scoped estricto.
   - Registrar métricas de sync (created, updated, skipped).
+  - Procesar archivos con concurrencia acotada (max_concurrency threads
+    compartiendo el GoogleDriveClient y su rate limiting).
+  - Reusar el access_token de la cuenta entre syncs (AccessTokenCachePort):
+    N sources de una misma cuenta => un solo refresh por expiración.
 
 Collaborators:
   - ConnectorSourceRepository: persistencia de sources.
@@ -22,16 +26,19 @@ Collaborators:
   - DocumentRepository: documentos + chunks.
   - TokenEncryptionPort: cifrado de tokens.
   - OAuthPort: refresh de access_token.
+  - AccessTokenCachePort (opcional): cache de access_token por cuenta.
   - GoogleDriveClient: interacción con Drive API.
   - crosscutting.metrics: métricas de observabilidad.
+  - services.concurrency.map_ordered: pool de threads acotado.
 
 Flow (Update-Aware):
   1. Validar source existe + pertenece al workspace.
   2. Obtener cuenta OAuth (tokens).
-  3. Descifrar refresh_token → refrescar access_token.
+  3. access_token: cache por cuenta; si no hay, descifrar refresh_token →
+     refrescar (coalescido por cuenta).
   4. Construir GoogleDriveClient con access_token.
   5. Delta sync: obtener cambios desde último cursor.
-  6. Para cada archivo:
+  6. Para cada archivo (en paralelo; mismo file_id => mismo worker, en orden):
      a. Si NO existe doc → CREATE (ingestar nuevo).
      b. Si existe doc:
         - Comparar modified_time/etag.
@@ -43,8 +50,10 @@ Flow (Update-Aware):
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from dataclasses import dataclass
+from typing import Sequence
 from uuid import UUID, uuid4
 
 from app.crosscutting.metrics import (
@@ -54,6 +63,8 @@ from app.crosscutting.metrics import (
     record_connector_sync_locked,
 )
 from app.domain.connectors import (
+    AccessTokenCachePort,
+    ConnectorAccount,
     ConnectorAccountRepository,
     ConnectorFile,
     ConnectorProvider,
@@ -64,6 +75,7 @@ from app.domain.connectors import (
 )
 from app.domain.entities import Document
 from app.domain.repositories import DocumentRepository
+from app.infrastructure.services.concurrency import map_ordered
 from app.infrastructure.services.google_drive_client import (
     ConnectorFileTooLargeError,
     ConnectorPermanentError,
@@ -136,6 +148,35 @@ def _file_has_changed(existing_doc: Document, drive_file: ConnectorFile) -> bool
     return True
 
 
+def _group_by_file_id(
+    files: Sequence[ConnectorFile],
+) -> list[list[ConnectorFile]]:
+    """
+    Agrupa por file_id preservando el orden de primera aparición.
+
+    La Changes API puede listar el mismo archivo más de una vez: esas entradas
+    se procesan en serie (mismo worker) para que la segunda vea el documento
+    creado por la primera, igual que en el sync secuencial.
+    """
+    groups: dict[str, list[ConnectorFile]] = {}
+    for file in files:
+        groups.setdefault(file.file_id, []).append(file)
+    return list(groups.values())
+
+
+def _token_cache_key(account: ConnectorAccount) -> str:
+    """
+    Key del access_token: cuenta + huella del refresh_token vigente.
+
+    Reconectar la cuenta (nuevo refresh_token) cambia la key, así que nunca
+    se reusa un access_token emitido para credenciales anteriores.
+    """
+    fingerprint = hashlib.sha256(
+        account.encrypted_refresh_token.encode("utf-8")
+    ).hexdigest()[:16]
+    return f"{account.id}:{fingerprint}"
+
+
 class SyncConnectorSourceUseCase:
     """
     Sincroniza archivos desde la fuente externa hacia el workspace.
@@ -154,13 +195,20 @@ class SyncConnectorSourceUseCase:
         encryption: TokenEncryptionPort,
         oauth_port: OAuthPort,
         drive_client_factory=None,
+        *,
+        max_concurrency: int = 1,
+        token_cache: AccessTokenCachePort | None = None,
     ):
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
         self._connector_repo = connector_repo
         self._account_repo = account_repo
         self._document_repo = document_repo
         self._encryption = encryption
         self._oauth = oauth_port
         self._drive_client_factory = drive_client_factory
+        self._max_concurrency = max_concurrency
+        self._token_cache = token_cache
 
     def execute(self, workspace_id: UUID, source_id: UUID) -> SyncConnectorSourceResult:
         # 1) Validate source
@@ -185,10 +233,9 @@ class SyncConnectorSourceUseCase:
                 )
             )
 
-        # 3) Decrypt refresh_token → refresh access_token
+        # 3) Access token (cacheado por cuenta o refresh)
         try:
-            refresh_token = self._encryption.decrypt(account.encrypted_refresh_token)
-            access_token = self._oauth.refresh_access_token(refresh_token)
+            access_token = self._get_access_token(account)
         except ValueError as exc:
             logger.error(
                 "sync: token refresh failed",
@@ -214,7 +261,9 @@ class SyncConnectorSourceUseCase:
                 GoogleDriveClient,
             )
 
-            client = GoogleDriveClient(access_token)  # defaults de Settings
+            client = GoogleDriveClient(  # defaults de Settings
+                access_token, max_concurrency=self._max_concurrency
+            )
 
         # 5) Acquire per-source sync lock (CAS)
         locked = self._connector_repo.try_set_syncing(source_id)
@@ -242,6 +291,9 @@ class SyncConnectorSourceUseCase:
                 "sync: get_delta failed",
                 extra={"source_id": str(source_id), "error": str(exc)},
             )
+            if exc.status_code == 401 and self._token_cache is not None:
+                # R: Token revocado/rotado: el próximo sync debe refrescar.
+                self._token_cache.invalidate(_token_cache_key(account))
             self._connector_repo.update_status(source_id, ConnectorSourceStatus.ERROR)
             return SyncConnectorSourceResult(
                 error=ConnectorError(
@@ -269,14 +321,26 @@ class SyncConnectorSourceUseCase:
         skipped = 0
         errored = 0
 
-        for file in files_to_process:
-            action = self._process_file(
-                workspace_id=workspace_id,
-                source_id=source_id,
-                file=file,
-                client=client,
-            )
-
+        def _process_group(group: Sequence[ConnectorFile]) -> list[str]:
+            return [
+                self._process_file(
+                    workspace_id=workspace_id,
+                    source_id=source_id,
+                    file=file,
+                    client=client,
+                )
+                for file in group
+            ]
+
+        # R: Los contadores se agregan acá, en el thread del sync, a partir de
+        # las acciones devueltas por los workers (sin estado compartido).
+        actions = map_ordered(
+            _process_group,
+            _group_by_file_id(files_to_process),
+            max_workers=self._max_concurrency,
+            thread_name_prefix="connector-sync",
+        )
+        for action in (action for group in actions for action in group):
             if action == SyncAction.CREATE:
                 created += 1
                 record_connector_file_created()
@@ -330,6 +394,18 @@ class SyncConnectorSourceUseCase:
 
         return SyncConnectorSourceResult(source_id=source_id, stats=stats)
 
+    def _get_access_token(self, account: ConnectorAccount) -> str:
+        """access_token vigente para la cuenta (ValueError si el refresh falla)."""
+        if self._token_cache is None:
+            refresh_token = self._encryption.decrypt(account.encrypted_refresh_token)
+            return self._oauth.refresh_access_token(refresh_token)
+
+        def _refresh():
+            refresh_token = self._encryption.decrypt(account.encrypted_refresh_token)
+            return self._oauth.refresh_access_token_with_expiry(refresh_token)
+
+        return self._token_cache.get_or_refresh(_token_cache_key(account), _refresh)
+
     def _process_file(
         self,
         workspace_id: UUID,
@@ -53,8 +53,10 @@ from .document_results import (
     DocumentErrorCode,
     DownloadDocumentResult,
     GetDocumentResult,
+    IngestDocumentBatchResult,
     IngestDocumentResult,
     ListDocumentsResult,
+    PresignedUploadResult,
     ReprocessDocumentResult,
     SearchChunksResult,
     UpdateDocumentMetadataResult,
@@ -82,8 +84,10 @@ __all__ = [
     "UpdateDocumentMetadataResult",
     "DownloadDocumentResult",
     "UploadDocumentResult",
+    "PresignedUploadResult",
     "ReprocessDocumentResult",
     "IngestDocumentResult",
+    "IngestDocumentBatchResult",
     "AnswerQueryResult",
     "SearchChunksResult",
     # Error types
@@ -31,7 +31,9 @@ Responsibilities:
     - Definir DocumentError como contrato mínimo de error.
     - Definir DTOs de resultados por caso de uso:
         * ListDocumentsResult, GetDocumentResult, DeleteDocumentResult
-        * UploadDocumentResult, ReprocessDocumentResult, IngestDocumentResult
+        * UploadDocumentResult, PresignedUploadResult, ReprocessDocumentResult,
+          IngestDocumentResult
+        * IngestDocumentBatchResult
         * AnswerQueryResult, SearchChunksResult
 
 Collaborators:
@@ -42,7 +44,7 @@ Collaborators:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import List
 from uuid import UUID
@@ -162,6 +164,30 @@ class UploadDocumentResult:
     error: DocumentError | None = None
 
 
+@dataclass
+class PresignedUploadResult:
+    """
+    Resultado para iniciar un upload directo a storage (URL presignada PUT).
+
+    Campos:
+      - document_id: ID del documento reservado (status UPLOADING).
+      - upload_url: URL presignada para el PUT del cliente.
+      - storage_key: key del objeto en storage.
+      - expires_in_seconds: vigencia de la URL.
+      - error: error tipado si falló.
+
+    Nota:
+      - El cliente debe enviar el mismo Content-Type firmado y luego llamar
+        al endpoint de completion para encolar el procesamiento.
+    """
+
+    document_id: UUID | None = None
+    upload_url: str | None = None
+    storage_key: str | None = None
+    expires_in_seconds: int | None = None
+    error: DocumentError | None = None
+
+
 @dataclass
 class ReprocessDocumentResult:
     """
@@ -196,6 +222,20 @@ class IngestDocumentResult:
     error: DocumentError | None = None
 
 
+@dataclass
+class IngestDocumentBatchResult:
+    """
+    Resultado de un ingest batch.
+
+    Campos:
+      - results: un IngestDocumentResult por documento (orden de entrada).
+      - error: error global (workspace inválido / sin acceso).
+    """
+
+    results: List[IngestDocumentResult] = field(default_factory=list)
+    error: DocumentError | None = None
+
+
 @dataclass
 class AnswerQueryResult:
     """
@@ -33,7 +33,9 @@ Responsibilities:
 
 Collaborators:
     - Módulos internos del paquete:
-        ingest_document, upload_document, process_uploaded_document,
+        ingest_document, ingest_document_batch (pasos compartidos en
+        ingest_document_steps), upload_document, presigned_upload,
+        process_uploaded_document, backfill_nodes,
         reprocess_document, cancel_document_processing, get_document_status
 ===============================================================================
 """
@@ -41,6 +43,11 @@ Collaborators:
 from __future__ import annotations
 
 # Support operations
+from .backfill_nodes import (
+    BackfillNodesInput,
+    BackfillNodesResult,
+    BackfillNodesUseCase,
+)
 from .cancel_document_processing import (
     CancelDocumentProcessingInput,
     CancelDocumentProcessingResult,
@@ -54,6 +61,19 @@ from .get_document_status import (
 
 # Core ingestion pipeline
 from .ingest_document import IngestDocumentInput, IngestDocumentUseCase
+from .ingest_document_batch import (
+    IngestBatchItem,
+    IngestDocumentBatchInput,
+    IngestDocumentBatchUseCase,
+)
+from .presigned_upload import (
+    CompletePresignedUploadInput,
+    CompletePresignedUploadUseCase,
+    CreatePresignedUploadInput,
+    CreatePresignedUploadUseCase,
+    ExpirePresignedUploadInput,
+    ExpirePresignedUploadUseCase,
+)
 from .process_uploaded_document import (
     ProcessUploadedDocumentInput,
     ProcessUploadedDocumentOutput,
@@ -74,6 +94,13 @@ __all__ = [
     # Core pipeline: Upload -> Process
     "UploadDocumentInput",
     "UploadDocumentUseCase",
+    # Core pipeline: Direct-to-storage upload (presigned PUT + completion)
+    "CreatePresignedUploadInput",
+    "CreatePresignedUploadUseCase",
+    "CompletePresignedUploadInput",
+    "CompletePresignedUploadUseCase",
+    "ExpirePresignedUploadInput",
+    "ExpirePresignedUploadUseCase",
     "ProcessUploadedDocumentInput",
     "ProcessUploadedDocumentOutput",
     "ProcessUploadedDocumentUseCase",
@@ -83,6 +110,9 @@ __all__ = [
     # Core pipeline: Direct ingest (text -> chunks -> embeddings)
     "IngestDocumentInput",
     "IngestDocumentUseCase",
+    "IngestBatchItem",
+    "IngestDocumentBatchInput",
+    "IngestDocumentBatchUseCase",
     # Support: Cancel stuck documents
     "CancelDocumentProcessingInput",
     "CancelDocumentProcessingResult",
@@ -91,4 +121,8 @@ __all__ = [
     "GetDocumentProcessingStatusInput",
     "GetDocumentProcessingStatusResult",
     "GetDocumentProcessingStatusUseCase",
+    # Support: Build 2-tier nodes from stored chunks (no provider calls)
+    "BackfillNodesInput",
+    "BackfillNodesResult",
+    "BackfillNodesUseCase",
 ]
@@ -0,0 +1,174 @@
+"""
+===============================================================================
+USE CASE: Backfill Nodes (2-tier retrieval sin llamadas al proveedor)
+===============================================================================
+
+Name:
+    Backfill Nodes Use Case
+
+Business Goal:
+    Construir (o reconstruir) los nodos de 2-tier retrieval de documentos ya
+    procesados, derivando cada vector de nodo de los embeddings de sus chunks.
+
+Why (Context / Intención):
+    - Activar ENABLE_2TIER_RETRIEVAL sobre un workspace existente no genera
+      nodos para lo ya ingestado.
+    - Re-procesar todo costaría extracción + embeddings de nuevo; con las
+      estrategias de centroide (mean / length_weighted) alcanza con leer los
+      chunks persistidos: cero llamadas al proveedor.
+
+-------------------------------------------------------------------------------
+CRC CARD (Class-Responsibility-Collaborator)
+-------------------------------------------------------------------------------
+Class:
+    BackfillNodesUseCase
+
+Responsibilities:
+    - Recorrer documentos READY del workspace (paginado) o los IDs pedidos.
+    - Leer los chunks (con embedding) de cada documento.
+    - build_nodes con estrategia de centroide y reemplazar los nodos previos.
+    - Aislar fallas por documento (uno roto no corta el backfill).
+
+Collaborators:
+    - DocumentRepository:
+        list_documents / get_document / find_chunks_by_node_spans
+        delete_nodes_for_document / save_nodes
+    - node_builder.build_nodes
+===============================================================================
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Final, Iterator
+from uuid import UUID
+
+from ....domain.entities import Document
+from ....domain.repositories import DocumentRepository
+from ...node_builder import NODE_EMBEDDING_PROVIDER, build_nodes
+
+logger = logging.getLogger(__name__)
+
+_STATUS_READY: Final[str] = "READY"
+_PAGE_SIZE: Final[int] = 100
+# Span que cubre todos los chunk_index de un documento.
+_ALL_CHUNKS_SPAN_END: Final[int] = 2**31 - 1
+
+
+@dataclass(frozen=True)
+class BackfillNodesInput:
+    """
+    DTO de entrada.
+
+    - document_ids: None => todos los documentos READY del workspace.
+    - dry_run: calcula nodos pero no persiste.
+    """
+
+    workspace_id: UUID
+    document_ids: list[UUID] | None = None
+    dry_run: bool = False
+
+
+@dataclass
+class BackfillNodesResult:
+    """Resumen del backfill (contadores + IDs fallidos)."""
+
+    documents_processed: int = 0
+    documents_skipped: int = 0
+    nodes_created: int = 0
+    failed_document_ids: list[UUID] = field(default_factory=list)
+
+
+class BackfillNodesUseCase:
+    """
+    Use Case (Command):
+        Construye nodos desde chunks persistidos sin llamar al proveedor.
+    """
+
+    def __init__(
+        self,
+        repository: DocumentRepository,
+        *,
+        group_size: int,
+        max_chars: int,
+        embedding_strategy: str,
+    ) -> None:
+        if embedding_strategy == NODE_EMBEDDING_PROVIDER:
+            raise ValueError(
+                "Backfill requires a centroid strategy (mean | length_weighted)"
+            )
+        self._documents = repository
+        self._group_size = group_size
+        self._max_chars = max_chars
+        self._strategy = embedding_strategy
+
+    def execute(self, input_data: BackfillNodesInput) -> BackfillNodesResult:
+        result = BackfillNodesResult()
+        for document in self._iter_documents(input_data):
+            try:
+                created = self._backfill_document(
+                    document, input_data.workspace_id, dry_run=input_data.dry_run
+                )
+            except Exception:
+                logger.warning(
+                    "Node backfill failed. document_id=%s", document.id, exc_info=True
+                )
+                result.failed_document_ids.append(document.id)
+                continue
+
+            if created is None:
+                result.documents_skipped += 1
+            else:
+                result.documents_processed += 1
+                result.nodes_created += created
+        return result
+
+    def _iter_documents(self, input_data: BackfillNodesInput) -> Iterator[Document]:
+        if input_data.document_ids is not None:
+            for document_id in input_data.document_ids:
+                document = self._documents.get_document(
+                    document_id, workspace_id=input_data.workspace_id
+                )
+                if document is not None:
+                    yield document
+            return
+
+        offset = 0
+        while True:
+            page = self._documents.list_documents(
+                limit=_PAGE_SIZE,
+                offset=offset,
+                workspace_id=input_data.workspace_id,
+                status=_STATUS_READY,
+            )
+            yield from page
+            if len(page) < _PAGE_SIZE:
+                return
+            offset += _PAGE_SIZE
+
+    def _backfill_document(
+        self, document: Document, workspace_id: UUID, *, dry_run: bool
+    ) -> int | None:
+        """Nodos creados, o None si el documento no tiene chunks."""
+        chunks = self._documents.find_chunks_by_node_spans(
+            [(document.id, 0, _ALL_CHUNKS_SPAN_END)], workspace_id=workspace_id
+        )
+        if not chunks:
+            return None
+
+        nodes = build_nodes(
+            document_id=document.id,
+            workspace_id=workspace_id,
+            chunks=chunks,
+            embedding_service=None,
+            group_size=self._group_size,
+            max_chars=self._max_chars,
+            embedding_strategy=self._strategy,
+        )
+        if not dry_run:
+            self._documents.delete_nodes_for_document(
+                document.id, workspace_id=workspace_id
+            )
+            self._documents.save_nodes(document.id, nodes, workspace_id=workspace_id)
+        return len(nodes)
@@ -0,0 +1,130 @@
+"""
+===============================================================================
+MÓDULO: Chunk Embedding Reuse (reprocesamiento incremental)
+===============================================================================
+
+Name:
+    Chunk Embedding Reuse
+
+Responsibility:
+    - Calcular el content_hash de cada chunk (normalizado, scopeado por
+      workspace y por modelo de embeddings).
+    - Buscar embeddings ya persistidos para esos hashes (mismo documento o
+      cualquier otro documento del workspace).
+    - Embeber SOLO los chunks nuevos/cambiados (y cada texto único una sola vez).
+    - Registrar métricas de embeddings reutilizados vs calculados.
+
+Why:
+    - Reprocesar un documento donde cambió un párrafo volvía a embeber todos
+      los chunks: costo y latencia del provider proporcionales al documento,
+      no al cambio.
+
+Arquitectura:
+    - Capa: Application (helper de use cases de ingesta)
+    - Dependencias: DocumentRepository (puerto), EmbeddingService (puerto)
+
+-------------------------------------------------------------------------------
+CRC (Component Card)
+-------------------------------------------------------------------------------
+Component: embed_chunks_with_reuse, embedding_model_id
+Responsibilities:
+  - Resolver embeddings por hash antes de llamar al provider
+  - Mantener el orden 1:1 con los textos de entrada
+  - Nunca reutilizar vectores de otro modelo (el modelo va en el hash)
+Collaborators:
+  - application.content_hash.compute_chunk_hash
+  - DocumentRepository.find_chunk_embeddings_by_hash
+  - EmbeddingService.embed_batch
+Constraints:
+  - Lookup best-effort: si falla, se embebe todo (no rompe el pipeline)
+  - Debe ejecutarse ANTES de borrar los chunks previos del documento
+===============================================================================
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from uuid import UUID
+
+from ....crosscutting.metrics import record_chunk_embeddings
+from ....domain.repositories import DocumentRepository
+from ....domain.services import EmbeddingService
+from ...content_hash import compute_chunk_hash
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ChunkEmbeddings:
+    """Embeddings alineados con los textos de entrada (+ hashes y conteos)."""
+
+    embeddings: list[list[float]]
+    content_hashes: list[str]
+    reused: int
+    computed: int
+
+
+def embedding_model_id(embedding_service: EmbeddingService) -> str:
+    """model_id del servicio de embeddings (nombre de clase si no lo expone)."""
+    model_id = getattr(embedding_service, "model_id", None)
+    if isinstance(model_id, str):
+        return model_id
+    return type(embedding_service).__qualname__
+
+
+def embed_chunks_with_reuse(
+    *,
+    repository: DocumentRepository,
+    embedding_service: EmbeddingService,
+    workspace_id: UUID,
+    chunks_text: list[str],
+) -> ChunkEmbeddings:
+    """
+    Devuelve un embedding por chunk, reutilizando los ya persistidos por hash.
+
+    Errores:
+      - RuntimeError si el provider no devuelve 1 embedding por texto pedido.
+      - Excepciones del EmbeddingService se propagan (el caller marca FAILED).
+    """
+    model = embedding_model_id(embedding_service)
+    content_hashes = [
+        compute_chunk_hash(workspace_id, t, embedding_model=model) for t in chunks_text
+    ]
+    unique_hashes = list(dict.fromkeys(content_hashes))
+
+    try:
+        known = dict(
+            repository.find_chunk_embeddings_by_hash(workspace_id, unique_hashes)
+        )
+    except Exception:
+        # R: Reuso es optimización: si el lookup falla, embebemos todo.
+        logger.warning(
+            "Chunk embedding lookup failed; embedding all chunks",
+            extra={"workspace_id": str(workspace_id)},
+            exc_info=True,
+        )
+        known = {}
+
+    # R: Cada texto nuevo se embebe una sola vez aunque se repita en el documento.
+    pending: dict[str, str] = {}
+    for content_hash, text in zip(content_hashes, chunks_text, strict=True):
+        if content_hash not in known and content_hash not in pending:
+            pending[content_hash] = text
+
+    if pending:
+        vectors = embedding_service.embed_batch(list(pending.values()))
+        if len(vectors) != len(pending):
+            raise RuntimeError("Embedding batch size mismatch")
+        known.update(zip(pending.keys(), vectors, strict=True))
+
+    computed = len(pending)
+    reused = len(chunks_text) - computed
+    record_chunk_embeddings(reused=reused, computed=computed)
+
+    return ChunkEmbeddings(
+        embeddings=[known[h] for h in content_hashes],
+        content_hashes=content_hashes,
+        reused=reused,
+        computed=computed,
+    )
@@ -18,10 +18,14 @@ Why (Context / Intención):
       cuándo un documento está listo.
     - No queremos cargar toda la entidad Document si solo necesitamos el status.
     - Permite UI responsiva mostrando "Procesando...", "Listo", "Falló", etc.
+    - El progreso (chunks_done/total) lo registra el worker en modo checkpoint
+      junto con cada lote comprometido: refleja trabajo persistido, no estimado.
 
 Security:
     - Requiere acceso de lectura al workspace (no expone documentos de otros).
-    - Solo retorna información mínima (status, progress hints).
+    - Solo retorna información mínima (status, progreso).
+    - El Document se adjunta solo para el chequeo de acceso del borde HTTP
+      (allowed_roles); no se serializa.
 
 -------------------------------------------------------------------------------
 CRC CARD (Class-Responsibility-Collaborator)
@@ -58,6 +62,10 @@ Outputs:
         file_name: str | None        (nombre del archivo para UI)
         error_message: str | None    (mensaje de error si FAILED)
         is_ready: bool               (helper para polling: status == READY)
+        chunks_done / chunks_total: int | None  (progreso comprometido)
+        progress: float | None       (0..1; None si el total no se conoce)
+        updated_at: datetime | None  (último checkpoint registrado)
+        document: Document | None    (solo para chequeo de acceso)
         error: DocumentError | None
 
 Error Mapping:
@@ -71,9 +79,11 @@ Error Mapping:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Final
 from uuid import UUID
 
+from ....domain.entities import Document
 from ....domain.repositories import (
     DocumentRepository,
     WorkspaceAclRepository,
@@ -113,6 +123,11 @@ class GetDocumentProcessingStatusResult:
       - file_name: nombre del archivo (útil para mostrar en UI mientras procesa)
       - error_message: mensaje de error si status == FAILED
       - is_ready: helper booleano para polling (status == READY)
+      - chunks_done / chunks_total: progreso comprometido (modo checkpoint);
+        None si el documento no registra progreso
+      - progress: fracción 0..1 (None si el total aún no se conoce)
+      - updated_at: último checkpoint registrado
+      - document: entidad para el chequeo de acceso del borde HTTP
       - error: error tipado si la operación falló
     """
 
@@ -120,6 +135,11 @@ class GetDocumentProcessingStatusResult:
     file_name: str | None = None
     error_message: str | None = None
     is_ready: bool = False
+    chunks_done: int | None = None
+    chunks_total: int | None = None
+    progress: float | None = None
+    updated_at: datetime | None = None
+    document: Document | None = None
     error: DocumentError | None = None
 
 
@@ -184,6 +204,11 @@ class GetDocumentProcessingStatusUseCase:
                 document.error_message if document.status == "FAILED" else None
             ),
             is_ready=document.status == STATUS_READY,
+            chunks_done=document.processing_chunks_done,
+            chunks_total=document.processing_chunks_total,
+            progress=document.processing_progress,
+            updated_at=document.processing_updated_at,
+            document=document,
         )
 
     # =========================================================================
@@ -44,6 +44,7 @@ Responsibilities:
     - Return IngestDocumentResult with document_id and chunks_created.
 
 Collaborators:
+    - IngestDocumentSteps: pasos por documento (compartidos con el batch)
     - WorkspaceRepository (via resolve_workspace_for_write)
     - DocumentRepository:
         save_document_with_chunks(document, chunks)  # atomic contract
@@ -51,8 +52,8 @@ Collaborators:
         chunk(text) -> list[str]
     - EmbeddingService:
         embed_batch(texts) -> list[list[float]]  # same length as inputs
-    - prompt_injection_detector.detect:
-        detect(content) -> detection(flags, risk_score, patterns)
+    - prompt_injection_detector.detect_many:
+        detect_many(chunks) -> detections(flags, risk_score, patterns)
     - record_prompt_injection_detected(pattern):
         metric counter for each detected pattern
     - normalize_tags(metadata):
@@ -92,51 +93,19 @@ Error Mapping:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Final, Optional
-from uuid import UUID, uuid4
+from uuid import uuid4
 
 from ....crosscutting.logger import logger
-from ....crosscutting.metrics import record_dedup_hit, record_prompt_injection_detected
-from ....domain.access import normalize_allowed_roles
-from ....domain.entities import Chunk, Document
+from ....crosscutting.metrics import record_dedup_hit
 from ....domain.repositories import DocumentRepository, WorkspaceRepository
 from ....domain.services import EmbeddingService, TextChunkerService
-from ....domain.tags import normalize_tags
-from ....domain.workspace_policy import WorkspaceActor
-from ...content_hash import compute_content_hash
-from ...prompt_injection_detector import detect
-from ..documents.document_results import (
-    DocumentError,
-    DocumentErrorCode,
-    IngestDocumentResult,
-)
+from ..documents.document_results import IngestDocumentResult
 from ..workspace.workspace_access import resolve_workspace_for_write
-
-_RESOURCE_WORKSPACE: Final[str] = "Workspace"
-_MSG_WORKSPACE_ID_REQUIRED: Final[str] = "workspace_id is required"
-_MSG_TITLE_REQUIRED: Final[str] = "title is required"
-_SECURITY_DOC_KEY: Final[str] = "rag_security"
-
-
-@dataclass(frozen=True)
-class IngestDocumentInput:
-    """
-    DTO de entrada para ingesta.
-
-    Notas:
-      - metadata es copiada a un dict propio para evitar efectos colaterales.
-      - title es obligatorio.
-      - text puede ser vacío/blanco: se persiste el documento con 0 chunks y
-        NO se invoca embedding (cumple restricción de no llamar APIs externas).
-    """
-
-    workspace_id: UUID
-    actor: WorkspaceActor | None
-    title: str
-    text: str
-    source: Optional[str] = None
-    metadata: Dict[str, Any] | None = None
+from .ingest_document_steps import (
+    SECURITY_DOC_KEY,
+    IngestDocumentInput,
+    IngestDocumentSteps,
+)
 
 
 class IngestDocumentUseCase:
@@ -154,14 +123,20 @@ class IngestDocumentUseCase:
         enable_2tier_retrieval: bool = False,
         node_group_size: int = 5,
         node_text_max_chars: int = 2000,
+        node_embedding_strategy: str = "provider",
     ) -> None:
         self._documents = repository
         self._workspaces = workspace_repository
-        self._embeddings = embedding_service
-        self._chunker = chunker
-        self._enable_2tier = enable_2tier_retrieval
-        self._node_group_size = node_group_size
-        self._node_text_max_chars = node_text_max_chars
+        # R: Pasos por documento compartidos con el ingest batch (una sola fuente).
+        self._steps = IngestDocumentSteps(
+            repository,
+            embedding_service,
+            chunker,
+            enable_2tier_retrieval=enable_2tier_retrieval,
+            node_group_size=node_group_size,
+            node_text_max_chars=node_text_max_chars,
+            node_embedding_strategy=node_embedding_strategy,
+        )
 
     def execute(self, input_data: IngestDocumentInput) -> IngestDocumentResult:
         """
@@ -180,7 +155,7 @@ class IngestDocumentUseCase:
         # ---------------------------------------------------------------------
         # 1) Validaciones mínimas (baratas) antes de tocar repos o servicios.
         # ---------------------------------------------------------------------
-        validation_error = self._validate_input(input_data)
+        validation_error = self._steps.validate_input(input_data)
         if validation_error is not None:
             return IngestDocumentResult(error=validation_error)
 
@@ -198,7 +173,7 @@ class IngestDocumentUseCase:
         # ---------------------------------------------------------------------
         # 2b) Dedup: verificar si el contenido ya existe en el workspace.
         # ---------------------------------------------------------------------
-        content_hash = self._compute_dedup_hash(input_data)
+        content_hash = self._steps.compute_dedup_hash(input_data)
         if content_hash is not None:
             existing = self._documents.get_document_by_content_hash(
                 input_data.workspace_id, content_hash
@@ -222,7 +197,7 @@ class IngestDocumentUseCase:
         # 3) Construcción de entidades de dominio (Document + metadata normalizada).
         # ---------------------------------------------------------------------
         document_id = uuid4()
-        document, document_metadata = self._build_document(
+        document, document_metadata = self._steps.build_document(
             document_id=document_id,
             input_data=input_data,
             content_hash=content_hash,
@@ -231,7 +206,7 @@ class IngestDocumentUseCase:
         # ---------------------------------------------------------------------
         # 4) Chunking (sin dependencias externas).
         # ---------------------------------------------------------------------
-        chunks_text = self._chunk_text(input_data.text)
+        chunks_text = self._steps.chunk_text(input_data.text)
 
         # ---------------------------------------------------------------------
         # 5) Si no hay chunks, NO llamar servicios externos.
@@ -241,7 +216,9 @@ class IngestDocumentUseCase:
             try:
                 self._documents.save_document_with_chunks(document, [])
             except Exception:
-                dup = self._resolve_dedup_race(input_data.workspace_id, content_hash)
+                dup = self._steps.resolve_dedup_race(
+                    input_data.workspace_id, content_hash
+                )
                 if dup is not None:
                     return dup
                 raise
@@ -251,26 +228,29 @@ class IngestDocumentUseCase:
         # 6) Embeddings batch + análisis de seguridad por chunk.
         # ---------------------------------------------------------------------
         # Restricción: batch size/quota debe manejarse dentro de EmbeddingService.
-        embeddings = self._embed_chunks(chunks_text)
+        embeddings = self._steps.embed_chunks(chunks_text)
         if embeddings is None:
-            return IngestDocumentResult(error=self._service_unavailable_error())
+            return IngestDocumentResult(error=self._steps.service_unavailable_error())
 
-        chunk_entities, security_summary = self._build_chunk_entities_with_security(
-            document_id=document_id,
-            chunks_text=chunks_text,
-            embeddings=embeddings,
+        chunk_entities, security_summary = (
+            self._steps.build_chunk_entities_with_security(
+                document_id=document_id,
+                workspace_id=input_data.workspace_id,
+                chunks_text=chunks_text,
+                embeddings=embeddings,
+            )
         )
 
         # Adjuntamos resumen de seguridad al metadata del documento si hay hallazgos.
         if security_summary is not None:
-            document_metadata[_SECURITY_DOC_KEY] = security_summary
+            document_metadata[SECURITY_DOC_KEY] = security_summary
             # Importante: document.metadata apunta a document_metadata (mutable),
             # así que ya quedó actualizado en la entidad `document`.
 
         # ---------------------------------------------------------------------
         # 7) Persistencia atómica (Documento + Chunks + Nodos opcionales).
         # ---------------------------------------------------------------------
-        nodes = self._maybe_build_nodes(
+        nodes = self._steps.maybe_build_nodes(
             document_id=document_id,
             workspace_id=input_data.workspace_id,
             chunk_entities=chunk_entities,
@@ -281,7 +261,7 @@ class IngestDocumentUseCase:
                 document, chunk_entities, nodes=nodes
             )
         except Exception:
-            dup = self._resolve_dedup_race(input_data.workspace_id, content_hash)
+            dup = self._steps.resolve_dedup_race(input_data.workspace_id, content_hash)
             if dup is not None:
                 return dup
             raise
@@ -291,253 +271,5 @@ class IngestDocumentUseCase:
             chunks_created=len(chunk_entities),
         )
 
-    # =========================================================================
-    # Helpers privados: mantienen execute() legible y encapsulan reglas.
-    # =========================================================================
-
-    @staticmethod
-    def _validate_input(input_data: IngestDocumentInput) -> DocumentError | None:
-        """
-        Valida campos obligatorios para ejecutar el use case.
-
-        Reglas:
-          - workspace_id requerido
-          - title requerido (no vacío luego de strip)
-          - text puede ser vacío/blanco (se permite: 0 chunks y no embedding)
-        """
-        if not input_data.workspace_id:
-            return DocumentError(
-                code=DocumentErrorCode.VALIDATION_ERROR,
-                message=_MSG_WORKSPACE_ID_REQUIRED,
-                resource=_RESOURCE_WORKSPACE,
-            )
-
-        if not (input_data.title or "").strip():
-            return DocumentError(
-                code=DocumentErrorCode.VALIDATION_ERROR,
-                message=_MSG_TITLE_REQUIRED,
-                resource="Document",
-            )
-
-        return None
-
-    @staticmethod
-    def _compute_dedup_hash(input_data: IngestDocumentInput) -> str | None:
-        """
-        Computa hash de contenido para deduplicación.
-
-        Retorna None si el texto es vacío (no aplica dedup).
-        """
-        text = (input_data.text or "").strip()
-        if not text:
-            return None
-        return compute_content_hash(input_data.workspace_id, text)
-
-    def _resolve_dedup_race(
-        self, workspace_id: UUID, content_hash: str | None
-    ) -> IngestDocumentResult | None:
-        """
-        Maneja race condition de dedup: si un insert concurrente ganó el
-        constraint único, re-lee el documento existente y retorna resultado
-        idempotente.
-
-        Retorna None si no se puede resolver (error no relacionado con dedup).
-        """
-        if content_hash is None:
-            return None
-        try:
-            existing = self._documents.get_document_by_content_hash(
-                workspace_id, content_hash
-            )
-        except Exception:
-            return None
-        if existing is None:
-            return None
-        logger.info(
-            "Dedup race condition resuelta",
-            extra={
-                "existing_document_id": str(existing.id),
-                "workspace_id": str(workspace_id),
-                "dedup_hit": True,
-            },
-        )
-        record_dedup_hit()
-        return IngestDocumentResult(document_id=existing.id, chunks_created=0)
-
-    def _build_document(
-        self,
-        *,
-        document_id: UUID,
-        input_data: IngestDocumentInput,
-        content_hash: str | None = None,
-    ) -> tuple[Document, Dict[str, Any]]:
-        """
-        Construye la entidad Document asegurando metadata normalizada.
-
-        Nota:
-          - Se copia metadata para evitar mutaciones a estructuras externas.
-          - tags y allowed_roles se derivan de metadata (normalizadores de dominio).
-        """
-        metadata: Dict[str, Any] = dict(input_data.metadata or {})
-        tags = normalize_tags(metadata)
-        allowed_roles = normalize_allowed_roles(metadata)
-
-        document = Document(
-            id=document_id,
-            workspace_id=input_data.workspace_id,
-            title=input_data.title.strip(),
-            source=input_data.source,
-            metadata=metadata,
-            tags=tags,
-            allowed_roles=allowed_roles,
-            content_hash=content_hash,
-        )
-        return document, metadata
 
-    def _chunk_text(self, text: str) -> list[str]:
-        """
-        Ejecuta chunking semántico.
-
-        Regla importante:
-          - Si text es vacío/blanco → devuelve lista vacía (0 chunks).
-            Esto evita invocar embeddings y cumple la restricción de no llamar
-            APIs externas si no hay chunks.
-        """
-        normalized_text = (text or "").strip()
-        if not normalized_text:
-            return []
-        return self._chunker.chunk(normalized_text)
-
-    def _embed_chunks(self, chunks_text: list[str]) -> list[list[float]] | None:
-        """
-        Genera embeddings batch para los chunks.
-
-        Manejo de fallas:
-          - Si el embedding service falla (excepción), devolvemos None y el caller
-            responde SERVICE_UNAVAILABLE.
-        """
-        try:
-            embeddings = self._embeddings.embed_batch(chunks_text)
-        except Exception:
-            return None
-
-        # Defensa: el contrato esperado es 1 embedding por chunk.
-        if len(embeddings) != len(chunks_text):
-            return None
-
-        return embeddings
-
-    def _build_chunk_entities_with_security(
-        self,
-        *,
-        document_id: UUID,
-        chunks_text: list[str],
-        embeddings: list[list[float]],
-    ) -> tuple[list[Chunk], dict[str, Any] | None]:
-        """
-        Construye entidades Chunk y aplica detección de prompt injection.
-
-        Estrategia:
-          - Por cada chunk:
-              * correr detect(content)
-              * si hay patterns: adjuntar metadata de seguridad al chunk
-              * registrar métricas por pattern detectado
-          - Se agrega un resumen agregado en el documento:
-              rag_security = {security_flags, risk_score, detected_patterns}
-            solo si se detectó algo.
-
-        Devuelve:
-          - chunk_entities: list[Chunk]
-          - security_summary: dict | None
-        """
-        detected_flags: set[str] = set()
-        detected_patterns: set[str] = set()
-        max_risk_score: float = 0.0
-
-        chunk_entities: list[Chunk] = []
-
-        for index, (content, embedding) in enumerate(zip(chunks_text, embeddings)):
-            detection = detect(content)
-
-            chunk_metadata: dict[str, Any] = {}
-            if detection.patterns:
-                # Metadata por chunk para auditoría puntual.
-                chunk_metadata = {
-                    "security_flags": detection.flags,
-                    "risk_score": detection.risk_score,
-                    "detected_patterns": detection.patterns,
-                }
-
-                # Métricas por patrón detectado (observabilidad).
-                for pattern in detection.patterns:
-                    record_prompt_injection_detected(pattern)
-
-                detected_flags.update(detection.flags)
-                detected_patterns.update(detection.patterns)
-                max_risk_score = max(max_risk_score, float(detection.risk_score))
-
-            chunk_entities.append(
-                Chunk(
-                    content=content,
-                    embedding=embedding,
-                    document_id=document_id,
-                    chunk_index=index,
-                    metadata=chunk_metadata,
-                )
-            )
-
-        # Resumen agregado (solo si hay hallazgos).
-        if not detected_patterns:
-            return chunk_entities, None
-
-        security_summary: dict[str, Any] = {
-            "security_flags": sorted(detected_flags),
-            "risk_score": round(max_risk_score, 4),
-            "detected_patterns": sorted(detected_patterns),
-        }
-        return chunk_entities, security_summary
-
-    @staticmethod
-    def _service_unavailable_error() -> DocumentError:
-        """
-        Error consistente cuando una dependencia externa (embeddings) falla.
-        """
-        return DocumentError(
-            code=DocumentErrorCode.SERVICE_UNAVAILABLE,
-            message="Embedding service is unavailable.",
-            resource="EmbeddingService",
-        )
-
-    def _maybe_build_nodes(
-        self,
-        *,
-        document_id: UUID,
-        workspace_id: UUID,
-        chunk_entities: list[Chunk],
-    ) -> list | None:
-        """
-        Genera nodos si 2-tier retrieval está habilitado.
-
-        Graceful: si falla, loguea warning y retorna None (ingesta continúa sin nodos).
-        """
-        if not self._enable_2tier or not chunk_entities:
-            return None
-
-        try:
-            from ...node_builder import build_nodes
-
-            return build_nodes(
-                document_id=document_id,
-                workspace_id=workspace_id,
-                chunks=chunk_entities,
-                embedding_service=self._embeddings,
-                group_size=self._node_group_size,
-                max_chars=self._node_text_max_chars,
-            )
-        except Exception:
-            logger.warning(
-                "Node generation failed (graceful degradation)",
-                extra={"document_id": str(document_id)},
-                exc_info=True,
-            )
-            return None
+__all__ = ["IngestDocumentInput", "IngestDocumentUseCase"]
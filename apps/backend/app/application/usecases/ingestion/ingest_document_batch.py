@@ -0,0 +1,344 @@
+"""
+===============================================================================
+USE CASE: Ingest Document Batch (N textos → 1 pipeline)
+===============================================================================
+
+Name:
+    Ingest Document Batch Use Case
+
+Business Goal:
+    Ingerir varios documentos de texto en un mismo workspace con costo
+    proporcional al total de chunks y no a la cantidad de documentos:
+      - acceso de escritura resuelto UNA vez
+      - dedup de todos los content_hash en UNA query
+      - embeddings de todos los chunks en UNA llamada a embed_batch
+        (el EmbeddingService arma lotes del tamaño del provider, cruzando
+        límites de documento)
+      - persistencia bulk en UNA transacción
+
+What this use case guarantees (invariantes):
+  1) Mismas reglas por documento que IngestDocumentUseCase (validación,
+     tags/allowed_roles, seguridad por chunk, nodos 2-tier, dedup).
+  2) Resultado por documento, en el orden de entrada (document_id,
+     chunks_created, error).
+  3) Si el guardado bulk falla, se reintenta documento por documento para
+     aislar el fallo (dedup race incluida).
+
+-------------------------------------------------------------------------------
+CRC CARD (Class-Responsibility-Collaborator)
+-------------------------------------------------------------------------------
+Class:
+    IngestDocumentBatchUseCase
+
+Responsibilities:
+    - Resolver acceso de escritura al workspace (una vez).
+    - Validar cada documento y reportar errores por documento.
+    - Deduplicar contra el workspace (1 query) y dentro del batch.
+    - Chunking por documento + embeddings batch cross-document.
+    - Persistir todo con save_documents_with_chunks (fallback por documento).
+
+Collaborators:
+    - IngestDocumentSteps: reglas por documento (build/chunk/seguridad/nodos),
+      las mismas que usa IngestDocumentUseCase
+    - WorkspaceRepository (via resolve_workspace_for_write)
+    - DocumentRepository:
+        get_documents_by_content_hashes(workspace_id, hashes)
+        save_documents_with_chunks(items)
+        save_document_with_chunks(document, chunks, nodes)  # fallback
+    - EmbeddingService:
+        embed_batch(texts) -> list[list[float]]
+===============================================================================
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid4
+
+from ....crosscutting.logger import logger
+from ....crosscutting.metrics import record_dedup_hit
+from ....domain.entities import Chunk, Document, Node
+from ....domain.repositories import DocumentRepository, WorkspaceRepository
+from ....domain.services import EmbeddingService, TextChunkerService
+from ....domain.workspace_policy import WorkspaceActor
+from ..documents.document_results import (
+    DocumentError,
+    DocumentErrorCode,
+    IngestDocumentBatchResult,
+    IngestDocumentResult,
+)
+from ..workspace.workspace_access import resolve_workspace_for_write
+from .ingest_document_steps import (
+    SECURITY_DOC_KEY,
+    IngestDocumentInput,
+    IngestDocumentSteps,
+)
+
+
+@dataclass(frozen=True)
+class IngestBatchItem:
+    """Documento de texto dentro de un batch (mismo contrato que el ingest simple)."""
+
+    title: str
+    text: str
+    source: Optional[str] = None
+    metadata: Dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class IngestDocumentBatchInput:
+    """DTO de entrada: todos los documentos van al mismo workspace."""
+
+    workspace_id: UUID
+    actor: WorkspaceActor | None
+    documents: list[IngestBatchItem] = field(default_factory=list)
+
+
+@dataclass
+class _Pending:
+    """Documento en vuelo dentro del batch (interno)."""
+
+    position: int
+    document: Document
+    metadata: Dict[str, Any]
+    chunks_text: list[str]
+    chunks: list[Chunk] = field(default_factory=list)
+    nodes: list[Node] | None = None
+
+
+class IngestDocumentBatchUseCase:
+    """
+    Use Case (Application Service / Command):
+        Ingesta batch de documentos de texto con embeddings cross-document.
+    """
+
+    def __init__(
+        self,
+        repository: DocumentRepository,
+        workspace_repository: WorkspaceRepository,
+        embedding_service: EmbeddingService,
+        chunker: TextChunkerService,
+        enable_2tier_retrieval: bool = False,
+        node_group_size: int = 5,
+        node_text_max_chars: int = 2000,
+        node_embedding_strategy: str = "provider",
+    ) -> None:
+        self._documents = repository
+        self._workspaces = workspace_repository
+        # R: Reglas por documento compartidas con el ingest simple (una sola fuente).
+        self._steps = IngestDocumentSteps(
+            repository,
+            embedding_service,
+            chunker,
+            enable_2tier_retrieval=enable_2tier_retrieval,
+            node_group_size=node_group_size,
+            node_text_max_chars=node_text_max_chars,
+            node_embedding_strategy=node_embedding_strategy,
+        )
+
+    def execute(
+        self, input_data: IngestDocumentBatchInput
+    ) -> IngestDocumentBatchResult:
+        """
+        Ejecuta la ingesta batch.
+
+        Orden de operaciones:
+          1) Acceso de escritura (una vez).
+          2) Validación por documento.
+          3) Dedup: workspace (1 query) + repetidos dentro del batch.
+          4) Chunking por documento.
+          5) Embeddings de todos los chunks (1 llamada a embed_batch).
+          6) Entidades + seguridad + nodos por documento.
+          7) Persistencia bulk (fallback por documento).
+        """
+        if not input_data.workspace_id:
+            return IngestDocumentBatchResult(
+                error=DocumentError(
+                    code=DocumentErrorCode.VALIDATION_ERROR,
+                    message="workspace_id is required",
+                    resource="Workspace",
+                )
+            )
+
+        # ---------------------------------------------------------------------
+        # 1) Acceso de escritura (una vez para todo el batch).
+        # ---------------------------------------------------------------------
+        _, workspace_error = resolve_workspace_for_write(
+            workspace_id=input_data.workspace_id,
+            actor=input_data.actor,
+            workspace_repository=self._workspaces,
+        )
+        if workspace_error is not None:
+            return IngestDocumentBatchResult(error=workspace_error)
+
+        results: list[IngestDocumentResult | None] = [None] * len(input_data.documents)
+        inputs = [
+            IngestDocumentInput(
+                workspace_id=input_data.workspace_id,
+                actor=input_data.actor,
+                title=item.title,
+                text=item.text,
+                source=item.source,
+                metadata=item.metadata,
+            )
+            for item in input_data.documents
+        ]
+
+        # ---------------------------------------------------------------------
+        # 2) Validación por documento + hashes de dedup.
+        # ---------------------------------------------------------------------
+        hashes: list[str | None] = []
+        for position, doc_input in enumerate(inputs):
+            error = self._steps.validate_input(doc_input)
+            if error is not None:
+                results[position] = IngestDocumentResult(error=error)
+                hashes.append(None)
+                continue
+            hashes.append(self._steps.compute_dedup_hash(doc_input))
+
+        # ---------------------------------------------------------------------
+        # 3) Dedup contra el workspace (1 query) y dentro del batch.
+        # ---------------------------------------------------------------------
+        existing = self._documents.get_documents_by_content_hashes(
+            input_data.workspace_id,
+            sorted({h for h in hashes if h is not None}),
+        )
+
+        pending: list[_Pending] = []
+        first_in_batch: dict[str, int] = {}
+        duplicates: list[tuple[int, int]] = []  # (position, posición original)
+        for position, doc_input in enumerate(inputs):
+            if results[position] is not None:
+                continue
+            content_hash = hashes[position]
+            if content_hash is not None and content_hash in existing:
+                record_dedup_hit()
+                results[position] = IngestDocumentResult(
+                    document_id=existing[content_hash].id, chunks_created=0
+                )
+                continue
+            if content_hash is not None and content_hash in first_in_batch:
+                duplicates.append((position, first_in_batch[content_hash]))
+                continue
+            if content_hash is not None:
+                first_in_batch[content_hash] = position
+
+            # -----------------------------------------------------------------
+            # 4) Documento + chunking (sin servicios externos).
+            # -----------------------------------------------------------------
+            document, metadata = self._steps.build_document(
+                document_id=uuid4(),
+                input_data=doc_input,
+                content_hash=content_hash,
+            )
+            pending.append(
+                _Pending(
+                    position=position,
+                    document=document,
+                    metadata=metadata,
+                    chunks_text=self._steps.chunk_text(doc_input.text),
+                )
+            )
+
+        # ---------------------------------------------------------------------
+        # 5) Embeddings cross-document (solo si hay chunks).
+        # ---------------------------------------------------------------------
+        all_chunks_text = [text for item in pending for text in item.chunks_text]
+        if all_chunks_text:
+            embeddings = self._steps.embed_chunks(all_chunks_text)
+            if embeddings is None:
+                error = self._steps.service_unavailable_error()
+                for item in pending:
+                    results[item.position] = IngestDocumentResult(error=error)
+                pending = []
+                embeddings = []
+        else:
+            embeddings = []
+
+        # ---------------------------------------------------------------------
+        # 6) Entidades + seguridad + nodos por documento.
+        # ---------------------------------------------------------------------
+        offset = 0
+        for item in pending:
+            count = len(item.chunks_text)
+            if not count:
+                continue
+            item.chunks, security_summary = (
+                self._steps.build_chunk_entities_with_security(
+                    document_id=item.document.id,
+                    workspace_id=input_data.workspace_id,
+                    chunks_text=item.chunks_text,
+                    embeddings=embeddings[offset : offset + count],
+                )
+            )
+            offset += count
+            if security_summary is not None:
+                item.metadata[SECURITY_DOC_KEY] = security_summary
+            item.nodes = self._steps.maybe_build_nodes(
+                document_id=item.document.id,
+                workspace_id=input_data.workspace_id,
+                chunk_entities=item.chunks,
+            )
+
+        # ---------------------------------------------------------------------
+        # 7) Persistencia bulk (fallback por documento para aislar fallos).
+        # ---------------------------------------------------------------------
+        if pending:
+            self._persist(input_data.workspace_id, pending, results)
+
+        for position, original in duplicates:
+            record_dedup_hit()
+            original_result = results[original]
+            results[position] = (
+                original_result
+                if original_result is None or original_result.error is not None
+                else IngestDocumentResult(
+                    document_id=original_result.document_id, chunks_created=0
+                )
+            )
+
+        return IngestDocumentBatchResult(
+            results=[r or IngestDocumentResult() for r in results]
+        )
+
+    def _persist(
+        self,
+        workspace_id: UUID,
+        pending: list[_Pending],
+        results: list[IngestDocumentResult | None],
+    ) -> None:
+        """Guardado bulk; si falla, documento por documento (misma semántica que el simple)."""
+        try:
+            self._documents.save_documents_with_chunks(
+                [(item.document, item.chunks, item.nodes) for item in pending]
+            )
+        except Exception:
+            logger.warning(
+                "Bulk ingest save failed; falling back to per-document saves",
+                extra={"workspace_id": str(workspace_id), "documents": len(pending)},
+                exc_info=True,
+            )
+        else:
+            for item in pending:
+                results[item.position] = IngestDocumentResult(
+                    document_id=item.document.id, chunks_created=len(item.chunks)
+                )
+            return
+
+        for item in pending:
+            try:
+                self._documents.save_document_with_chunks(
+                    item.document, item.chunks, nodes=item.nodes
+                )
+            except Exception:
+                dup = self._steps.resolve_dedup_race(
+                    workspace_id, item.document.content_hash
+                )
+                if dup is None:
+                    raise
+                results[item.position] = dup
+                continue
+            results[item.position] = IngestDocumentResult(
+                document_id=item.document.id, chunks_created=len(item.chunks)
+            )
@@ -0,0 +1,348 @@
+"""
+===============================================================================
+TARJETA CRC — application/usecases/ingestion/ingest_document_steps.py
+===============================================================================
+
+Class:
+    IngestDocumentSteps
+
+Responsabilidades:
+    - Definir IngestDocumentInput (DTO compartido por simple y batch).
+    - Concentrar los pasos por documento de la ingesta de texto (validación,
+      dedup hash, Document, chunking, embeddings, seguridad por chunk, nodos
+      2-tier y resolución de dedup race).
+    - Ser la única fuente de esas reglas para IngestDocumentUseCase y
+      IngestDocumentBatchUseCase (ninguno toca internals del otro).
+
+Colaboradores:
+    - DocumentRepository: get_document_by_content_hash (dedup race)
+    - TextChunkerService / EmbeddingService
+    - prompt_injection_detector.detect_many + record_prompt_injection_detected
+    - node_builder.build_nodes (opcional, 2-tier)
+===============================================================================
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Final, Optional
+from uuid import UUID
+
+from ....crosscutting.logger import logger
+from ....crosscutting.metrics import record_dedup_hit, record_prompt_injection_detected
+from ....domain.access import normalize_allowed_roles
+from ....domain.entities import Chunk, Document
+from ....domain.repositories import DocumentRepository
+from ....domain.services import EmbeddingService, TextChunkerService
+from ....domain.tags import normalize_tags
+from ....domain.workspace_policy import WorkspaceActor
+from ...content_hash import compute_chunk_hash, compute_content_hash
+from ...prompt_injection_detector import detect_many
+from ..documents.document_results import (
+    DocumentError,
+    DocumentErrorCode,
+    IngestDocumentResult,
+)
+from .chunk_embedding_reuse import embedding_model_id
+
+_RESOURCE_WORKSPACE: Final[str] = "Workspace"
+_MSG_WORKSPACE_ID_REQUIRED: Final[str] = "workspace_id is required"
+_MSG_TITLE_REQUIRED: Final[str] = "title is required"
+SECURITY_DOC_KEY: Final[str] = "rag_security"
+
+
+@dataclass(frozen=True)
+class IngestDocumentInput:
+    """
+    DTO de entrada para ingesta.
+
+    Notas:
+      - metadata es copiada a un dict propio para evitar efectos colaterales.
+      - title es obligatorio.
+      - text puede ser vacío/blanco: se persiste el documento con 0 chunks y
+        NO se invoca embedding (cumple restricción de no llamar APIs externas).
+    """
+
+    workspace_id: UUID
+    actor: WorkspaceActor | None
+    title: str
+    text: str
+    source: Optional[str] = None
+    metadata: Dict[str, Any] | None = None
+
+
+class IngestDocumentSteps:
+    """Pasos por documento compartidos por el ingest simple y el batch."""
+
+    def __init__(
+        self,
+        repository: DocumentRepository,
+        embedding_service: EmbeddingService,
+        chunker: TextChunkerService,
+        *,
+        enable_2tier_retrieval: bool = False,
+        node_group_size: int = 5,
+        node_text_max_chars: int = 2000,
+        node_embedding_strategy: str = "provider",
+    ) -> None:
+        self._documents = repository
+        self._embeddings = embedding_service
+        self._chunker = chunker
+        self._enable_2tier = enable_2tier_retrieval
+        self._node_group_size = node_group_size
+        self._node_text_max_chars = node_text_max_chars
+        self._node_embedding_strategy = node_embedding_strategy
+
+    @staticmethod
+    def validate_input(input_data: IngestDocumentInput) -> DocumentError | None:
+        """
+        Valida campos obligatorios para ejecutar el use case.
+
+        Reglas:
+          - workspace_id requerido
+          - title requerido (no vacío luego de strip)
+          - text puede ser vacío/blanco (se permite: 0 chunks y no embedding)
+        """
+        if not input_data.workspace_id:
+            return DocumentError(
+                code=DocumentErrorCode.VALIDATION_ERROR,
+                message=_MSG_WORKSPACE_ID_REQUIRED,
+                resource=_RESOURCE_WORKSPACE,
+            )
+
+        if not (input_data.title or "").strip():
+            return DocumentError(
+                code=DocumentErrorCode.VALIDATION_ERROR,
+                message=_MSG_TITLE_REQUIRED,
+                resource="Document",
+            )
+
+        return None
+
+    @staticmethod
+    def compute_dedup_hash(input_data: IngestDocumentInput) -> str | None:
+        """
+        Computa hash de contenido para deduplicación.
+
+        Retorna None si el texto es vacío (no aplica dedup).
+        """
+        text = (input_data.text or "").strip()
+        if not text:
+            return None
+        return compute_content_hash(input_data.workspace_id, text)
+
+    def resolve_dedup_race(
+        self, workspace_id: UUID, content_hash: str | None
+    ) -> IngestDocumentResult | None:
+        """
+        Maneja race condition de dedup: si un insert concurrente ganó el
+        constraint único, re-lee el documento existente y retorna resultado
+        idempotente.
+
+        Retorna None si no se puede resolver (error no relacionado con dedup).
+        """
+        if content_hash is None:
+            return None
+        try:
+            existing = self._documents.get_document_by_content_hash(
+                workspace_id, content_hash
+            )
+        except Exception:
+            return None
+        if existing is None:
+            return None
+        logger.info(
+            "Dedup race condition resuelta",
+            extra={
+                "existing_document_id": str(existing.id),
+                "workspace_id": str(workspace_id),
+                "dedup_hit": True,
+            },
+        )
+        record_dedup_hit()
+        return IngestDocumentResult(document_id=existing.id, chunks_created=0)
+
+    def build_document(
+        self,
+        *,
+        document_id: UUID,
+        input_data: IngestDocumentInput,
+        content_hash: str | None = None,
+    ) -> tuple[Document, Dict[str, Any]]:
+        """
+        Construye la entidad Document asegurando metadata normalizada.
+
+        Nota:
+          - Se copia metadata para evitar mutaciones a estructuras externas.
+          - tags y allowed_roles se derivan de metadata (normalizadores de dominio).
+        """
+        metadata: Dict[str, Any] = dict(input_data.metadata or {})
+        tags = normalize_tags(metadata)
+        allowed_roles = normalize_allowed_roles(metadata)
+
+        document = Document(
+            id=document_id,
+            workspace_id=input_data.workspace_id,
+            title=input_data.title.strip(),
+            source=input_data.source,
+            metadata=metadata,
+            tags=tags,
+            allowed_roles=allowed_roles,
+            content_hash=content_hash,
+        )
+        return document, metadata
+
+    def chunk_text(self, text: str) -> list[str]:
+        """
+        Ejecuta chunking semántico.
+
+        Regla importante:
+          - Si text es vacío/blanco → devuelve lista vacía (0 chunks).
+            Esto evita invocar embeddings y cumple la restricción de no llamar
+            APIs externas si no hay chunks.
+        """
+        normalized_text = (text or "").strip()
+        if not normalized_text:
+            return []
+        return self._chunker.chunk(normalized_text)
+
+    def embed_chunks(self, chunks_text: list[str]) -> list[list[float]] | None:
+        """
+        Genera embeddings batch para los chunks.
+
+        Manejo de fallas:
+          - Si el embedding service falla (excepción), devolvemos None y el caller
+            responde SERVICE_UNAVAILABLE.
+        """
+        try:
+            embeddings = self._embeddings.embed_batch(chunks_text)
+        except Exception:
+            return None
+
+        # Defensa: el contrato esperado es 1 embedding por chunk.
+        if len(embeddings) != len(chunks_text):
+            return None
+
+        return embeddings
+
+    def build_chunk_entities_with_security(
+        self,
+        *,
+        document_id: UUID,
+        workspace_id: UUID,
+        chunks_text: list[str],
+        embeddings: list[list[float]],
+    ) -> tuple[list[Chunk], dict[str, Any] | None]:
+        """
+        Construye entidades Chunk y aplica detección de prompt injection.
+
+        Estrategia:
+          - Detección en lote (detect_many) y luego, por cada chunk:
+              * si hay patterns: adjuntar metadata de seguridad al chunk
+              * registrar métricas por pattern detectado
+          - Se agrega un resumen agregado en el documento:
+              rag_security = {security_flags, risk_score, detected_patterns}
+            solo si se detectó algo.
+
+        Devuelve:
+          - chunk_entities: list[Chunk]
+          - security_summary: dict | None
+        """
+        detected_flags: set[str] = set()
+        detected_patterns: set[str] = set()
+        max_risk_score: float = 0.0
+
+        chunk_entities: list[Chunk] = []
+        embedding_model = embedding_model_id(self._embeddings)
+
+        detections = detect_many(chunks_text)
+        for index, (content, embedding, detection) in enumerate(
+            zip(chunks_text, embeddings, detections, strict=True)
+        ):
+            chunk_metadata: dict[str, Any] = {}
+            if detection.patterns:
+                # Metadata por chunk para auditoría puntual.
+                chunk_metadata = {
+                    "security_flags": detection.flags,
+                    "risk_score": detection.risk_score,
+                    "detected_patterns": detection.patterns,
+                }
+
+                # Métricas por patrón detectado (observabilidad).
+                for pattern in detection.patterns:
+                    record_prompt_injection_detected(pattern)
+
+                detected_flags.update(detection.flags)
+                detected_patterns.update(detection.patterns)
+                max_risk_score = max(max_risk_score, float(detection.risk_score))
+
+            chunk_entities.append(
+                Chunk(
+                    content=content,
+                    embedding=embedding,
+                    document_id=document_id,
+                    chunk_index=index,
+                    metadata=chunk_metadata,
+                    # Habilita reuso/dedup de embeddings por contenido.
+                    content_hash=compute_chunk_hash(
+                        workspace_id, content, embedding_model=embedding_model
+                    ),
+                )
+            )
+
+        # Resumen agregado (solo si hay hallazgos).
+        if not detected_patterns:
+            return chunk_entities, None
+
+        security_summary: dict[str, Any] = {
+            "security_flags": sorted(detected_flags),
+            "risk_score": round(max_risk_score, 4),
+            "detected_patterns": sorted(detected_patterns),
+        }
+        return chunk_entities, security_summary
+
+    @staticmethod
+    def service_unavailable_error() -> DocumentError:
+        """
+        Error consistente cuando una dependencia externa (embeddings) falla.
+        """
+        return DocumentError(
+            code=DocumentErrorCode.SERVICE_UNAVAILABLE,
+            message="Embedding service is unavailable.",
+            resource="EmbeddingService",
+        )
+
+    def maybe_build_nodes(
+        self,
+        *,
+        document_id: UUID,
+        workspace_id: UUID,
+        chunk_entities: list[Chunk],
+    ) -> list | None:
+        """
+        Genera nodos si 2-tier retrieval está habilitado.
+
+        Graceful: si falla, loguea warning y retorna None (ingesta continúa sin nodos).
+        """
+        if not self._enable_2tier or not chunk_entities:
+            return None
+
+        try:
+            from ...node_builder import build_nodes
+
+            return build_nodes(
+                document_id=document_id,
+                workspace_id=workspace_id,
+                chunks=chunk_entities,
+                embedding_service=self._embeddings,
+                group_size=self._node_group_size,
+                max_chars=self._node_text_max_chars,
+                embedding_strategy=self._node_embedding_strategy,
+            )
+        except Exception:
+            logger.warning(
+                "Node generation failed (graceful degradation)",
+                extra={"document_id": str(document_id)},
+                exc_info=True,
+            )
+            return None
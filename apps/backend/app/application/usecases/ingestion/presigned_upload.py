@@ -0,0 +1,460 @@
+"""
+===============================================================================
+USE CASE: Presigned Upload (Direct-to-Storage Upload + Completion)
+===============================================================================
+
+Name:
+    Presigned Upload Use Cases
+
+Business Goal:
+    Permitir que el cliente suba el archivo directo a storage (S3/MinIO) con
+    una URL presignada PUT, sacando al proceso API del camino de los bytes:
+      - create: reserva el documento (UPLOADING) y emite la URL firmada
+      - complete: verifica el objeto (HEAD: tamaño/tipo) y encola procesamiento
+      - expire: si nunca se completó, el documento pasa a FAILED al vencer la URL
+
+Why (Context / Intención):
+    - Con el upload clásico cada byte pasa por FastAPI (red + CPU + disco).
+    - Con la URL presignada el API solo maneja metadata; el hash de dedup se
+      calcula en el worker, que ya descarga el archivo para procesarlo.
+    - Un PUT simple alcanza: max_upload_bytes (25MB por defecto) está muy por
+      debajo del límite de 5GB de un PUT en S3 (no hace falta multipart).
+
+-------------------------------------------------------------------------------
+CRC CARD (Class-Responsibility-Collaborator)
+-------------------------------------------------------------------------------
+Class:
+    CreatePresignedUploadUseCase
+
+Responsibilities:
+    - Enforce workspace write access.
+    - Validar storage disponible y tamaño declarado.
+    - Persistir Document con status UPLOADING y metadata del archivo.
+    - Agendar el vencimiento (TTL de la URL + gracia); si falla, FAILED.
+    - Emitir URL presignada PUT (Content-Type firmado).
+
+Class:
+    CompletePresignedUploadUseCase
+
+Responsibilities:
+    - Enforce workspace write access.
+    - Idempotencia: si el documento ya no está UPLOADING, devolver su estado.
+    - HEAD del objeto: existencia, tamaño (0 < size <= max) y Content-Type.
+    - Si el objeto es inválido: borrarlo (best-effort) y marcar FAILED.
+    - Transición UPLOADING -> PENDING (CAS) y encolar procesamiento.
+
+Class:
+    ExpirePresignedUploadUseCase
+
+Responsibilities:
+    - Transición UPLOADING -> FAILED (CAS): no pisa un complete concurrente.
+    - Borrar el objeto parcial/huérfano del storage (best-effort).
+
+Collaborators:
+    - DocumentRepository:
+        save_document / update_document_file_metadata / get_document
+        transition_document_status
+    - FileStoragePort:
+        generate_presigned_upload_url / head_file / delete_file
+    - DocumentProcessingQueue:
+        enqueue_document_processing / schedule_upload_expiry
+    - Document results:
+        PresignedUploadResult / UploadDocumentResult / DocumentError
+===============================================================================
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Final
+from uuid import UUID, uuid4
+
+from ....domain.access import normalize_allowed_roles
+from ....domain.entities import Document
+from ....domain.repositories import DocumentRepository, WorkspaceRepository
+from ....domain.services import DocumentProcessingQueue, FileStoragePort
+from ....domain.tags import normalize_tags
+from ....domain.workspace_policy import WorkspaceActor
+from ..documents.document_results import (
+    DocumentError,
+    DocumentErrorCode,
+    PresignedUploadResult,
+    UploadDocumentResult,
+)
+from ..workspace.workspace_access import resolve_workspace_for_write
+from .upload_document import UploadDocumentUseCase
+
+_RESOURCE_DOCUMENT: Final[str] = "Document"
+_RESOURCE_STORAGE: Final[str] = "FileStorage"
+_RESOURCE_QUEUE: Final[str] = "DocumentProcessingQueue"
+
+STATUS_UPLOADING: Final[str] = "UPLOADING"
+STATUS_PENDING: Final[str] = "PENDING"
+STATUS_FAILED: Final[str] = "FAILED"
+
+_MSG_STORAGE_UNAVAILABLE: Final[str] = "File storage unavailable."
+_MSG_QUEUE_UNAVAILABLE: Final[str] = "Document queue unavailable."
+_MSG_DOC_NOT_FOUND: Final[str] = "Document not found."
+_MSG_INVALID_SIZE: Final[str] = "Declared file size is out of range."
+_MSG_OBJECT_MISSING: Final[str] = "Uploaded file not found in storage."
+_MSG_OBJECT_INVALID: Final[str] = "Uploaded file does not match the declared upload."
+_MSG_ENQUEUE_FAILED_INTERNAL: Final[str] = "Failed to enqueue document processing job"
+_MSG_EXPIRY_FAILED_INTERNAL: Final[str] = "Failed to schedule upload expiry"
+_MSG_UPLOAD_EXPIRED: Final[str] = "Upload expired before completion."
+
+# R: Un PUT iniciado justo antes de vencer la URL puede terminar después, y el
+#    cliente aún tiene que llamar a complete: no vencemos en el mismo segundo.
+_EXPIRY_GRACE_SECONDS: Final[int] = 300
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CreatePresignedUploadInput:
+    """
+    DTO de entrada para iniciar un upload directo.
+
+    Notas:
+      - size_bytes es el tamaño declarado por el cliente; el real se verifica
+        con HEAD al completar.
+      - mime_type queda firmado en la URL (el PUT debe enviar el mismo header).
+    """
+
+    workspace_id: UUID
+    actor: WorkspaceActor | None
+    title: str
+    file_name: str
+    mime_type: str
+    size_bytes: int
+    source: str | None = None
+    metadata: dict[str, Any] | None = None
+    uploaded_by_user_id: UUID | None = None
+
+
+@dataclass(frozen=True)
+class CompletePresignedUploadInput:
+    """DTO de entrada para confirmar un upload directo ya subido al storage."""
+
+    workspace_id: UUID
+    document_id: UUID
+    actor: WorkspaceActor | None
+
+
+@dataclass(frozen=True)
+class ExpirePresignedUploadInput:
+    """DTO de entrada del job de vencimiento (sin actor: lo dispara el sistema)."""
+
+    workspace_id: UUID
+    document_id: UUID
+
+
+class CreatePresignedUploadUseCase:
+    """
+    Use Case (Command):
+        Reserva el documento (UPLOADING) y devuelve una URL presignada PUT.
+    """
+
+    def __init__(
+        self,
+        repository: DocumentRepository,
+        workspace_repository: WorkspaceRepository,
+        storage: FileStoragePort | None,
+        queue: DocumentProcessingQueue | None,
+        *,
+        max_upload_bytes: int,
+        expires_in_seconds: int = 900,
+    ) -> None:
+        self._documents = repository
+        self._workspaces = workspace_repository
+        self._storage = storage
+        self._queue = queue
+        self._max_upload_bytes = max_upload_bytes
+        self._expires_in_seconds = expires_in_seconds
+
+    def execute(self, input_data: CreatePresignedUploadInput) -> PresignedUploadResult:
+        """
+        Orden:
+          1) Enforce write access + storage/queue disponibles + tamaño declarado.
+          2) Reservar el documento (UPLOADING).
+          3) Agendar el vencimiento; sin él, un upload abandonado quedaría
+             UPLOADING para siempre (FAILED + 503 si no se puede agendar).
+          4) Firmar la URL PUT.
+        """
+        _, workspace_error = resolve_workspace_for_write(
+            workspace_id=input_data.workspace_id,
+            actor=input_data.actor,
+            workspace_repository=self._workspaces,
+        )
+        if workspace_error is not None:
+            return PresignedUploadResult(error=workspace_error)
+
+        if self._storage is None:
+            return PresignedUploadResult(
+                error=_service_unavailable(_MSG_STORAGE_UNAVAILABLE, _RESOURCE_STORAGE)
+            )
+        if self._queue is None:
+            return PresignedUploadResult(
+                error=_service_unavailable(_MSG_QUEUE_UNAVAILABLE, _RESOURCE_QUEUE)
+            )
+
+        if not 0 < input_data.size_bytes <= self._max_upload_bytes:
+            return PresignedUploadResult(error=_validation_error(_MSG_INVALID_SIZE))
+
+        document_id = uuid4()
+        storage_key = UploadDocumentUseCase._build_storage_key(
+            document_id=document_id, file_name=input_data.file_name
+        )
+
+        # R: content_hash queda NULL hasta que el worker lo calcule (dedup diferido).
+        metadata_payload = dict(input_data.metadata or {})
+        document = Document(
+            id=document_id,
+            workspace_id=input_data.workspace_id,
+            title=(input_data.title or "").strip(),
+            source=input_data.source,
+            metadata=metadata_payload,
+            tags=normalize_tags(metadata_payload),
+            allowed_roles=normalize_allowed_roles(metadata_payload),
+        )
+        self._documents.save_document(document)
+        self._documents.update_document_file_metadata(
+            document_id,
+            workspace_id=input_data.workspace_id,
+            file_name=input_data.file_name,
+            mime_type=input_data.mime_type,
+            storage_key=storage_key,
+            uploaded_by_user_id=input_data.uploaded_by_user_id,
+            status=STATUS_UPLOADING,
+            error_message=None,
+        )
+
+        try:
+            self._queue.schedule_upload_expiry(
+                document_id,
+                workspace_id=input_data.workspace_id,
+                delay_seconds=self._expires_in_seconds + _EXPIRY_GRACE_SECONDS,
+            )
+        except Exception:
+            logger.warning(
+                "Failed to schedule presigned upload expiry. document_id=%s",
+                document_id,
+            )
+            self._documents.transition_document_status(
+                document_id,
+                workspace_id=input_data.workspace_id,
+                from_statuses=[STATUS_UPLOADING],
+                to_status=STATUS_FAILED,
+                error_message=_MSG_EXPIRY_FAILED_INTERNAL,
+            )
+            return PresignedUploadResult(
+                error=_service_unavailable(_MSG_QUEUE_UNAVAILABLE, _RESOURCE_QUEUE)
+            )
+
+        upload_url = self._storage.generate_presigned_upload_url(
+            storage_key,
+            content_type=input_data.mime_type,
+            expires_in_seconds=self._expires_in_seconds,
+        )
+
+        return PresignedUploadResult(
+            document_id=document_id,
+            upload_url=upload_url,
+            storage_key=storage_key,
+            expires_in_seconds=self._expires_in_seconds,
+        )
+
+
+class CompletePresignedUploadUseCase:
+    """
+    Use Case (Command):
+        Verifica el objeto subido (HEAD) y encola el procesamiento.
+    """
+
+    def __init__(
+        self,
+        repository: DocumentRepository,
+        workspace_repository: WorkspaceRepository,
+        storage: FileStoragePort | None,
+        queue: DocumentProcessingQueue | None,
+        *,
+        max_upload_bytes: int,
+    ) -> None:
+        self._documents = repository
+        self._workspaces = workspace_repository
+        self._storage = storage
+        self._queue = queue
+        self._max_upload_bytes = max_upload_bytes
+
+    def execute(self, input_data: CompletePresignedUploadInput) -> UploadDocumentResult:
+        """
+        Orden:
+          1) Enforce write access + storage/queue disponibles.
+          2) Cargar documento; si ya no está UPLOADING, respuesta idempotente.
+          3) HEAD del objeto y validación de tamaño/tipo.
+          4) CAS UPLOADING -> PENDING y encolar (FAILED si falla el enqueue).
+        """
+        _, workspace_error = resolve_workspace_for_write(
+            workspace_id=input_data.workspace_id,
+            actor=input_data.actor,
+            workspace_repository=self._workspaces,
+        )
+        if workspace_error is not None:
+            return UploadDocumentResult(error=workspace_error)
+
+        if self._storage is None:
+            return UploadDocumentResult(
+                error=_service_unavailable(_MSG_STORAGE_UNAVAILABLE, _RESOURCE_STORAGE)
+            )
+        if self._queue is None:
+            return UploadDocumentResult(
+                error=_service_unavailable(_MSG_QUEUE_UNAVAILABLE, _RESOURCE_QUEUE)
+            )
+
+        document = self._documents.get_document(
+            input_data.document_id, workspace_id=input_data.workspace_id
+        )
+        if document is None or not document.storage_key:
+            return UploadDocumentResult(
+                error=DocumentError(
+                    code=DocumentErrorCode.NOT_FOUND,
+                    message=_MSG_DOC_NOT_FOUND,
+                    resource=_RESOURCE_DOCUMENT,
+                )
+            )
+
+        # Idempotencia: un retry del cliente no reencola ni re-valida.
+        if document.status != STATUS_UPLOADING:
+            return self._result(document, document.status)
+
+        info = self._storage.head_file(document.storage_key)
+        if info is None:
+            return UploadDocumentResult(error=_validation_error(_MSG_OBJECT_MISSING))
+
+        content_type = (info.content_type or "").split(";")[0].strip()
+        if (
+            not 0 < info.size_bytes <= self._max_upload_bytes
+            or content_type != document.mime_type
+        ):
+            logger.warning(
+                "Presigned upload rejected. document_id=%s size=%s content_type=%s",
+                document.id,
+                info.size_bytes,
+                content_type,
+            )
+            self._reject(document)
+            return UploadDocumentResult(error=_validation_error(_MSG_OBJECT_INVALID))
+
+        transitioned = self._documents.transition_document_status(
+            document.id,
+            workspace_id=input_data.workspace_id,
+            from_statuses=[STATUS_UPLOADING],
+            to_status=STATUS_PENDING,
+            error_message=None,
+        )
+        if not transitioned:
+            # Otra llamada concurrente de completion ya lo encoló.
+            return self._result(document, STATUS_PENDING)
+
+        try:
+            self._queue.enqueue_document_processing(
+                document.id, workspace_id=input_data.workspace_id
+            )
+        except Exception:
+            logger.warning(
+                "Failed to enqueue document processing. document_id=%s", document.id
+            )
+            self._documents.transition_document_status(
+                document.id,
+                workspace_id=input_data.workspace_id,
+                from_statuses=[STATUS_PENDING],
+                to_status=STATUS_FAILED,
+                error_message=_MSG_ENQUEUE_FAILED_INTERNAL,
+            )
+            return UploadDocumentResult(
+                error=_service_unavailable(_MSG_QUEUE_UNAVAILABLE, _RESOURCE_QUEUE)
+            )
+
+        return self._result(document, STATUS_PENDING)
+
+    @staticmethod
+    def _result(document: Document, status: str | None) -> UploadDocumentResult:
+        return UploadDocumentResult(
+            document_id=document.id,
+            status=status,
+            file_name=document.file_name,
+            mime_type=document.mime_type,
+        )
+
+    def _reject(self, document: Document) -> None:
+        """Marca FAILED y borra el objeto inválido (best-effort)."""
+        self._documents.transition_document_status(
+            document.id,
+            workspace_id=document.workspace_id,
+            from_statuses=[STATUS_UPLOADING],
+            to_status=STATUS_FAILED,
+            error_message=_MSG_OBJECT_INVALID,
+        )
+        try:
+            self._storage.delete_file(document.storage_key)
+        except Exception:
+            logger.warning(
+                "Failed to delete rejected upload. key=%s", document.storage_key
+            )
+
+
+class ExpirePresignedUploadUseCase:
+    """
+    Use Case (Command):
+        Vence un upload directo que nunca se completó (job agendado al crear).
+    """
+
+    def __init__(
+        self,
+        repository: DocumentRepository,
+        storage: FileStoragePort | None,
+    ) -> None:
+        self._documents = repository
+        self._storage = storage
+
+    def execute(self, input_data: ExpirePresignedUploadInput) -> bool:
+        """
+        Retorna True si el documento venció (estaba UPLOADING).
+
+        El CAS hace al job idempotente y seguro frente a un complete
+        concurrente: si ya pasó a PENDING (o se borró), no se toca nada.
+        """
+        expired = self._documents.transition_document_status(
+            input_data.document_id,
+            workspace_id=input_data.workspace_id,
+            from_statuses=[STATUS_UPLOADING],
+            to_status=STATUS_FAILED,
+            error_message=_MSG_UPLOAD_EXPIRED,
+        )
+        if not expired:
+            return False
+
+        logger.info("Presigned upload expired. document_id=%s", input_data.document_id)
+        document = self._documents.get_document(
+            input_data.document_id, workspace_id=input_data.workspace_id
+        )
+        if self._storage is not None and document is not None and document.storage_key:
+            try:
+                self._storage.delete_file(document.storage_key)
+            except Exception:
+                logger.warning(
+                    "Failed to delete expired upload. key=%s", document.storage_key
+                )
+        return True
+
+
+def _validation_error(message: str) -> DocumentError:
+    return DocumentError(
+        code=DocumentErrorCode.VALIDATION_ERROR,
+        message=message,
+        resource=_RESOURCE_DOCUMENT,
+    )
+
+
+def _service_unavailable(message: str, resource: str) -> DocumentError:
+    return UploadDocumentUseCase._service_unavailable(message, resource)
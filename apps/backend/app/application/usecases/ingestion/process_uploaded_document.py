@@ -39,29 +39,40 @@ Responsibilities:
     - Validar configuración de storage y metadata del documento (storage_key/mime).
     - Descargar archivo y extraer texto.
     - Chunking y reemplazo de chunks anteriores.
-    - Generar embeddings batch (solo si hay chunks).
+    - Generar embeddings batch SOLO para chunks nuevos/cambiados: los que
+      coinciden por content_hash reutilizan el embedding ya persistido.
     - Aplicar detección de prompt injection por chunk:
         * agregar metadata al chunk
         * registrar métricas por patrón detectado
     - Persistir chunks y transicionar estado a READY.
     - Capturar errores, truncarlos y transicionar a FAILED.
+    - Modo pipeline (opt-in): extracción por página, embeddings por lote y
+      persistencia por lote solapados con colas acotadas (memoria acotada).
+    - Modo checkpoint (opt-in): cada lote (chunks + embeddings) se compromete
+      junto con el progreso (chunks_done/total); un retry del mismo job
+      reanuda desde el último lote comprometido si la huella de entradas
+      (hash del archivo + chunker + modelo de embeddings) no cambió.
 
 Collaborators:
     - DocumentRepository:
         get_document(document_id, workspace_id)
         transition_document_status(... from_statuses, to_status, error_message)
-        delete_chunks_for_document(document_id, workspace_id)
-        save_chunks(document_id, chunk_entities, workspace_id)
+        delete_chunks_for_document(document_id, workspace_id, keep_chunk_ids)
+        save_chunks(document_id, chunk_entities, workspace_id, checkpoint)
+        save_processing_checkpoint(document_id, checkpoint, workspace_id)
+        find_chunk_embeddings_by_hash(workspace_id, content_hashes)
     - FileStoragePort:
         download_file(storage_key) -> bytes
+        open_stream(storage_key) -> BinaryIO (stream_downloads: memoria acotada)
     - DocumentTextExtractor:
-        extract_text(mime_type, content_bytes) -> str
+        extract_text(mime_type, content) -> str
+        iter_text(mime_type, content) -> Iterator[str] (opcional, pipeline)
     - TextChunkerService:
         chunk(text) -> list[str]
     - EmbeddingService:
         embed_batch(chunks) -> list[list[float]]
-    - prompt_injection_detector.detect:
-        detect(text) -> detection(flags, risk_score, patterns)
+    - prompt_injection_detector.detect_many:
+        detect_many(texts) -> detections(flags, risk_score, patterns)
     - record_prompt_injection_detected(pattern):
         métrica por patrón
 
@@ -72,6 +83,7 @@ Inputs:
     - ProcessUploadedDocumentInput:
         document_id: UUID
         workspace_id: UUID
+        job_id: str | None (owner de la corrida en modo checkpoint)
 
 Outputs:
     - ProcessUploadedDocumentOutput:
@@ -81,7 +93,8 @@ Outputs:
 Status semantics:
     - "MISSING": no se encontró el documento
     - "READY": ya procesado / o procesado exitosamente en esta ejecución
-    - "PROCESSING": ya estaba en proceso (otro worker)
+    - "PROCESSING": ya estaba en proceso (otro worker); en modo checkpoint,
+      si el owner es este mismo job (retry tras timeout/crash) se reanuda
     - "FAILED": falló el pipeline
     - "UNKNOWN": estado inesperado cuando no se pudo transicionar a PROCESSING
 ===============================================================================
@@ -89,13 +102,14 @@ Status semantics:
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from dataclasses import dataclass
-from typing import Final
-from uuid import UUID
+from dataclasses import dataclass, replace
+from typing import BinaryIO, Final, Iterator
+from uuid import UUID, uuid4, uuid5
 
-from ....crosscutting.metrics import record_prompt_injection_detected
-from ....domain.entities import Chunk
+from ....crosscutting.metrics import record_dedup_hit, record_prompt_injection_detected
+from ....domain.entities import Chunk, Document, ProcessingCheckpoint
 from ....domain.repositories import DocumentRepository
 from ....domain.services import (
     DocumentTextExtractor,
@@ -103,7 +117,18 @@ from ....domain.services import (
     FileStoragePort,
     TextChunkerService,
 )
-from ...prompt_injection_detector import detect
+from ...content_hash import compute_file_hash, compute_file_hash_stream
+from ...prompt_injection_detector import detect_many
+from .chunk_embedding_reuse import (
+    ChunkEmbeddings,
+    embed_chunks_with_reuse,
+    embedding_model_id,
+)
+from .processing_pipeline import (
+    iter_chunks_incremental,
+    iter_indexed_batches,
+    run_bounded_pipeline,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -120,6 +145,16 @@ STATUS_FAILED: Final[str] = "FAILED"
 STATUS_MISSING: Final[str] = "MISSING"
 STATUS_UNKNOWN: Final[str] = "UNKNOWN"
 
+# Span que cubre todos los chunk_index de un documento.
+_ALL_CHUNKS_SPAN_END: Final[int] = 2**31 - 1
+
+# Atributos de chunkers que cambian dónde se corta el texto.
+_CHUNKER_CONFIG_ATTRS: Final[tuple[str, ...]] = (
+    "chunk_size",
+    "max_chunk_size",
+    "overlap",
+)
+
 
 @dataclass(frozen=True)
 class ProcessUploadedDocumentInput:
@@ -128,10 +163,12 @@ class ProcessUploadedDocumentInput:
 
     Notas:
       - workspace_id se usa para scoping del documento (seguridad/consistencia).
+      - job_id identifica la corrida (RQ conserva el id entre retries).
     """
 
     document_id: UUID
     workspace_id: UUID
+    job_id: str | None = None
 
 
 @dataclass(frozen=True)
@@ -162,6 +199,30 @@ def _truncate_error(message: str, max_len: int = MAX_ERROR_MESSAGE_LEN) -> str:
     return value[: max_len - 3] + "..."
 
 
+def _processing_fingerprint(
+    content_hash: str, chunker: TextChunkerService, embedding_service: EmbeddingService
+) -> str:
+    """
+    Huella de las entradas de una corrida con checkpoint.
+
+    Mismo archivo + mismo chunker (clase y tamaños) + mismo modelo de
+    embeddings => los lotes comprometidos siguen siendo válidos.
+    """
+    chunker_config = ",".join(
+        f"{name}={value}"
+        for name in _CHUNKER_CONFIG_ATTRS
+        if isinstance(value := getattr(chunker, name, None), (int, str))
+    )
+    model_id = embedding_model_id(embedding_service)
+    raw = f"{content_hash}|{type(chunker).__qualname__}|{chunker_config}|{model_id}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _checkpoint_chunk_id(run_id: UUID, chunk_index: int) -> UUID:
+    """ID determinístico por (corrida, índice): al reanudar se conocen sin leerlos."""
+    return uuid5(run_id, str(chunk_index))
+
+
 class ProcessUploadedDocumentUseCase:
     """
     Use Case (Application Service / Worker Command):
@@ -179,6 +240,12 @@ class ProcessUploadedDocumentUseCase:
         enable_2tier_retrieval: bool = False,
         node_group_size: int = 5,
         node_text_max_chars: int = 2000,
+        node_embedding_strategy: str = "provider",
+        enable_pipeline: bool = False,
+        pipeline_batch_size: int = 64,
+        pipeline_queue_size: int = 2,
+        stream_downloads: bool = False,
+        checkpoint_enabled: bool = False,
     ) -> None:
         self._documents = repository
         self._storage = storage
@@ -188,6 +255,12 @@ class ProcessUploadedDocumentUseCase:
         self._enable_2tier = enable_2tier_retrieval
         self._node_group_size = node_group_size
         self._node_text_max_chars = node_text_max_chars
+        self._node_embedding_strategy = node_embedding_strategy
+        self._enable_pipeline = enable_pipeline
+        self._pipeline_batch_size = pipeline_batch_size
+        self._pipeline_queue_size = pipeline_queue_size
+        self._stream_downloads = stream_downloads
+        self._checkpoint_enabled = checkpoint_enabled
 
     def execute(
         self, input_data: ProcessUploadedDocumentInput
@@ -234,7 +307,15 @@ class ProcessUploadedDocumentUseCase:
         if document.status == STATUS_READY:
             return ProcessUploadedDocumentOutput(status=STATUS_READY, chunks_created=0)
 
-        if document.status == STATUS_PROCESSING:
+        # R: Un retry del mismo job (timeout/crash) ya es dueño del lock.
+        resuming_own_run = (
+            self._checkpoint_enabled
+            and input_data.job_id is not None
+            and document.status == STATUS_PROCESSING
+            and document.processing_owner == input_data.job_id
+        )
+
+        if document.status == STATUS_PROCESSING and not resuming_own_run:
             return ProcessUploadedDocumentOutput(
                 status=STATUS_PROCESSING, chunks_created=0
             )
@@ -243,7 +324,7 @@ class ProcessUploadedDocumentUseCase:
         # 4) Lock lógico: transición a PROCESSING (atómica en repositorio).
         # ---------------------------------------------------------------------
         # from_statuses incluye None para documentos recién creados sin status.
-        transitioned = self._documents.transition_document_status(
+        transitioned = resuming_own_run or self._documents.transition_document_status(
             document_id,
             workspace_id=workspace_id,
             from_statuses=[None, STATUS_PENDING, STATUS_FAILED],
@@ -260,6 +341,7 @@ class ProcessUploadedDocumentUseCase:
 
         # A partir de acá, el documento está "reservado" para este worker.
         chunks_created = 0
+        content: bytes | BinaryIO | None = None
 
         try:
             # -----------------------------------------------------------------
@@ -274,8 +356,61 @@ class ProcessUploadedDocumentUseCase:
             # -----------------------------------------------------------------
             # 6) Descargar archivo y extraer texto.
             # -----------------------------------------------------------------
-            content_bytes = self._storage.download_file(document.storage_key)
-            text = self._extractor.extract_text(document.mime_type, content_bytes)
+            content = self._download(document.storage_key)
+
+            # R: Dedup diferido (uploads presignados llegan sin content_hash).
+            content_hash = document.content_hash or self._hash_content(
+                document.workspace_id, content
+            )
+            duplicate_of = self._claim_content_hash(document, content_hash)
+            if duplicate_of is not None:
+                self._documents.transition_document_status(
+                    document_id,
+                    workspace_id=workspace_id,
+                    from_statuses=[STATUS_PROCESSING],
+                    to_status=STATUS_FAILED,
+                    error_message=f"Duplicate of document {duplicate_of}",
+                )
+                return ProcessUploadedDocumentOutput(
+                    status=STATUS_FAILED, chunks_created=0
+                )
+
+            checkpoint = (
+                self._start_checkpoint(
+                    document,
+                    input_data.job_id,
+                    fingerprint=_processing_fingerprint(
+                        content_hash, self._chunker, self._embeddings
+                    ),
+                )
+                if self._checkpoint_enabled
+                else None
+            )
+
+            if self._enable_pipeline or checkpoint is not None:
+                # R: Extracción, embeddings y persistencia solapados por lote.
+                chunks_created = self._process_pipelined(
+                    document_id=document_id,
+                    workspace_id=workspace_id,
+                    mime_type=document.mime_type,
+                    content=content,
+                    checkpoint=checkpoint,
+                )
+                if checkpoint is None and document.processing_run_id is not None:
+                    # R: Una corrida previa con checkpoint ya no es reanudable.
+                    self._finish_checkpoint(document_id, workspace_id, None)
+                self._documents.transition_document_status(
+                    document_id,
+                    workspace_id=workspace_id,
+                    from_statuses=[STATUS_PROCESSING],
+                    to_status=STATUS_READY,
+                    error_message=None,
+                )
+                return ProcessUploadedDocumentOutput(
+                    status=STATUS_READY, chunks_created=chunks_created
+                )
+
+            text = self._extractor.extract_text(document.mime_type, content)
 
             # -----------------------------------------------------------------
             # 7) Chunking.
@@ -284,27 +419,33 @@ class ProcessUploadedDocumentUseCase:
             chunks_text = self._chunker.chunk(text or "")
 
             # -----------------------------------------------------------------
-            # 8) Reemplazar chunks existentes (re-procesamiento seguro).
+            # 8) Embeddings con reuso por content_hash (solo si hay chunks).
+            # -----------------------------------------------------------------
+            # Importante: ANTES de borrar los chunks previos, para poder reutilizar
+            # los embeddings de los chunks que no cambiaron.
+            embedded = None
+            if chunks_text:
+                embedded = embed_chunks_with_reuse(
+                    repository=self._documents,
+                    embedding_service=self._embeddings,
+                    workspace_id=workspace_id,
+                    chunks_text=chunks_text,
+                )
+
+            # -----------------------------------------------------------------
+            # 9) Reemplazar chunks existentes (re-procesamiento seguro).
             # -----------------------------------------------------------------
             # Motivo: si el documento se reprocesa, no queremos chunks duplicados.
             self._documents.delete_chunks_for_document(
                 document_id, workspace_id=workspace_id
             )
 
-            # -----------------------------------------------------------------
-            # 9) Embeddings + construcción de entidades Chunk (solo si hay chunks).
-            # -----------------------------------------------------------------
-            if chunks_text:
-                embeddings = self._embeddings.embed_batch(chunks_text)
-
-                # Defensa: contrato esperado es 1 embedding por chunk.
-                if len(embeddings) != len(chunks_text):
-                    raise RuntimeError("Embedding batch size mismatch")
-
+            if embedded is not None:
                 chunk_entities = self._build_chunk_entities(
                     document_id=document_id,
                     chunks_text=chunks_text,
-                    embeddings=embeddings,
+                    embeddings=embedded.embeddings,
+                    content_hashes=embedded.content_hashes,
                 )
 
                 self._documents.save_chunks(
@@ -319,6 +460,10 @@ class ProcessUploadedDocumentUseCase:
                     chunk_entities=chunk_entities,
                 )
 
+            if document.processing_run_id is not None:
+                # R: Una corrida previa con checkpoint ya no es reanudable.
+                self._finish_checkpoint(document_id, workspace_id, None)
+
             # -----------------------------------------------------------------
             # 10) Finalizar estado a READY.
             # -----------------------------------------------------------------
@@ -352,6 +497,282 @@ class ProcessUploadedDocumentUseCase:
             )
             return ProcessUploadedDocumentOutput(status=STATUS_FAILED, chunks_created=0)
 
+        finally:
+            # El spool de open_stream puede estar en disco: liberarlo siempre.
+            if content is not None and not isinstance(content, bytes):
+                content.close()
+
+    # =========================================================================
+    # Modo checkpoint: progreso comprometido por lote + reanudación.
+    # =========================================================================
+
+    def _start_checkpoint(
+        self, document: Document, job_id: str | None, *, fingerprint: str
+    ) -> ProcessingCheckpoint:
+        """
+        Retoma la corrida registrada en el documento o inicia una nueva.
+
+        Los chunks de una corrida interrumpida siguen persistidos (índices
+        0..chunks_done-1, IDs determinísticos): no se re-embeben. Solo se
+        retoma si la huella coincide; si el archivo o la configuración de
+        chunking/embeddings cambió, se empieza una corrida nueva (los chunks
+        de la anterior se reemplazan al terminar).
+        """
+        resumable = (
+            document.processing_run_id is not None
+            and document.processing_fingerprint == fingerprint
+        )
+        if document.processing_run_id is not None and not resumable:
+            logger.info(
+                "Process document: stale checkpoint discarded",
+                extra={"document_id": str(document.id)},
+            )
+        if resumable:
+            checkpoint = ProcessingCheckpoint(
+                run_id=document.processing_run_id,
+                chunks_done=document.processing_chunks_done or 0,
+                chunks_total=document.processing_chunks_total,
+                owner=job_id,
+                fingerprint=fingerprint,
+            )
+            logger.info(
+                "Process document: resuming from checkpoint",
+                extra={
+                    "document_id": str(document.id),
+                    "chunks_done": checkpoint.chunks_done,
+                },
+            )
+        else:
+            checkpoint = ProcessingCheckpoint(
+                run_id=uuid4(), chunks_done=0, owner=job_id, fingerprint=fingerprint
+            )
+        self._documents.save_processing_checkpoint(
+            document.id, checkpoint, workspace_id=document.workspace_id
+        )
+        return checkpoint
+
+    def _finish_checkpoint(
+        self, document_id: UUID, workspace_id: UUID, chunks_total: int | None
+    ) -> None:
+        """Cierra la corrida (run_id=None): el progreso final queda visible."""
+        self._documents.save_processing_checkpoint(
+            document_id,
+            ProcessingCheckpoint(
+                run_id=None,
+                chunks_done=chunks_total or 0,
+                chunks_total=chunks_total,
+            ),
+            workspace_id=workspace_id,
+        )
+
+    def _download(self, storage_key: str) -> bytes | BinaryIO:
+        """
+        Archivo a procesar: stream spooleado (memoria acotada) o bytes.
+
+        - stream_downloads: descarga por rangos a un temp file; los parsers
+          (pypdf / python-docx) leen del stream sin una copia completa en RAM.
+        - Si no: download_file() (comportamiento original).
+        """
+        if self._stream_downloads:
+            return self._storage.open_stream(storage_key)
+        return self._storage.download_file(storage_key)
+
+    @staticmethod
+    def _hash_content(workspace_id: UUID, content: bytes | BinaryIO) -> str:
+        """Hash de dedup del archivo (stream: se rebobina para la extracción)."""
+        if isinstance(content, bytes):
+            return compute_file_hash(workspace_id, content)
+        content_hash = compute_file_hash_stream(workspace_id, content)
+        content.seek(0)
+        return content_hash
+
+    def _claim_content_hash(self, document: Document, content_hash: str) -> UUID | None:
+        """
+        Registra el hash de dedup si el documento aún no lo tiene.
+
+        Retorna el id del documento existente si el archivo ya estaba en el
+        workspace (unique index por content_hash); None en caso contrario.
+        """
+        if document.content_hash:
+            return None
+        if self._documents.set_document_content_hash(
+            document.id,
+            workspace_id=document.workspace_id,
+            content_hash=content_hash,
+        ):
+            return None
+        existing = self._documents.get_document_by_content_hash(
+            document.workspace_id, content_hash
+        )
+        logger.info(
+            "Process document: duplicate upload",
+            extra={"document_id": str(document.id), "dedup_hit": True},
+        )
+        record_dedup_hit()
+        return existing.id if existing is not None else None
+
+    # =========================================================================
+    # Modo pipeline: extracción → embeddings → persistencia por lotes.
+    # =========================================================================
+
+    def _iter_text(self, mime_type: str, content: bytes | BinaryIO) -> Iterator[str]:
+        """Texto por partes si el extractor lo soporta; si no, en un solo bloque."""
+        iter_text = getattr(self._extractor, "iter_text", None)
+        if iter_text is not None:
+            yield from iter_text(mime_type, content)
+            return
+        text = self._extractor.extract_text(mime_type, content)
+        if text:
+            yield text
+
+    def _process_pipelined(
+        self,
+        *,
+        document_id: UUID,
+        workspace_id: UUID,
+        mime_type: str,
+        content: bytes | BinaryIO,
+        checkpoint: ProcessingCheckpoint | None = None,
+    ) -> int:
+        """
+        Procesa el documento en lotes solapados y devuelve chunks creados.
+
+        - Los chunks nuevos se insertan con IDs explícitos junto a los previos;
+          al terminar se borran los previos (keep_chunk_ids). Así el reuso por
+          content_hash sigue viendo los embeddings anteriores durante el proceso.
+        - Ante error con lotes ya insertados, se borran los chunks del documento
+          (nuevos y previos) y el error sube al handler de FAILED.
+        - Con checkpoint: IDs derivados de la corrida, progreso guardado con
+          cada lote y, ante error, los lotes comprometidos se conservan para
+          reanudar. Sin pipeline, el texto se chunkea entero antes de embeber
+          para conocer chunks_total (progreso real desde el primer lote).
+        """
+        saved_ids: list[UUID] = []
+        # R: Solo contenido/índice para nodos 2-tier (sin embeddings en memoria).
+        node_chunks: list[Chunk] = []
+
+        resumed_from = checkpoint.chunks_done if checkpoint is not None else 0
+        chunks_total = checkpoint.chunks_total if checkpoint is not None else None
+        chunks_source: Iterator[str]
+        if checkpoint is not None and not self._enable_pipeline:
+            all_chunks = self._chunker.chunk(
+                self._extractor.extract_text(mime_type, content) or ""
+            )
+            chunks_total = len(all_chunks)
+            chunks_source = iter(all_chunks)
+            if resumed_from > chunks_total:
+                # R: Defensa extra (la huella ya cubre archivo/config): un
+                #    checkpoint más largo que el texto actual no es reanudable.
+                checkpoint = replace(checkpoint, run_id=uuid4())
+                resumed_from = 0
+            checkpoint = replace(
+                checkpoint, chunks_done=resumed_from, chunks_total=chunks_total
+            )
+            self._documents.save_processing_checkpoint(
+                document_id, checkpoint, workspace_id=workspace_id
+            )
+        else:
+            chunks_source = iter_chunks_incremental(
+                self._chunker, self._iter_text(mime_type, content)
+            )
+        if checkpoint is not None:
+            saved_ids.extend(
+                _checkpoint_chunk_id(checkpoint.run_id, index)
+                for index in range(resumed_from)
+            )
+
+        def _embed(
+            item: tuple[int, list[str]],
+        ) -> tuple[int, list[str], ChunkEmbeddings]:
+            start_index, chunks_text = item
+            embedded = embed_chunks_with_reuse(
+                repository=self._documents,
+                embedding_service=self._embeddings,
+                workspace_id=workspace_id,
+                chunks_text=chunks_text,
+            )
+            return start_index, chunks_text, embedded
+
+        def _persist(item: tuple[int, list[str], ChunkEmbeddings]) -> None:
+            start_index, chunks_text, embedded = item
+            chunk_entities = self._build_chunk_entities(
+                document_id=document_id,
+                chunks_text=chunks_text,
+                embeddings=embedded.embeddings,
+                content_hashes=embedded.content_hashes,
+                start_index=start_index,
+            )
+            progress: ProcessingCheckpoint | None = None
+            if checkpoint is not None:
+                for chunk in chunk_entities:
+                    chunk.chunk_id = _checkpoint_chunk_id(
+                        checkpoint.run_id, chunk.chunk_index
+                    )
+                progress = replace(
+                    checkpoint,
+                    chunks_done=start_index + len(chunk_entities),
+                    chunks_total=chunks_total,
+                )
+            else:
+                for chunk in chunk_entities:
+                    chunk.chunk_id = uuid4()
+            self._documents.save_chunks(
+                document_id,
+                chunk_entities,
+                workspace_id=workspace_id,
+                checkpoint=progress,
+            )
+            saved_ids.extend(chunk.chunk_id for chunk in chunk_entities)
+            if self._enable_2tier:
+                # R: el embedding solo se retiene si el nodo se deriva de él.
+                keep_embedding = self._node_embedding_strategy != "provider"
+                node_chunks.extend(
+                    Chunk(
+                        content=chunk.content,
+                        embedding=chunk.embedding if keep_embedding else [],
+                        document_id=document_id,
+                        chunk_index=chunk.chunk_index,
+                        chunk_id=chunk.chunk_id,
+                    )
+                    for chunk in chunk_entities
+                )
+
+        source = iter_indexed_batches(
+            chunks_source, self._pipeline_batch_size, skip=resumed_from
+        )
+
+        try:
+            run_bounded_pipeline(
+                source,
+                [_embed, _persist],
+                queue_size=self._pipeline_queue_size,
+            )
+        except Exception:
+            if saved_ids and checkpoint is None:
+                # R: Sin chunks parciales: queda FAILED y sin chunks hasta reprocesar.
+                self._documents.delete_chunks_for_document(
+                    document_id, workspace_id=workspace_id
+                )
+            raise
+
+        self._documents.delete_chunks_for_document(
+            document_id, workspace_id=workspace_id, keep_chunk_ids=saved_ids
+        )
+        if resumed_from and self._enable_2tier:
+            # R: Los lotes de la corrida anterior no están en memoria: se leen
+            # ya borrados los chunks previos (solo quedan los de esta corrida).
+            node_chunks = self._documents.find_chunks_by_node_spans(
+                [(document_id, 0, _ALL_CHUNKS_SPAN_END)], workspace_id=workspace_id
+            )
+        self._maybe_generate_nodes(
+            document_id=document_id,
+            workspace_id=workspace_id,
+            chunk_entities=node_chunks,
+        )
+        if checkpoint is not None:
+            self._finish_checkpoint(document_id, workspace_id, len(saved_ids))
+        return len(saved_ids) - resumed_from
+
     # =========================================================================
     # Helpers privados: separan construcción de chunks y seguridad.
     # =========================================================================
@@ -362,12 +783,13 @@ class ProcessUploadedDocumentUseCase:
         document_id: UUID,
         chunks_text: list[str],
         embeddings: list[list[float]],
+        content_hashes: list[str],
+        start_index: int = 0,
     ) -> list[Chunk]:
         """
         Construye entidades Chunk con metadata de seguridad si se detectan patrones.
 
-        Por cada chunk:
-          - detect(content_text)
+        Detección en lote (detect_many) y, por cada chunk:
           - si hay patterns:
               * adjuntar security_flags, risk_score, detected_patterns
               * registrar métrica por pattern
@@ -378,9 +800,11 @@ class ProcessUploadedDocumentUseCase:
         """
         chunk_entities: list[Chunk] = []
 
-        for index, (content_text, embedding) in enumerate(zip(chunks_text, embeddings)):
-            detection = detect(content_text)
-
+        detections = detect_many(chunks_text)
+        for index, (content_text, embedding, content_hash, detection) in enumerate(
+            zip(chunks_text, embeddings, content_hashes, detections),
+            start=start_index,
+        ):
             chunk_metadata: dict = {}
             if detection.patterns:
                 chunk_metadata = {
@@ -398,6 +822,7 @@ class ProcessUploadedDocumentUseCase:
                     document_id=document_id,
                     chunk_index=index,
                     metadata=chunk_metadata,
+                    content_hash=content_hash,
                 )
             )
 
@@ -433,6 +858,7 @@ class ProcessUploadedDocumentUseCase:
                 embedding_service=self._embeddings,
                 group_size=self._node_group_size,
                 max_chars=self._node_text_max_chars,
+                embedding_strategy=self._node_embedding_strategy,
             )
 
             if nodes:
@@ -0,0 +1,192 @@
+"""
+===============================================================================
+TARJETA CRC — application/usecases/ingestion/processing_pipeline.py
+===============================================================================
+
+Módulo:
+    Pipeline acotado de procesamiento (extracción → embeddings → persistencia)
+
+Responsabilidades:
+    - Chunking incremental sobre texto que llega por partes (páginas).
+    - Agrupar chunks en lotes indexados (offset de chunk_index por lote),
+      opcionalmente salteando un prefijo ya comprometido (reanudación).
+    - Ejecutar etapas solapadas en threads conectados por colas acotadas:
+      la memoria pico queda en O(queue_size * batch_size) chunks.
+    - Propagar el primer error al caller y detener las demás etapas.
+
+Colaboradores:
+    - domain.services.TextChunkerService: chunk(text) -> list[str]
+    - ProcessUploadedDocumentUseCase: define las etapas (embed / persist)
+
+Notas:
+    - Sin dependencias de infraestructura: solo stdlib (threading/queue).
+    - contextvars se copian por thread (request_id/logs del worker).
+===============================================================================
+"""
+
+from __future__ import annotations
+
+import contextvars
+import itertools
+import queue
+import threading
+from typing import Any, Callable, Final, Iterable, Iterator, Sequence
+
+from ....domain.services import TextChunkerService
+
+DEFAULT_BUFFER_CHARS: Final[int] = 16_000
+
+# R: Intervalo de polling para put/get: permite cortar rápido ante errores.
+_POLL_SECONDS: Final[float] = 0.1
+
+_SENTINEL: Final[object] = object()
+
+
+def iter_chunks_incremental(
+    chunker: TextChunkerService,
+    parts: Iterable[str],
+    *,
+    buffer_chars: int = DEFAULT_BUFFER_CHARS,
+) -> Iterator[str]:
+    """
+    Chunkea texto que llega por partes sin materializar el documento entero.
+
+    Estrategia:
+      - Se acumulan partes hasta superar buffer_chars y se chunkea el buffer.
+      - Se emiten todos los chunks menos el último, que se arrastra al buffer
+        siguiente (el corte real puede caer en la próxima parte).
+      - Si el buffer produce un único chunk gigante (> 2x buffer), se emite
+        igual para mantener la memoria acotada.
+    """
+    buffer = ""
+    for part in parts:
+        if not part:
+            continue
+        buffer = f"{buffer}\n\n{part}" if buffer else part
+        if len(buffer) < buffer_chars:
+            continue
+
+        chunks = chunker.chunk(buffer)
+        if len(chunks) > 1:
+            yield from chunks[:-1]
+            buffer = chunks[-1]
+        elif len(buffer) > 2 * buffer_chars:
+            yield from chunks
+            buffer = ""
+
+    if buffer:
+        yield from chunker.chunk(buffer)
+
+
+def iter_indexed_batches(
+    items: Iterable[str], batch_size: int, *, skip: int = 0
+) -> Iterator[tuple[int, list[str]]]:
+    """
+    Agrupa items en lotes de batch_size: (índice del primer item, lote).
+
+    skip: descarta los primeros items (ya comprometidos al reanudar); los
+    índices siguen siendo absolutos.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size debe ser > 0")
+
+    batch: list[str] = []
+    start = skip
+    for item in itertools.islice(items, skip, None):
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield start, batch
+            start += len(batch)
+            batch = []
+    if batch:
+        yield start, batch
+
+
+def run_bounded_pipeline(
+    source: Iterable[Any],
+    stages: Sequence[Callable[[Any], Any]],
+    *,
+    queue_size: int = 2,
+) -> None:
+    """
+    Ejecuta `stages` en cadena, cada una en su thread, alimentadas por `source`.
+
+    - `source` se consume en el thread del caller (p.ej. extracción + chunking).
+    - La salida de cada etapa es la entrada de la siguiente; la de la última
+      se descarta (la última etapa persiste).
+    - Colas acotadas: un productor rápido se bloquea en vez de acumular.
+    - Ante el primer error (source o etapa) se detiene todo y se re-lanza.
+    """
+    if not stages:
+        raise ValueError("stages no puede estar vacío")
+    if queue_size <= 0:
+        raise ValueError("queue_size debe ser > 0")
+
+    stop = threading.Event()
+    errors: list[BaseException] = []
+    queues: list[queue.Queue] = [queue.Queue(maxsize=queue_size) for _ in stages]
+
+    def _put(q: queue.Queue, item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(q: queue.Queue) -> Any:
+        while not stop.is_set():
+            try:
+                return q.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return _SENTINEL
+
+    def _fail(exc: BaseException) -> None:
+        errors.append(exc)
+        stop.set()
+
+    def _worker(index: int, stage: Callable[[Any], Any]) -> None:
+        inbox = queues[index]
+        outbox = queues[index + 1] if index + 1 < len(queues) else None
+        try:
+            while True:
+                item = _get(inbox)
+                if item is _SENTINEL:
+                    break
+                result = stage(item)
+                if outbox is not None and not _put(outbox, result):
+                    return
+        except BaseException as exc:
+            _fail(exc)
+            return
+        if outbox is not None:
+            _put(outbox, _SENTINEL)
+
+    threads = [
+        threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(_worker, index, stage),
+            name=f"ingest-pipeline-{index}",
+            daemon=True,
+        )
+        for index, stage in enumerate(stages)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        for item in source:
+            if not _put(queues[0], item):
+                break
+        else:
+            _put(queues[0], _SENTINEL)
+    except BaseException as exc:
+        _fail(exc)
+    finally:
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
@@ -14,6 +14,7 @@ Business Goal:
       - que el documento tenga archivo asociado (storage_key + mime_type)
       - que no esté actualmente en PROCESSING
       - transición de estado robusta a PENDING
+      - que el reproceso empiece de cero (se descarta el checkpoint reanudable)
       - encolado en la cola de procesamiento (queue)
 
 Why (Context / Intención):
@@ -38,6 +39,7 @@ Responsibilities:
     - Validar que el documento tenga archivo subido (storage_key, mime_type).
     - Evitar reprocesar si está en PROCESSING.
     - Transicionar estado a PENDING (atómico) para habilitar requeue.
+    - Descartar el checkpoint de una corrida anterior (reproceso explícito).
     - Encolar el job en DocumentProcessingQueue.
     - Manejar fallas de encolado:
         * revertir estado a FAILED con mensaje de error estable
@@ -51,8 +53,9 @@ Collaborators:
     - DocumentRepository:
         get_document(document_id, workspace_id)
         transition_document_status(... from_statuses, to_status, error_message)
+        clear_processing_checkpoint(document_id, workspace_id)
     - DocumentProcessingQueue:
-        enqueue_document_processing(document_id, workspace_id)
+        enqueue_document_processing(document_id, workspace_id, priority=REPROCESS)
     - Document results:
         ReprocessDocumentResult / DocumentError / DocumentErrorCode
 ===============================================================================
@@ -65,7 +68,7 @@ from typing import Final
 from uuid import UUID
 
 from ....domain.repositories import DocumentRepository, WorkspaceRepository
-from ....domain.services import DocumentProcessingQueue
+from ....domain.services import DocumentProcessingQueue, ProcessingPriority
 from ....domain.workspace_policy import WorkspaceActor
 from ..documents.document_results import (
     DocumentError,
@@ -196,6 +199,13 @@ class ReprocessDocumentUseCase:
                 error=self._conflict(_MSG_ALREADY_PROCESSING)
             )
 
+        # R: Reproceso explícito => corrida nueva; un checkpoint previo no se
+        #    reanuda aunque la huella coincida.
+        self._documents.clear_processing_checkpoint(
+            input_data.document_id,
+            workspace_id=input_data.workspace_id,
+        )
+
         # ---------------------------------------------------------------------
         # 7) Encolar job. Si falla, dejar estado consistente (FAILED) y retornar error.
         # ---------------------------------------------------------------------
@@ -203,6 +213,7 @@ class ReprocessDocumentUseCase:
             self._queue.enqueue_document_processing(
                 input_data.document_id,
                 workspace_id=input_data.workspace_id,
+                priority=ProcessingPriority.REPROCESS,
             )
         except Exception:
             # Si la cola falló, no queremos dejar el documento en PENDING indefinidamente.
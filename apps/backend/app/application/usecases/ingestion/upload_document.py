@@ -56,7 +56,7 @@ Collaborators:
         update_document_file_metadata(...)
         transition_document_status(...)
     - FileStoragePort:
-        upload_file(storage_key, content, mime_type)
+        upload_file(storage_key, content, mime_type)  # bytes o stream
     - DocumentProcessingQueue:
         enqueue_document_processing(document_id, workspace_id)
     - Domain helpers:
@@ -71,7 +71,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Any, Final
+from typing import Any, BinaryIO, Final
 from uuid import UUID, uuid4
 
 from ....crosscutting.metrics import record_dedup_hit
@@ -81,7 +81,7 @@ from ....domain.repositories import DocumentRepository, WorkspaceRepository
 from ....domain.services import DocumentProcessingQueue, FileStoragePort
 from ....domain.tags import normalize_tags
 from ....domain.workspace_policy import WorkspaceActor
-from ...content_hash import compute_file_hash
+from ...content_hash import compute_file_hash, compute_file_hash_stream
 from ..documents.document_results import (
     DocumentError,
     DocumentErrorCode,
@@ -109,7 +109,9 @@ class UploadDocumentInput:
     DTO de entrada para upload.
 
     Notas:
-      - content contiene el archivo en bytes.
+      - content contiene el archivo en bytes o un stream seekable (p.ej. el
+        SpooledTemporaryFile del upload): en ese caso se hashea y se sube por
+        bloques, sin materializar el archivo en memoria.
       - metadata es opcional y se usa para derivar tags/allowed_roles.
       - uploaded_by_user_id permite rastrear quién realizó el upload (auditoría).
     """
@@ -119,7 +121,7 @@ class UploadDocumentInput:
     title: str
     file_name: str
     mime_type: str
-    content: bytes
+    content: bytes | BinaryIO
     source: str | None = None
     metadata: dict[str, Any] | None = None
     uploaded_by_user_id: UUID | None = None
@@ -170,7 +172,7 @@ class UploadDocumentUseCase:
         # ---------------------------------------------------------------------
         # 1b) Dedup: verificar si el archivo ya existe en el workspace.
         # ---------------------------------------------------------------------
-        content_hash = compute_file_hash(input_data.workspace_id, input_data.content)
+        content_hash = self._hash_content(input_data.workspace_id, input_data.content)
         existing = self._documents.get_document_by_content_hash(
             input_data.workspace_id, content_hash
         )
@@ -305,6 +307,22 @@ class UploadDocumentUseCase:
         safe_name = (file_name or "file").strip()
         return f"documents/{document_id}/{safe_name}"
 
+    @staticmethod
+    def _hash_content(workspace_id: UUID, content: bytes | BinaryIO) -> str:
+        """
+        Hash de dedup del archivo.
+
+        - bytes: hash directo.
+        - stream: primera pasada por bloques y rebobinado, para que el upload
+          posterior lea el archivo completo (memoria O(bloque)).
+        """
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return compute_file_hash(workspace_id, bytes(content))
+        content.seek(0)
+        content_hash = compute_file_hash_stream(workspace_id, content)
+        content.seek(0)
+        return content_hash
+
     @staticmethod
     def _service_unavailable(message: str, resource: str) -> DocumentError:
         """Error SERVICE_UNAVAILABLE consistente para dependencias externas."""
@@ -38,10 +38,14 @@ from .application.rank_fusion import RankFusionService
 from .application.usecases import (
     AnswerQueryUseCase,
     ArchiveWorkspaceUseCase,
+    CompletePresignedUploadUseCase,
+    CreatePresignedUploadUseCase,
     CreateWorkspaceUseCase,
     DeleteDocumentUseCase,
+    GetDocumentProcessingStatusUseCase,
     GetDocumentUseCase,
     GetWorkspaceUseCase,
+    IngestDocumentBatchUseCase,
     IngestDocumentUseCase,
     ListDocumentsUseCase,
     ListWorkspacesUseCase,
@@ -87,9 +91,17 @@ from .domain.services import (
     TextChunkerService,
 )
 from .infrastructure.cache import get_embedding_cache
-from .infrastructure.parsers import SimpleDocumentTextExtractor
+from .infrastructure.events import DocumentStatusBroadcaster, PostgresStatusListener
+from .infrastructure.parsers import ParserOptions, SimpleDocumentTextExtractor
+from .infrastructure.parsers.extraction_cache import (
+    DiskExtractionCacheBackend,
+    ExtractionCache,
+    StorageExtractionCacheBackend,
+)
 from .infrastructure.queue import RQDocumentProcessingQueue, RQQueueConfig
 from .infrastructure.repositories import (
+    CachedWorkspaceAclRepository,
+    CachedWorkspaceRepository,
     InMemoryConversationRepository,
     InMemoryWorkspaceAclRepository,
     InMemoryWorkspaceRepository,
@@ -99,8 +111,10 @@ from .infrastructure.repositories import (
     PostgresDocumentRepository,
     PostgresWorkspaceAclRepository,
     PostgresWorkspaceRepository,
+    WorkspaceAccessCache,
 )
 from .infrastructure.services import (
+    AccessTokenCache,
     CachingEmbeddingService,
     FakeEmbeddingService,
     FakeLLMService,
@@ -136,7 +150,9 @@ def _is_test_env() -> bool:
 @lru_cache(maxsize=1)
 def get_document_repository() -> DocumentRepository:
     """Devuelve el repositorio de documentos (Postgres)."""
-    return PostgresDocumentRepository()
+    return PostgresDocumentRepository(
+        publish_status_events=get_settings().document_status_stream_enabled
+    )
 
 
 @lru_cache(maxsize=1)
@@ -148,20 +164,34 @@ def get_conversation_repository() -> ConversationRepository:
     )
 
 
+@lru_cache(maxsize=1)
+def get_workspace_access_cache() -> WorkspaceAccessCache:
+    """Cache compartido de workspace/ACL (request-scoped + LRU con TTL)."""
+    settings = get_settings()
+    return WorkspaceAccessCache(
+        ttl_seconds=settings.workspace_cache_ttl_seconds,
+        max_entries=settings.workspace_cache_max_entries,
+    )
+
+
 @lru_cache(maxsize=1)
 def get_workspace_repository() -> WorkspaceRepository:
-    """Repositorio de workspaces (in-memory en test; Postgres en runtime)."""
+    """Repositorio de workspaces (in-memory en test; Postgres cacheado en runtime)."""
     if _is_test_env():
         return InMemoryWorkspaceRepository()
-    return PostgresWorkspaceRepository()
+    return CachedWorkspaceRepository(
+        PostgresWorkspaceRepository(), get_workspace_access_cache()
+    )
 
 
 @lru_cache(maxsize=1)
 def get_workspace_acl_repository() -> WorkspaceAclRepository:
-    """Repositorio de ACL de workspace (in-memory en test; Postgres en runtime)."""
+    """Repositorio de ACL (in-memory en test; Postgres cacheado en runtime)."""
     if _is_test_env():
         return InMemoryWorkspaceAclRepository()
-    return PostgresWorkspaceAclRepository()
+    return CachedWorkspaceAclRepository(
+        PostgresWorkspaceAclRepository(), get_workspace_access_cache()
+    )
 
 
 @lru_cache(maxsize=1)
@@ -186,11 +216,14 @@ def get_embedding_service() -> EmbeddingService:
     if settings.fake_embeddings:
         provider = FakeEmbeddingService()
     else:
-        provider = GoogleEmbeddingService()
+        provider = GoogleEmbeddingService(
+            max_concurrency=settings.embedding_max_concurrency
+        )
 
     return CachingEmbeddingService(
         provider=provider,
         cache=get_embedding_cache(),
+        max_concurrency=settings.embedding_max_concurrency,
     )
 
 
@@ -272,6 +305,9 @@ def get_file_storage() -> FileStoragePort | None:
         secret_key=settings.s3_secret_key,
         region=settings.s3_region or None,
         endpoint_url=settings.s3_endpoint_url or None,
+        multipart_chunk_bytes=settings.s3_multipart_chunk_mb * 1024 * 1024,
+        multipart_max_concurrency=settings.s3_multipart_max_concurrency,
+        download_spool_bytes=settings.s3_download_spool_mb * 1024 * 1024,
     )
     return S3FileStorageAdapter(config)
 
@@ -279,7 +315,57 @@ def get_file_storage() -> FileStoragePort | None:
 @lru_cache(maxsize=1)
 def get_document_text_extractor() -> DocumentTextExtractor:
     """Extractor de texto (PDF/DOCX/TXT) por strategies internas."""
-    return SimpleDocumentTextExtractor()
+    settings = get_settings()
+    options = ParserOptions(
+        pdf_parallel_workers=settings.pdf_parallel_workers,
+        pdf_parallel_min_pages=settings.pdf_parallel_min_pages,
+    )
+    return SimpleDocumentTextExtractor(
+        options=options, cache=_build_extraction_cache(options)
+    )
+
+
+def _build_extraction_cache(options: ParserOptions) -> ExtractionCache | None:
+    """Cache de texto extraído según EXTRACTION_CACHE_BACKEND (None si off)."""
+    settings = get_settings()
+    backend = settings.extraction_cache_backend
+    if backend == "disk":
+        return ExtractionCache(
+            DiskExtractionCacheBackend(
+                settings.extraction_cache_dir,
+                max_bytes=settings.extraction_cache_max_mb * 1024 * 1024,
+            ),
+            options=options,
+        )
+    if backend == "storage":
+        storage = get_file_storage()
+        if storage is None:
+            return None
+        return ExtractionCache(
+            StorageExtractionCacheBackend(
+                storage, prefix=settings.extraction_cache_prefix
+            ),
+            options=options,
+        )
+    return None
+
+
+@lru_cache(maxsize=1)
+def get_document_status_broadcaster() -> DocumentStatusBroadcaster | None:
+    """
+    Hub de eventos de status (un LISTEN por proceso, fan-out a clientes SSE).
+
+    None si el stream está deshabilitado.
+    """
+    settings = get_settings()
+    if not settings.document_status_stream_enabled:
+        return None
+    return DocumentStatusBroadcaster(
+        lambda on_payload, on_gap: PostgresStatusListener(
+            settings.database_url, on_payload, on_gap
+        ),
+        replay_size=settings.document_status_stream_replay_size,
+    )
 
 
 @lru_cache(maxsize=1)
@@ -352,6 +438,22 @@ def get_ingest_document_use_case() -> IngestDocumentUseCase:
         enable_2tier_retrieval=settings.enable_2tier_retrieval,
         node_group_size=settings.node_group_size,
         node_text_max_chars=settings.node_text_max_chars,
+        node_embedding_strategy=settings.node_embedding_strategy,
+    )
+
+
+def get_ingest_document_batch_use_case() -> IngestDocumentBatchUseCase:
+    """Caso de uso: ingesta batch de textos (embeddings cross-document)."""
+    settings = get_settings()
+    return IngestDocumentBatchUseCase(
+        repository=get_document_repository(),
+        workspace_repository=get_workspace_repository(),
+        embedding_service=get_embedding_service(),
+        chunker=get_text_chunker(),
+        enable_2tier_retrieval=settings.enable_2tier_retrieval,
+        node_group_size=settings.node_group_size,
+        node_text_max_chars=settings.node_text_max_chars,
+        node_embedding_strategy=settings.node_embedding_strategy,
     )
 
 
@@ -402,6 +504,15 @@ def get_get_document_use_case() -> GetDocumentUseCase:
     )
 
 
+def get_get_document_processing_status_use_case() -> GetDocumentProcessingStatusUseCase:
+    """Caso de uso: estado de procesamiento (progreso) de un documento."""
+    return GetDocumentProcessingStatusUseCase(
+        document_repository=get_document_repository(),
+        workspace_repository=get_workspace_repository(),
+        acl_repository=get_workspace_acl_repository(),
+    )
+
+
 def get_get_workspace_use_case() -> GetWorkspaceUseCase:
     """Caso de uso: obtener workspace."""
     return GetWorkspaceUseCase(
@@ -428,6 +539,30 @@ def get_upload_document_use_case() -> UploadDocumentUseCase:
     )
 
 
+def get_create_presigned_upload_use_case() -> CreatePresignedUploadUseCase:
+    """Caso de uso: iniciar upload directo a storage (URL PUT presignada)."""
+    settings = get_settings()
+    return CreatePresignedUploadUseCase(
+        repository=get_document_repository(),
+        workspace_repository=get_workspace_repository(),
+        storage=get_file_storage(),
+        queue=get_document_queue(),
+        max_upload_bytes=settings.max_upload_bytes,
+        expires_in_seconds=settings.presigned_upload_expires_seconds,
+    )
+
+
+def get_complete_presigned_upload_use_case() -> CompletePresignedUploadUseCase:
+    """Caso de uso: confirmar upload directo (HEAD + enqueue)."""
+    return CompletePresignedUploadUseCase(
+        repository=get_document_repository(),
+        workspace_repository=get_workspace_repository(),
+        storage=get_file_storage(),
+        queue=get_document_queue(),
+        max_upload_bytes=get_settings().max_upload_bytes,
+    )
+
+
 def get_reprocess_document_use_case() -> ReprocessDocumentUseCase:
     """Caso de uso: reprocesar documento (enqueue)."""
     return ReprocessDocumentUseCase(
@@ -552,6 +687,52 @@ def get_handle_oauth_callback_use_case() -> HandleOAuthCallbackUseCase:
     )
 
 
+@lru_cache(maxsize=1)
+def get_drive_http_client():
+    """Pool HTTP de Drive compartido por proceso (HTTP/2 + keep-alive, sin token)."""
+    from app.infrastructure.services.google_drive_client import build_http_client
+
+    settings = get_settings()
+    return build_http_client(
+        http2=settings.connector_http2_enabled,
+        max_connections=settings.connector_http_max_connections,
+        max_keepalive_connections=settings.connector_http_max_keepalive,
+        keepalive_expiry_s=settings.connector_http_keepalive_expiry_s,
+        timeout_s=settings.connector_http_timeout_s,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_connector_token_cache() -> AccessTokenCache | None:
+    """
+    Cache de access_tokens de conectores (por cuenta).
+
+    - off => None (refresh en cada sync).
+    - redis => compartido entre workers (tokens cifrados); sin REDIS_URL
+      se degrada a memoria.
+    """
+    settings = get_settings()
+    backend = settings.connector_token_cache_backend
+    if backend == "off":
+        return None
+
+    redis_client = None
+    encryption = None
+    if backend == "redis" and settings.redis_url.strip():
+        redis_client = Redis.from_url(
+            settings.redis_url,
+            socket_connect_timeout=2,
+            socket_timeout=5,
+            decode_responses=True,
+        )
+        encryption = get_token_encryption()
+    return AccessTokenCache(
+        margin_seconds=settings.connector_token_cache_margin_seconds,
+        redis_client=redis_client,
+        encryption=encryption,
+    )
+
+
 def get_sync_connector_source_use_case() -> SyncConnectorSourceUseCase:
     """Caso de uso: sincronizar fuente de conector (Google Drive)."""
     settings = get_settings()
@@ -566,6 +747,8 @@ def get_sync_connector_source_use_case() -> SyncConnectorSourceUseCase:
             retry_base_delay_s=settings.connector_retry_base_delay_s,
             retry_max_delay_s=settings.connector_retry_max_delay_s,
             timeout_s=settings.connector_http_timeout_s,
+            max_concurrency=settings.connector_sync_concurrency,
+            http_client=get_drive_http_client(),
         )
 
     return SyncConnectorSourceUseCase(
@@ -575,4 +758,6 @@ def get_sync_connector_source_use_case() -> SyncConnectorSourceUseCase:
         encryption=get_token_encryption(),
         oauth_port=get_oauth_port(),
         drive_client_factory=_drive_factory,
+        max_concurrency=settings.connector_sync_concurrency,
+        token_cache=get_connector_token_cache(),
     )
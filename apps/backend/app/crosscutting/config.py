@@ -86,6 +86,8 @@ class Settings(BaseSettings):
     # -------------------------------------------------------------------------
     max_body_bytes: int = 10 * 1024 * 1024  # 10MB
     max_upload_bytes: int = 25 * 1024 * 1024  # 25MB
+    upload_streaming_enabled: bool = True  # hash + upload por bloques (sin buffer)
+    presigned_upload_expires_seconds: int = 900  # vigencia de la URL PUT directa
 
     # -------------------------------------------------------------------------
     # Límites de API
@@ -102,6 +104,21 @@ class Settings(BaseSettings):
     chunk_size: int = 900
     chunk_overlap: int = 120
 
+    # -------------------------------------------------------------------------
+    # Pipeline de procesamiento (extracción → embeddings → persistencia)
+    # -------------------------------------------------------------------------
+    ingest_pipeline_enabled: bool = False
+    ingest_pipeline_batch_size: int = 64
+    ingest_pipeline_queue_size: int = 2
+    ingest_checkpoint_enabled: bool = False  # lotes comprometidos + reanudación
+    worker_stream_downloads_enabled: bool = True  # descarga spooleada (open_stream)
+    pdf_parallel_workers: int = 0  # procesos para extraer páginas de PDF (0 = serial)
+    pdf_parallel_min_pages: int = 64  # PDFs más chicos se extraen en serie
+    extraction_cache_backend: str = "off"  # off | disk | storage
+    extraction_cache_dir: str = "/tmp/rag-extraction-cache"
+    extraction_cache_max_mb: int = 512  # cota del backend disk
+    extraction_cache_prefix: str = "extraction-cache"  # prefijo en el bucket
+
     # -------------------------------------------------------------------------
     # Redis (cola/cache)
     # -------------------------------------------------------------------------
@@ -127,6 +144,11 @@ class Settings(BaseSettings):
     jwt_cookie_name: str = "access_token"
     jwt_cookie_secure: bool = False
 
+    # Cache de auth (hot path): desactivación visible en <= TTL entre réplicas
+    auth_user_cache_ttl_seconds: float = 30.0  # 0 = sin cache de usuarios
+    auth_user_cache_max_entries: int = 4096
+    auth_token_cache_max_entries: int = 4096  # 0 = sin cache de tokens
+
     # -------------------------------------------------------------------------
     # Google OAuth (Connector)
     # -------------------------------------------------------------------------
@@ -143,6 +165,15 @@ class Settings(BaseSettings):
     connector_retry_base_delay_s: float = 1.0
     connector_retry_max_delay_s: float = 30.0
     connector_http_timeout_s: float = 60.0
+    connector_sync_concurrency: int = 4  # archivos descargados en paralelo por sync
+    # Pool HTTP compartido por proceso (todas las syncs de Drive)
+    connector_http2_enabled: bool = True  # requiere httpx[http2]; si no, HTTP/1.1
+    connector_http_max_connections: int = 10  # Drive = un host => tope por host
+    connector_http_max_keepalive: int = 10
+    connector_http_keepalive_expiry_s: float = 60.0
+    # Cache de access_tokens por cuenta: off | memory | redis (compartido, cifrado)
+    connector_token_cache_backend: str = "memory"
+    connector_token_cache_margin_seconds: float = 300.0  # vence antes que el token
 
     # -------------------------------------------------------------------------
     # S3/MinIO
@@ -152,6 +183,9 @@ class Settings(BaseSettings):
     s3_access_key: str = ""
     s3_secret_key: str = ""
     s3_region: str = ""
+    s3_multipart_chunk_mb: int = 8  # tamaño de parte (y umbral) del multipart
+    s3_multipart_max_concurrency: int = 2  # partes en vuelo por upload
+    s3_download_spool_mb: int = 8  # open_stream: en memoria hasta N MB, luego disco
 
     # -------------------------------------------------------------------------
     # Database pool
@@ -191,6 +225,31 @@ class Settings(BaseSettings):
     node_group_size: int = 5
     node_text_max_chars: int = 2000
     node_top_k: int = 10
+    # provider = re-embeber node_text; mean | length_weighted = centroide de
+    # los embeddings de los chunks (sin llamadas extra al proveedor)
+    node_embedding_strategy: str = "provider"
+
+    # -------------------------------------------------------------------------
+    # Streaming SSE (agrupamiento de tokens)
+    # -------------------------------------------------------------------------
+    sse_flush_interval_ms: int = 30  # 0 = un frame por token
+    sse_flush_max_chars: int = 256
+    sse_disconnect_check_interval_ms: int = 250
+
+    # -------------------------------------------------------------------------
+    # Stream SSE de status de documentos (Postgres LISTEN/NOTIFY)
+    # -------------------------------------------------------------------------
+    document_status_stream_enabled: bool = False  # NOTIFY + endpoint /events
+    document_status_stream_batch_ms: int = 250  # ventana de agrupamiento
+    document_status_stream_max_batch: int = 200  # eventos por frame SSE
+    document_status_stream_heartbeat_seconds: int = 15
+    document_status_stream_replay_size: int = 1000  # buffer para Last-Event-ID
+
+    # -------------------------------------------------------------------------
+    # Cache de workspace/ACL (resolución de acceso)
+    # -------------------------------------------------------------------------
+    workspace_cache_ttl_seconds: float = 5.0  # 0 = sólo cache por request
+    workspace_cache_max_entries: int = 1024
 
     # -------------------------------------------------------------------------
     # Retrys (resiliencia)
@@ -199,6 +258,22 @@ class Settings(BaseSettings):
     retry_base_delay_seconds: float = 1.0
     retry_max_delay_seconds: float = 30.0
 
+    # -------------------------------------------------------------------------
+    # Embeddings (concurrencia hacia el provider)
+    # -------------------------------------------------------------------------
+    embedding_max_concurrency: int = 4  # lotes en vuelo; se reduce ante 429
+
+    # -------------------------------------------------------------------------
+    # Cola de documentos (carriles de prioridad + fairness por workspace)
+    # -------------------------------------------------------------------------
+    queue_lane_weight_interactive: int = 6  # uploads de usuarios
+    queue_lane_weight_reprocess: int = 3
+    queue_lane_weight_connector: int = 1  # bulk import de conectores
+    worker_workspace_max_concurrency: int = (
+        0  # jobs en vuelo por workspace; 0 = sin tope
+    )
+    worker_workspace_defer_seconds: float = 2.0  # demora del re-agendado (RQ scheduler)
+
     # -------------------------------------------------------------------------
     # Seed de dev
     # -------------------------------------------------------------------------
@@ -238,6 +313,84 @@ class Settings(BaseSettings):
             raise ValueError("chunk_overlap debe ser >= 0")
         return v
 
+    @field_validator("embedding_max_concurrency")
+    @classmethod
+    def _validate_embedding_max_concurrency(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("embedding_max_concurrency debe ser > 0")
+        return v
+
+    @field_validator(
+        "s3_multipart_chunk_mb", "s3_multipart_max_concurrency", "s3_download_spool_mb"
+    )
+    @classmethod
+    def _validate_s3_multipart(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("s3_multipart_* / s3_download_spool_mb debe ser > 0")
+        return v
+
+    @field_validator("connector_sync_concurrency")
+    @classmethod
+    def _validate_connector_sync_concurrency(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("connector_sync_concurrency debe ser > 0")
+        return v
+
+    @field_validator("connector_token_cache_backend")
+    @classmethod
+    def _validate_connector_token_cache_backend(cls, v: str) -> str:
+        value = (v or "off").strip().lower()
+        if value not in {"off", "memory", "redis"}:
+            raise ValueError(
+                "connector_token_cache_backend debe ser off | memory | redis"
+            )
+        return value
+
+    @field_validator("connector_token_cache_margin_seconds")
+    @classmethod
+    def _validate_connector_token_cache_margin(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("connector_token_cache_margin_seconds debe ser >= 0")
+        return v
+
+    @field_validator(
+        "connector_http_max_connections",
+        "connector_http_max_keepalive",
+        "connector_http_keepalive_expiry_s",
+    )
+    @classmethod
+    def _validate_connector_http_pool(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("connector_http_* debe ser > 0")
+        return v
+
+    @field_validator(
+        "queue_lane_weight_interactive",
+        "queue_lane_weight_reprocess",
+        "queue_lane_weight_connector",
+    )
+    @classmethod
+    def _validate_queue_lane_weights(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("queue_lane_weight_* debe ser > 0")
+        return v
+
+    @field_validator(
+        "worker_workspace_max_concurrency", "worker_workspace_defer_seconds"
+    )
+    @classmethod
+    def _validate_worker_workspace_fairness(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("worker_workspace_* no puede ser negativo")
+        return v
+
+    @field_validator("ingest_pipeline_batch_size", "ingest_pipeline_queue_size")
+    @classmethod
+    def _validate_ingest_pipeline_sizes(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("ingest_pipeline_* debe ser > 0")
+        return v
+
     @field_validator("max_body_bytes", "max_upload_bytes")
     @classmethod
     def _validate_sizes(cls, v: int) -> int:
@@ -248,6 +401,38 @@ class Settings(BaseSettings):
             raise ValueError("tamaño máximo demasiado alto (revisar configuración)")
         return v
 
+    @field_validator("extraction_cache_backend")
+    @classmethod
+    def _validate_extraction_cache_backend(cls, v: str) -> str:
+        value = (v or "off").strip().lower()
+        if value not in {"off", "disk", "storage"}:
+            raise ValueError("extraction_cache_backend debe ser off | disk | storage")
+        return value
+
+    @field_validator("extraction_cache_max_mb")
+    @classmethod
+    def _validate_extraction_cache_max_mb(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("extraction_cache_max_mb debe ser > 0")
+        return v
+
+    @field_validator("pdf_parallel_workers", "pdf_parallel_min_pages")
+    @classmethod
+    def _validate_pdf_parallel(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("pdf_parallel_* debe ser >= 0")
+        return v
+
+    @field_validator("presigned_upload_expires_seconds")
+    @classmethod
+    def _validate_presigned_upload_expiry(cls, v: int) -> int:
+        # S3 SigV4 no acepta URLs presignadas de más de 7 días.
+        if not 0 < v <= 7 * 24 * 3600:
+            raise ValueError(
+                "presigned_upload_expires_seconds debe estar en (0, 604800]"
+            )
+        return v
+
     @field_validator("rate_limit_rps")
     @classmethod
     def _validate_rps(cls, v: float) -> float:
@@ -325,6 +510,16 @@ class Settings(BaseSettings):
             raise ValueError("node_group_size debe ser > 0")
         return v
 
+    @field_validator("node_embedding_strategy")
+    @classmethod
+    def _validate_node_embedding_strategy(cls, v: str) -> str:
+        value = (v or "provider").strip().lower()
+        if value not in {"provider", "mean", "length_weighted"}:
+            raise ValueError(
+                "node_embedding_strategy debe ser provider | mean | length_weighted"
+            )
+        return value
+
     @field_validator("node_text_max_chars")
     @classmethod
     def _validate_node_text_max_chars(cls, v: int) -> int:
@@ -339,6 +534,63 @@ class Settings(BaseSettings):
             raise ValueError("node_top_k debe ser > 0")
         return v
 
+    @field_validator("sse_flush_interval_ms", "sse_disconnect_check_interval_ms")
+    @classmethod
+    def _validate_sse_intervals(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("los intervalos SSE deben ser >= 0")
+        return v
+
+    @field_validator(
+        "document_status_stream_max_batch",
+        "document_status_stream_heartbeat_seconds",
+        "document_status_stream_replay_size",
+    )
+    @classmethod
+    def _validate_status_stream_sizes(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("document_status_stream_* debe ser > 0")
+        return v
+
+    @field_validator("document_status_stream_batch_ms")
+    @classmethod
+    def _validate_status_stream_batch(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("document_status_stream_batch_ms debe ser >= 0")
+        return v
+
+    @field_validator("sse_flush_max_chars")
+    @classmethod
+    def _validate_sse_flush_max_chars(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("sse_flush_max_chars debe ser > 0")
+        return v
+
+    @field_validator(
+        "auth_user_cache_ttl_seconds",
+        "auth_user_cache_max_entries",
+        "auth_token_cache_max_entries",
+    )
+    @classmethod
+    def _validate_auth_cache(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("los parámetros de cache de auth deben ser >= 0")
+        return v
+
+    @field_validator("workspace_cache_ttl_seconds")
+    @classmethod
+    def _validate_workspace_cache_ttl(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("workspace_cache_ttl_seconds debe ser >= 0")
+        return v
+
+    @field_validator("workspace_cache_max_entries")
+    @classmethod
+    def _validate_workspace_cache_max_entries(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("workspace_cache_max_entries debe ser > 0")
+        return v
+
     # -------------------------------------------------------------------------
     # Validaciones cruzadas (modelo)
     # -------------------------------------------------------------------------
@@ -25,13 +25,16 @@ Decisiones de diseño (Senior):
       TODO funciona igual (no-op). Esto mantiene el backend portable.
     - Registro único global: Prometheus requiere singletons.
     - Normalización de paths: evita explosión de cardinalidad.
+    - Modo multiproceso: si `PROMETHEUS_MULTIPROC_DIR` está definido (worker
+      con varios procesos), /metrics agrega los archivos de todos los hijos.
 ===============================================================================
 """
 
 from __future__ import annotations
 
+import os
 import re
-from typing import Optional
+from typing import Callable, Optional
 
 # -----------------------------------------------------------------------------
 # Dependencia opcional (prometheus_client)
@@ -70,6 +73,12 @@ _llm_latency: Optional["Histogram"] = None
 _embedding_cache_hits: Optional["Counter"] = None
 _embedding_cache_misses: Optional["Counter"] = None
 
+_workspace_cache_hits: Optional["Counter"] = None
+_workspace_cache_misses: Optional["Counter"] = None
+
+# Reuso de embeddings por chunk (content_hash)
+_chunk_embeddings_total: Optional["Counter"] = None
+
 _worker_processed_total: Optional["Counter"] = None
 _worker_failed_total: Optional["Counter"] = None
 _worker_duration: Optional["Histogram"] = None
@@ -84,6 +93,9 @@ _sources_returned_count: Optional["Histogram"] = None
 # Dedup
 _dedup_hit_total: Optional["Counter"] = None
 
+# Cache de extracción de texto
+_extraction_cache_total: Optional["Counter"] = None
+
 # Hybrid retrieval
 _hybrid_retrieval_total: Optional["Counter"] = None
 
@@ -107,16 +119,27 @@ _connector_api_retries_total: Optional["Counter"] = None
 _connector_api_failures_total: Optional["Counter"] = None
 _connector_sync_locked_total: Optional["Counter"] = None
 
+# Connector HTTP (pool compartido: reuso de conexiones + latencia por endpoint)
+_connector_http_requests_total: Optional["Counter"] = None
+_connector_http_duration: Optional["Histogram"] = None
+_connector_token_cache_total: Optional["Counter"] = None
+
+# Backlog por carril de la cola de documentos (muestreado en cada scrape)
+_queue_lane_sampler: Optional[Callable[[], list[tuple[str, int, float]]]] = None
+
 
 def _init_metrics() -> None:
     """Inicializa métricas (una sola vez)."""
     global _requests_total, _request_latency
     global _embed_latency, _retrieve_latency, _llm_latency
     global _embedding_cache_hits, _embedding_cache_misses
+    global _workspace_cache_hits, _workspace_cache_misses
+    global _chunk_embeddings_total
     global _worker_processed_total, _worker_failed_total, _worker_duration
     global _policy_refusal_total, _prompt_injection_detected_total
     global _cross_scope_block_total, _answer_without_sources_total
     global _sources_returned_count, _dedup_hit_total, _hybrid_retrieval_total
+    global _extraction_cache_total
     global _db_query_duration
     global _dense_latency, _sparse_latency, _fusion_latency
     global _rerank_latency, _retrieval_fallback_total
@@ -124,6 +147,8 @@ def _init_metrics() -> None:
     global _connector_files_skipped_unchanged_total
     global _connector_api_retries_total, _connector_api_failures_total
     global _connector_sync_locked_total
+    global _connector_http_requests_total, _connector_http_duration
+    global _connector_token_cache_total
 
     if not _prometheus_available or _requests_total is not None:
         return
@@ -187,6 +212,30 @@ def _init_metrics() -> None:
         registry=_registry,
     )
 
+    # ------------------------
+    # Cache workspace/ACL
+    # ------------------------
+    _workspace_cache_hits = Counter(
+        "rag_workspace_cache_hit_total",
+        "Hits del cache de workspace/ACL",
+        ["kind"],
+        registry=_registry,
+    )
+
+    _workspace_cache_misses = Counter(
+        "rag_workspace_cache_miss_total",
+        "Misses del cache de workspace/ACL",
+        ["kind"],
+        registry=_registry,
+    )
+
+    _chunk_embeddings_total = Counter(
+        "rag_chunk_embeddings_total",
+        "Embeddings de chunks en ingesta (reused=por content_hash, computed=provider)",
+        ["source"],
+        registry=_registry,
+    )
+
     # ------------------------
     # Worker
     # ------------------------
@@ -255,6 +304,16 @@ def _init_metrics() -> None:
         registry=_registry,
     )
 
+    # ------------------------
+    # Cache de extracción de texto
+    # ------------------------
+    _extraction_cache_total = Counter(
+        "rag_extraction_cache_total",
+        "Lookups del cache de texto extraído (por hash del archivo)",
+        ["result"],
+        registry=_registry,
+    )
+
     # ------------------------
     # Hybrid retrieval
     # ------------------------
@@ -354,9 +413,63 @@ def _init_metrics() -> None:
         registry=_registry,
     )
 
+    _connector_http_requests_total = Counter(
+        "rag_connector_http_requests_total",
+        "Requests HTTP a proveedores de conectores (connection=new|reused)",
+        ["provider", "endpoint", "connection"],
+        registry=_registry,
+    )
+
+    _connector_http_duration = Histogram(
+        "rag_connector_http_request_duration_seconds",
+        "Latencia de requests HTTP a proveedores de conectores (segundos)",
+        ["provider", "endpoint"],
+        buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+        registry=_registry,
+    )
+
+    _connector_token_cache_total = Counter(
+        "rag_connector_token_cache_total",
+        "Lookups del cache de access_tokens de conectores",
+        ["result"],
+        registry=_registry,
+    )
+
+
+class _QueueLaneCollector:
+    """Collector custom: rag_queue_depth / rag_queue_oldest_job_age_seconds por carril."""
+
+    def collect(self):
+        sampler = _queue_lane_sampler
+        if sampler is None:
+            return
+        try:
+            samples = sampler()
+        except Exception:
+            # Best-effort: un scrape nunca debe fallar por Redis.
+            return
+
+        from prometheus_client.core import GaugeMetricFamily  # type: ignore
+
+        depth = GaugeMetricFamily(
+            "rag_queue_depth", "Jobs esperando por carril de la cola", labels=["lane"]
+        )
+        age = GaugeMetricFamily(
+            "rag_queue_oldest_job_age_seconds",
+            "Antigüedad del job más viejo por carril (segundos)",
+            labels=["lane"],
+        )
+        for lane, lane_depth, oldest_age in samples:
+            depth.add_metric([lane], lane_depth)
+            age.add_metric([lane], oldest_age)
+        yield depth
+        yield age
+
 
 # Inicialización al importar el módulo
 _init_metrics()
+if _prometheus_available:
+    _registry.register(_QueueLaneCollector())
 
 
 # -----------------------------------------------------------------------------
@@ -429,6 +542,33 @@ def record_embedding_cache_miss(count: int = 1, kind: str = "query") -> None:
         _embedding_cache_misses.labels(kind=kind).inc(count)
 
 
+def record_workspace_cache_hit(count: int = 1, kind: str = "workspace") -> None:
+    """Incrementa hits del cache de workspace/ACL."""
+    if not _prometheus_available:
+        return
+    if _workspace_cache_hits:
+        _workspace_cache_hits.labels(kind=kind).inc(count)
+
+
+def record_workspace_cache_miss(count: int = 1, kind: str = "workspace") -> None:
+    """Incrementa misses del cache de workspace/ACL."""
+    if not _prometheus_available:
+        return
+    if _workspace_cache_misses:
+        _workspace_cache_misses.labels(kind=kind).inc(count)
+
+
+def record_chunk_embeddings(*, reused: int = 0, computed: int = 0) -> None:
+    """Cuenta embeddings de chunks reutilizados vs calculados por el provider."""
+    if not _prometheus_available:
+        return
+    if _chunk_embeddings_total:
+        if reused:
+            _chunk_embeddings_total.labels(source="reused").inc(reused)
+        if computed:
+            _chunk_embeddings_total.labels(source="computed").inc(computed)
+
+
 def observe_db_query_duration(kind: str, seconds: float) -> None:
     """Observa duración de una query DB.
 
@@ -514,6 +654,14 @@ def record_dedup_hit(count: int = 1) -> None:
         _dedup_hit_total.inc(count)
 
 
+def record_extraction_cache(result: str) -> None:
+    """Cuenta lookups del cache de extracción (result: "hit" | "miss")."""
+    if not _prometheus_available:
+        return
+    if _extraction_cache_total:
+        _extraction_cache_total.labels(result=result).inc()
+
+
 def record_hybrid_retrieval(endpoint: str) -> None:
     """Cuenta requests que usaron hybrid retrieval (dense+sparse+RRF).
 
@@ -618,6 +766,32 @@ def record_connector_sync_locked(count: int = 1) -> None:
         _connector_sync_locked_total.inc(count)
 
 
+def record_connector_token_cache(result: str) -> None:
+    """Cuenta lookups de access_token (result: "hit" | "shared_hit" | "refresh")."""
+    if not _prometheus_available:
+        return
+    if _connector_token_cache_total:
+        _connector_token_cache_total.labels(result=result).inc()
+
+
+def observe_connector_http_request(
+    provider: str, endpoint: str, seconds: float, *, reused_connection: bool
+) -> None:
+    """Registra latencia y reuso de conexión de un request a un proveedor."""
+    if not _prometheus_available:
+        return
+    if _connector_http_requests_total:
+        _connector_http_requests_total.labels(
+            provider=provider,
+            endpoint=endpoint,
+            connection="reused" if reused_connection else "new",
+        ).inc()
+    if _connector_http_duration:
+        _connector_http_duration.labels(provider=provider, endpoint=endpoint).observe(
+            seconds
+        )
+
+
 # -----------------------------------------------------------------------------
 # Helpers internos
 # -----------------------------------------------------------------------------
@@ -658,13 +832,48 @@ def _status_bucket(code: int) -> str:
 # -----------------------------------------------------------------------------
 
 
+_MULTIPROC_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def _multiprocess_dir() -> str:
+    return os.getenv(_MULTIPROC_ENV, "").strip()
+
+
 def get_metrics_response() -> tuple[bytes, str]:
     """Genera el body y content-type para /metrics."""
     if not _prometheus_available:
         return b"# prometheus_client no instalado\n", "text/plain"
+    if _multiprocess_dir():
+        # R: Agregado entre procesos (cada hijo escribe sus valores en el dir).
+        from prometheus_client import multiprocess  # type: ignore
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        registry.register(_QueueLaneCollector())
+        return generate_latest(registry), CONTENT_TYPE_LATEST
     return generate_latest(_registry), CONTENT_TYPE_LATEST
 
 
+def set_queue_lane_sampler(
+    sampler: Optional[Callable[[], list[tuple[str, int, float]]]],
+) -> None:
+    """Registra el muestreo (carril, profundidad, antigüedad) para /metrics."""
+    global _queue_lane_sampler
+    _queue_lane_sampler = sampler
+
+
+def mark_process_dead(pid: Optional[int]) -> None:
+    """Limpia los archivos de un proceso muerto (solo en modo multiproceso)."""
+    if not _prometheus_available or not pid or not _multiprocess_dir():
+        return
+    from prometheus_client import multiprocess  # type: ignore
+
+    try:
+        multiprocess.mark_process_dead(pid)
+    except Exception:
+        pass
+
+
 def is_prometheus_available() -> bool:
     """Indica si prometheus_client está instalado."""
     return _prometheus_available
@@ -49,6 +49,7 @@ from .error_responses import (
     ErrorDetail,
 )
 from .logger import logger
+from .request_cache import request_cache_scope
 
 
 class RequestContextMiddleware(BaseHTTPMiddleware):
@@ -62,6 +63,7 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
     Responsabilidades:
       - Generar/aceptar X-Request-Id
       - Setear contextvars para correlación de logs
+      - Abrir el cache request-scoped (crosscutting.request_cache)
       - Emitir logs y métricas por request
       - Garantizar clear_context() para evitar leaks
 
@@ -89,7 +91,9 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
         status_code = 500
 
         try:
-            response = await call_next(request)
+            # R: Cache por request (ej: workspace/ACL leídos por router y use case).
+            with request_cache_scope():
+                response = await call_next(request)
             status_code = response.status_code
             return response
         except Exception:
@@ -0,0 +1,61 @@
+# apps/backend/app/crosscutting/request_cache.py
+"""
+===============================================================================
+MÓDULO: Cache request-scoped (memoización por request HTTP)
+===============================================================================
+
+Objetivo
+--------
+- Memoizar lecturas repetidas dentro de UN request (ej: el mismo workspace
+  cargado por el router y luego por el use case).
+- Vivir sólo lo que dura el request: sin TTL, sin invalidación cruzada.
+
+-------------------------------------------------------------------------------
+CRC (Component Card)
+-------------------------------------------------------------------------------
+Componentes:
+  - request_cache_scope()
+  - get_request_cache()
+
+Responsabilidades:
+  - Abrir/cerrar un dict por request usando ContextVar
+  - Exponer el dict activo (o None fuera de un request)
+
+Colaboradores:
+  - crosscutting.middleware.RequestContextMiddleware (abre el scope)
+  - infrastructure.repositories.cached (consume el dict)
+
+Notas:
+  - El dict se comparte con el threadpool de Starlette: `run_in_threadpool`
+    copia el contexto, pero la referencia al dict es la misma.
+  - Fuera de un request (worker, scripts) no hay scope: los callers
+    deben tratar None como "sin cache por request".
+===============================================================================
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+_request_cache_var: ContextVar[dict[Any, Any] | None] = ContextVar(
+    "request_cache", default=None
+)
+
+
+@contextmanager
+def request_cache_scope() -> Iterator[dict[Any, Any]]:
+    """Abre un cache vacío para el request actual y lo descarta al salir."""
+    cache: dict[Any, Any] = {}
+    token = _request_cache_var.set(cache)
+    try:
+        yield cache
+    finally:
+        _request_cache_var.reset(token)
+
+
+def get_request_cache() -> dict[Any, Any] | None:
+    """Devuelve el cache del request activo (None si no hay scope)."""
+    return _request_cache_var.get()
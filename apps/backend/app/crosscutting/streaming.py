@@ -1,7 +1,7 @@
 # apps/backend/app/crosscutting/streaming.py
 """
 ===============================================================================
-MÓDULO: Streaming SSE (Server-Sent Events) para respuestas del LLM
+MÓDULO: Streaming SSE (Server-Sent Events) para respuestas del LLM y eventos
 ===============================================================================
 
 Objetivo
@@ -11,15 +11,26 @@ Objetivo
 - Enviar evento done al final
 - Manejar desconexión del cliente sin romper el worker/API
 
+Performance
+-----------
+- Los tokens del LLM se agrupan en frames (flush por tiempo o por tamaño),
+  reduciendo writes/json.dumps por stream.
+- La respuesta se acumula en una lista (ensamblado lineal, no `+=`).
+- La desconexión del cliente se consulta con un timer, no por token.
+- Eventos (status de documentos): un frame SSE por lote, con `id:` del último
+  evento para reconexión con Last-Event-ID; heartbeat como comentario.
+
 -------------------------------------------------------------------------------
 CRC (Component Card)
 -------------------------------------------------------------------------------
 Componente:
-  stream_answer()
+  stream_answer(), stream_event_batches()
 
 Responsabilidades:
   - Formatear eventos SSE
   - Orquestar stream desde LLMService.generate_stream
+  - Coalescer tokens en frames (tiempo / tamaño) con una única task lectora
+  - Emitir lotes de eventos desde una EventBatchSource (fan-out por proceso)
 
 Colaboradores:
   - domain.services.LLMService
@@ -29,8 +40,12 @@ Colaboradores:
 
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import AsyncGenerator, List, Optional
+import time
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import AsyncGenerator, AsyncIterator, List, Optional, Protocol
 
 from fastapi import Request
 from fastapi.responses import StreamingResponse
@@ -38,6 +53,7 @@ from fastapi.responses import StreamingResponse
 from ..domain.entities import Chunk, ConversationMessage
 from ..domain.repositories import ConversationRepository
 from ..domain.services import LLMService
+from .config import get_settings
 from .logger import logger
 
 
@@ -52,10 +68,11 @@ async def stream_answer(
     """
     SSE Events:
       - sources: {"sources":[...], "conversation_id": "..."}
-      - token: {"token":"..."}
+      - token: {"token":"..."}  (uno o más tokens agrupados por frame)
       - done: {"answer":"...", "conversation_id":"..."}
       - error: {"error":"..."}
     """
+    settings = get_settings()
     return StreamingResponse(
         _generate_sse(
             query,
@@ -64,6 +81,11 @@ async def stream_answer(
             request,
             conversation_id,
             conversation_repository,
+            flush_interval_s=settings.sse_flush_interval_ms / 1000,
+            flush_max_chars=settings.sse_flush_max_chars,
+            disconnect_check_interval_s=(
+                settings.sse_disconnect_check_interval_ms / 1000
+            ),
         ),
         media_type="text/event-stream",
         headers={
@@ -81,8 +103,14 @@ async def _generate_sse(
     request: Request,
     conversation_id: Optional[str],
     conversation_repository: Optional[ConversationRepository],
+    *,
+    flush_interval_s: float = 0.03,
+    flush_max_chars: int = 256,
+    disconnect_check_interval_s: float = 0.25,
 ) -> AsyncGenerator[str, None]:
-    full_answer = ""
+    # R: Lista + join final: ensamblado O(n) aunque la respuesta sea larga.
+    answer_parts: list[str] = []
+    last_disconnect_check = time.monotonic()
 
     try:
         sources = [
@@ -92,14 +120,24 @@ async def _generate_sse(
             "sources", {"sources": sources, "conversation_id": conversation_id}
         )
 
-        async for token in llm_service.generate_stream(query, chunks):
-            if await request.is_disconnected():
-                logger.info("SSE: cliente desconectado")
-                return
+        frames = _coalesce_tokens(
+            llm_service.generate_stream(query, chunks),
+            flush_interval_s=flush_interval_s,
+            flush_max_chars=flush_max_chars,
+        )
+        async with aclosing(frames):
+            async for frame in frames:
+                now = time.monotonic()
+                if now - last_disconnect_check >= disconnect_check_interval_s:
+                    last_disconnect_check = now
+                    if await request.is_disconnected():
+                        logger.info("SSE: cliente desconectado")
+                        return
 
-            full_answer += token
-            yield _sse_event("token", {"token": token})
+                answer_parts.append(frame)
+                yield _sse_event("token", {"token": frame})
 
+        full_answer = "".join(answer_parts)
         if conversation_id and conversation_repository:
             conversation_repository.append_message(
                 conversation_id,
@@ -115,6 +153,194 @@ async def _generate_sse(
         yield _sse_event("error", {"error": "Error durante streaming"})
 
 
-def _sse_event(event: str, data: dict) -> str:
+async def _coalesce_tokens(
+    tokens: AsyncIterator[str],
+    *,
+    flush_interval_s: float,
+    flush_max_chars: int,
+) -> AsyncGenerator[str, None]:
+    """
+    Agrupa tokens en frames.
+
+    Reglas:
+      - Flush cuando el buffer llega a `flush_max_chars`.
+      - Flush cuando pasan `flush_interval_s` desde el primer token pendiente,
+        aunque el provider no emita nada nuevo (no se retiene texto).
+      - `flush_interval_s <= 0` desactiva el agrupamiento (1 token = 1 frame).
+
+    Una sola task lee el upstream (no una por token); al terminar o cortar
+    (desconexión) se cancela y se cierra el generador upstream con aclose().
+    """
+    if flush_interval_s <= 0:
+        try:
+            async for token in tokens:
+                if token:
+                    yield token
+        finally:
+            await _aclose(tokens)
+        return
+
+    loop = asyncio.get_running_loop()
+    # R: maxsize=1 => backpressure: el provider no se adelanta al consumidor.
+    queue: asyncio.Queue[object] = asyncio.Queue(maxsize=1)
+    pump = asyncio.ensure_future(_pump_tokens(tokens, queue))
+    pending: list[str] = []
+    pending_chars = 0
+    deadline: float | None = None
+
+    try:
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            try:
+                async with asyncio.timeout(timeout):
+                    item = await queue.get()
+            except TimeoutError:
+                # R: Timer vencido con tokens pendientes: emitimos sin esperar más.
+                yield "".join(pending)
+                pending, pending_chars, deadline = [], 0, None
+                continue
+
+            if item is _END_OF_STREAM:
+                break
+            if isinstance(item, BaseException):
+                raise item
+
+            token = item
+            if not token:
+                continue
+            pending.append(token)
+            pending_chars += len(token)
+            if deadline is None:
+                deadline = loop.time() + flush_interval_s
+
+            if pending_chars >= flush_max_chars or loop.time() >= deadline:
+                yield "".join(pending)
+                pending, pending_chars, deadline = [], 0, None
+    finally:
+        # R: Si el consumidor corta antes (desconexión), no dejamos la task
+        # colgada ni el stream del provider abierto.
+        if not pump.done():
+            pump.cancel()
+        await asyncio.gather(pump, return_exceptions=True)
+        await _aclose(tokens)
+
+    if pending:
+        yield "".join(pending)
+
+
+_END_OF_STREAM = object()
+
+
+async def _pump_tokens(tokens: AsyncIterator[str], queue: asyncio.Queue) -> None:
+    """Lee el upstream y entrega tokens (o la excepción) por la cola."""
+    try:
+        async for token in tokens:
+            await queue.put(token)
+    except Exception as exc:
+        await queue.put(exc)
+        return
+    await queue.put(_END_OF_STREAM)
+
+
+async def _aclose(iterator: AsyncIterator[str]) -> None:
+    aclose = getattr(iterator, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+# =============================================================================
+# Streams de eventos (lotes + reconexión)
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class EventBatch:
+    """
+    Lote de eventos a emitir como un único frame SSE.
+
+    - last_event_id: id del último evento (cliente lo reenvía como Last-Event-ID).
+    - reset: se perdieron eventos (gap/overflow): el cliente debe re-sincronizar.
+    """
+
+    events: list[dict] = field(default_factory=list)
+    last_event_id: str | None = None
+    reset: bool = False
+
+
+class EventBatchSource(Protocol):
+    """Suscripción que entrega lotes de eventos (None => timeout sin eventos)."""
+
+    async def next_batch(
+        self, *, window_s: float, max_events: int, timeout_s: float
+    ) -> EventBatch | None: ...
+
+    def close(self) -> None: ...
+
+
+def stream_event_batches(
+    source: EventBatchSource,
+    request: Request,
+    *,
+    event: str,
+    batch_window_s: float,
+    max_batch: int,
+    heartbeat_s: float,
+) -> StreamingResponse:
+    """
+    SSE Events:
+      - reset: {}  (re-sincronizar: pedir el estado actual)
+      - <event>: {"events": [...]}  con `id:` = último evento del lote
+      - comentario ": ping" cada heartbeat_s sin eventos
+    """
+    return StreamingResponse(
+        _generate_event_batches(
+            source,
+            request,
+            event=event,
+            batch_window_s=batch_window_s,
+            max_batch=max_batch,
+            heartbeat_s=heartbeat_s,
+        ),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+async def _generate_event_batches(
+    source: EventBatchSource,
+    request: Request,
+    *,
+    event: str,
+    batch_window_s: float,
+    max_batch: int,
+    heartbeat_s: float,
+) -> AsyncGenerator[str, None]:
+    try:
+        while True:
+            batch = await source.next_batch(
+                window_s=batch_window_s, max_events=max_batch, timeout_s=heartbeat_s
+            )
+            if await request.is_disconnected():
+                logger.info("SSE: cliente desconectado")
+                return
+            if batch is None:
+                yield ": ping\n\n"
+                continue
+            if batch.reset:
+                yield _sse_event("reset", {})
+            if batch.events:
+                yield _sse_event(
+                    event, {"events": batch.events}, event_id=batch.last_event_id
+                )
+    finally:
+        source.close()
+
+
+def _sse_event(event: str, data: dict, *, event_id: str | None = None) -> str:
     # SSE: cada evento termina con doble newline
-    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+    frame = f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+    return f"id: {event_id}\n{frame}" if event_id else frame
@@ -4,7 +4,7 @@ TARJETA CRC — domain/cache.py
 ===============================================================================
 
 Módulo:
-    Puerto de Cache de Embeddings (Dominio)
+    Puertos de Cache (Dominio): embeddings + invalidación de usuarios
 
 Responsabilidades:
     - Definir el contrato (Protocol) para cachear vectores de embedding.
@@ -12,6 +12,8 @@ Responsabilidades:
         * application/usecases depende de esta interfaz
         * infrastructure/cache implementa backends concretos (memoria / Redis)
     - Establecer un “lenguaje común” para operaciones básicas (get/set).
+    - Definir el contrato para invalidar usuarios cacheados tras escrituras
+      (el repositorio de usuarios avisa sin conocer al cache de auth).
 
 Colaboradores:
     - infrastructure/cache/*: implementaciones de cache (in-memory, Redis, etc.)
@@ -33,6 +35,7 @@ Notas de diseño (Senior / Sustentable):
 from __future__ import annotations
 
 from typing import Protocol
+from uuid import UUID
 
 
 class EmbeddingCachePort(Protocol):
@@ -81,3 +84,17 @@ class EmbeddingCachePort(Protocol):
             - Idealmente es “best-effort”: si falla el cache, el sistema debe seguir funcionando.
         """
         ...
+
+
+class UserCacheInvalidationPort(Protocol):
+    """
+    Receptor de invalidaciones de usuario.
+
+    Lo implementa el cache de autenticación (identity/auth_cache) y lo recibe
+    el repositorio de usuarios: tras cada escritura sobre un usuario se llama
+    a invalidate_user para que el cambio se vea en el mismo proceso.
+    """
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        """Descarta el usuario cacheado (no-op si no estaba)."""
+        ...
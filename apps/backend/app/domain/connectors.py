@@ -16,6 +16,7 @@ Responsabilidades:
     - Definir ConnectorAccountRepository (puerto de persistencia de cuentas).
     - Definir OAuthPort (puerto para flujos OAuth con proveedores).
     - Definir TokenEncryptionPort (puerto para cifrado de tokens).
+    - Definir AccessTokenCachePort (reuso de access_tokens entre syncs).
 
 Colaboradores:
     - infrastructure/repositories: implementaciones concretas.
@@ -33,7 +34,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Protocol, Tuple
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
 from uuid import UUID
 
 # ---------------------------------------------------------------------------
@@ -270,6 +271,14 @@ class OAuthTokenResponse:
     expires_in: int = 3600
 
 
+@dataclass(frozen=True)
+class OAuthAccessToken:
+    """access_token refrescado + vigencia informada por el proveedor."""
+
+    access_token: str
+    expires_in: int = 3600
+
+
 class OAuthPort(Protocol):
     """Contrato para flujos OAuth con proveedores externos."""
 
@@ -284,3 +293,30 @@ class OAuthPort(Protocol):
     def refresh_access_token(self, refresh_token: str) -> str:
         """Refresca el access_token usando un refresh_token. Devuelve nuevo access_token."""
         ...
+
+    def refresh_access_token_with_expiry(self, refresh_token: str) -> OAuthAccessToken:
+        """Como refresh_access_token, pero informa la vigencia (para cachear)."""
+        ...
+
+
+# ---------------------------------------------------------------------------
+# Puerto: Cache de access_tokens
+# ---------------------------------------------------------------------------
+
+
+class AccessTokenCachePort(Protocol):
+    """
+    Contrato para reusar access_tokens hasta (casi) su expiración.
+
+    - key: identifica cuenta + refresh_token vigente (no el token en sí).
+    - refresh: se invoca solo ante miss; refreshes concurrentes de la misma
+      key se coalescen en uno.
+    """
+
+    def get_or_refresh(self, key: str, refresh: Callable[[], OAuthAccessToken]) -> str:
+        """Devuelve un access_token vigente (cacheado o recién refrescado)."""
+        ...
+
+    def invalidate(self, key: str) -> None:
+        """Descarta el token cacheado (ej: el proveedor respondió 401)."""
+        ...
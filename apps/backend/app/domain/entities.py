@@ -85,6 +85,14 @@ class Document:
     external_etag: Optional[str] = None  # fingerprint/hash del proveedor
     external_mime_type: Optional[str] = None  # tipo MIME reportado
 
+    # Checkpoint de procesamiento (reanudación + progreso)
+    processing_run_id: Optional[UUID] = None  # None => sin corrida reanudable
+    processing_owner: Optional[str] = None  # job que tiene la corrida
+    processing_fingerprint: Optional[str] = None  # archivo + config de la corrida
+    processing_chunks_done: Optional[int] = None
+    processing_chunks_total: Optional[int] = None  # None => aún desconocido
+    processing_updated_at: Optional[datetime] = None
+
     @property
     def is_deleted(self) -> bool:
         """True si está soft-deleted."""
@@ -111,6 +119,35 @@ class Document:
         self.status = status
         self.error_message = error_message
 
+    @property
+    def processing_progress(self) -> float | None:
+        """Fracción 0..1 de chunks persistidos; None si el total no se conoce."""
+        if not self.processing_chunks_total:
+            return None
+        done = self.processing_chunks_done or 0
+        return min(1.0, done / self.processing_chunks_total)
+
+
+@dataclass(frozen=True)
+class ProcessingCheckpoint:
+    """
+    Progreso comprometido de una corrida de procesamiento.
+
+    - run_id: identifica la corrida (IDs de chunks derivados de él);
+      None => corrida terminada, nada que reanudar.
+    - chunks_done: chunks persistidos (índices 0..chunks_done-1).
+    - chunks_total: total esperado; None si aún no se conoce (streaming).
+    - owner: job que ejecuta la corrida (un retry del mismo job la retoma).
+    - fingerprint: huella de las entradas (hash del archivo + chunker +
+      modelo de embeddings); si cambia, los lotes comprometidos no valen.
+    """
+
+    run_id: Optional[UUID]
+    chunks_done: int
+    chunks_total: Optional[int] = None
+    owner: Optional[str] = None
+    fingerprint: Optional[str] = None
+
 
 # ---------------------------------------------------------------------------
 # Workspace
@@ -138,6 +175,9 @@ class Workspace:
     # Full-text search
     fts_language: str = "spanish"
 
+    # Dedup de chunks: contenido idéntico comparte un único embedding almacenado
+    chunk_dedup_enabled: bool = False
+
     # Control de acceso
     allowed_roles: List[str] = field(default_factory=list)
     shared_user_ids: List[UUID] = field(default_factory=list)
@@ -200,6 +240,8 @@ class Chunk:
     chunk_id: Optional[UUID] = None
     similarity: Optional[float] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # SHA-256 del contenido normalizado (scopeado por workspace): reuso de embeddings.
+    content_hash: Optional[str] = None
 
 
 # ---------------------------------------------------------------------------
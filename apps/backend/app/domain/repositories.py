@@ -25,7 +25,7 @@ Reglas:
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Protocol
+from typing import Collection, Protocol
 from uuid import UUID
 
 from .audit import AuditEvent
@@ -34,6 +34,7 @@ from .entities import (
     ConversationMessage,
     Document,
     Node,
+    ProcessingCheckpoint,
     Workspace,
     WorkspaceVisibility,
 )
@@ -52,8 +53,14 @@ class DocumentRepository(Protocol):
         chunks: list[Chunk],
         *,
         workspace_id: UUID | None = None,
+        checkpoint: ProcessingCheckpoint | None = None,
     ) -> None:
-        """Persiste chunks asociados a un documento."""
+        """
+        Persiste chunks asociados a un documento.
+
+        checkpoint: si se indica, se guarda en la misma transacción (un lote
+        comprometido siempre coincide con el progreso registrado).
+        """
         ...
 
     def save_document_with_chunks(
@@ -62,6 +69,18 @@ class DocumentRepository(Protocol):
         """Persiste documento + chunks (+ nodos opcionales) de forma atómica."""
         ...
 
+    def save_documents_with_chunks(
+        self, items: list[tuple[Document, list[Chunk], list[Node] | None]]
+    ) -> None:
+        """Persiste varios documentos con sus chunks en una única transacción."""
+        ...
+
+    def find_chunk_embeddings_by_hash(
+        self, workspace_id: UUID, content_hashes: list[str]
+    ) -> dict[str, list[float]]:
+        """Embeddings ya persistidos en el workspace, indexados por content_hash."""
+        ...
+
     def find_similar_chunks(
         self,
         embedding: list[float],
@@ -163,6 +182,12 @@ class DocumentRepository(Protocol):
         """Busca documento por hash de contenido dentro de un workspace."""
         ...
 
+    def get_documents_by_content_hashes(
+        self, workspace_id: UUID, content_hashes: list[str]
+    ) -> dict[str, Document]:
+        """Documentos activos del workspace indexados por content_hash (1 query)."""
+        ...
+
     def get_by_external_source_id(
         self, workspace_id: UUID, external_source_id: str
     ) -> Document | None:
@@ -219,10 +244,43 @@ class DocumentRepository(Protocol):
         """Transición de estado (compare-and-set)."""
         ...
 
+    def save_processing_checkpoint(
+        self,
+        document_id: UUID,
+        checkpoint: ProcessingCheckpoint,
+        *,
+        workspace_id: UUID | None = None,
+    ) -> bool:
+        """Registra progreso/owner de la corrida; False si no está PROCESSING."""
+        ...
+
+    def clear_processing_checkpoint(
+        self,
+        document_id: UUID,
+        *,
+        workspace_id: UUID | None = None,
+    ) -> bool:
+        """Descarta la corrida reanudable (reproceso explícito); no si PROCESSING."""
+        ...
+
+    def set_document_content_hash(
+        self,
+        document_id: UUID,
+        *,
+        workspace_id: UUID | None = None,
+        content_hash: str,
+    ) -> bool:
+        """Setea content_hash; False si otro documento del workspace ya lo tiene."""
+        ...
+
     def delete_chunks_for_document(
-        self, document_id: UUID, *, workspace_id: UUID | None = None
+        self,
+        document_id: UUID,
+        *,
+        workspace_id: UUID | None = None,
+        keep_chunk_ids: Collection[UUID] | None = None,
     ) -> int:
-        """Elimina chunks de un documento."""
+        """Elimina chunks de un documento (salvo keep_chunk_ids, si se indica)."""
         ...
 
     def restore_document(
@@ -298,6 +356,7 @@ class WorkspaceRepository(Protocol):
         visibility: WorkspaceVisibility | None = None,
         allowed_roles: list[str] | None = None,
         fts_language: str | None = None,
+        chunk_dedup_enabled: bool | None = None,
     ) -> Workspace | None:
         """Actualiza atributos de un workspace."""
         ...
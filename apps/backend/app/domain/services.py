@@ -23,7 +23,9 @@ Reglas:
 
 from __future__ import annotations
 
-from typing import AsyncGenerator, Protocol
+from dataclasses import dataclass
+from enum import Enum
+from typing import AsyncGenerator, BinaryIO, Iterator, Protocol
 from uuid import UUID
 
 
@@ -66,15 +68,31 @@ class TextChunkerService(Protocol):
     def chunk(self, text: str) -> list[str]: ...
 
 
+@dataclass(frozen=True)
+class StoredObjectInfo:
+    """Metadata de un objeto en storage (HEAD, sin descargar el contenido)."""
+
+    size_bytes: int
+    content_type: str | None = None
+
+
 class FileStoragePort(Protocol):
     """Contrato de storage de archivos (S3/MinIO/etc.)."""
 
     def upload_file(
-        self, key: str, content: bytes, content_type: str | None
+        self, key: str, content: bytes | BinaryIO, content_type: str | None
     ) -> None: ...
 
     def download_file(self, key: str) -> bytes: ...
 
+    def open_stream(self, key: str) -> BinaryIO:
+        """
+        Descarga por bloques a un archivo temporal (spooled) rebobinado.
+
+        El caller es dueño del stream (usarlo como context manager / close()).
+        """
+        ...
+
     def delete_file(self, key: str) -> None: ...
 
     def generate_presigned_url(
@@ -85,16 +103,52 @@ class FileStoragePort(Protocol):
         filename: str | None = None,
     ) -> str: ...
 
+    def generate_presigned_upload_url(
+        self,
+        key: str,
+        *,
+        content_type: str,
+        expires_in_seconds: int = 900,
+    ) -> str: ...
+
+    def head_file(self, key: str) -> StoredObjectInfo | None: ...
+
 
 class DocumentTextExtractor(Protocol):
     """Contrato para extraer texto desde documentos binarios."""
 
-    def extract_text(self, mime_type: str, content: bytes) -> str: ...
+    def extract_text(self, mime_type: str, content: bytes | BinaryIO) -> str: ...
+
+
+class PagedTextExtractor(Protocol):
+    """Capacidad opcional: extracción incremental (p.ej. página a página)."""
+
+    def iter_text(self, mime_type: str, content: bytes | BinaryIO) -> Iterator[str]: ...
+
+
+class ProcessingPriority(str, Enum):
+    """Clase de prioridad del procesamiento (cada una mapea a un carril/cola)."""
+
+    INTERACTIVE = "interactive"  # upload de un usuario esperando el resultado
+    REPROCESS = "reprocess"  # reproceso manual de un documento existente
+    CONNECTOR = "connector"  # sync masivo de conectores (bulk import)
 
 
 class DocumentProcessingQueue(Protocol):
     """Contrato para encolar procesamiento de documentos."""
 
     def enqueue_document_processing(
-        self, document_id: UUID, *, workspace_id: UUID
+        self,
+        document_id: UUID,
+        *,
+        workspace_id: UUID,
+        priority: ProcessingPriority = ProcessingPriority.INTERACTIVE,
+    ) -> str: ...
+
+    def schedule_upload_expiry(
+        self,
+        document_id: UUID,
+        *,
+        workspace_id: UUID,
+        delay_seconds: int,
     ) -> str: ...
@@ -0,0 +1,198 @@
+"""
+===============================================================================
+TARJETA CRC — identity/auth_cache.py
+===============================================================================
+
+Módulo:
+    Cache de autenticación (usuarios + tokens verificados)
+
+Responsabilidades:
+    - Cachear el User resuelto por user_id (LRU acotado + TTL corto).
+    - Cachear el payload de tokens ya verificados hasta su `exp`.
+    - Invalidar usuarios explícitamente ante escrituras (activar/desactivar,
+      password, update) para que el cambio se vea en el mismo proceso.
+
+Colaboradores:
+    - identity/auth_users.py: consulta el cache antes de decodificar/ir a DB.
+    - domain.cache.UserCacheInvalidationPort: AuthCacheUserInvalidator lo
+      implementa; el repo de usuarios lo recibe inyectado (no importa este módulo).
+    - crosscutting.config.get_settings: TTL y tamaños.
+
+Decisiones de diseño (Senior):
+    - Deactivation bound: en otros procesos/réplicas el cambio se ve en, a lo
+      sumo, `auth_user_cache_ttl_seconds` (0 = sin cache de usuarios).
+    - Tokens: la clave es SHA-256(secret + token): no guardamos el token crudo
+      y rotar el secret invalida todo el cache.
+    - Una carga que arrancó antes de una invalidación no publica su resultado
+      (epoch), evitando re-cachear un usuario recién desactivado.
+    - User es inmutable (frozen): se comparte sin copias.
+===============================================================================
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import Any
+from uuid import UUID
+
+from ..crosscutting.config import get_settings
+from .users import User
+
+
+class _ExpiringLru:
+    """LRU acotado donde cada entrada trae su propio vencimiento."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max(0, int(max_entries))
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, now: float) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, expires_at: float) -> None:
+        if self._max_entries == 0:
+            return
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class AuthCache:
+    """Cache thread-safe de usuarios autenticados y tokens verificados."""
+
+    def __init__(
+        self,
+        *,
+        user_ttl_seconds: float = 30.0,
+        user_max_entries: int = 4096,
+        token_max_entries: int = 4096,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._user_ttl = float(user_ttl_seconds)
+        self._clock = clock
+        self._lock = Lock()
+        self._users = _ExpiringLru(user_max_entries if self._user_ttl > 0 else 0)
+        self._tokens = _ExpiringLru(token_max_entries)
+        self._epoch = 0
+
+    # =========================================================
+    # Usuarios
+    # =========================================================
+    @property
+    def user_epoch(self) -> int:
+        """Snapshot a tomar ANTES de cargar un usuario desde el repositorio."""
+        return self._epoch
+
+    def get_user(self, user_id: UUID) -> User | None:
+        now = self._clock()
+        with self._lock:
+            return self._users.get(user_id, now)
+
+    def put_user(self, user: User, *, epoch: int) -> None:
+        expires_at = self._clock() + self._user_ttl
+        with self._lock:
+            if epoch != self._epoch:
+                return
+            self._users.set(user.id, user, expires_at)
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._users.pop(user_id)
+
+    # =========================================================
+    # Tokens verificados
+    # =========================================================
+    def get_token(self, token: str, secret: str) -> Any | None:
+        key = self._token_key(token, secret)
+        now = self._clock()
+        with self._lock:
+            return self._tokens.get(key, now)
+
+    def put_token(
+        self, token: str, secret: str, payload: Any, *, expires_at: float
+    ) -> None:
+        key = self._token_key(token, secret)
+        with self._lock:
+            self._tokens.set(key, payload, expires_at)
+
+    # =========================================================
+    # Mantenimiento
+    # =========================================================
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._users.clear()
+            self._tokens.clear()
+
+    @staticmethod
+    def _token_key(token: str, secret: str) -> bytes:
+        return hashlib.sha256(f"{secret}\0{token}".encode()).digest()
+
+
+# ---------------------------------------------------------------------------
+# Singleton de proceso
+# ---------------------------------------------------------------------------
+
+_auth_cache: AuthCache | None = None
+_auth_cache_lock = Lock()
+
+
+def get_auth_cache() -> AuthCache:
+    """Acceso lazy al cache global (configurado desde Settings)."""
+    global _auth_cache
+    if _auth_cache is None:
+        with _auth_cache_lock:
+            if _auth_cache is None:
+                s = get_settings()
+                _auth_cache = AuthCache(
+                    user_ttl_seconds=s.auth_user_cache_ttl_seconds,
+                    user_max_entries=s.auth_user_cache_max_entries,
+                    token_max_entries=s.auth_token_cache_max_entries,
+                )
+    return _auth_cache
+
+
+def invalidate_cached_user(user_id: UUID) -> None:
+    """Invalida un usuario (no instancia el cache si nunca se usó)."""
+    if _auth_cache is not None:
+        _auth_cache.invalidate_user(user_id)
+
+
+class AuthCacheUserInvalidator:
+    """
+    Adaptador UserCacheInvalidationPort -> cache de proceso.
+
+    Resuelve el singleton en cada llamada (sobrevive a reset_auth_cache).
+    """
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        invalidate_cached_user(user_id)
+
+
+def reset_auth_cache() -> None:
+    """Reset del singleton (útil para tests)."""
+    global _auth_cache
+    _auth_cache = None
@@ -10,7 +10,8 @@ Responsabilidades:
     - Hashear/verificar passwords (Argon2).
     - Emitir JWT de acceso con expiración (access token).
     - Decodificar y validar JWT (firma, exp, claims mínimos).
-    - Resolver usuario actual (token -> user_id -> repo).
+    - Resolver usuario actual (token -> user_id -> repo), con cache de
+      tokens verificados y de usuarios (identity/auth_cache.py).
     - Exponer dependencias FastAPI (require_user, require_role).
     - Extraer token desde Authorization: Bearer o cookie.
 
@@ -20,6 +21,8 @@ Colaboradores:
     - crosscutting.logger: logging estructurado.
     - infrastructure.repositories.postgres.user: get_user_by_email/get_user_by_id.
     - identity.users: User / UserRole.
+    - identity.auth_cache: cache de usuarios/tokens (hot path de cada request);
+      se registra como UserCacheInvalidationPort del repo de usuarios.
 
 Decisiones de diseño (Senior / Clean Architecture):
     - La lógica criptográfica vive acá (borde de identidad), NO en dominio.
@@ -47,9 +50,15 @@ from ..crosscutting.logger import logger
 from ..infrastructure.repositories.postgres.user import (
     get_user_by_email,
     get_user_by_id,
+    set_user_cache_invalidator,
 )
+from .auth_cache import AuthCacheUserInvalidator, get_auth_cache
 from .users import User, UserRole
 
+# R: Este módulo es quien cachea usuarios: al importarlo, el repo de usuarios
+#    queda conectado al cache (escrituras => invalidación en este proceso).
+set_user_cache_invalidator(AuthCacheUserInvalidator())
+
 # ---------------------------------------------------------------------------
 # Constantes (evitan strings mágicos)
 # ---------------------------------------------------------------------------
@@ -94,6 +103,7 @@ class TokenPayload:
     user_id: str
     email: str
     role: UserRole
+    expires_at: int | None = None
 
 
 def get_auth_settings() -> AuthSettings:
@@ -195,6 +205,12 @@ def decode_access_token(
     """
     auth_settings = settings or get_auth_settings()
 
+    # R: Token ya verificado (misma firma/secret) y todavía vigente: sin re-decode.
+    cache = get_auth_cache()
+    cached = cache.get_token(token, auth_settings.jwt_secret)
+    if cached is not None:
+        return cached
+
     try:
         payload = jwt.decode(
             token,
@@ -226,7 +242,14 @@ def decode_access_token(
     except ValueError as exc:
         raise unauthorized("Token inválido.") from exc
 
-    return TokenPayload(user_id=str(user_id), email=str(email), role=role)
+    expires_at = int(payload[CLAIM_EXP])
+    token_payload = TokenPayload(
+        user_id=str(user_id), email=str(email), role=role, expires_at=expires_at
+    )
+    cache.put_token(
+        token, auth_settings.jwt_secret, token_payload, expires_at=expires_at
+    )
+    return token_payload
 
 
 def get_current_user(token: str) -> User:
@@ -238,9 +261,16 @@ def get_current_user(token: str) -> User:
     except ValueError as exc:
         raise unauthorized("Token inválido.") from exc
 
-    user = get_user_by_id(user_id)
-    if not user:
-        raise unauthorized("Token inválido.")
+    # R: Cache acotado por TTL: una desactivación en otra réplica se propaga
+    #    en <= auth_user_cache_ttl_seconds (en este proceso, al instante).
+    cache = get_auth_cache()
+    user = cache.get_user(user_id)
+    if user is None:
+        epoch = cache.user_epoch
+        user = get_user_by_id(user_id)
+        if not user:
+            raise unauthorized("Token inválido.")
+        cache.put_user(user, epoch=epoch)
     if not user.is_active:
         raise forbidden("El usuario está inactivo.")
     return user
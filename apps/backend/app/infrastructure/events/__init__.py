@@ -0,0 +1,35 @@
+"""
+===============================================================================
+SUBSISTEMA: Infraestructura / Events
+===============================================================================
+
+CRC CARD (Package)
+-------------------------------------------------------------------------------
+Nombre:
+    infrastructure.events
+
+Responsabilidades:
+    - Exponer el hub de eventos de status de documentos (fan-out por proceso).
+    - Exponer el listener Postgres (LISTEN/NOTIFY) que lo alimenta.
+
+Colaboradores:
+    - document_status.DocumentStatusBroadcaster
+    - document_status.PostgresStatusListener
+===============================================================================
+"""
+
+from .document_status import (
+    DOCUMENT_STATUS_CHANNEL,
+    DocumentStatusBroadcaster,
+    DocumentStatusEvent,
+    PostgresStatusListener,
+    StatusSubscription,
+)
+
+__all__ = [
+    "DOCUMENT_STATUS_CHANNEL",
+    "DocumentStatusBroadcaster",
+    "DocumentStatusEvent",
+    "PostgresStatusListener",
+    "StatusSubscription",
+]
@@ -0,0 +1,371 @@
+"""
+===============================================================================
+ARCHIVO: document_status.py
+===============================================================================
+
+CRC CARD (Module)
+-------------------------------------------------------------------------------
+Nombre:
+    Eventos de status de documentos (Postgres LISTEN/NOTIFY -> SSE)
+
+Responsabilidades:
+    - Definir el evento publicado por transition_document_status (NOTIFY en la
+      misma transacción que el UPDATE: solo se entrega si hubo commit).
+    - Mantener UNA suscripción upstream por proceso (thread con LISTEN sobre
+      una conexión dedicada) y hacer fan-out a N clientes SSE por workspace.
+    - Guardar los últimos eventos (ring buffer) para reconexión con
+      Last-Event-ID; si el id ya no está (o hubo un gap) => reset.
+    - Entregar eventos por lotes (ventana de tiempo / tamaño máximo).
+
+Colaboradores:
+    - psycopg (conexión autocommit + Connection.notifies)
+    - crosscutting.streaming.EventBatch / stream_event_batches
+    - PostgresDocumentRepository (publica con pg_notify)
+
+Decisiones:
+    - Los ids son opacos: el orden de entrega de NOTIFY es el orden de commit
+      (igual en todos los procesos), así que "después de X" se resuelve por
+      posición en el buffer, no comparando ids.
+    - Una cola acotada por cliente: un cliente lento no frena a los demás;
+      si se llena, se descartan sus eventos y recibe reset.
+===============================================================================
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Final, Protocol
+from uuid import UUID, uuid4
+
+from ...crosscutting.logger import logger
+from ...crosscutting.streaming import EventBatch
+
+DOCUMENT_STATUS_CHANNEL: Final[str] = "document_status"
+
+_RECONNECT_DELAY_SECONDS: Final[float] = 1.0
+_NOTIFY_POLL_SECONDS: Final[float] = 1.0
+
+
+@dataclass(frozen=True)
+class DocumentStatusEvent:
+    """
+    Transición de status de un documento.
+
+    uploaded_by_user_id / allowed_roles viajan para filtrar por acceso al
+    documento en el borde HTTP; no se envían al cliente.
+    """
+
+    workspace_id: UUID
+    document_id: UUID
+    status: str
+    error_message: str | None = None
+    uploaded_by_user_id: UUID | None = None
+    allowed_roles: tuple[str, ...] = ()
+    id: str = field(default_factory=lambda: uuid4().hex)
+
+    def to_payload(self) -> str:
+        """JSON para pg_notify (error_message ya viene truncado, < 8000 bytes)."""
+        return json.dumps(
+            {
+                "id": self.id,
+                "workspace_id": str(self.workspace_id),
+                "document_id": str(self.document_id),
+                "status": self.status,
+                "error_message": self.error_message,
+                "uploaded_by_user_id": (
+                    str(self.uploaded_by_user_id) if self.uploaded_by_user_id else None
+                ),
+                "allowed_roles": list(self.allowed_roles),
+            }
+        )
+
+    @classmethod
+    def from_payload(cls, payload: str) -> "DocumentStatusEvent":
+        data = json.loads(payload)
+        uploaded_by = data.get("uploaded_by_user_id")
+        return cls(
+            id=data["id"],
+            workspace_id=UUID(data["workspace_id"]),
+            document_id=UUID(data["document_id"]),
+            status=data["status"],
+            error_message=data.get("error_message"),
+            uploaded_by_user_id=UUID(uploaded_by) if uploaded_by else None,
+            allowed_roles=tuple(data.get("allowed_roles") or ()),
+        )
+
+    def to_client_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "document_id": str(self.document_id),
+            "status": self.status,
+            "error_message": self.error_message,
+        }
+
+
+# ============================================================
+# Upstream: una conexión LISTEN por proceso
+# ============================================================
+class StatusListener(Protocol):
+    def start(self) -> None: ...
+
+    def stop(self) -> None: ...
+
+
+class PostgresStatusListener:
+    """
+    Thread dedicado con LISTEN sobre una conexión propia (fuera del pool).
+
+    - on_payload(payload): por cada NOTIFY recibido.
+    - on_gap(): tras reconectar (los NOTIFY del corte se perdieron).
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        on_payload: Callable[[str], None],
+        on_gap: Callable[[], None],
+        *,
+        channel: str = DOCUMENT_STATUS_CHANNEL,
+    ) -> None:
+        self._database_url = database_url
+        self._on_payload = on_payload
+        self._on_gap = on_gap
+        self._channel = channel
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="document-status-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        import psycopg
+        from psycopg import sql
+
+        connected_once = False
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(self._database_url, autocommit=True) as conn:
+                    conn.execute(
+                        sql.SQL("LISTEN {}").format(sql.Identifier(self._channel))
+                    )
+                    if connected_once:
+                        self._on_gap()
+                    connected_once = True
+                    while not self._stop.is_set():
+                        for notify in conn.notifies(timeout=_NOTIFY_POLL_SECONDS):
+                            self._on_payload(notify.payload)
+            except Exception as exc:
+                logger.warning(
+                    "Document status listener disconnected",
+                    extra={"error": str(exc)},
+                )
+                self._stop.wait(_RECONNECT_DELAY_SECONDS)
+
+
+# ============================================================
+# Fan-out: suscripciones por workspace
+# ============================================================
+class StatusSubscription:
+    """Cola acotada de un cliente SSE (implementa EventBatchSource)."""
+
+    def __init__(
+        self,
+        broadcaster: "DocumentStatusBroadcaster",
+        workspace_id: UUID,
+        *,
+        queue_size: int,
+        accept: Callable[[DocumentStatusEvent], bool] | None,
+    ) -> None:
+        self.workspace_id = workspace_id
+        self._broadcaster = broadcaster
+        self._accept = accept
+        self._queue: asyncio.Queue[DocumentStatusEvent] = asyncio.Queue(queue_size)
+        self._reset = False
+        self._wakeup = asyncio.Event()
+
+    def push(self, event: DocumentStatusEvent) -> None:
+        if self._accept is not None and not self._accept(event):
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # R: Cliente lento: se descarta su backlog y se le pide re-sincronizar.
+            self.reset()
+            return
+        self._wakeup.set()
+
+    def reset(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._reset = True
+        self._wakeup.set()
+
+    async def next_batch(
+        self, *, window_s: float, max_events: int, timeout_s: float
+    ) -> EventBatch | None:
+        if self._queue.empty() and not self._reset:
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout_s)
+            except asyncio.TimeoutError:
+                return None
+            # R: Ventana corta para juntar el resto del lote (bulk uploads).
+            if window_s > 0 and not self._reset:
+                await asyncio.sleep(window_s)
+
+        events: list[DocumentStatusEvent] = []
+        while not self._queue.empty() and len(events) < max_events:
+            events.append(self._queue.get_nowait())
+        reset, self._reset = self._reset, False
+        return EventBatch(
+            events=[event.to_client_dict() for event in events],
+            last_event_id=events[-1].id if events else None,
+            reset=reset,
+        )
+
+    def close(self) -> None:
+        self._broadcaster.unsubscribe(self)
+
+
+class DocumentStatusBroadcaster:
+    """
+    Hub por proceso: una suscripción upstream, N clientes SSE.
+
+    Vive en el event loop de la API; el listener (thread) entrega vía
+    call_soon_threadsafe. El listener arranca con el primer cliente.
+    """
+
+    def __init__(
+        self,
+        listener_factory: Callable[
+            [Callable[[str], None], Callable[[], None]], StatusListener
+        ],
+        *,
+        replay_size: int = 1000,
+        queue_size: int = 256,
+    ) -> None:
+        if replay_size <= 0 or queue_size <= 0:
+            raise ValueError("replay_size y queue_size deben ser > 0")
+        self._listener_factory = listener_factory
+        self._listener: StatusListener | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue_size = queue_size
+        self._history: deque[DocumentStatusEvent] = deque(maxlen=replay_size)
+        self._subscribers: dict[UUID, set[StatusSubscription]] = {}
+
+    # -------------------------------------------------------------
+    # Lado cliente (event loop)
+    # -------------------------------------------------------------
+    def subscribe(
+        self,
+        workspace_id: UUID,
+        *,
+        last_event_id: str | None = None,
+        accept: Callable[[DocumentStatusEvent], bool] | None = None,
+    ) -> StatusSubscription:
+        """Registra un cliente; con last_event_id re-entrega lo que se perdió."""
+        self._ensure_started()
+        subscription = StatusSubscription(
+            self, workspace_id, queue_size=self._queue_size, accept=accept
+        )
+        if last_event_id:
+            missed = self._events_after(last_event_id)
+            if missed is None:
+                subscription.reset()
+            else:
+                for event in missed:
+                    if event.workspace_id == workspace_id:
+                        subscription.push(event)
+        self._subscribers.setdefault(workspace_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: StatusSubscription) -> None:
+        subscribers = self._subscribers.get(subscription.workspace_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.workspace_id]
+
+    def subscriber_count(self) -> int:
+        return sum(len(subs) for subs in self._subscribers.values())
+
+    # -------------------------------------------------------------
+    # Lado upstream
+    # -------------------------------------------------------------
+    def publish(self, event: DocumentStatusEvent) -> None:
+        """Registra el evento y lo reparte (llamar desde el event loop)."""
+        self._history.append(event)
+        for subscription in tuple(self._subscribers.get(event.workspace_id, ())):
+            subscription.push(event)
+
+    def reset_all(self) -> None:
+        """Gap upstream: el historial ya no es confiable => reset a todos."""
+        self._history.clear()
+        for subscribers in self._subscribers.values():
+            for subscription in subscribers:
+                subscription.reset()
+
+    def close(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    # -------------------------------------------------------------
+    # Internos
+    # -------------------------------------------------------------
+    def _events_after(self, last_event_id: str) -> list[DocumentStatusEvent] | None:
+        """Eventos posteriores a last_event_id; None si ya salió del buffer."""
+        history = list(self._history)
+        for index in range(len(history) - 1, -1, -1):
+            if history[index].id == last_event_id:
+                return history[index + 1 :]
+        return None
+
+    def _ensure_started(self) -> None:
+        if self._listener is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._listener = self._listener_factory(self._on_payload, self._on_gap)
+        self._listener.start()
+
+    def _on_payload(self, payload: str) -> None:
+        """Thread del listener: parsea y delega al event loop."""
+        try:
+            event = DocumentStatusEvent.from_payload(payload)
+        except (ValueError, KeyError, TypeError):
+            logger.warning(
+                "Invalid document status payload", extra={"payload": payload}
+            )
+            return
+        self._call_in_loop(self.publish, event)
+
+    def _on_gap(self) -> None:
+        self._call_in_loop(self.reset_all)
+
+    def _call_in_loop(self, callback: Callable, *args: object) -> None:
+        try:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            # Loop cerrado (shutdown): no hay clientes a quienes avisar.
+            pass
+
+
+__all__ = [
+    "DOCUMENT_STATUS_CHANNEL",
+    "DocumentStatusBroadcaster",
+    "DocumentStatusEvent",
+    "PostgresStatusListener",
+    "StatusSubscription",
+]
@@ -11,15 +11,18 @@ Nombre:
 Responsabilidades:
     - Exponer el adaptador principal usado por DI (SimpleDocumentTextExtractor).
     - Exponer la lista única de MIME soportados (SUPPORTED_MIME_TYPES).
+    - Exponer ParserOptions (configuración de límites / extracción paralela).
     - Mantener el "public API" del paquete estable.
 
 Colaboradores:
     - document_text_extractor.SimpleDocumentTextExtractor
     - mime_types.SUPPORTED_MIME_TYPES
+    - contracts.ParserOptions
 ===============================================================================
 """
 
+from .contracts import ParserOptions
 from .document_text_extractor import SimpleDocumentTextExtractor
 from .mime_types import SUPPORTED_MIME_TYPES
 
-__all__ = ["SimpleDocumentTextExtractor", "SUPPORTED_MIME_TYPES"]
+__all__ = ["ParserOptions", "SimpleDocumentTextExtractor", "SUPPORTED_MIME_TYPES"]
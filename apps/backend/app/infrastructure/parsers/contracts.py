@@ -12,6 +12,7 @@ Responsabilidades:
     - Definir el contrato de parser (BaseParser) mediante Protocol.
     - Definir el resultado rico (ExtractedText) con metadatos y warnings.
     - Definir opciones compartidas (ParserOptions) para comportamiento consistente.
+    - Definir la entrada de los parsers (ParserInput: bytes o stream binario).
 
 Colaboradores:
     - parsers específicos (PdfParser, DocxParser, TextParser)
@@ -23,7 +24,21 @@ Colaboradores:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Protocol, runtime_checkable
+from io import BytesIO
+from typing import Any, BinaryIO, Protocol, Union, runtime_checkable
+
+# Entrada de parsing: bytes en memoria o stream binario seekable (p.ej. el
+# spool de FileStoragePort.open_stream). pypdf/python-docx leen el stream
+# en forma perezosa, sin copiar el archivo completo a memoria.
+ParserInput = Union[bytes, BinaryIO]
+
+
+def as_binary_stream(content: ParserInput) -> BinaryIO:
+    """Stream rebobinado para el parser (envuelve bytes en BytesIO)."""
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return BytesIO(bytes(content))
+    content.seek(0)
+    return content
 
 
 @dataclass(frozen=True)
@@ -38,6 +53,10 @@ class ParserOptions:
       - allow_empty: permite decidir si "vacío" es error o no.
       - normalize_whitespace: estabiliza texto para chunking.
       - encoding: para text/plain.
+      - pdf_parallel_workers: procesos para extraer páginas de PDF en paralelo
+        (0/1 = serial).
+      - pdf_parallel_min_pages: por debajo de este tamaño no conviene paralelizar
+        (el arranque del pool cuesta más que lo que ahorra).
     """
 
     max_pages: int | None = 100
@@ -45,6 +64,8 @@ class ParserOptions:
     allow_empty: bool = True
     normalize_whitespace: bool = True
     encoding: str = "utf-8"
+    pdf_parallel_workers: int = 0
+    pdf_parallel_min_pages: int = 64
 
 
 @dataclass(frozen=True)
@@ -86,9 +107,9 @@ class BaseParser(Protocol):
       - LSP: cualquier parser concreto debe ser intercambiable por este contrato.
     """
 
-    def parse(self, content: bytes, *, options: ParserOptions) -> ExtractedText:
+    def parse(self, content: ParserInput, *, options: ParserOptions) -> ExtractedText:
         """
-        Parsear bytes -> texto + metadatos.
+        Parsear bytes o stream -> texto + metadatos.
 
         Errores esperables:
           - DocumentParsingError
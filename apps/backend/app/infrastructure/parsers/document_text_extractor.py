@@ -13,19 +13,25 @@ Responsabilidades:
     - Elegir Strategy correcta mediante ParserRegistry.
     - Aplicar opciones globales (ParserOptions) de forma consistente.
     - Retornar solo str (compatibilidad), descartando metadata por ahora.
+    - Ofrecer extracción incremental (iter_text) para el pipeline de proceso.
+    - Consultar el cache de extracción (opcional) antes de parsear.
 
 Colaboradores:
     - domain.services.DocumentTextExtractor (contrato)
     - registry.ParserRegistry
     - contracts.ParserOptions
     - normalize.normalize_text / truncate_text
+    - extraction_cache.ExtractionCache (opcional)
 ===============================================================================
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 from ...domain.services import DocumentTextExtractor
-from .contracts import ParserOptions
+from .contracts import ParserInput, ParserOptions
+from .extraction_cache import ExtractionCache
 from .normalize import normalize_text, truncate_text
 from .registry import ParserRegistry
 
@@ -43,19 +49,29 @@ class SimpleDocumentTextExtractor(DocumentTextExtractor):
         self,
         registry: ParserRegistry | None = None,
         options: ParserOptions | None = None,
+        cache: ExtractionCache | None = None,
     ) -> None:
         self._registry = registry or ParserRegistry()
         self._options = options or ParserOptions()
+        self._cache = cache
 
-    def extract_text(self, mime_type: str, content: bytes) -> str:
+    def extract_text(self, mime_type: str, content: ParserInput) -> str:
         """
-        Extrae texto desde bytes usando la Strategy adecuada.
+        Extrae texto desde bytes o stream usando la Strategy adecuada.
 
         Nota:
           - El dominio hoy espera 'str'. Internamente usamos ExtractedText
             para poder crecer (warnings, truncado, metadatos).
         """
         parser = self._registry.get_parser(mime_type)
+
+        cache_key = None
+        if self._cache is not None:
+            cache_key = self._cache.key_for(mime_type, content, mode="text")
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return "".join(cached)
+
         extracted = parser.parse(content, options=self._options)
 
         # Capa final de higiene: asegura consistencia aunque un parser se “olvide”
@@ -64,4 +80,57 @@ class SimpleDocumentTextExtractor(DocumentTextExtractor):
         )
         text, _ = truncate_text(text, max_chars=self._options.max_chars)
 
+        if cache_key is not None:
+            self._cache.set(cache_key, [text])
         return text
+
+    def iter_text(self, mime_type: str, content: ParserInput) -> Iterator[str]:
+        """
+        Extracción incremental (PagedTextExtractor).
+
+        - Parsers con `iter_pages` (PDF) emiten página a página.
+        - El resto cae a extract_text() en un único fragmento.
+        - max_chars se aplica de forma acumulativa (mismo límite total).
+        - Con cache: un hit devuelve las mismas páginas sin parsear; las
+          páginas se guardan solo si la iteración terminó completa.
+        """
+        parser = self._registry.get_parser(mime_type)
+        iter_pages = getattr(parser, "iter_pages", None)
+        if iter_pages is None:
+            text = self.extract_text(mime_type, content)
+            if text:
+                yield text
+            return
+
+        if self._cache is None:
+            yield from self._iter_parsed_pages(iter_pages, content)
+            return
+
+        cache_key = self._cache.key_for(mime_type, content, mode="pages")
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            yield from cached
+            return
+
+        pages: list[str] = []
+        for page in self._iter_parsed_pages(iter_pages, content):
+            pages.append(page)
+            yield page
+        self._cache.set(cache_key, pages)
+
+    def _iter_parsed_pages(self, iter_pages, content: ParserInput) -> Iterator[str]:
+        """Páginas normalizadas con max_chars acumulativo."""
+        remaining = self._options.max_chars
+        for page in iter_pages(content, options=self._options):
+            text = normalize_text(
+                page, collapse_whitespace=self._options.normalize_whitespace
+            )
+            if remaining is not None and remaining > 0:
+                text, truncated = truncate_text(text, max_chars=remaining)
+                remaining -= len(text)
+                if text:
+                    yield text
+                if truncated or remaining <= 0:
+                    return
+            elif text:
+                yield text
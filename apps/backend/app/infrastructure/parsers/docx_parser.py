@@ -23,9 +23,13 @@ Colaboradores:
 
 from __future__ import annotations
 
-from io import BytesIO
-
-from .contracts import BaseParser, ExtractedText, ParserOptions
+from .contracts import (
+    BaseParser,
+    ExtractedText,
+    ParserInput,
+    ParserOptions,
+    as_binary_stream,
+)
 from .errors import DocumentParsingError, EmptyDocumentError
 from .normalize import normalize_text, truncate_text
 
@@ -33,7 +37,7 @@ from .normalize import normalize_text, truncate_text
 class DocxParser(BaseParser):
     """Estrategia de parsing para DOCX (python-docx)."""
 
-    def parse(self, content: bytes, *, options: ParserOptions) -> ExtractedText:
+    def parse(self, content: ParserInput, *, options: ParserOptions) -> ExtractedText:
         try:
             from docx import Document
         except ImportError as e:
@@ -42,7 +46,7 @@ class DocxParser(BaseParser):
             ) from e
 
         try:
-            doc = Document(BytesIO(content))
+            doc = Document(as_binary_stream(content))
         except Exception as e:
             raise DocumentParsingError(
                 "No se pudo abrir el DOCX (archivo corrupto o inválido)",
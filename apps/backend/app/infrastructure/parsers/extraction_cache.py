@@ -0,0 +1,251 @@
+"""
+===============================================================================
+ARCHIVO: extraction_cache.py
+===============================================================================
+
+CRC CARD (Module)
+-------------------------------------------------------------------------------
+Nombre:
+    Cache de texto extraído (content-addressed)
+
+Responsabilidades:
+    - Evitar re-ejecutar pypdf/python-docx sobre bytes idénticos (reprocess,
+      mismo archivo en otro workspace).
+    - Derivar la key del SHA-256 de los bytes crudos + versión de parsers +
+      ParserOptions que afectan el resultado.
+    - Guardar el texto normalizado comprimido (zlib) en disco local o en el
+      object storage (compartido entre workers).
+
+Colaboradores:
+    - document_text_extractor.SimpleDocumentTextExtractor (consulta/guarda)
+    - domain.services.FileStoragePort (backend "storage")
+    - crosscutting.metrics.record_extraction_cache
+
+Decisiones:
+    - Best-effort: cualquier error del cache es un miss (nunca rompe el parsing).
+    - El valor es una lista de fragmentos: extract_text guarda uno solo e
+      iter_text guarda las páginas (mismo "shape" de salida en un hit).
+    - EXTRACTION_CACHE_VERSION se incrementa al cambiar la lógica de parsers
+      (invalida todo el cache sin borrarlo).
+===============================================================================
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Final
+
+from ...crosscutting.logger import logger
+from ...crosscutting.metrics import record_extraction_cache
+from ...domain.services import FileStoragePort
+from .contracts import ParserInput, ParserOptions
+from .mime_types import normalize_mime_type
+
+EXTRACTION_CACHE_VERSION: Final[str] = "1"
+
+_HASH_CHUNK_BYTES: Final[int] = 1024 * 1024
+
+# Opciones que no cambian el texto resultante (solo cómo se calcula).
+_OPTIONS_NOT_IN_KEY: Final[frozenset[str]] = frozenset(
+    {"pdf_parallel_workers", "pdf_parallel_min_pages"}
+)
+
+
+@lru_cache(maxsize=1)
+def _parser_library_versions() -> dict[str, str]:
+    """Versiones de pypdf/python-docx (un upgrade puede cambiar la extracción)."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    versions: dict[str, str] = {}
+    for package in ("pypdf", "python-docx"):
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = ""
+    return versions
+
+
+def _hash_content(content: ParserInput) -> str:
+    """SHA-256 de los bytes crudos (stream: por bloques y rebobinado)."""
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(content).hexdigest()
+    h = hashlib.sha256()
+    content.seek(0)
+    for block in iter(lambda: content.read(_HASH_CHUNK_BYTES), b""):
+        h.update(block)
+    content.seek(0)
+    return h.hexdigest()
+
+
+# ============================================================
+# Backends (bytes opacos por key)
+# ============================================================
+class ExtractionCacheBackend(ABC):
+    """Contrato mínimo de almacenamiento del cache de extracción."""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """Blob cacheado o None (miss)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, blob: bytes) -> None:
+        """Persiste el blob (best-effort)."""
+        raise NotImplementedError
+
+
+class DiskExtractionCacheBackend(ExtractionCacheBackend):
+    """
+    Cache en disco local del worker.
+
+    - Escritura atómica (temp + os.replace): lectores nunca ven blobs a medias.
+    - Cota de tamaño: al superar max_bytes se borran los archivos menos
+      usados (mtime; un hit hace "touch").
+    """
+
+    def __init__(self, directory: str, *, max_bytes: int) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be > 0")
+        self._dir = directory
+        self._max_bytes = max_bytes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._dir, f"{key}.z")
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fh:
+                blob = fh.read()
+            os.utime(path)
+            return blob
+        except OSError:
+            return None
+
+    def set(self, key: str, blob: bytes) -> None:
+        os.makedirs(self._dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(blob)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in os.scandir(self._dir):
+            if entry.name.endswith(".z"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                pass
+
+
+class StorageExtractionCacheBackend(ExtractionCacheBackend):
+    """Cache en el object storage (S3/MinIO): compartido entre workers/réplicas."""
+
+    def __init__(self, storage: FileStoragePort, *, prefix: str) -> None:
+        self._storage = storage
+        self._prefix = prefix.rstrip("/") + "/"
+
+    def _object_key(self, key: str) -> str:
+        return f"{self._prefix}{key[:2]}/{key}.z"
+
+    def get(self, key: str) -> bytes | None:
+        # Un miss es NoSuchKey: lo trata ExtractionCache como cualquier error.
+        return self._storage.download_file(self._object_key(key))
+
+    def set(self, key: str, blob: bytes) -> None:
+        self._storage.upload_file(
+            self._object_key(key), blob, "application/octet-stream"
+        )
+
+
+# ============================================================
+# Fachada
+# ============================================================
+class ExtractionCache:
+    """Cache de fragmentos de texto extraído, direccionado por contenido."""
+
+    def __init__(
+        self, backend: ExtractionCacheBackend, *, options: ParserOptions
+    ) -> None:
+        self._backend = backend
+        options_in_key = {
+            name: value
+            for name, value in dataclasses.asdict(options).items()
+            if name not in _OPTIONS_NOT_IN_KEY
+        }
+        self._fingerprint_base = {
+            "version": EXTRACTION_CACHE_VERSION,
+            "libraries": _parser_library_versions(),
+            "options": options_in_key,
+        }
+
+    def key_for(self, mime_type: str, content: ParserInput, *, mode: str) -> str:
+        """
+        Key = sha256(bytes crudos) + fingerprint(versión, libs, opciones, MIME, modo).
+
+        mode: "text" (extract_text) | "pages" (iter_text).
+        """
+        fingerprint = json.dumps(
+            {
+                **self._fingerprint_base,
+                "mime_type": normalize_mime_type(mime_type),
+                "mode": mode,
+            },
+            sort_keys=True,
+        )
+        suffix = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:16]
+        return f"{_hash_content(content)}-{suffix}"
+
+    def get(self, key: str) -> list[str] | None:
+        try:
+            blob = self._backend.get(key)
+            fragments = json.loads(zlib.decompress(blob)) if blob else None
+        except Exception:
+            fragments = None
+        if not isinstance(fragments, list):
+            record_extraction_cache("miss")
+            return None
+        record_extraction_cache("hit")
+        return fragments
+
+    def set(self, key: str, fragments: list[str]) -> None:
+        try:
+            blob = zlib.compress(json.dumps(fragments).encode("utf-8"), 6)
+            self._backend.set(key, blob)
+        except Exception as exc:
+            logger.warning(
+                "Extraction cache write failed",
+                extra={"key": key, "error": str(exc)},
+            )
+
+
+__all__ = [
+    "EXTRACTION_CACHE_VERSION",
+    "DiskExtractionCacheBackend",
+    "ExtractionCache",
+    "ExtractionCacheBackend",
+    "StorageExtractionCacheBackend",
+]
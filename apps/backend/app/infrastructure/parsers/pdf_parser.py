@@ -12,6 +12,14 @@ Responsabilidades:
     - Extraer texto desde PDF usando pypdf.
     - Aplicar límites defensivos (páginas + chars vía adapter/normalizer).
     - Ser tolerante a fallos parciales (una página rota no tumba todo).
+    - Extracción paralela opcional por rangos de páginas (ProcessPoolExecutor):
+      mismo orden, warnings por página y límites (max_pages/max_chars).
+      Aplica en los hijos del supervisor del worker (WORKER_PROCESSES > 1),
+      que ejecutan los jobs en proceso (rq.SimpleWorker): el pool vive lo
+      que vive el hijo. En un hijo creado con fork (work-horse de rq.Worker,
+      modo de un solo proceso) se extrae en serie, porque el pool spawn se
+      crearía y descartaría en cada job.
+    - Reportar offsets por página en metadata["page_offsets"].
     - Emitir warnings útiles (observabilidad).
 
 Colaboradores:
@@ -23,17 +31,124 @@ Colaboradores:
 
 from __future__ import annotations
 
-from io import BytesIO
+import atexit
+import math
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Generator, Iterator
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from multiprocessing import get_context
 
-from .contracts import BaseParser, ExtractedText, ParserOptions
+from .contracts import (
+    BaseParser,
+    ExtractedText,
+    ParserInput,
+    ParserOptions,
+    as_binary_stream,
+)
 from .errors import DocumentParsingError, EmptyDocumentError
 from .normalize import normalize_text, truncate_text
 
+# (índice de página, texto normalizado, warning o None)
+_PageResult = tuple[int, str, str | None]
+
+_PAGE_SEPARATOR = "\n"
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+_forked_child = False
+
+
+def _after_fork_in_child() -> None:
+    """
+    Hijo creado con fork: el pool heredado no sirve (sus threads de gestión
+    quedaron en el padre) y el proceso suele vivir un solo job.
+    """
+    global _pool, _pool_workers, _pool_lock, _forked_child
+    _pool = None
+    _pool_workers = 0
+    _pool_lock = threading.Lock()
+    _forked_child = True
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _extract_page(page, index: int, collapse_whitespace: bool) -> _PageResult:
+    try:
+        text = page.extract_text() or ""
+    except Exception as e:
+        return (
+            index,
+            "",
+            f"Fallo al extraer texto de página {index}: {type(e).__name__}",
+        )
+    return index, normalize_text(text, collapse_whitespace=collapse_whitespace), None
+
+
+def _extract_page_range(
+    path: str, start: int, stop: int, collapse_whitespace: bool
+) -> list[_PageResult]:
+    """Tarea del process pool: extrae [start, stop) abriendo el PDF desde disco."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(path, strict=False)
+    return [
+        _extract_page(reader.pages[i], i, collapse_whitespace)
+        for i in range(start, stop)
+    ]
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Pool compartido por proceso (se crea una vez; arrancar procesos es caro).
+
+    Spawn: los hijos no heredan threads/sockets del worker (pool de BD, etc.).
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=get_context("spawn")
+            )
+            _pool_workers = workers
+        return _pool
+
+
+@atexit.register
+def _reset_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+@contextmanager
+def _shared_pdf_path(content: ParserInput) -> Iterator[str]:
+    """Path en disco del PDF para los procesos del pool (temp file si hace falta)."""
+    tmp = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+    try:
+        with tmp:
+            shutil.copyfileobj(as_binary_stream(content), tmp)
+        yield tmp.name
+    finally:
+        os.unlink(tmp.name)
+
 
 class PdfParser(BaseParser):
     """Estrategia de parsing para PDFs (pypdf)."""
 
-    def parse(self, content: bytes, *, options: ParserOptions) -> ExtractedText:
+    @staticmethod
+    def _open_reader(content: ParserInput):
         # Lazy import: mejora cold start del worker/api
         try:
             from pypdf import PdfReader
@@ -44,13 +159,41 @@ class PdfParser(BaseParser):
 
         # Abrir PDF (strict=False reduce fallos por PDFs imperfectos)
         try:
-            reader = PdfReader(BytesIO(content), strict=False)
+            return PdfReader(as_binary_stream(content), strict=False)
         except Exception as e:
             raise DocumentParsingError(
                 "No se pudo abrir el PDF (archivo corrupto o inválido)",
                 original_error=e,
             ) from e
 
+    def iter_pages(
+        self, content: ParserInput, *, options: ParserOptions
+    ) -> Iterator[str]:
+        """
+        Texto normalizado página a página (pipeline de procesamiento).
+
+        - Mismos límites que parse(): max_pages y páginas rotas se saltean.
+        - El truncado por max_chars lo aplica el adapter (es acumulativo).
+        """
+        reader = self._open_reader(content)
+        max_pages = (
+            options.max_pages if (options.max_pages and options.max_pages > 0) else None
+        )
+
+        emitted = False
+        for _, text, _ in self._iter_pages_serial(reader, max_pages, options):
+            if text:
+                emitted = True
+                yield text
+
+        if not emitted and not options.allow_empty:
+            raise EmptyDocumentError(
+                "PDF sin texto extraíble (posible escaneo sin OCR)"
+            )
+
+    def parse(self, content: ParserInput, *, options: ParserOptions) -> ExtractedText:
+        reader = self._open_reader(content)
+
         warnings: list[str] = []
 
         # page_count es best-effort: PDFs raros pueden fallar
@@ -67,41 +210,54 @@ class PdfParser(BaseParser):
             options.max_pages if (options.max_pages and options.max_pages > 0) else None
         )
 
-        extracted_parts: list[str] = []
-        truncated_by_pages = False
+        truncated_by_pages = (
+            max_pages is not None and page_count is not None and page_count > max_pages
+        )
+        if truncated_by_pages:
+            warnings.append(f"PDF truncado por max_pages={max_pages}")
 
-        # Iteración defensiva por página:
-        # - si una página rompe, agregamos warning y seguimos
-        for i, page in enumerate(reader.pages):
-            if max_pages is not None and i >= max_pages:
-                truncated_by_pages = True
-                warnings.append(f"PDF truncado por max_pages={max_pages}")
-                break
+        limit = page_count if max_pages is None else min(page_count or 0, max_pages)
+        if page_count is not None and self._use_parallel(limit, options):
+            pages = self._iter_pages_parallel(content, limit, options)
+        else:
+            pages = self._iter_pages_serial(reader, max_pages, options)
 
-            try:
-                text = page.extract_text() or ""
-            except Exception as e:
-                warnings.append(
-                    f"Fallo al extraer texto de página {i}: {type(e).__name__}"
+        # Ensamblado incremental: texto normalizado por página + offsets.
+        # Al alcanzar max_chars se corta la iteración (cancela lo pendiente).
+        parts: list[str] = []
+        page_offsets: list[dict[str, int]] = []
+        length = 0
+        try:
+            for index, text, warning in pages:
+                if warning:
+                    warnings.append(warning)
+                if not text:
+                    continue
+                if parts:
+                    length += len(_PAGE_SEPARATOR)
+                page_offsets.append(
+                    {"page": index, "start": length, "end": length + len(text)}
                 )
-                continue
-
-            if text.strip():
-                extracted_parts.append(text)
-
-        raw_text = "\n".join(extracted_parts)
+                parts.append(text)
+                length += len(text)
+                if options.max_chars and length >= options.max_chars:
+                    break
+        finally:
+            pages.close()
 
-        # Normalización y truncado por chars (sostenibilidad)
-        normalized = normalize_text(
-            raw_text, collapse_whitespace=options.normalize_whitespace
-        )
         normalized, truncated_by_chars = truncate_text(
-            normalized, max_chars=options.max_chars
+            _PAGE_SEPARATOR.join(parts), max_chars=options.max_chars
         )
+        if truncated_by_chars:
+            page_offsets = [
+                {**offset, "end": min(offset["end"], len(normalized))}
+                for offset in page_offsets
+                if offset["start"] < len(normalized)
+            ]
 
         result = ExtractedText(
             content=normalized,
-            metadata={"source": "pdf"},
+            metadata={"source": "pdf", "page_offsets": page_offsets},
             warnings=warnings,
             page_count=page_count,
             was_truncated=truncated_by_pages or truncated_by_chars,
@@ -114,3 +270,74 @@ class PdfParser(BaseParser):
             )
 
         return result
+
+    # =========================================================================
+    # Extracción por página: serial (en proceso) o paralela (process pool)
+    # =========================================================================
+
+    @staticmethod
+    def _use_parallel(limit: int, options: ParserOptions) -> bool:
+        # R: En un hijo forkeado el arranque del pool (spawn) se pagaría por
+        #    job y se perdería al terminar: serie es más barato.
+        if _forked_child:
+            return False
+        return options.pdf_parallel_workers > 1 and limit >= max(
+            2, options.pdf_parallel_min_pages
+        )
+
+    @staticmethod
+    def _iter_pages_serial(
+        reader, max_pages: int | None, options: ParserOptions
+    ) -> Generator[_PageResult, None, None]:
+        # Iteración defensiva por página: si una página rompe, warning y seguimos.
+        for i, page in enumerate(reader.pages):
+            if max_pages is not None and i >= max_pages:
+                break
+            yield _extract_page(page, i, options.normalize_whitespace)
+
+    def _iter_pages_parallel(
+        self, content: ParserInput, limit: int, options: ParserOptions
+    ) -> Generator[_PageResult, None, None]:
+        """
+        Reparte rangos de páginas entre procesos y las devuelve en orden.
+
+        - Cada proceso abre el PDF desde un temp file compartido (no se
+          serializa el archivo por cada tarea).
+        - Rangos chicos (≈4 por proceso): balancean páginas desparejas y
+          permiten cancelar temprano al llegar a max_chars.
+        """
+        workers = options.pdf_parallel_workers
+        step = max(1, math.ceil(limit / (workers * 4)))
+
+        with _shared_pdf_path(content) as path:
+            pool = _get_pool(workers)
+            futures = [
+                pool.submit(
+                    _extract_page_range,
+                    path,
+                    start,
+                    min(start + step, limit),
+                    options.normalize_whitespace,
+                )
+                for start in range(0, limit, step)
+            ]
+            next_index = 0
+            try:
+                for future in futures:
+                    for page_result in future.result():
+                        yield page_result
+                        next_index = page_result[0] + 1
+            except BrokenProcessPool:
+                # Un proceso murió (OOM/kill): se descarta el pool y se sigue
+                # en serie desde la primera página no emitida.
+                _reset_pool()
+                reader = self._open_reader(content)
+                for i in range(next_index, limit):
+                    yield _extract_page(
+                        reader.pages[i], i, options.normalize_whitespace
+                    )
+            finally:
+                # Corte temprano (max_chars) o error: no procesar lo pendiente.
+                for future in futures:
+                    future.cancel()
+                wait(futures)
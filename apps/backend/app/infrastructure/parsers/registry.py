@@ -24,7 +24,13 @@ from __future__ import annotations
 
 from collections.abc import Callable
 
-from .contracts import BaseParser, ExtractedText, ParserOptions
+from .contracts import (
+    BaseParser,
+    ExtractedText,
+    ParserInput,
+    ParserOptions,
+    as_binary_stream,
+)
 from .docx_parser import DocxParser
 from .errors import UnsupportedMimeTypeError
 from .mime_types import (
@@ -46,7 +52,9 @@ class TextParser(BaseParser):
       - El adapter central aplica normalización/truncado también.
     """
 
-    def parse(self, content: bytes, *, options: ParserOptions) -> ExtractedText:
+    def parse(self, content: ParserInput, *, options: ParserOptions) -> ExtractedText:
+        if not isinstance(content, (bytes, bytearray, memoryview)):
+            content = as_binary_stream(content).read()
         try:
             text = content.decode(options.encoding)
         except UnicodeDecodeError:
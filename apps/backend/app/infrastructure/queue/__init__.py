@@ -11,17 +11,27 @@ Nombre:
 Responsabilidades:
     - Exponer el adaptador de cola utilizado por DI (RQDocumentProcessingQueue).
     - Exponer el contrato de configuración (RQQueueConfig).
+    - Exponer helpers de fairness (tope por workspace, backlog por carril).
     - Mantener un API de import estable para el resto del backend.
 
 Colaboradores:
     - rq_queue.RQDocumentProcessingQueue
     - rq_queue.RQQueueConfig
+    - fairness.WorkspaceConcurrencyLimiter
 ===============================================================================
 """
 
+from .fairness import (
+    WorkspaceConcurrencyLimiter,
+    defer_job,
+    sample_lane_backlog,
+)
 from .rq_queue import RQDocumentProcessingQueue, RQQueueConfig
 
 __all__ = [
     "RQDocumentProcessingQueue",
     "RQQueueConfig",
+    "WorkspaceConcurrencyLimiter",
+    "defer_job",
+    "sample_lane_backlog",
 ]
@@ -0,0 +1,183 @@
+"""
+===============================================================================
+ARCHIVO: infrastructure/queue/fairness.py
+===============================================================================
+
+CRC CARD (Módulo)
+-------------------------------------------------------------------------------
+Nombre:
+    Fairness de la cola de documentos (tope por workspace + backlog por carril)
+
+Responsabilidades:
+    - Limitar jobs concurrentes por workspace (semáforo distribuido en Redis).
+    - Diferir un job que no obtuvo slot: RQ lo re-agenda (mismo job id) y
+      vuelve al final de su carril tras una demora, sin ocupar al worker.
+    - Muestrear profundidad y antigüedad del job más viejo por carril.
+
+Colaboradores:
+    - worker.jobs.process_document_job (acquire/release/defer)
+    - worker.worker (sampler de métricas por carril)
+    - job_paths.QUEUE_LANES / lane_queue_name
+
+Decisiones:
+    - Semáforo = sorted set con leases (score = vencimiento): si un proceso
+      muere con el slot tomado, el lease expira solo (sin slots "perdidos").
+    - Acquire atómico con un script Lua (sin carreras entre workers).
+    - Fail-open: si Redis falla en el acquire, se procesa igual (la fairness
+      es una optimización, no un requisito de correctitud).
+===============================================================================
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from datetime import datetime, timezone
+from typing import Any, Final
+from uuid import UUID
+
+from ...crosscutting.logger import logger
+from .job_paths import QUEUE_LANES, lane_queue_name
+
+_KEY_PREFIX: Final[str] = "rag:queue:ws-inflight"
+
+# Meta del job con el enqueue original (los deferrals re-encolan el mismo job).
+FIRST_ENQUEUED_AT_META: Final[str] = "first_enqueued_at"
+
+# R: Válvula de seguridad: tras tantos deferrals seguidos RQ marca el job
+#    como fallido (con 2s de demora son varias horas de espera).
+_MAX_DEFERRALS: Final[int] = 10_000
+
+# KEYS[1]=set del workspace; ARGV: now, límite, lease (s), token
+_ACQUIRE_LUA: Final[str] = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local lease = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now)
+if redis.call('ZSCORE', key, ARGV[4]) then
+  return 1
+end
+if redis.call('ZCARD', key) >= limit then
+  return 0
+end
+redis.call('ZADD', key, now + lease, ARGV[4])
+redis.call('EXPIRE', key, math.ceil(lease))
+return 1
+"""
+
+
+class WorkspaceConcurrencyLimiter:
+    """Semáforo distribuido: como máximo N jobs en vuelo por workspace."""
+
+    def __init__(
+        self,
+        redis: Any,
+        *,
+        max_per_workspace: int,
+        lease_seconds: float,
+    ) -> None:
+        if max_per_workspace <= 0:
+            raise ValueError("max_per_workspace must be > 0")
+        self._redis = redis
+        self._limit = max_per_workspace
+        self._lease = max(1.0, float(lease_seconds))
+        self._acquire = redis.register_script(_ACQUIRE_LUA)
+
+    @staticmethod
+    def _key(workspace_id: UUID) -> str:
+        return f"{_KEY_PREFIX}:{workspace_id}"
+
+    def try_acquire(self, workspace_id: UUID, token: str) -> bool:
+        """Toma un slot para `token`; False si el workspace está en su tope."""
+        try:
+            acquired = self._acquire(
+                keys=[self._key(workspace_id)],
+                args=[time.time(), self._limit, self._lease, token],
+            )
+        except Exception as exc:
+            logger.warning(
+                "Workspace limiter unavailable; processing without cap",
+                extra={"workspace_id": str(workspace_id), "error": str(exc)},
+            )
+            return True
+        return bool(int(acquired))
+
+    def release(self, workspace_id: UUID, token: str) -> None:
+        """Libera el slot (best-effort: si falla, el lease vence solo)."""
+        try:
+            self._redis.zrem(self._key(workspace_id), token)
+        except Exception as exc:
+            logger.warning(
+                "Workspace limiter release failed",
+                extra={"workspace_id": str(workspace_id), "error": str(exc)},
+            )
+
+
+def defer_job(job: Any, *, delay_seconds: float) -> Any:
+    """
+    Difiere el job EN CURSO: devuelve un `rq.Retry` que el job debe retornar.
+
+    RQ re-agenda el MISMO job (mismo id, args y opciones) para dentro de
+    `delay_seconds` vía su scheduler y libera el worker al instante; al
+    vencer, el job vuelve al final de su carril. El `enqueued_at` original se
+    guarda en meta para que la antigüedad del backlog no se resetee.
+    """
+    from rq import Retry  # type: ignore
+
+    meta = getattr(job, "meta", None)
+    if meta is not None and FIRST_ENQUEUED_AT_META not in meta:
+        enqueued_at = getattr(job, "enqueued_at", None)
+        if enqueued_at is not None:
+            meta[FIRST_ENQUEUED_AT_META] = enqueued_at.isoformat()
+            job.save_meta()
+    return Retry(max=_MAX_DEFERRALS, interval=max(0, math.ceil(delay_seconds)))
+
+
+def _job_enqueued_at(job: Any) -> datetime | None:
+    """Primer enqueue del job (sobrevive a deferrals); si no, enqueued_at."""
+    first = (getattr(job, "meta", None) or {}).get(FIRST_ENQUEUED_AT_META)
+    if first:
+        try:
+            return datetime.fromisoformat(first)
+        except ValueError:
+            pass
+    return getattr(job, "enqueued_at", None)
+
+
+def sample_lane_backlog(
+    redis: Any, base_queue_name: str
+) -> list[tuple[str, int, float]]:
+    """
+    (carril, profundidad, antigüedad del job más viejo en segundos) por carril.
+
+    La antigüedad se mide desde el primer enqueue del job en la cabeza de la
+    cola (meta `first_enqueued_at` si fue diferido; si no, `enqueued_at`).
+    """
+    from rq import Queue  # type: ignore
+    from rq.job import Job  # type: ignore
+
+    samples: list[tuple[str, int, float]] = []
+    now = datetime.now(timezone.utc)
+    for lane in QUEUE_LANES:
+        queue = Queue(name=lane_queue_name(base_queue_name, lane), connection=redis)
+        depth = queue.count
+        age = 0.0
+        if depth:
+            job_ids = queue.get_job_ids(offset=0, length=1)
+            job = Job.fetch(job_ids[0], connection=redis) if job_ids else None
+            enqueued_at = _job_enqueued_at(job) if job is not None else None
+            if enqueued_at is not None:
+                if enqueued_at.tzinfo is None:
+                    enqueued_at = enqueued_at.replace(tzinfo=timezone.utc)
+                age = max(0.0, (now - enqueued_at).total_seconds())
+        samples.append((lane, depth, age))
+    return samples
+
+
+__all__ = [
+    "FIRST_ENQUEUED_AT_META",
+    "WorkspaceConcurrencyLimiter",
+    "defer_job",
+    "sample_lane_backlog",
+]
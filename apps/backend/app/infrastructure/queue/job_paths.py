@@ -10,11 +10,13 @@ Nombre:
 
 Responsabilidades:
     - Centralizar nombres de colas y rutas "importables" de jobs.
+    - Mapear clases de prioridad a carriles (una cola RQ por carril).
     - Evitar strings mágicos dispersos (anti-drift).
 
 Colaboradores:
     - rq_queue.RQDocumentProcessingQueue
     - worker.jobs.process_document_job (job ejecutado por el worker)
+    - worker.jobs.expire_presigned_upload_job (vencimiento de uploads directos)
 
 Notas:
     - Las rutas deben ser importables por el worker de RQ.
@@ -27,9 +29,23 @@ from __future__ import annotations
 # Nombre por defecto de la cola de documentos.
 DOCUMENTS_QUEUE_NAME: str = "documents"
 
+# Carriles en orden de prioridad (valores de domain.services.ProcessingPriority).
+# "interactive" usa el nombre base: compatible con jobs encolados antes de los carriles.
+QUEUE_LANES: tuple[str, ...] = ("interactive", "reprocess", "connector")
+
+
+def lane_queue_name(base_queue_name: str, lane: str) -> str:
+    """Nombre de la cola RQ de un carril (interactive → nombre base)."""
+    if lane == QUEUE_LANES[0]:
+        return base_queue_name
+    return f"{base_queue_name}.{lane}"
+
 
 # Job principal de procesamiento de documentos.
 # IMPORTANTÍSIMO:
 #   - Debe coincidir con la ubicación real del job.
 #   - Se valida en runtime cuando se inicializa la cola.
 PROCESS_DOCUMENT_JOB_PATH: str = "app.worker.jobs.process_document_job"
+
+# Vencimiento de un upload directo (presigned PUT) nunca completado.
+EXPIRE_PRESIGNED_UPLOAD_JOB_PATH: str = "app.worker.jobs.expire_presigned_upload_job"
@@ -11,12 +11,14 @@ Clase:
 Responsabilidades:
     - Implementar el puerto de dominio `DocumentProcessingQueue` usando RQ.
     - Encolar el job de procesamiento de documentos de forma segura y observable.
+    - Rutear cada job al carril de su prioridad (interactive / reprocess / connector).
+    - Agendar el vencimiento de uploads directos (RQ scheduler, enqueue_in).
     - Validar configuración (nombre de cola + job path importable) en modo fail-fast.
     - Encapsular dependencias externas (rq/redis) para no “filtrarlas” al dominio.
 
 Colaboradores:
     - domain.services.DocumentProcessingQueue
-    - job_paths.PROCESS_DOCUMENT_JOB_PATH
+    - job_paths.PROCESS_DOCUMENT_JOB_PATH / EXPIRE_PRESIGNED_UPLOAD_JOB_PATH
     - import_utils.is_importable_dotted_path
     - errors.QueueConfigurationError / QueueEnqueueError
     - crosscutting.logger
@@ -31,14 +33,21 @@ Patrones:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import timedelta
 from typing import Any
 from uuid import UUID
 
 from ...crosscutting.logger import logger
-from ...domain.services import DocumentProcessingQueue
+from ...domain.services import DocumentProcessingQueue, ProcessingPriority
 from .errors import QueueConfigurationError, QueueEnqueueError
 from .import_utils import is_importable_dotted_path
-from .job_paths import DOCUMENTS_QUEUE_NAME, PROCESS_DOCUMENT_JOB_PATH
+from .job_paths import (
+    DOCUMENTS_QUEUE_NAME,
+    EXPIRE_PRESIGNED_UPLOAD_JOB_PATH,
+    PROCESS_DOCUMENT_JOB_PATH,
+    QUEUE_LANES,
+    lane_queue_name,
+)
 
 
 @dataclass(frozen=True)
@@ -46,7 +55,8 @@ class RQQueueConfig:
     """Configuración del adaptador RQ.
 
     queue_name:
-        Nombre de la cola en Redis.
+        Nombre base de la cola en Redis (carril interactive); los demás
+        carriles usan `<queue_name>.<lane>`.
     retry_max_attempts:
         Número de reintentos automáticos si el worker falla.
     job_timeout_seconds:
@@ -74,19 +84,27 @@ class RQDocumentProcessingQueue(DocumentProcessingQueue):
         self._redis = redis
         self._config = _validate_config(config)
 
-        # Fail-fast: el worker necesita importar el job.
-        if not is_importable_dotted_path(PROCESS_DOCUMENT_JOB_PATH):
-            raise QueueConfigurationError(
-                "Job path no importable para RQ: "
-                f"{PROCESS_DOCUMENT_JOB_PATH}. "
-                "Revisar `infrastructure/queue/job_paths.py` y `app/worker/jobs.py`."
-            )
+        # Fail-fast: el worker necesita importar los jobs.
+        for job_path in (PROCESS_DOCUMENT_JOB_PATH, EXPIRE_PRESIGNED_UPLOAD_JOB_PATH):
+            if not is_importable_dotted_path(job_path):
+                raise QueueConfigurationError(
+                    "Job path no importable para RQ: "
+                    f"{job_path}. "
+                    "Revisar `infrastructure/queue/job_paths.py` y "
+                    "`app/worker/jobs.py`."
+                )
 
         # Lazy import: rq es dependencia opcional.
         self._rq = _lazy_import_rq()
 
-        # Construimos la cola real.
-        self._queue = self._rq.Queue(name=self._config.queue_name, connection=redis)
+        # Una cola real por carril de prioridad.
+        self._queues = {
+            lane: self._rq.Queue(
+                name=lane_queue_name(self._config.queue_name, lane),
+                connection=redis,
+            )
+            for lane in QUEUE_LANES
+        }
 
         # Retry policy (si max_attempts <= 0, desactivamos)
         self._retry = None
@@ -104,7 +122,11 @@ class RQDocumentProcessingQueue(DocumentProcessingQueue):
         )
 
     def enqueue_document_processing(
-        self, document_id: UUID, *, workspace_id: UUID
+        self,
+        document_id: UUID,
+        *,
+        workspace_id: UUID,
+        priority: ProcessingPriority = ProcessingPriority.INTERACTIVE,
     ) -> str:
         """Encola el job de procesamiento de un documento.
 
@@ -112,8 +134,10 @@ class RQDocumentProcessingQueue(DocumentProcessingQueue):
           - En la cola guardamos strings (UUIDs como texto) para evitar problemas
             de pickling/compatibilidad.
         """
+        lane = ProcessingPriority(priority).value
+        queue = self._queues[lane]
         try:
-            job = self._queue.enqueue(
+            job = queue.enqueue(
                 PROCESS_DOCUMENT_JOB_PATH,
                 args=(str(document_id), str(workspace_id)),
                 retry=self._retry,
@@ -131,7 +155,8 @@ class RQDocumentProcessingQueue(DocumentProcessingQueue):
                     "document_id": str(document_id),
                     "workspace_id": str(workspace_id),
                     "job_id": job_id,
-                    "queue": self._config.queue_name,
+                    "queue": queue.name,
+                    "lane": lane,
                 },
             )
 
@@ -143,7 +168,8 @@ class RQDocumentProcessingQueue(DocumentProcessingQueue):
                 extra={
                     "document_id": str(document_id),
                     "workspace_id": str(workspace_id),
-                    "queue": self._config.queue_name,
+                    "queue": queue.name,
+                    "lane": lane,
                 },
             )
             raise QueueEnqueueError(
@@ -151,6 +177,55 @@ class RQDocumentProcessingQueue(DocumentProcessingQueue):
                 original_error=exc,
             ) from exc
 
+    def schedule_upload_expiry(
+        self,
+        document_id: UUID,
+        *,
+        workspace_id: UUID,
+        delay_seconds: int,
+    ) -> str:
+        """Agenda el vencimiento de un upload directo (carril interactive).
+
+        El job queda en el ScheduledJobRegistry hasta `delay_seconds`; el
+        scheduler de RQ del worker lo promueve a la cola al vencer.
+        """
+        queue = self._queues[QUEUE_LANES[0]]
+        try:
+            job = queue.enqueue_in(
+                timedelta(seconds=max(0, int(delay_seconds))),
+                EXPIRE_PRESIGNED_UPLOAD_JOB_PATH,
+                args=(str(document_id), str(workspace_id)),
+                job_timeout=self._config.job_timeout_seconds,
+                result_ttl=self._config.result_ttl_seconds,
+                description=f"expire_presigned_upload:{document_id}",
+            )
+            job_id = str(getattr(job, "id", "") or "")
+
+            logger.info(
+                "Vencimiento de upload agendado",
+                extra={
+                    "document_id": str(document_id),
+                    "workspace_id": str(workspace_id),
+                    "job_id": job_id,
+                    "delay_seconds": delay_seconds,
+                },
+            )
+            return job_id
+
+        except Exception as exc:
+            logger.exception(
+                "Error al agendar vencimiento de upload",
+                extra={
+                    "document_id": str(document_id),
+                    "workspace_id": str(workspace_id),
+                    "queue": queue.name,
+                },
+            )
+            raise QueueEnqueueError(
+                "No se pudo agendar el vencimiento del upload",
+                original_error=exc,
+            ) from exc
+
 
 # -----------------------------------------------------------------------------
 # Helpers privados (módulo)
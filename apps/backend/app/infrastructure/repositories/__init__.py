@@ -6,6 +6,7 @@ This module provides concrete implementations of domain repository interfaces.
 Structure:
     - postgres/     Production implementations (SQLAlchemy + PostgreSQL)
     - in_memory/    Testing & development implementations (ephemeral)
+    - cached/       Cache decorators over ports (workspace/ACL, short TTL)
     - redis/        (Future) Caching and rate limiting
 
 Usage:
@@ -19,6 +20,15 @@ Factory Pattern:
     Use get_repository() for DI-friendly instantiation.
 """
 
+# =============================================================================
+# Cache Decorators (wrap any implementation)
+# =============================================================================
+from .cached import (
+    CachedWorkspaceAclRepository,
+    CachedWorkspaceRepository,
+    WorkspaceAccessCache,
+)
+
 # =============================================================================
 # In-Memory Implementations (Testing/Development)
 # =============================================================================
@@ -61,4 +71,8 @@ __all__ = [
     "InMemoryConversationRepository",
     "InMemoryWorkspaceRepository",
     "InMemoryWorkspaceAclRepository",
+    # Cached
+    "CachedWorkspaceRepository",
+    "CachedWorkspaceAclRepository",
+    "WorkspaceAccessCache",
 ]
@@ -0,0 +1,16 @@
+"""
+Cached Repository Decorators.
+
+Wrap domain repository ports with short-TTL caches (request-scoped + LRU).
+The inner repository stays the source of truth; writes invalidate.
+"""
+
+from .workspace import CachedWorkspaceRepository
+from .workspace_acl import CachedWorkspaceAclRepository
+from .workspace_cache import WorkspaceAccessCache
+
+__all__ = [
+    "CachedWorkspaceAclRepository",
+    "CachedWorkspaceRepository",
+    "WorkspaceAccessCache",
+]
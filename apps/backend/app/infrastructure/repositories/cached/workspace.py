@@ -0,0 +1,146 @@
+"""
+============================================================
+TARJETA CRC — infrastructure/repositories/cached/workspace.py
+============================================================
+Class: CachedWorkspaceRepository
+
+Responsibilities:
+  - Decorar un WorkspaceRepository cacheando `get_workspace`.
+  - Invalidar el workspace ante update/archive (y create, por simetría).
+  - Delegar sin cambios los listados (no se cachean).
+
+Collaborators:
+  - domain.repositories.WorkspaceRepository (inner)
+  - WorkspaceAccessCache
+
+Constraints / Notes:
+  - Copias defensivas: Workspace es mutable (listas de roles/ACL).
+  - Los use cases de publish/share escriben vía update_workspace, por lo
+    que la invalidación les aplica sin acoplarlos al cache.
+============================================================
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from uuid import UUID
+
+from ....domain.entities import Workspace, WorkspaceVisibility
+from ....domain.repositories import WorkspaceRepository
+from .workspace_cache import WorkspaceAccessCache
+
+_KIND = "workspace"
+
+
+def _copy(workspace: Workspace | None) -> Workspace | None:
+    if workspace is None:
+        return None
+    return replace(
+        workspace,
+        allowed_roles=list(workspace.allowed_roles),
+        shared_user_ids=list(workspace.shared_user_ids),
+    )
+
+
+class CachedWorkspaceRepository:
+    """Decorator de cache sobre el puerto WorkspaceRepository."""
+
+    def __init__(self, inner: WorkspaceRepository, cache: WorkspaceAccessCache):
+        self._inner = inner
+        self._cache = cache
+
+    # =========================================================
+    # Lecturas cacheadas
+    # =========================================================
+    def get_workspace(self, workspace_id: UUID) -> Workspace | None:
+        cached = self._cache.get_or_load(
+            (_KIND, workspace_id),
+            lambda: _copy(self._inner.get_workspace(workspace_id)),
+        )
+        return _copy(cached)
+
+    # =========================================================
+    # Lecturas sin cache (delegación)
+    # =========================================================
+    def list_workspaces(
+        self,
+        *,
+        owner_user_id: UUID | None = None,
+        include_archived: bool = False,
+    ) -> list[Workspace]:
+        return self._inner.list_workspaces(
+            owner_user_id=owner_user_id, include_archived=include_archived
+        )
+
+    def list_workspaces_by_visibility(
+        self,
+        visibility: WorkspaceVisibility,
+        *,
+        include_archived: bool = False,
+    ) -> list[Workspace]:
+        return self._inner.list_workspaces_by_visibility(
+            visibility, include_archived=include_archived
+        )
+
+    def list_workspaces_by_ids(
+        self,
+        workspace_ids: list[UUID],
+        *,
+        include_archived: bool = False,
+    ) -> list[Workspace]:
+        return self._inner.list_workspaces_by_ids(
+            workspace_ids, include_archived=include_archived
+        )
+
+    def list_workspaces_visible_to_user(
+        self,
+        user_id: UUID,
+        *,
+        include_archived: bool = False,
+    ) -> list[Workspace]:
+        return self._inner.list_workspaces_visible_to_user(
+            user_id, include_archived=include_archived
+        )
+
+    def get_workspace_by_owner_and_name(
+        self, owner_user_id: UUID | None, name: str
+    ) -> Workspace | None:
+        return self._inner.get_workspace_by_owner_and_name(owner_user_id, name)
+
+    # =========================================================
+    # Escrituras (invalidan)
+    # =========================================================
+    def create_workspace(self, workspace: Workspace) -> Workspace:
+        created = self._inner.create_workspace(workspace)
+        self._cache.invalidate((_KIND, created.id))
+        return created
+
+    def update_workspace(
+        self,
+        workspace_id: UUID,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        visibility: WorkspaceVisibility | None = None,
+        allowed_roles: list[str] | None = None,
+        fts_language: str | None = None,
+        chunk_dedup_enabled: bool | None = None,
+    ) -> Workspace | None:
+        try:
+            return self._inner.update_workspace(
+                workspace_id,
+                name=name,
+                description=description,
+                visibility=visibility,
+                allowed_roles=allowed_roles,
+                fts_language=fts_language,
+                chunk_dedup_enabled=chunk_dedup_enabled,
+            )
+        finally:
+            self._cache.invalidate((_KIND, workspace_id))
+
+    def archive_workspace(self, workspace_id: UUID) -> bool:
+        try:
+            return self._inner.archive_workspace(workspace_id)
+        finally:
+            self._cache.invalidate((_KIND, workspace_id))
@@ -0,0 +1,52 @@
+"""
+============================================================
+TARJETA CRC — infrastructure/repositories/cached/workspace_acl.py
+============================================================
+Class: CachedWorkspaceAclRepository
+
+Responsibilities:
+  - Decorar un WorkspaceAclRepository cacheando `list_workspace_acl`.
+  - Invalidar la ACL del workspace ante `replace_workspace_acl` (share).
+  - Delegar el reverse lookup (`list_workspaces_for_user`) sin cache.
+
+Collaborators:
+  - domain.repositories.WorkspaceAclRepository (inner)
+  - WorkspaceAccessCache
+
+Constraints / Notes:
+  - Devuelve listas nuevas: el caller puede mutarlas sin tocar el cache.
+============================================================
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from ....domain.repositories import WorkspaceAclRepository
+from .workspace_cache import WorkspaceAccessCache
+
+_KIND = "acl"
+
+
+class CachedWorkspaceAclRepository:
+    """Decorator de cache sobre el puerto WorkspaceAclRepository."""
+
+    def __init__(self, inner: WorkspaceAclRepository, cache: WorkspaceAccessCache):
+        self._inner = inner
+        self._cache = cache
+
+    def list_workspace_acl(self, workspace_id: UUID) -> list[UUID]:
+        cached = self._cache.get_or_load(
+            (_KIND, workspace_id),
+            lambda: tuple(self._inner.list_workspace_acl(workspace_id)),
+        )
+        return list(cached or ())
+
+    def replace_workspace_acl(self, workspace_id: UUID, user_ids: list[UUID]) -> None:
+        try:
+            self._inner.replace_workspace_acl(workspace_id, user_ids)
+        finally:
+            self._cache.invalidate((_KIND, workspace_id))
+
+    def list_workspaces_for_user(self, user_id: UUID) -> list[UUID]:
+        return self._inner.list_workspaces_for_user(user_id)
@@ -0,0 +1,158 @@
+"""
+============================================================
+TARJETA CRC — infrastructure/repositories/cached/workspace_cache.py
+============================================================
+Class: WorkspaceAccessCache
+
+Responsibilities:
+  - Cachear lecturas de workspace/ACL en dos niveles:
+      1) request-scoped (dict del request actual, sin TTL)
+      2) cross-request (LRU acotado + TTL corto, por proceso)
+  - Invalidar explícitamente ambas capas ante escrituras.
+  - Evitar que una lectura "en vuelo" repueble el cache con datos viejos
+    después de una invalidación (epoch de invalidación).
+
+Collaborators:
+  - crosscutting.request_cache.get_request_cache
+  - crosscutting.metrics (hits/misses)
+  - CachedWorkspaceRepository / CachedWorkspaceAclRepository
+
+Constraints / Notes:
+  - Thread-safe: OrderedDict bajo Lock (lo usan threadpool y worker).
+  - TTL <= 0 desactiva la capa cross-request (el nivel request sigue activo).
+  - Staleness entre procesos/réplicas acotada por el TTL: la invalidación
+    es local al proceso que escribe.
+  - No cachea "no encontrado" (None): evita ocultar un create reciente.
+============================================================
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import Any, TypeVar
+
+from ....crosscutting.metrics import (
+    record_workspace_cache_hit,
+    record_workspace_cache_miss,
+)
+from ....crosscutting.request_cache import get_request_cache
+
+T = TypeVar("T")
+
+_REQUEST_NAMESPACE = "workspace_access"
+
+
+class WorkspaceAccessCache:
+    """
+    Cache de workspace/ACL (request + LRU con TTL).
+
+    Claves: tuplas `(kind, id)` (ej: ("workspace", UUID)).
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 5.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = float(ttl_seconds)
+        self._max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._lock = Lock()
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        # R: Se incrementa en cada invalidación; un load que arrancó antes no
+        #    puede publicar su resultado (podría ser previo a la escritura).
+        self._epoch = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    # =========================================================
+    # API
+    # =========================================================
+    def get_or_load(
+        self,
+        key: tuple[str, Hashable],
+        loader: Callable[[], T | None],
+    ) -> T | None:
+        """
+        Devuelve el valor cacheado o lo carga con `loader`.
+
+        Nota:
+          - El valor devuelto es el almacenado: el caller hace copia defensiva.
+        """
+        kind = key[0]
+        request_key = (_REQUEST_NAMESPACE, key)
+        request_cache = get_request_cache()
+        if request_cache is not None and request_key in request_cache:
+            record_workspace_cache_hit(kind=kind)
+            return request_cache[request_key]
+
+        found, value = self._get_shared(key)
+        if found:
+            record_workspace_cache_hit(kind=kind)
+        else:
+            record_workspace_cache_miss(kind=kind)
+            epoch = self._epoch
+            value = loader()
+            if value is None:
+                return None
+            self._set_shared(key, value, epoch=epoch)
+
+        if request_cache is not None:
+            request_cache[request_key] = value
+        return value
+
+    def invalidate(self, key: tuple[str, Hashable]) -> None:
+        """Elimina la clave de ambas capas (request actual + cross-request)."""
+        request_cache = get_request_cache()
+        if request_cache is not None:
+            request_cache.pop((_REQUEST_NAMESPACE, key), None)
+        with self._lock:
+            self._epoch += 1
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Vacía la capa cross-request (tests / operaciones masivas)."""
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    # =========================================================
+    # Helpers internos
+    # =========================================================
+    def _get_shared(self, key: Hashable) -> tuple[bool, Any]:
+        if not self.enabled:
+            return False, None
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def _set_shared(self, key: Hashable, value: Any, *, epoch: int) -> None:
+        if not self.enabled:
+            return
+        expires_at = self._clock() + self._ttl
+        with self._lock:
+            if epoch != self._epoch:
+                return
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
@@ -275,6 +275,7 @@ class InMemoryWorkspaceRepository(WorkspaceRepository):
             visibility=workspace.visibility,
             owner_user_id=workspace.owner_user_id,
             fts_language=workspace.fts_language or "spanish",
+            chunk_dedup_enabled=bool(workspace.chunk_dedup_enabled),
             # Campos "de presentación/ACL" en memoria: copias defensivas
             allowed_roles=self._copy_roles(workspace.allowed_roles),
             shared_user_ids=self._copy_shared_ids(
@@ -299,6 +300,7 @@ class InMemoryWorkspaceRepository(WorkspaceRepository):
         visibility: WorkspaceVisibility | None = None,
         allowed_roles: list[str] | None = None,
         fts_language: str | None = None,
+        chunk_dedup_enabled: bool | None = None,
     ) -> Optional[Workspace]:
         """
         Actualiza atributos.
@@ -327,6 +329,11 @@ class InMemoryWorkspaceRepository(WorkspaceRepository):
                 visibility=visibility if visibility is not None else current.visibility,
                 owner_user_id=current.owner_user_id,
                 fts_language=resolved_fts_language,
+                chunk_dedup_enabled=(
+                    bool(chunk_dedup_enabled)
+                    if chunk_dedup_enabled is not None
+                    else current.chunk_dedup_enabled
+                ),
                 allowed_roles=(
                     self._copy_roles(allowed_roles)
                     if allowed_roles is not None
@@ -10,6 +10,12 @@ Responsibilities:
 - Inserción batch de chunks (performance / menos round-trips).
 - Búsqueda vectorial por similitud (cosine distance) usando pgvector.
 - Re-ranking opcional con MMR (diversidad vs relevancia).
+- Modo dedup por workspace: chunks con contenido idéntico comparten un único
+  embedding (chunk_embeddings) y el retrieval colapsa duplicados antes de top_k.
+- Checkpoint de procesamiento (progreso/owner) en la misma transacción que
+  cada lote de chunks: un retry reanuda desde el último lote comprometido.
+- Opcional: pg_notify por transición de status (misma transacción) para el
+  stream SSE de status de documentos.
 
 Collaborators:
 - domain.entities: Document, Chunk
@@ -28,17 +34,18 @@ Constraints / Notes (Clean / KISS):
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Collection, Iterable
 from uuid import UUID, uuid4
 
 import numpy as np
-from psycopg.errors import DuplicatePreparedStatement
+from psycopg.errors import DuplicatePreparedStatement, UniqueViolation
 from psycopg.types.json import Json
 from psycopg_pool import ConnectionPool
 
 from ....crosscutting.exceptions import DatabaseError
 from ....crosscutting.logger import logger
-from ....domain.entities import Chunk, Document, Node
+from ....domain.entities import Chunk, Document, Node, ProcessingCheckpoint
+from ...events.document_status import DOCUMENT_STATUS_CHANNEL, DocumentStatusEvent
 
 # ============================================================
 # Constantes de contrato (DB / embeddings)
@@ -47,6 +54,85 @@ from ....domain.entities import Chunk, Document, Node
 # Dimensión esperada del embedding (debe matchear chunks.embedding vector(768))
 EMBEDDING_DIMENSION = 768
 
+# INSERT canónico de chunks (save_chunks / save_document_with_chunks).
+# Filas: ver _build_chunk_rows.
+_INSERT_CHUNK_SQL = """
+    INSERT INTO chunks (
+        id, document_id, chunk_index, content, embedding, metadata,
+        content_hash, chunk_embedding_id, tsv
+    )
+    VALUES (
+        %s, %s, %s, %s, %s, %s, %s, %s,
+        to_tsvector(%s::regconfig, coalesce(%s, ''))
+    )
+"""
+
+# Progreso de la corrida: solo mientras el documento está PROCESSING.
+_UPDATE_CHECKPOINT_SQL = """
+    UPDATE documents
+    SET processing_run_id = %s,
+        processing_owner = %s,
+        processing_fingerprint = %s,
+        processing_chunks_done = %s,
+        processing_chunks_total = %s,
+        processing_updated_at = NOW()
+    WHERE id = %s AND workspace_id = %s AND status = 'PROCESSING'
+"""
+
+# Reproceso explícito: la próxima corrida empieza de cero (no reanuda).
+_CLEAR_CHECKPOINT_SQL = """
+    UPDATE documents
+    SET processing_run_id = NULL,
+        processing_owner = NULL,
+        processing_fingerprint = NULL,
+        processing_chunks_done = NULL,
+        processing_chunks_total = NULL,
+        processing_updated_at = NOW()
+    WHERE id = %s AND workspace_id = %s AND status <> 'PROCESSING'
+"""
+
+_UPSERT_DOCUMENT_SQL = """
+    INSERT INTO documents (
+        id,
+        workspace_id,
+        title,
+        source,
+        metadata,
+        tags,
+        allowed_roles,
+        content_hash
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (id) DO UPDATE
+    SET workspace_id = EXCLUDED.workspace_id,
+        title = EXCLUDED.title,
+        source = EXCLUDED.source,
+        metadata = EXCLUDED.metadata,
+        tags = EXCLUDED.tags,
+        allowed_roles = EXCLUDED.allowed_roles,
+        content_hash = EXCLUDED.content_hash
+"""
+
+_INSERT_NODE_SQL = """
+    INSERT INTO nodes (
+        id, workspace_id, document_id, node_index,
+        node_text, span_start, span_end, embedding, metadata
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+# Flag dedup del workspace como subquery escalar (InitPlan: se evalúa una vez).
+_DEDUP_ENABLED_SQL = (
+    "SELECT w.chunk_dedup_enabled FROM workspaces w WHERE w.id = %(ws)s"
+)
+
+# Vector search en modo dedup: chunks con embedding propio y mismo content_hash
+# (legacy / pre-dedup) colapsan DESPUÉS del LIMIT del índice, así que se piden
+# top_k * factor candidatos; si aun así no alcanza, se reintenta ampliando
+# hasta top_k * max.
+_DEDUP_OVERFETCH_FACTOR = 4
+_DEDUP_OVERFETCH_MAX = 64
+
 # Allowlist de ORDER BY: evita inyección y mantiene un contrato estable de sorting.
 _DOCUMENT_SORTS: dict[str, str] = {
     "created_at_desc": "created_at DESC NULLS LAST",
@@ -73,12 +159,21 @@ class PostgresDocumentRepository:
         file_name, mime_type, storage_key,
         uploaded_by_user_id, status, error_message, tags, allowed_roles,
         content_hash, external_source_id,
-        external_source_provider, external_modified_time, external_etag, external_mime_type
+        external_source_provider, external_modified_time, external_etag, external_mime_type,
+        processing_run_id, processing_owner, processing_chunks_done,
+        processing_chunks_total, processing_updated_at, processing_fingerprint
     """
 
-    def __init__(self, pool: ConnectionPool | None = None):
+    def __init__(
+        self,
+        pool: ConnectionPool | None = None,
+        *,
+        publish_status_events: bool = False,
+    ):
         # Pool inyectable: tests pueden usar un pool controlado o fake.
         self._pool = pool
+        # NOTIFY por transición de status (stream SSE de la API).
+        self._publish_status_events = publish_status_events
 
     # ============================================================
     # Pool / Scope guards
@@ -214,6 +309,13 @@ class PostgresDocumentRepository:
             external_modified_time=row[18] if len(row) > 18 else None,
             external_etag=row[19] if len(row) > 19 else None,
             external_mime_type=row[20] if len(row) > 20 else None,
+            # Checkpoint de procesamiento (reanudación + progreso)
+            processing_run_id=row[21] if len(row) > 21 else None,
+            processing_owner=row[22] if len(row) > 22 else None,
+            processing_chunks_done=row[23] if len(row) > 23 else None,
+            processing_chunks_total=row[24] if len(row) > 24 else None,
+            processing_updated_at=row[25] if len(row) > 25 else None,
+            processing_fingerprint=row[26] if len(row) > 26 else None,
         )
 
     def _rows_to_documents(self, rows: list[tuple]) -> list[Document]:
@@ -425,6 +527,33 @@ class PostgresDocumentRepository:
 
         return None if not row else self._row_to_document(row)
 
+    def get_documents_by_content_hashes(
+        self, workspace_id: UUID, content_hashes: list[str]
+    ) -> dict[str, Document]:
+        """
+        Variante batch de get_document_by_content_hash (ingesta batch).
+
+        Retorna {content_hash: Document} solo para hashes con documento activo.
+        """
+        if not content_hashes:
+            return {}
+
+        rows = self._fetchall(
+            query=f"""
+                SELECT {self._DOC_SELECT_COLUMNS}
+                FROM documents
+                WHERE workspace_id = %s
+                  AND content_hash = ANY(%s)
+                  AND deleted_at IS NULL
+            """,
+            params=[workspace_id, list(content_hashes)],
+            context_msg="PostgresDocumentRepository: Get documents by content hashes failed",
+            extra={"workspace_id": str(workspace_id), "hashes": len(content_hashes)},
+        )
+
+        documents = [self._row_to_document(row) for row in rows]
+        return {doc.content_hash: doc for doc in documents if doc.content_hash}
+
     def get_by_external_source_id(
         self, workspace_id: UUID, external_source_id: str
     ) -> Document | None:
@@ -524,13 +653,125 @@ class PostgresDocumentRepository:
     # ============================================================
     # Chunk persistence (batch)
     # ============================================================
-    def _lookup_workspace_fts_language(self, conn, workspace_id: UUID) -> str:
-        """Obtiene fts_language del workspace. Fallback a 'spanish'."""
+    def _lookup_workspace_chunk_settings(
+        self, conn, workspace_id: UUID
+    ) -> tuple[str, bool]:
+        """Obtiene (fts_language, chunk_dedup_enabled). Fallback: ('spanish', False)."""
         row = conn.execute(
-            "SELECT COALESCE(w.fts_language, 'spanish') FROM workspaces w WHERE w.id = %s",
+            """
+            SELECT COALESCE(w.fts_language, 'spanish'), w.chunk_dedup_enabled
+            FROM workspaces w
+            WHERE w.id = %s
+            """,
             (workspace_id,),
         ).fetchone()
-        return row[0] if row else "spanish"
+        if not row:
+            return "spanish", False
+        return row[0], bool(row[1])
+
+    def _upsert_shared_embeddings(
+        self,
+        conn,
+        workspace_id: UUID,
+        chunks: list[Chunk],
+        *,
+        batch: bool = True,
+    ) -> dict[str, UUID]:
+        """
+        Modo dedup: asegura un embedding compartido por content_hash.
+
+        - INSERT ... ON CONFLICT DO NOTHING (el primero en llegar gana).
+        - Luego resolvemos los ids con FOR KEY SHARE: un GC concurrente no
+          puede borrar la fila antes de que nuestros chunks la referencien.
+        """
+        first_by_hash: dict[str, Chunk] = {}
+        for chunk in chunks:
+            if chunk.content_hash and chunk.content_hash not in first_by_hash:
+                first_by_hash[chunk.content_hash] = chunk
+        if not first_by_hash:
+            return {}
+
+        rows = [
+            (uuid4(), workspace_id, content_hash, chunk.embedding)
+            for content_hash, chunk in first_by_hash.items()
+        ]
+        insert_sql = """
+            INSERT INTO chunk_embeddings (id, workspace_id, content_hash, embedding)
+            VALUES (%s, %s, %s, %s)
+            ON CONFLICT (workspace_id, content_hash) DO NOTHING
+        """
+        if batch:
+            with conn.cursor() as cur:
+                cur.executemany(insert_sql, rows)
+        else:
+            for row in rows:
+                conn.execute(insert_sql, row)
+
+        resolved = conn.execute(
+            """
+            SELECT content_hash, id
+            FROM chunk_embeddings
+            WHERE workspace_id = %s AND content_hash = ANY(%s)
+            FOR KEY SHARE
+            """,
+            (workspace_id, list(first_by_hash)),
+        ).fetchall()
+        return {content_hash: embedding_id for content_hash, embedding_id in resolved}
+
+    def _build_chunk_rows(
+        self,
+        conn,
+        workspace_id: UUID,
+        document_id: UUID,
+        chunks: list[Chunk],
+        *,
+        batch: bool = True,
+    ) -> list[tuple]:
+        """
+        Filas para _INSERT_CHUNK_SQL.
+
+        En modo dedup, los chunks con content_hash referencian el embedding
+        compartido y NO guardan copia propia (el HNSW de chunks no crece).
+        """
+        fts_lang, dedup = self._lookup_workspace_chunk_settings(conn, workspace_id)
+        shared_ids = (
+            self._upsert_shared_embeddings(conn, workspace_id, chunks, batch=batch)
+            if dedup
+            else {}
+        )
+        return self._chunk_rows(
+            document_id, chunks, fts_lang=fts_lang, shared_ids=shared_ids
+        )
+
+    @staticmethod
+    def _chunk_rows(
+        document_id: UUID,
+        chunks: list[Chunk],
+        *,
+        fts_lang: str,
+        shared_ids: dict[str, UUID],
+    ) -> list[tuple]:
+        """Filas de chunks de UN documento con settings ya resueltos."""
+        rows: list[tuple] = []
+        for idx, chunk in enumerate(chunks):
+            shared_id = shared_ids.get(chunk.content_hash or "")
+            rows.append(
+                (
+                    chunk.chunk_id or uuid4(),
+                    document_id,
+                    chunk.chunk_index if chunk.chunk_index is not None else idx,
+                    chunk.content,
+                    None
+                    if shared_id
+                    else chunk.embedding,  # pgvector acepta lista/array
+                    Json(chunk.metadata or {}),
+                    chunk.content_hash,
+                    shared_id,
+                    fts_lang,
+                    chunk.content,
+                )
+            )
+        return rows
 
     def save_chunks(
         self,
@@ -538,6 +779,7 @@ class PostgresDocumentRepository:
         chunks: list[Chunk],
         *,
         workspace_id: UUID | None = None,
+        checkpoint: ProcessingCheckpoint | None = None,
     ) -> None:
         """
         Inserta chunks para un documento (batch insert).
@@ -545,6 +787,7 @@ class PostgresDocumentRepository:
         - Valida embeddings (dimensión).
         - Verifica que el documento exista en el workspace y no esté deleted.
         - Inserta N chunks con executemany (performance).
+        - checkpoint: se actualiza en la misma transacción que los chunks.
         """
         if not chunks:
             return
@@ -570,47 +813,32 @@ class PostgresDocumentRepository:
                         f"Document {document_id} not found for workspace {scoped_workspace_id}"
                     )
 
-                # 2) Lookup workspace fts_language
-                fts_lang = self._lookup_workspace_fts_language(
-                    conn, scoped_workspace_id
+                # 2) Filas (fts_language + embeddings compartidos si hay dedup)
+                batch = self._build_chunk_rows(
+                    conn, scoped_workspace_id, document_id, chunks
                 )
 
-                # 3) Preparación del batch (cada fila corresponde a un INSERT)
-                batch = [
-                    (
-                        chunk.chunk_id or uuid4(),
-                        document_id,
-                        chunk.chunk_index if chunk.chunk_index is not None else idx,
-                        chunk.content,
-                        chunk.embedding,  # pgvector acepta lista/array
-                        Json(chunk.metadata or {}),
-                        fts_lang,
-                        chunk.content,
-                    )
-                    for idx, chunk in enumerate(chunks)
-                ]
-
-                # 4) Inserción batch (con fallback por colisiones de prepared statements).
+                # 3) Inserción batch (con fallback por colisiones de prepared statements).
                 with conn.cursor() as cur:
                     try:
-                        cur.executemany(
-                            """
-                            INSERT INTO chunks (id, document_id, chunk_index, content, embedding, metadata, tsv)
-                            VALUES (%s, %s, %s, %s, %s, %s, to_tsvector(%s::regconfig, coalesce(%s, '')))
-                            """,
-                            batch,
-                        )
+                        cur.executemany(_INSERT_CHUNK_SQL, batch)
                     except DuplicatePreparedStatement:
                         # Fallback defensivo: desactivamos batch si el driver choca en prepared statements.
+                        # El rollback descarta también los embeddings compartidos: se rearman las filas.
                         conn.rollback()
-                        for row in batch:
-                            conn.execute(
-                                """
-                                INSERT INTO chunks (id, document_id, chunk_index, content, embedding, metadata, tsv)
-                                VALUES (%s, %s, %s, %s, %s, %s, to_tsvector(%s::regconfig, coalesce(%s, '')))
-                                """,
-                                row,
-                            )
+                        for row in self._build_chunk_rows(
+                            conn, scoped_workspace_id, document_id, chunks, batch=False
+                        ):
+                            conn.execute(_INSERT_CHUNK_SQL, row)
+
+                # 4) Checkpoint atómico con el lote (reanudación exacta).
+                if checkpoint is not None:
+                    conn.execute(
+                        _UPDATE_CHECKPOINT_SQL,
+                        self._checkpoint_params(
+                            checkpoint, document_id, scoped_workspace_id
+                        ),
+                    )
 
             logger.info(
                 "PostgresDocumentRepository: Saved chunks",
@@ -629,6 +857,59 @@ class PostgresDocumentRepository:
             )
             raise DatabaseError(f"Failed to save chunks: {exc}") from exc
 
+    def find_chunk_embeddings_by_hash(
+        self, workspace_id: UUID, content_hashes: list[str]
+    ) -> dict[str, list[float]]:
+        """
+        Embeddings existentes en el workspace para los content_hash dados.
+
+        - Incluye chunks del mismo documento (reprocess) y de otros documentos,
+          más los embeddings compartidos del modo dedup (chunk_embeddings).
+        - Un embedding por hash (DISTINCT ON): mismo contenido y mismo modelo
+          (el modelo de embeddings es parte del hash, ver compute_chunk_hash).
+        - Usa ix_chunks_content_hash; el join con documents aplica el scope.
+        """
+        if not content_hashes:
+            return {}
+
+        scoped_workspace_id = self._require_workspace_id(
+            workspace_id, "find_chunk_embeddings_by_hash"
+        )
+        rows = self._fetchall(
+            query="""
+                SELECT DISTINCT ON (x.content_hash) x.content_hash, x.embedding
+                FROM (
+                    SELECT ce.content_hash, ce.embedding
+                    FROM chunk_embeddings ce
+                    WHERE ce.workspace_id = %s
+                      AND ce.content_hash = ANY(%s)
+                    UNION ALL
+                    SELECT c.content_hash, c.embedding
+                    FROM chunks c
+                    JOIN documents d ON d.id = c.document_id
+                    WHERE d.workspace_id = %s
+                      AND c.content_hash = ANY(%s)
+                      AND c.embedding IS NOT NULL
+                ) x
+                ORDER BY x.content_hash
+            """,
+            params=[
+                scoped_workspace_id,
+                list(content_hashes),
+                scoped_workspace_id,
+                list(content_hashes),
+            ],
+            context_msg="PostgresDocumentRepository: Failed to look up chunk embeddings",
+            extra={
+                "workspace_id": str(scoped_workspace_id),
+                "hashes": len(content_hashes),
+            },
+        )
+        return {
+            row[0]: (row[1].tolist() if hasattr(row[1], "tolist") else list(row[1]))
+            for row in rows
+        }
+
     def save_document_with_chunks(
         self, document: Document, chunks: list[Chunk], nodes: list[Node] | None = None
     ) -> None:
@@ -654,98 +935,24 @@ class PostgresDocumentRepository:
                 with conn.transaction():
                     # 1) Upsert del documento
                     conn.execute(
-                        """
-                        INSERT INTO documents (
-                            id,
-                            workspace_id,
-                            title,
-                            source,
-                            metadata,
-                            tags,
-                            allowed_roles,
-                            content_hash
-                        )
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (id) DO UPDATE
-                        SET workspace_id = EXCLUDED.workspace_id,
-                            title = EXCLUDED.title,
-                            source = EXCLUDED.source,
-                            metadata = EXCLUDED.metadata,
-                            tags = EXCLUDED.tags,
-                            allowed_roles = EXCLUDED.allowed_roles,
-                            content_hash = EXCLUDED.content_hash
-                        """,
-                        (
-                            document.id,
-                            workspace_id,
-                            document.title,
-                            document.source,
-                            Json(document.metadata),
-                            document.tags or [],
-                            document.allowed_roles or [],
-                            document.content_hash,
-                        ),
+                        _UPSERT_DOCUMENT_SQL,
+                        self._document_row(document, workspace_id),
                     )
 
                     # 2) Inserción de chunks (si hay)
                     if chunks:
-                        fts_lang = self._lookup_workspace_fts_language(
-                            conn, workspace_id
+                        batch = self._build_chunk_rows(
+                            conn, workspace_id, document.id, chunks
                         )
-                        batch = [
-                            (
-                                chunk.chunk_id or uuid4(),
-                                document.id,
-                                (
-                                    chunk.chunk_index
-                                    if chunk.chunk_index is not None
-                                    else idx
-                                ),
-                                chunk.content,
-                                chunk.embedding,
-                                Json(chunk.metadata or {}),
-                                fts_lang,
-                                chunk.content,
-                            )
-                            for idx, chunk in enumerate(chunks)
-                        ]
-
                         with conn.cursor() as cur:
-                            cur.executemany(
-                                """
-                                INSERT INTO chunks (id, document_id, chunk_index, content, embedding, metadata, tsv)
-                                VALUES (%s, %s, %s, %s, %s, %s, to_tsvector(%s::regconfig, coalesce(%s, '')))
-                                """,
-                                batch,
-                            )
+                            cur.executemany(_INSERT_CHUNK_SQL, batch)
 
                     # 3) Inserción de nodos (si hay)
                     if nodes:
-                        node_batch = [
-                            (
-                                node.node_id or uuid4(),
-                                workspace_id,
-                                document.id,
-                                node.node_index if node.node_index is not None else idx,
-                                node.node_text,
-                                node.span_start,
-                                node.span_end,
-                                node.embedding,
-                                Json(node.metadata or {}),
-                            )
-                            for idx, node in enumerate(nodes)
-                        ]
-
                         with conn.cursor() as cur:
                             cur.executemany(
-                                """
-                                INSERT INTO nodes (
-                                    id, workspace_id, document_id, node_index,
-                                    node_text, span_start, span_end, embedding, metadata
-                                )
-                                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                                """,
-                                node_batch,
+                                _INSERT_NODE_SQL,
+                                self._node_rows(workspace_id, document.id, nodes),
                             )
 
             logger.info(
@@ -762,6 +969,130 @@ class PostgresDocumentRepository:
             )
             raise DatabaseError(f"Failed to save document with chunks: {exc}") from exc
 
+    def save_documents_with_chunks(
+        self, items: list[tuple[Document, list[Chunk], list[Node] | None]]
+    ) -> None:
+        """
+        Guardado atómico de VARIOS documentos (ingesta batch).
+
+        - Una transacción y un executemany por tabla (documents/chunks/nodes):
+          psycopg3 los envía en pipeline, sin un round trip por fila.
+        - Settings del workspace y embeddings compartidos (dedup) se
+          resuelven una sola vez para todos los chunks.
+        - Todos los documentos deben pertenecer al mismo workspace.
+        """
+        if not items:
+            return
+
+        workspace_ids = {doc.workspace_id for doc, _chunks, _nodes in items}
+        if len(workspace_ids) != 1:
+            raise ValueError("save_documents_with_chunks requires a single workspace")
+        workspace_id = self._require_workspace_id(
+            next(iter(workspace_ids)), "save_documents_with_chunks"
+        )
+
+        all_chunks = [chunk for _doc, chunks, _nodes in items for chunk in chunks]
+        if all_chunks:
+            self._validate_embeddings(all_chunks)
+        for _doc, _chunks, nodes in items:
+            if nodes:
+                self._validate_node_embeddings(nodes)
+
+        try:
+            pool = self._get_pool()
+            with pool.connection() as conn:
+                with conn.transaction():
+                    with conn.cursor() as cur:
+                        cur.executemany(
+                            _UPSERT_DOCUMENT_SQL,
+                            [
+                                self._document_row(doc, workspace_id)
+                                for doc, _, _ in items
+                            ],
+                        )
+
+                    if all_chunks:
+                        fts_lang, dedup = self._lookup_workspace_chunk_settings(
+                            conn, workspace_id
+                        )
+                        shared_ids = (
+                            self._upsert_shared_embeddings(
+                                conn, workspace_id, all_chunks
+                            )
+                            if dedup
+                            else {}
+                        )
+                        chunk_rows = [
+                            row
+                            for doc, chunks, _nodes in items
+                            for row in self._chunk_rows(
+                                doc.id,
+                                chunks,
+                                fts_lang=fts_lang,
+                                shared_ids=shared_ids,
+                            )
+                        ]
+                        with conn.cursor() as cur:
+                            cur.executemany(_INSERT_CHUNK_SQL, chunk_rows)
+
+                    node_rows = [
+                        row
+                        for doc, _chunks, nodes in items
+                        if nodes
+                        for row in self._node_rows(workspace_id, doc.id, nodes)
+                    ]
+                    if node_rows:
+                        with conn.cursor() as cur:
+                            cur.executemany(_INSERT_NODE_SQL, node_rows)
+
+            logger.info(
+                "PostgresDocumentRepository: Bulk save completed",
+                extra={"documents": len(items), "chunks": len(all_chunks)},
+            )
+
+        except ValueError:
+            raise
+        except Exception as exc:
+            logger.exception(
+                "PostgresDocumentRepository: Bulk save failed (rolled back)",
+                extra={"documents": len(items), "error": str(exc)},
+            )
+            raise DatabaseError(f"Failed to save documents with chunks: {exc}") from exc
+
+    @staticmethod
+    def _document_row(document: Document, workspace_id: UUID) -> tuple:
+        """Parámetros de _UPSERT_DOCUMENT_SQL."""
+        return (
+            document.id,
+            workspace_id,
+            document.title,
+            document.source,
+            Json(document.metadata),
+            document.tags or [],
+            document.allowed_roles or [],
+            document.content_hash,
+        )
+
+    @staticmethod
+    def _node_rows(
+        workspace_id: UUID, document_id: UUID, nodes: list[Node]
+    ) -> list[tuple]:
+        """Parámetros de _INSERT_NODE_SQL."""
+        return [
+            (
+                node.node_id or uuid4(),
+                workspace_id,
+                document_id,
+                node.node_index if node.node_index is not None else idx,
+                node.node_text,
+                node.span_start,
+                node.span_end,
+                node.embedding,
+                Json(node.metadata or {}),
+            )
+            for idx, node in enumerate(nodes)
+        ]
+
     # ============================================================
     # Update metadata / status (pipeline)
     # ============================================================
@@ -879,9 +1210,28 @@ class PostgresDocumentRepository:
                 elif include_null:
                     sql += " AND status IS NULL"
 
-                result = conn.execute(sql, params)
-
-            return bool(result.rowcount and result.rowcount > 0)
+                if not self._publish_status_events:
+                    result = conn.execute(sql, params)
+                    return bool(result.rowcount and result.rowcount > 0)
+
+                sql += " RETURNING uploaded_by_user_id, allowed_roles"
+                row = conn.execute(sql, params).fetchone()
+                if row is None:
+                    return False
+                # R: Mismo commit que el UPDATE: solo se notifica lo persistido.
+                event = DocumentStatusEvent(
+                    workspace_id=scoped_workspace_id,
+                    document_id=document_id,
+                    status=to_status,
+                    error_message=error_message,
+                    uploaded_by_user_id=row[0],
+                    allowed_roles=tuple(row[1] or ()),
+                )
+                conn.execute(
+                    "SELECT pg_notify(%s, %s)",
+                    (DOCUMENT_STATUS_CHANNEL, event.to_payload()),
+                )
+            return True
 
         except Exception as exc:
             logger.exception(
@@ -894,35 +1244,188 @@ class PostgresDocumentRepository:
             )
             raise DatabaseError(f"Failed to transition status: {exc}") from exc
 
+    @staticmethod
+    def _checkpoint_params(
+        checkpoint: ProcessingCheckpoint, document_id: UUID, workspace_id: UUID
+    ) -> tuple:
+        return (
+            checkpoint.run_id,
+            checkpoint.owner,
+            checkpoint.fingerprint,
+            checkpoint.chunks_done,
+            checkpoint.chunks_total,
+            document_id,
+            workspace_id,
+        )
+
+    def save_processing_checkpoint(
+        self,
+        document_id: UUID,
+        checkpoint: ProcessingCheckpoint,
+        *,
+        workspace_id: UUID | None = None,
+    ) -> bool:
+        """
+        Registra progreso/owner de la corrida en curso.
+
+        Solo aplica si el documento está PROCESSING (no pisa READY/FAILED).
+        """
+        scoped_workspace_id = self._require_workspace_id(
+            workspace_id, "save_processing_checkpoint"
+        )
+
+        try:
+            pool = self._get_pool()
+            with pool.connection() as conn:
+                result = conn.execute(
+                    _UPDATE_CHECKPOINT_SQL,
+                    self._checkpoint_params(
+                        checkpoint, document_id, scoped_workspace_id
+                    ),
+                )
+            return bool(result.rowcount and result.rowcount > 0)
+
+        except Exception as exc:
+            logger.exception(
+                "PostgresDocumentRepository: Save processing checkpoint failed",
+                extra={
+                    "document_id": str(document_id),
+                    "workspace_id": str(scoped_workspace_id),
+                    "error": str(exc),
+                },
+            )
+            raise DatabaseError(f"Failed to save processing checkpoint: {exc}") from exc
+
+    def clear_processing_checkpoint(
+        self,
+        document_id: UUID,
+        *,
+        workspace_id: UUID | None = None,
+    ) -> bool:
+        """
+        Descarta la corrida reanudable y su progreso (reproceso explícito).
+
+        No aplica si el documento está PROCESSING (la corrida sigue viva).
+        """
+        scoped_workspace_id = self._require_workspace_id(
+            workspace_id, "clear_processing_checkpoint"
+        )
+
+        try:
+            pool = self._get_pool()
+            with pool.connection() as conn:
+                result = conn.execute(
+                    _CLEAR_CHECKPOINT_SQL, (document_id, scoped_workspace_id)
+                )
+            return bool(result.rowcount and result.rowcount > 0)
+
+        except Exception as exc:
+            logger.exception(
+                "PostgresDocumentRepository: Clear processing checkpoint failed",
+                extra={
+                    "document_id": str(document_id),
+                    "workspace_id": str(scoped_workspace_id),
+                    "error": str(exc),
+                },
+            )
+            raise DatabaseError(
+                f"Failed to clear processing checkpoint: {exc}"
+            ) from exc
+
+    def set_document_content_hash(
+        self,
+        document_id: UUID,
+        *,
+        workspace_id: UUID | None = None,
+        content_hash: str,
+    ) -> bool:
+        """
+        Setea content_hash de un documento que aún no lo tiene.
+
+        Retorna False si otro documento del workspace ya tiene el mismo hash
+        (unique index ix_documents_workspace_content_hash): el caller decide
+        cómo resolver el duplicado.
+        """
+        scoped_workspace_id = self._require_workspace_id(
+            workspace_id, "set_document_content_hash"
+        )
+
+        try:
+            pool = self._get_pool()
+            with pool.connection() as conn:
+                conn.execute(
+                    """
+                    UPDATE documents
+                    SET content_hash = %s
+                    WHERE id = %s AND workspace_id = %s
+                    """,
+                    (content_hash, document_id, scoped_workspace_id),
+                )
+            return True
+
+        except UniqueViolation:
+            return False
+        except Exception as exc:
+            logger.exception(
+                "PostgresDocumentRepository: Set content hash failed",
+                extra={
+                    "document_id": str(document_id),
+                    "workspace_id": str(scoped_workspace_id),
+                    "error": str(exc),
+                },
+            )
+            raise DatabaseError(f"Failed to set content hash: {exc}") from exc
+
     # ============================================================
     # Deletes / Restore
     # ============================================================
     def delete_chunks_for_document(
-        self, document_id: UUID, *, workspace_id: UUID | None = None
+        self,
+        document_id: UUID,
+        *,
+        workspace_id: UUID | None = None,
+        keep_chunk_ids: Collection[UUID] | None = None,
     ) -> int:
         """
         Borra chunks de un documento (scoped por workspace vía join).
 
+        - keep_chunk_ids: chunks a conservar (pipeline: se persisten los nuevos
+          antes de borrar los anteriores).
+
         Retorna cantidad de filas eliminadas.
         """
         scoped_workspace_id = self._require_workspace_id(
             workspace_id, "delete_chunks_for_document"
         )
 
+        keep_clause = ""
+        params: list[object] = [document_id, scoped_workspace_id]
+        if keep_chunk_ids:
+            keep_clause = "AND NOT (c.id = ANY(%s))"
+            params.append(list(keep_chunk_ids))
+
         try:
             pool = self._get_pool()
             with pool.connection() as conn:
-                result = conn.execute(
-                    """
+                rows = conn.execute(
+                    f"""
                     DELETE FROM chunks c
                     USING documents d
                     WHERE c.document_id = d.id
                       AND c.document_id = %s
                       AND d.workspace_id = %s
+                      {keep_clause}
+                    RETURNING c.chunk_embedding_id
                     """,
-                    (document_id, scoped_workspace_id),
-                )
-            return int(result.rowcount or 0)
+                    tuple(params),
+                ).fetchall()
+
+                shared_ids = list({r[0] for r in rows if r[0] is not None})
+                if shared_ids:
+                    self._delete_orphan_shared_embeddings(
+                        conn, scoped_workspace_id, shared_ids
+                    )
+            return len(rows)
 
         except Exception as exc:
             logger.exception(
@@ -935,6 +1438,34 @@ class PostgresDocumentRepository:
             )
             raise DatabaseError(f"Failed to delete chunks: {exc}") from exc
 
+    def _delete_orphan_shared_embeddings(
+        self, conn, workspace_id: UUID, embedding_ids: list[UUID]
+    ) -> None:
+        """
+        GC best-effort de embeddings compartidos sin referencias (modo dedup).
+
+        Corre en un savepoint: si un save concurrente acaba de referenciar la
+        fila, la FK aborta el GC sin deshacer el borrado de chunks.
+        """
+        try:
+            with conn.transaction():
+                conn.execute(
+                    """
+                    DELETE FROM chunk_embeddings ce
+                    WHERE ce.workspace_id = %s
+                      AND ce.id = ANY(%s)
+                      AND NOT EXISTS (
+                          SELECT 1 FROM chunks c WHERE c.chunk_embedding_id = ce.id
+                      )
+                    """,
+                    (workspace_id, embedding_ids),
+                )
+        except Exception as exc:
+            logger.warning(
+                "PostgresDocumentRepository: Shared embedding GC skipped",
+                extra={"workspace_id": str(workspace_id), "error": str(exc)},
+            )
+
     def soft_delete_document(
         self, document_id: UUID, *, workspace_id: UUID | None = None
     ) -> bool:
@@ -1075,24 +1606,42 @@ class PostgresDocumentRepository:
 
         safe_lang = validate_fts_language(fts_language)
 
-        sql = """
+        # En modo dedup, chunks idénticos colapsan (DISTINCT ON) antes del LIMIT.
+        sql = f"""
             SELECT
-              c.id,
-              c.document_id,
-              d.title,
-              d.source,
-              c.chunk_index,
-              c.content,
-              c.embedding,
-              c.metadata,
-              ts_rank_cd(c.tsv, websearch_to_tsquery(%s::regconfig, %s)) AS score
-            FROM chunks c
-            JOIN documents d ON d.id = c.document_id
-            WHERE d.deleted_at IS NULL
-              AND d.workspace_id = %s
-              AND c.tsv @@ websearch_to_tsquery(%s::regconfig, %s)
-            ORDER BY score DESC
-            LIMIT %s
+              m.id,
+              m.document_id,
+              m.title,
+              m.source,
+              m.chunk_index,
+              m.content,
+              m.embedding,
+              m.metadata,
+              m.score
+            FROM (
+              SELECT DISTINCT ON (dedup_key)
+                c.id,
+                c.document_id,
+                d.title,
+                d.source,
+                c.chunk_index,
+                c.content,
+                COALESCE(c.embedding, ce.embedding) AS embedding,
+                c.metadata,
+                ts_rank_cd(c.tsv, websearch_to_tsquery(%(lang)s::regconfig, %(q)s)) AS score,
+                CASE WHEN ({_DEDUP_ENABLED_SQL})
+                     THEN COALESCE(c.content_hash, c.id::text)
+                     ELSE c.id::text END AS dedup_key
+              FROM chunks c
+              JOIN documents d ON d.id = c.document_id
+              LEFT JOIN chunk_embeddings ce ON ce.id = c.chunk_embedding_id
+              WHERE d.deleted_at IS NULL
+                AND d.workspace_id = %(ws)s
+                AND c.tsv @@ websearch_to_tsquery(%(lang)s::regconfig, %(q)s)
+              ORDER BY dedup_key, score DESC, c.document_id, c.chunk_index
+            ) m
+            ORDER BY m.score DESC
+            LIMIT %(k)s
         """
 
         try:
@@ -1100,14 +1649,12 @@ class PostgresDocumentRepository:
             with pool.connection() as conn:
                 rows = conn.execute(
                     sql,
-                    (
-                        safe_lang,
-                        query_text,
-                        scoped_workspace_id,
-                        safe_lang,
-                        query_text,
-                        top_k,
-                    ),
+                    {
+                        "lang": safe_lang,
+                        "q": query_text,
+                        "ws": scoped_workspace_id,
+                        "k": top_k,
+                    },
                 ).fetchall()
 
             logger.info(
@@ -1171,10 +1718,58 @@ class PostgresDocumentRepository:
         if top_k <= 0:
             return []
 
-        # Filtro base: solo documentos vivos y del workspace
-        where_clause = "d.deleted_at IS NULL AND d.workspace_id = %s"
-
+        # Dos fuentes de candidatos (cada una con su índice HNSW):
+        #   - own: chunks con embedding propio (workspaces sin dedup / legacy)
+        #   - shared: embeddings compartidos (modo dedup) + un chunk representante
+        #     vivo por embedding. El branch se apaga (one-time filter) si el
+        #     workspace no tiene embeddings compartidos.
+        # En modo dedup se colapsa por content_hash ANTES del LIMIT final; como
+        # el colapso ocurre después del LIMIT de `own`, ese branch sobre-pide
+        # (fetch_k) y reporta cuántas filas trajo (own_count) para detectar
+        # si quedó saturado.
         sql = f"""
+            WITH own AS (
+              SELECT
+                c.id AS chunk_id,
+                c.embedding <=> %(q)s::vector AS distance,
+                CASE WHEN ({_DEDUP_ENABLED_SQL})
+                     THEN COALESCE(c.content_hash, c.id::text)
+                     ELSE c.id::text END AS dedup_key
+              FROM chunks c
+              JOIN documents d ON d.id = c.document_id
+              WHERE d.deleted_at IS NULL
+                AND d.workspace_id = %(ws)s
+                AND c.embedding IS NOT NULL
+              ORDER BY c.embedding <=> %(q)s::vector
+              LIMIT CASE WHEN ({_DEDUP_ENABLED_SQL}) THEN %(fetch_k)s ELSE %(k)s END
+            ),
+            shared AS (
+              SELECT rep.chunk_id, ce.distance, ce.content_hash AS dedup_key
+              FROM (
+                SELECT x.id, x.content_hash, x.embedding <=> %(q)s::vector AS distance
+                FROM chunk_embeddings x
+                WHERE x.workspace_id = %(ws)s
+                  AND EXISTS (
+                    SELECT 1 FROM chunk_embeddings e WHERE e.workspace_id = %(ws)s
+                  )
+                ORDER BY x.embedding <=> %(q)s::vector
+                LIMIT %(k)s
+              ) ce
+              CROSS JOIN LATERAL (
+                SELECT c.id AS chunk_id
+                FROM chunks c
+                JOIN documents d ON d.id = c.document_id
+                WHERE c.chunk_embedding_id = ce.id
+                  AND d.deleted_at IS NULL
+                ORDER BY c.document_id, c.chunk_index
+                LIMIT 1
+              ) rep
+            ),
+            candidates AS (
+              SELECT DISTINCT ON (u.dedup_key) u.chunk_id, u.distance
+              FROM (SELECT * FROM own UNION ALL SELECT * FROM shared) u
+              ORDER BY u.dedup_key, u.distance
+            )
             SELECT
               c.id,
               c.document_id,
@@ -1182,23 +1777,42 @@ class PostgresDocumentRepository:
               d.source,
               c.chunk_index,
               c.content,
-              c.embedding,
+              COALESCE(c.embedding, ce.embedding),
               c.metadata,
-              (1 - (c.embedding <=> %s::vector)) as score
-            FROM chunks c
+              (1 - cand.distance) as score,
+              (SELECT COUNT(*) FROM own) AS own_count
+            FROM candidates cand
+            JOIN chunks c ON c.id = cand.chunk_id
             JOIN documents d ON d.id = c.document_id
-            WHERE {where_clause}
-            ORDER BY c.embedding <=> %s::vector
-            LIMIT %s
+            LEFT JOIN chunk_embeddings ce ON ce.id = c.chunk_embedding_id
+            ORDER BY cand.distance
+            LIMIT %(k)s
         """
 
         try:
             pool = self._get_pool()
+            fetch_k = top_k * _DEDUP_OVERFETCH_FACTOR
             with pool.connection() as conn:
-                rows = conn.execute(
-                    sql,
-                    (embedding, scoped_workspace_id, embedding, top_k),
-                ).fetchall()
+                while True:
+                    rows = conn.execute(
+                        sql,
+                        {
+                            "q": embedding,
+                            "ws": scoped_workspace_id,
+                            "k": top_k,
+                            "fetch_k": fetch_k,
+                        },
+                    ).fetchall()
+                    # R: Faltan resultados sólo si `own` se cortó en fetch_k
+                    #    (hay más candidatos detrás de los duplicados colapsados).
+                    own_saturated = bool(rows) and rows[0][9] >= fetch_k
+                    if (
+                        len(rows) >= top_k
+                        or not own_saturated
+                        or fetch_k >= top_k * _DEDUP_OVERFETCH_MAX
+                    ):
+                        break
+                    fetch_k *= _DEDUP_OVERFETCH_FACTOR
 
             logger.info(
                 "PostgresDocumentRepository: Similar chunks retrieved",
@@ -1578,10 +2192,11 @@ class PostgresDocumentRepository:
               d.source,
               c.chunk_index,
               c.content,
-              c.embedding,
+              COALESCE(c.embedding, ce.embedding),
               c.metadata
             FROM chunks c
             JOIN documents d ON d.id = c.document_id
+            LEFT JOIN chunk_embeddings ce ON ce.id = c.chunk_embedding_id
             WHERE d.deleted_at IS NULL
               AND d.workspace_id = %s
               AND ({or_sql})
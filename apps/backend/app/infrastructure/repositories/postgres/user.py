@@ -26,6 +26,8 @@ Constraints / Notes (Clean Code / SOLID):
   - SQL parametrizado siempre (nunca interpolar input de usuario).
   - Evitar duplicación: helper de SELECT + helper de mapping + errores consistentes.
   - Orden estable en listados: created_at DESC, id DESC.
+  - Escrituras sobre un usuario notifican al UserCacheInvalidationPort inyectado
+    (set_user_cache_invalidator); este módulo no conoce al cache de auth.
 ============================================================
 """
 
@@ -38,6 +40,7 @@ from psycopg_pool import ConnectionPool
 
 from ....crosscutting.exceptions import DatabaseError
 from ....crosscutting.logger import logger
+from ....domain.cache import UserCacheInvalidationPort
 from ....identity.users import User, UserRole
 
 # ============================================================
@@ -66,6 +69,27 @@ def _get_pool() -> ConnectionPool:
     return get_pool()
 
 
+# ============================================================
+# Invalidación de cache de usuarios (puerto inyectado)
+# ============================================================
+# R: Quien cachea usuarios (identity/auth_users) se registra acá; el repo sólo
+#    conoce el puerto de dominio, no la implementación.
+_user_cache_invalidator: UserCacheInvalidationPort | None = None
+
+
+def set_user_cache_invalidator(
+    invalidator: UserCacheInvalidationPort | None,
+) -> None:
+    """Registra quién debe enterarse de escrituras sobre usuarios."""
+    global _user_cache_invalidator
+    _user_cache_invalidator = invalidator
+
+
+def _invalidate_cached_user(user_id: UUID) -> None:
+    if _user_cache_invalidator is not None:
+        _user_cache_invalidator.invalidate_user(user_id)
+
+
 # ============================================================
 # Helpers internos: mapping + ejecución
 # ============================================================
@@ -257,6 +281,7 @@ def set_user_active(user_id: UUID, is_active: bool) -> Optional[User]:
         log_msg="PostgresUserRepository: set_user_active failed",
         log_extra={"user_id": str(user_id), "is_active": is_active},
     )
+    _invalidate_cached_user(user_id)
     return _row_to_user(row) if row else None
 
 
@@ -279,6 +304,7 @@ def update_user_password(user_id: UUID, password_hash: str) -> Optional[User]:
         log_msg="PostgresUserRepository: update_user_password failed",
         log_extra={"user_id": str(user_id)},
     )
+    _invalidate_cached_user(user_id)
     return _row_to_user(row) if row else None
 
 
@@ -333,6 +359,7 @@ def update_user(
         log_msg="PostgresUserRepository: update_user failed",
         log_extra={"user_id": str(user_id), "updates": updates},
     )
+    _invalidate_cached_user(user_id)
     return _row_to_user(row) if row else None
 
 
@@ -48,7 +48,7 @@ class PostgresWorkspaceRepository:
     # R: SELECT base reutilizable (mismo orden de columnas para mapping consistente)
     _SELECT_COLUMNS = """
         id, name, description, visibility, owner_user_id,
-        archived_at, created_at, updated_at, fts_language
+        archived_at, created_at, updated_at, fts_language, chunk_dedup_enabled
     """
 
     # R: Orden determinístico: primero más recientes, luego nombre (estable)
@@ -82,6 +82,7 @@ class PostgresWorkspaceRepository:
             created_at,
             updated_at,
             fts_language,
+            chunk_dedup_enabled,
         ) = row
 
         return Workspace(
@@ -91,6 +92,7 @@ class PostgresWorkspaceRepository:
             visibility=WorkspaceVisibility(visibility),
             owner_user_id=owner_user_id,
             fts_language=fts_language or "spanish",
+            chunk_dedup_enabled=bool(chunk_dedup_enabled),
             created_at=created_at,
             updated_at=updated_at,
             archived_at=archived_at,
@@ -318,11 +320,13 @@ class PostgresWorkspaceRepository:
                     visibility,
                     owner_user_id,
                     archived_at,
-                    fts_language
+                    fts_language,
+                    chunk_dedup_enabled
                 )
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
                 RETURNING id, name, description, visibility, owner_user_id,
-                          archived_at, created_at, updated_at, fts_language
+                          archived_at, created_at, updated_at, fts_language,
+                          chunk_dedup_enabled
             """,
             params=[
                 workspace.id,
@@ -332,6 +336,7 @@ class PostgresWorkspaceRepository:
                 workspace.owner_user_id,
                 workspace.archived_at,
                 workspace.fts_language or "spanish",
+                bool(workspace.chunk_dedup_enabled),
             ],
             context_msg="PostgresWorkspaceRepository: Failed to create workspace",
             extra={"workspace_id": str(workspace.id)},
@@ -352,6 +357,7 @@ class PostgresWorkspaceRepository:
         visibility: WorkspaceVisibility | None = None,
         allowed_roles: list[str] | None = None,
         fts_language: str | None = None,
+        chunk_dedup_enabled: bool | None = None,
     ) -> Workspace | None:
         """
         R: Actualiza atributos del workspace.
@@ -380,6 +386,10 @@ class PostgresWorkspaceRepository:
             fields.append("fts_language = %s")
             params.append(validate_fts_language(fts_language))
 
+        if chunk_dedup_enabled is not None:
+            fields.append("chunk_dedup_enabled = %s")
+            params.append(bool(chunk_dedup_enabled))
+
         # R: Se ignora explícitamente (documentación de contrato)
         _ = allowed_roles
 
@@ -394,7 +404,8 @@ class PostgresWorkspaceRepository:
             SET {", ".join(fields)}
             WHERE id = %s
             RETURNING id, name, description, visibility, owner_user_id,
-                      archived_at, created_at, updated_at, fts_language
+                      archived_at, created_at, updated_at, fts_language,
+                      chunk_dedup_enabled
         """
         params.append(workspace_id)
 
@@ -53,6 +53,7 @@ from .cached_embedding_service import CachingEmbeddingService  # noqa: F401
 # ---------------------------------------------------------------------------
 # Connector OAuth + Encryption
 # ---------------------------------------------------------------------------
+from .access_token_cache import AccessTokenCache  # noqa: F401
 from .encryption import FernetTokenEncryption  # noqa: F401
 from .fake_embedding_service import FakeEmbeddingService  # noqa: F401
 from .google_drive_client import (  # noqa: F401
@@ -79,6 +80,7 @@ from .retry import (  # noqa: F401
     PERMANENT_HTTP_CODES,
     TRANSIENT_HTTP_CODES,
     create_retry_decorator,
+    is_rate_limit_error,
     is_transient_error,
     with_retry,
 )
@@ -93,6 +95,7 @@ __all__ = [
     "FakeLLMService",
     "GoogleLLMService",
     # Connector OAuth + Encryption + Drive Client
+    "AccessTokenCache",
     "FernetTokenEncryption",
     "ConnectorFileTooLargeError",
     "ConnectorPermanentError",
@@ -101,6 +104,7 @@ __all__ = [
     "GoogleOAuthAdapter",
     # Resilience / Retry
     "is_transient_error",
+    "is_rate_limit_error",
     "create_retry_decorator",
     "with_retry",
     "TRANSIENT_HTTP_CODES",
@@ -0,0 +1,255 @@
+"""
+============================================================
+TARJETA CRC — infrastructure/services/access_token_cache.py
+============================================================
+Class: AccessTokenCache
+
+Responsibilities:
+  - Implementar AccessTokenCachePort: reusar access_tokens de conectores
+    hasta su expiración menos un margen de seguridad.
+  - Coalescer refreshes concurrentes de la misma cuenta (un lock por key en
+    el proceso; lock SET NX en Redis entre procesos).
+  - Compartir tokens entre workers vía Redis (opcional, best-effort),
+    guardándolos cifrados.
+  - Registrar métricas (hit | shared_hit | refresh).
+
+Collaborators:
+  - domain.connectors (AccessTokenCachePort, OAuthAccessToken, TokenEncryptionPort)
+  - redis-py (opcional)
+  - crosscutting.metrics.record_connector_token_cache
+
+Decisiones:
+  - Nunca se cachea un fallo: si el refresh lanza, los que esperaban
+    reintentan (uno por vez) en vez de recibir el error ajeno.
+  - Redis caído => se degrada a cache en memoria (misma semántica que el
+    cache de embeddings).
+============================================================
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Final
+
+from ...crosscutting.logger import logger
+from ...crosscutting.metrics import record_connector_token_cache
+from ...domain.connectors import OAuthAccessToken, TokenEncryptionPort
+
+_REDIS_PREFIX: Final[str] = "rag:connector_token:"
+_REDIS_LOCK_PREFIX: Final[str] = "rag:connector_token_lock:"
+_REDIS_POLL_SECONDS: Final[float] = 0.1
+
+
+class AccessTokenCache:
+    """
+    Cache de access_tokens por cuenta de conector (L1 memoria, L2 Redis).
+
+    - margin_seconds: el token se considera vencido `margin` antes de su
+      expiración real (una sync no debería arrancar con un token al límite).
+    - redis_client + encryption: habilitan el nivel compartido.
+    """
+
+    def __init__(
+        self,
+        *,
+        margin_seconds: float = 300.0,
+        max_entries: int = 1024,
+        redis_client: Any | None = None,
+        encryption: TokenEncryptionPort | None = None,
+        lock_timeout_seconds: float = 10.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if margin_seconds < 0:
+            raise ValueError("margin_seconds must be >= 0")
+        if max_entries <= 0:
+            raise ValueError("max_entries must be > 0")
+        if redis_client is not None and encryption is None:
+            raise ValueError("encryption is required to share tokens via Redis")
+        self._margin = float(margin_seconds)
+        self._max_entries = int(max_entries)
+        self._redis = redis_client
+        self._encryption = encryption
+        self._lock_timeout = float(lock_timeout_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (expires_at, access_token)
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._key_locks: dict[str, threading.Lock] = {}
+
+    # ------------------------------------------------------------------
+    # AccessTokenCachePort
+    # ------------------------------------------------------------------
+    def get_or_refresh(self, key: str, refresh: Callable[[], OAuthAccessToken]) -> str:
+        token = self._get_local(key)
+        if token is not None:
+            record_connector_token_cache("hit")
+            return token
+
+        with self._key_lock(key):
+            # R: Otro thread pudo haber refrescado mientras esperábamos.
+            token = self._get_local(key)
+            if token is not None:
+                record_connector_token_cache("hit")
+                return token
+
+            shared = self._get_shared(key)
+            if shared is not None:
+                record_connector_token_cache("shared_hit")
+                self._put_local(key, *shared)
+                return shared[1]
+
+            return self._refresh_coalesced(key, refresh)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        if self._redis is not None:
+            try:
+                self._redis.delete(self._redis_key(key))
+            except Exception as exc:
+                logger.warning(
+                    "connector token cache: redis delete failed",
+                    extra={"error": str(exc)},
+                )
+
+    # ------------------------------------------------------------------
+    # Refresh (coalescido entre procesos si hay Redis)
+    # ------------------------------------------------------------------
+    def _refresh_coalesced(
+        self, key: str, refresh: Callable[[], OAuthAccessToken]
+    ) -> str:
+        acquired = self._acquire_shared_lock(key)
+        try:
+            if not acquired:
+                shared = self._wait_for_shared(key)
+                if shared is not None:
+                    record_connector_token_cache("shared_hit")
+                    self._put_local(key, *shared)
+                    return shared[1]
+
+            fresh = refresh()
+            record_connector_token_cache("refresh")
+            expires_at = self._clock() + max(0.0, fresh.expires_in - self._margin)
+            self._put_local(key, expires_at, fresh.access_token)
+            self._put_shared(key, expires_at, fresh.access_token)
+            return fresh.access_token
+        finally:
+            if acquired:
+                self._release_shared_lock(key)
+
+    def _wait_for_shared(self, key: str) -> tuple[float, str] | None:
+        """Otro proceso está refrescando: esperar su resultado (acotado)."""
+        deadline = time.monotonic() + self._lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(_REDIS_POLL_SECONDS)
+            shared = self._get_shared(key)
+            if shared is not None:
+                return shared
+        return None
+
+    # ------------------------------------------------------------------
+    # Nivel local (memoria)
+    # ------------------------------------------------------------------
+    def _get_local(self, key: str) -> str | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, token = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return token
+
+    def _put_local(self, key: str, expires_at: float, token: str) -> None:
+        if expires_at <= self._clock():
+            return
+        with self._lock:
+            self._entries[key] = (expires_at, token)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    # ------------------------------------------------------------------
+    # Nivel compartido (Redis, best-effort)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _redis_key(key: str, prefix: str = _REDIS_PREFIX) -> str:
+        return prefix + hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _get_shared(self, key: str) -> tuple[float, str] | None:
+        if self._redis is None or self._encryption is None:
+            return None
+        try:
+            raw = self._redis.get(self._redis_key(key))
+            if raw is None:
+                return None
+            data = json.loads(raw)
+            expires_at = float(data["exp"])
+            if expires_at <= self._clock():
+                return None
+            return expires_at, self._encryption.decrypt(data["token"])
+        except Exception as exc:
+            logger.warning(
+                "connector token cache: redis read failed",
+                extra={"error": str(exc)},
+            )
+            return None
+
+    def _put_shared(self, key: str, expires_at: float, token: str) -> None:
+        if self._redis is None or self._encryption is None:
+            return
+        ttl = int(expires_at - self._clock())
+        if ttl <= 0:
+            return
+        try:
+            payload = json.dumps(
+                {"exp": expires_at, "token": self._encryption.encrypt(token)}
+            )
+            self._redis.setex(self._redis_key(key), ttl, payload)
+        except Exception as exc:
+            logger.warning(
+                "connector token cache: redis write failed",
+                extra={"error": str(exc)},
+            )
+
+    def _acquire_shared_lock(self, key: str) -> bool:
+        """True si este proceso refresca; False si otro ya lo está haciendo."""
+        if self._redis is None:
+            return True
+        try:
+            return bool(
+                self._redis.set(
+                    self._redis_key(key, _REDIS_LOCK_PREFIX),
+                    "1",
+                    nx=True,
+                    ex=max(1, int(self._lock_timeout)),
+                )
+            )
+        except Exception:
+            # Sin Redis no hay coordinación: refrescamos localmente.
+            return True
+
+    def _release_shared_lock(self, key: str) -> None:
+        if self._redis is None:
+            return
+        try:
+            self._redis.delete(self._redis_key(key, _REDIS_LOCK_PREFIX))
+        except Exception:
+            pass
+
+
+__all__ = ["AccessTokenCache"]
@@ -8,6 +8,7 @@ Este módulo implementa un **Decorator** sobre `EmbeddingService` que agrega:
 - Deduplicación de inputs en batch (mismo texto → 1 embedding)
 - Preservación del orden original del batch
 - Métricas de hit/miss (Prometheus; se asume no-op si no está habilitado)
+- Misses en lotes concurrentes (opcional): cada lote se cachea al completarse
 
 Arquitectura
 ------------
@@ -36,6 +37,7 @@ Responsibilities:
   - Resolver embeddings con cache-aside (get/miss/set)
   - Deduplicar batch por clave estable y reconstruir resultados en el orden original
   - Emitir métricas de cache hit/miss (best-effort)
+  - Resolver misses en lotes concurrentes acotados (opcional)
 Collaborators:
   - EmbeddingService (provider): genera embeddings cuando hay miss
   - EmbeddingCachePort (cache): almacena y recupera vectores
@@ -58,6 +60,7 @@ from ...crosscutting.metrics import (
 )
 from ...domain.cache import EmbeddingCachePort
 from ...domain.services import EmbeddingService
+from .concurrency import map_ordered
 
 # ---------------------------------------------------------------------------
 # Cache key policy (normalización versionada)
@@ -115,6 +118,7 @@ class CachingEmbeddingService(EmbeddingService):
         provider: EmbeddingService,
         cache: EmbeddingCachePort,
         model_id: str | None = None,
+        max_concurrency: int = 1,
     ):
         """
         R: Constructor (inyección de dependencias).
@@ -123,6 +127,7 @@ class CachingEmbeddingService(EmbeddingService):
             provider: implementación real de EmbeddingService (Google, OpenAI, local, etc.)
             cache: puerto de cache (Redis/memoria/etc.)
             model_id: override explícito (si no, intenta leer provider.model_id)
+            max_concurrency: lotes de misses en paralelo (1 = un único call al provider)
         """
         self._provider = provider
         self._cache = cache
@@ -130,6 +135,10 @@ class CachingEmbeddingService(EmbeddingService):
         # R: model_id se usa para namespacing de claves de cache
         self._model_id = model_id or getattr(provider, "model_id", "unknown")
 
+        # R: Misses en paralelo: lotes del tamaño de batch del provider.
+        self._max_concurrency = max(1, max_concurrency)
+        self._miss_batch_size = getattr(provider, "batch_limit", None)
+
     @property
     def model_id(self) -> str:
         """R: Expone model_id para composición (por ejemplo: cache keys arriba en la pila)."""
@@ -258,38 +267,20 @@ class CachingEmbeddingService(EmbeddingService):
 
         # R: 2) Para misses, pedimos embeddings al provider (solo textos únicos faltantes)
         if miss_items:
-            miss_texts = [item[1] for item in miss_items]
-
-            try:
-                embeddings = self._provider.embed_batch(miss_texts)
-            except EmbeddingError:
-                raise
-            except Exception as exc:
-                raise EmbeddingError("Provider failed to embed batch") from exc
-
-            # R: Validación de integridad: provider debe devolver 1 vector por texto
-            if len(embeddings) != len(miss_items):
-                raise EmbeddingError(
-                    "Embedding batch size mismatch in caching service: "
-                    f"expected {len(miss_items)}, got {len(embeddings)}"
-                )
-
-            # R: Guardamos en cache (best-effort) y completamos todas las posiciones originales
-            for (key, _text, indices), embedding in zip(miss_items, embeddings):
-                try:
-                    self._cache.set(key, embedding)
-                except Exception as exc:
-                    logger.warning(
-                        "Embedding cache set failed (batch); continuing without cache",
-                        exc_info=True,
-                        extra={
-                            "key_prefix": key[:64],
-                            "error_type": type(exc).__name__,
-                        },
-                    )
+            slices = self._split_misses(miss_items)
+            resolved = map_ordered(
+                self._resolve_misses,
+                slices,
+                max_workers=self._max_concurrency,
+                thread_name_prefix="embed-miss",
+            )
 
-                for idx in indices:
-                    results[idx] = embedding
+            for miss_slice, embeddings in zip(slices, resolved, strict=True):
+                for (_key, _text, indices), embedding in zip(
+                    miss_slice, embeddings, strict=True
+                ):
+                    for idx in indices:
+                        results[idx] = embedding
 
         # R: Invariante final: todos los resultados deben estar completos
         if any(embedding is None for embedding in results):
@@ -299,3 +290,49 @@ class CachingEmbeddingService(EmbeddingService):
 
         # R: Cast seguro porque validamos que no hay None
         return cast(List[List[float]], results)
+
+    def _split_misses(
+        self, miss_items: list[tuple[str, str, list[int]]]
+    ) -> list[list[tuple[str, str, list[int]]]]:
+        """R: Un único lote salvo que haya concurrencia y batch size conocido."""
+        size = self._miss_batch_size
+        if self._max_concurrency <= 1 or not size or len(miss_items) <= size:
+            return [miss_items]
+        return [miss_items[i : i + size] for i in range(0, len(miss_items), size)]
+
+    def _resolve_misses(
+        self, miss_items: list[tuple[str, str, list[int]]]
+    ) -> List[List[float]]:
+        """R: Embebe un lote de misses y lo cachea (best-effort) apenas llega."""
+        miss_texts = [item[1] for item in miss_items]
+
+        try:
+            embeddings = self._provider.embed_batch(miss_texts)
+        except EmbeddingError:
+            raise
+        except Exception as exc:
+            raise EmbeddingError("Provider failed to embed batch") from exc
+
+        # R: Validación de integridad: provider debe devolver 1 vector por texto
+        if len(embeddings) != len(miss_items):
+            raise EmbeddingError(
+                "Embedding batch size mismatch in caching service: "
+                f"expected {len(miss_items)}, got {len(embeddings)}"
+            )
+
+        for (key, _text, _indices), embedding in zip(
+            miss_items, embeddings, strict=True
+        ):
+            try:
+                self._cache.set(key, embedding)
+            except Exception as exc:
+                logger.warning(
+                    "Embedding cache set failed (batch); continuing without cache",
+                    exc_info=True,
+                    extra={
+                        "key_prefix": key[:64],
+                        "error_type": type(exc).__name__,
+                    },
+                )
+
+        return embeddings
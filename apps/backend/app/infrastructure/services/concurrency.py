@@ -0,0 +1,172 @@
+"""app.infrastructure.services.concurrency
+
+Name: Bounded Concurrency Helpers (providers externos)
+
+Qué es
+------
+Utilidades para despachar llamadas a providers externos en paralelo con un
+tope de requests en vuelo:
+  - `AdaptiveConcurrencyLimiter`: semáforo con límite ajustable (AIMD).
+    Baja a la mitad ante rate limiting (429) y sube de a 1 tras éxitos.
+  - `RetryAfterGate`: pausa compartida; un Retry-After recibido por un
+    thread frena a todos los que usan el mismo provider.
+  - `map_ordered`: ejecuta una función sobre items en un pool de threads y
+    devuelve resultados en el MISMO orden de entrada.
+
+CRC (Component Card)
+--------------------
+Component: concurrency helpers
+Responsibilities:
+  - Acotar requests concurrentes a un provider (compartido entre llamadas)
+  - Reaccionar a rate limiting reduciendo concurrencia
+  - Compartir la espera de Retry-After entre threads
+  - Reensamblar resultados en orden y propagar el primer error
+Collaborators:
+  - GoogleEmbeddingService (lotes de embeddings)
+  - CachingEmbeddingService (misses en paralelo)
+  - GoogleDriveClient / SyncConnectorSourceUseCase (descargas en paralelo)
+Constraints:
+  - Sin dependencias externas (threading / concurrent.futures)
+  - contextvars se propagan a cada tarea (request_id en logs)
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, Sequence, TypeVar
+
+from ...crosscutting.logger import logger
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    R: Límite de concurrencia adaptativo (additive increase / multiplicative decrease).
+
+    - slot(): bloquea mientras in_flight >= límite actual.
+    - on_throttled(): límite //= 2 (mínimo 1).
+    - on_success(): tras `límite` éxitos consecutivos, límite += 1 (hasta el máximo).
+    """
+
+    def __init__(self, max_concurrency: int) -> None:
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
+        self._max = max_concurrency
+        self._limit = max_concurrency
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max
+
+    @property
+    def limit(self) -> int:
+        """R: Límite vigente (puede ser menor al máximo tras rate limiting)."""
+        with self._cond:
+            return self._limit
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """R: Reserva un slot de ejecución mientras dura el bloque."""
+        with self._cond:
+            while self._in_flight >= self._limit:
+                self._cond.wait()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def on_throttled(self) -> None:
+        """R: Rate limiting observado: reduce a la mitad la concurrencia."""
+        with self._cond:
+            self._successes = 0
+            new_limit = max(1, self._limit // 2)
+            if new_limit == self._limit:
+                return
+            self._limit = new_limit
+        logger.warning(
+            "Provider rate limited; reducing concurrency",
+            extra={"concurrency_limit": new_limit, "max_concurrency": self._max},
+        )
+
+    def on_success(self) -> None:
+        """R: Recuperación gradual hacia el máximo configurado."""
+        with self._cond:
+            if self._limit >= self._max:
+                return
+            self._successes += 1
+            if self._successes >= self._limit:
+                self._successes = 0
+                self._limit += 1
+                self._cond.notify_all()
+
+
+class RetryAfterGate:
+    """
+    R: Pausa compartida ante rate limiting.
+
+    - defer(s): nadie pasa wait() hasta dentro de `s` segundos (se extiende,
+      nunca se acorta).
+    - wait(): bloquea hasta que venza la pausa vigente (no-op si no hay).
+    """
+
+    def __init__(self) -> None:
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def defer(self, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def wait(self) -> None:
+        while True:
+            with self._lock:
+                remaining = self._resume_at - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
+
+def map_ordered(
+    fn: Callable[[T], R],
+    items: Sequence[T],
+    *,
+    max_workers: int,
+    thread_name_prefix: str = "provider",
+) -> list[R]:
+    """
+    R: Aplica `fn` a cada item con hasta `max_workers` threads; resultados en orden.
+
+    - max_workers <= 1 o un solo item: ejecución secuencial (sin threads).
+    - Ante el primer error se cancelan las tareas pendientes y se re-lanza.
+    """
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)),
+        thread_name_prefix=thread_name_prefix,
+    )
+    try:
+        futures = [
+            executor.submit(contextvars.copy_context().run, fn, item) for item in items
+        ]
+        return [future.result() for future in futures]
+    except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    finally:
+        executor.shutdown(wait=True)
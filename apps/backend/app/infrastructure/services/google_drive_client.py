@@ -13,11 +13,20 @@ Responsibilities:
   - Diferenciar errores permanentes (401/403 invalid_grant) vs transitorios (429/5xx).
   - Hashing incremental SHA-256 durante descarga (sin cargar todo en RAM).
   - Registrar métricas de resiliencia (retries, failures).
+  - Acotar requests en vuelo cuando varios threads comparten el cliente
+    (sync concurrente): un 429 baja la concurrencia y pausa a todos los
+    threads durante el Retry-After.
+  - Reusar un httpx.Client por proceso (HTTP/2, keep-alive): el access_token
+    se inyecta por request, nunca queda en el pool compartido.
+  - Medir latencia y reuso de conexión por endpoint (files.list,
+    changes.list, download).
 
 Collaborators:
   - domain.connectors (ConnectorClient, ConnectorFile, ConnectorDelta)
   - crosscutting.config (Settings — límites y retry config)
-  - crosscutting.metrics (record_connector_api_retry, record_connector_api_failure)
+  - crosscutting.metrics (record_connector_api_retry, record_connector_api_failure,
+    observe_connector_http_request)
+  - services.concurrency (AdaptiveConcurrencyLimiter, RetryAfterGate)
   - httpx (HTTP client)
 ============================================================
 """
@@ -26,18 +35,22 @@ from __future__ import annotations
 
 import hashlib
 import random
+import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple
 
 import httpx
 
 from ...crosscutting.logger import logger
 from ...crosscutting.metrics import (
+    observe_connector_http_request,
     record_connector_api_failure,
     record_connector_api_retry,
 )
 from ...domain.connectors import ConnectorDelta, ConnectorFile
+from .concurrency import AdaptiveConcurrencyLimiter, RetryAfterGate
 
 _DRIVE_FILES_URL = "https://www.googleapis.com/drive/v3/files"
 _DRIVE_CHANGES_URL = "https://www.googleapis.com/drive/v3/changes"
@@ -67,6 +80,18 @@ _PERMANENT_STATUS_CODES = frozenset({400, 401, 403, 404})
 
 _PROVIDER = "google_drive"
 
+# Labels de endpoint (baja cardinalidad) para métricas HTTP
+_ENDPOINT_FILES_LIST = "files.list"
+_ENDPOINT_CHANGES_LIST = "changes.list"
+_ENDPOINT_START_PAGE_TOKEN = "changes.getStartPageToken"
+_ENDPOINT_DOWNLOAD = "download"
+
+# Evento de httpcore (extensión "trace") emitido solo al abrir conexión nueva
+_TRACE_NEW_CONNECTION = "connection.connect_tcp.started"
+
+_shared_http_client: httpx.Client | None = None
+_shared_http_client_lock = threading.Lock()
+
 
 class ConnectorPermanentError(Exception):
     """Error permanente del proveedor (credenciales inválidas, recurso no encontrado)."""
@@ -104,6 +129,12 @@ class GoogleDriveClient:
     Recibe un access_token válido (ya refrescado por la capa de aplicación).
     Incluye retry con backoff exponencial + jitter para errores transitorios,
     descarga en streaming con límite anti-OOM y hashing incremental SHA-256.
+
+    Thread-safe: max_concurrency acota los requests en vuelo entre todos los
+    threads que comparten la instancia.
+
+    La instancia es liviana (una por sync): las conexiones viven en
+    `http_client`, compartido por proceso (default: get_shared_http_client()).
     """
 
     def __init__(
@@ -115,15 +146,21 @@ class GoogleDriveClient:
         retry_base_delay_s: float = 1.0,
         retry_max_delay_s: float = 30.0,
         timeout_s: float = 60.0,
+        max_concurrency: int = 1,
+        http_client: httpx.Client | None = None,
     ):
         if not access_token:
             raise ValueError("access_token is required for GoogleDriveClient")
+        # R: Header por request: el pool compartido no conoce tokens.
         self._headers = {"Authorization": f"Bearer {access_token}"}
+        self._http = http_client or get_shared_http_client()
         self._timeout = timeout_s
         self._max_file_bytes = max_file_bytes
         self._retry_max = retry_max_attempts
         self._retry_base = retry_base_delay_s
         self._retry_max_delay = retry_max_delay_s
+        self._limiter = AdaptiveConcurrencyLimiter(max_concurrency)
+        self._rate_limit_gate = RetryAfterGate()
 
     # ------------------------------------------------------------------
     # Retry helper (interno)
@@ -135,7 +172,7 @@ class GoogleDriveClient:
         url: str,
         *,
         params: dict | None = None,
-        stream: bool = False,
+        endpoint: str = "other",
     ) -> httpx.Response:
         """
         Ejecuta request HTTP con retry/backoff para errores transitorios.
@@ -144,30 +181,26 @@ class GoogleDriveClient:
         Diferencia errores permanentes (401/403/404) vs transitorios (429/5xx).
         """
         last_exc: Exception | None = None
+        delay = 0.0
 
         for attempt in range(1, self._retry_max + 1):
+            if delay:
+                time.sleep(delay)
+                delay = 0.0
             try:
-                if stream:
-                    # Para streaming usamos httpx.stream como context manager externo
-                    # Aquí retornamos el response del request normal con stream
-                    resp = httpx.request(
-                        method,
-                        url,
-                        params=params,
-                        headers=self._headers,
-                        timeout=self._timeout,
-                    )
-                else:
-                    resp = httpx.request(
+                with self._throttled(), _observe(endpoint) as trace:
+                    resp = self._http.request(
                         method,
                         url,
                         params=params,
                         headers=self._headers,
                         timeout=self._timeout,
+                        extensions={"trace": trace},
                     )
 
                 # Éxito
                 if resp.status_code < 400:
+                    self._limiter.on_success()
                     return resp
 
                 # Error permanente: no reintentar
@@ -180,12 +213,11 @@ class GoogleDriveClient:
                     )
 
                 # Error transitorio: reintentar
-                retry_after = _parse_retry_after(resp)
                 reason = _classify_error_reason(resp.status_code)
 
                 if attempt < self._retry_max:
                     record_connector_api_retry(_PROVIDER, reason)
-                    delay = self._calc_delay(attempt, retry_after)
+                    delay = self._transient_delay(attempt, resp)
                     logger.warning(
                         "google_drive: transitorio, reintentando",
                         extra={
@@ -195,7 +227,6 @@ class GoogleDriveClient:
                             "reason": reason,
                         },
                     )
-                    time.sleep(delay)
                     continue
 
                 # Último intento agotado
@@ -222,7 +253,6 @@ class GoogleDriveClient:
                             "reason": reason,
                         },
                     )
-                    time.sleep(delay)
                     continue
 
                 record_connector_api_failure(_PROVIDER, reason)
@@ -242,6 +272,27 @@ class GoogleDriveClient:
         base = max(jittered, retry_after)
         return min(base, self._retry_max_delay)
 
+    def _transient_delay(self, attempt: int, resp: httpx.Response) -> float:
+        """
+        Delay antes del próximo intento de ESTE thread.
+
+        Ante 429 la espera se comparte: se baja la concurrencia y se pausa a
+        todos los threads (el próximo intento espera en _throttled).
+        """
+        delay = self._calc_delay(attempt, _parse_retry_after(resp))
+        if resp.status_code != 429:
+            return delay
+        self._limiter.on_throttled()
+        self._rate_limit_gate.defer(delay)
+        return 0.0
+
+    @contextmanager
+    def _throttled(self) -> Iterator[None]:
+        """Respeta la pausa por rate limiting y reserva un slot de request."""
+        self._rate_limit_gate.wait()
+        with self._limiter.slot():
+            yield
+
     # ------------------------------------------------------------------
     # API pública
     # ------------------------------------------------------------------
@@ -259,7 +310,9 @@ class GoogleDriveClient:
             params["pageToken"] = page_token
 
         try:
-            resp = self._request_with_retry("GET", _DRIVE_FILES_URL, params=params)
+            resp = self._request_with_retry(
+                "GET", _DRIVE_FILES_URL, params=params, endpoint=_ENDPOINT_FILES_LIST
+            )
             data = resp.json()
         except (ConnectorPermanentError, ConnectorTransientError):
             raise
@@ -334,16 +387,25 @@ class GoogleDriveClient:
         - Retry con backoff (a nivel de request completo).
         """
         last_exc: Exception | None = None
+        delay = 0.0
 
         for attempt in range(1, self._retry_max + 1):
+            if delay:
+                time.sleep(delay)
+                delay = 0.0
             try:
-                with httpx.stream(
-                    "GET",
-                    url,
-                    params=params,
-                    headers=self._headers,
-                    timeout=self._timeout,
-                ) as resp:
+                with (
+                    self._throttled(),
+                    _observe(_ENDPOINT_DOWNLOAD) as trace,
+                    self._http.stream(
+                        "GET",
+                        url,
+                        params=params,
+                        headers=self._headers,
+                        timeout=self._timeout,
+                        extensions={"trace": trace},
+                    ) as resp,
+                ):
                     if resp.status_code in _PERMANENT_STATUS_CODES:
                         reason = _classify_error_reason(resp.status_code)
                         record_connector_api_failure(_PROVIDER, reason)
@@ -353,13 +415,11 @@ class GoogleDriveClient:
                         )
 
                     if resp.status_code >= 400:
-                        retry_after = _parse_retry_after(resp)
                         reason = _classify_error_reason(resp.status_code)
 
                         if attempt < self._retry_max:
                             record_connector_api_retry(_PROVIDER, reason)
-                            delay = self._calc_delay(attempt, retry_after)
-                            time.sleep(delay)
+                            delay = self._transient_delay(attempt, resp)
                             continue
 
                         record_connector_api_failure(_PROVIDER, reason)
@@ -384,6 +444,7 @@ class GoogleDriveClient:
                         chunks.append(chunk)
                         hasher.update(chunk)
 
+                    self._limiter.on_success()
                     return b"".join(chunks), hasher.hexdigest()
 
             except (ConnectorPermanentError, ConnectorFileTooLargeError):
@@ -398,7 +459,6 @@ class GoogleDriveClient:
                 if attempt < self._retry_max:
                     record_connector_api_retry(_PROVIDER, reason)
                     delay = self._calc_delay(attempt)
-                    time.sleep(delay)
                     continue
                 record_connector_api_failure(_PROVIDER, reason)
                 raise ConnectorTransientError(
@@ -439,6 +499,7 @@ class GoogleDriveClient:
                         "spaces": "drive",
                         "includeRemoved": "false",
                     },
+                    endpoint=_ENDPOINT_CHANGES_LIST,
                 )
                 data = resp.json()
 
@@ -482,7 +543,9 @@ class GoogleDriveClient:
     def _get_start_page_token(self) -> str:
         """Obtiene el startPageToken actual (para iniciar tracking de changes)."""
         try:
-            resp = self._request_with_retry("GET", _DRIVE_START_PAGE_TOKEN_URL)
+            resp = self._request_with_retry(
+                "GET", _DRIVE_START_PAGE_TOKEN_URL, endpoint=_ENDPOINT_START_PAGE_TOKEN
+            )
             return resp.json().get("startPageToken", "")
         except Exception as exc:
             logger.warning(
@@ -497,6 +560,85 @@ class GoogleDriveClient:
         return mime_type in _GOOGLE_EXPORT_MIMES or mime_type in _SUPPORTED_DIRECT_MIMES
 
 
+# ---------------------------------------------------------------------------
+# Pool HTTP compartido (por proceso)
+# ---------------------------------------------------------------------------
+
+
+def build_http_client(
+    *,
+    http2: bool = True,
+    max_connections: int = 10,
+    max_keepalive_connections: int = 10,
+    keepalive_expiry_s: float = 60.0,
+    timeout_s: float = 60.0,
+) -> httpx.Client:
+    """
+    httpx.Client para Drive API (sin credenciales: el token va por request).
+
+    - max_connections acota conexiones del pool; Drive usa un único host
+      (www.googleapis.com), así que es también el tope por host.
+    - HTTP/2 requiere el extra `h2` (httpx[http2]); si no está instalado se
+      usa HTTP/1.1 con keep-alive.
+    """
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning(
+                "google_drive: h2 no instalado, usando HTTP/1.1 (pip install httpx[http2])"
+            )
+            http2 = False
+    return httpx.Client(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_s,
+        ),
+        timeout=timeout_s,
+    )
+
+
+def get_shared_http_client() -> httpx.Client:
+    """Client por defecto del proceso (creado lazy, límites por defecto)."""
+    global _shared_http_client
+    if _shared_http_client is None:
+        with _shared_http_client_lock:
+            if _shared_http_client is None:
+                _shared_http_client = build_http_client()
+    return _shared_http_client
+
+
+class _ConnectionTrace:
+    """Callback de la extensión `trace` de httpcore: detecta conexión nueva."""
+
+    __slots__ = ("new_connection",)
+
+    def __init__(self) -> None:
+        self.new_connection = False
+
+    def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        if event_name == _TRACE_NEW_CONNECTION:
+            self.new_connection = True
+
+
+@contextmanager
+def _observe(endpoint: str) -> Iterator[_ConnectionTrace]:
+    """Mide un intento (incluye lectura del body) y si reusó conexión."""
+    trace = _ConnectionTrace()
+    started = time.perf_counter()
+    try:
+        yield trace
+    finally:
+        observe_connector_http_request(
+            _PROVIDER,
+            endpoint,
+            time.perf_counter() - started,
+            reused_connection=not trace.new_connection,
+        )
+
+
 # ---------------------------------------------------------------------------
 # Helpers (módulo)
 # ---------------------------------------------------------------------------
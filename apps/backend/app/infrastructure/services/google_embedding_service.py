@@ -7,15 +7,18 @@ Responsibilities:
   - Handle batch processing with API limits
   - Differentiate task_type for documents vs queries
   - Retry transient errors with exponential backoff + jitter
+  - Dispatch batches concurrently (bounded, adaptive on 429) and reassemble in order
 
 Collaborators:
   - domain.services.EmbeddingService: Interface implementation
   - google.genai: Google Gen AI SDK
   - retry: Resilience helper for transient errors
+  - concurrency: AdaptiveConcurrencyLimiter + map_ordered
 
 Constraints:
   - Batch limit of 10 texts (Google API constraint)
-  - Retries on 429, 5xx, timeouts
+  - Retries on 429, 5xx, timeouts (per batch)
+  - At most `max_concurrency` batches in flight per service instance
 
 Notes:
   - Adapter pattern over the Google GenAI SDK
@@ -32,7 +35,8 @@ from google import genai
 from ...crosscutting.exceptions import EmbeddingError
 from ...crosscutting.logger import logger
 from ...domain.services import EmbeddingService
-from .retry import create_retry_decorator
+from .concurrency import AdaptiveConcurrencyLimiter, map_ordered
+from .retry import create_retry_decorator, is_rate_limit_error
 
 
 def _batched(items: Sequence[str], batch_size: int) -> Iterator[list[str]]:
@@ -66,6 +70,7 @@ class GoogleEmbeddingService(EmbeddingService):
         batch_limit: int | None = None,
         expected_dimensions: int | None = EXPECTED_DIMENSIONS,
         retry_decorator: Callable | None = None,
+        max_concurrency: int = 1,
     ):
         """
         R: Initialize Google Embedding Service.
@@ -77,6 +82,7 @@ class GoogleEmbeddingService(EmbeddingService):
             batch_limit: Override API batch limit (default: 10)
             expected_dimensions: Validate vector length (default: 768; set None to skip)
             retry_decorator: Optional tenacity retry decorator factory
+            max_concurrency: Max batches in flight (default: 1 = sequential)
 
         Raises:
             EmbeddingError: If API key not configured
@@ -89,13 +95,15 @@ class GoogleEmbeddingService(EmbeddingService):
         self._model_id = (model_id or self.MODEL_ID).strip()
         self._batch_limit = batch_limit or self.BATCH_LIMIT
         self._expected_dimensions = expected_dimensions
+        # R: Shared across calls: bounds in-flight batches for the whole worker.
+        self._limiter = AdaptiveConcurrencyLimiter(max_concurrency)
 
         # R: Allow injecting a client for tests; otherwise build one from key
         self._client = client or genai.Client(api_key=resolved_key)
 
         # R: Build and cache a retry-wrapped callable (avoid redefining closures per call)
         decorator = retry_decorator or create_retry_decorator()
-        self._embed_content = decorator(self._client.models.embed_content)
+        self._embed_content = decorator(self._call_provider)
 
         logger.info(
             "GoogleEmbeddingService initialized",
@@ -103,19 +111,36 @@ class GoogleEmbeddingService(EmbeddingService):
                 "model_id": self._model_id,
                 "batch_limit": self._batch_limit,
                 "expected_dimensions": self._expected_dimensions,
+                "max_concurrency": max_concurrency,
             },
         )
 
+    def _call_provider(self, **kwargs):
+        """R: Raw SDK call; reports rate limiting to the limiter before retrying."""
+        try:
+            return self._client.models.embed_content(**kwargs)
+        except Exception as exc:
+            if is_rate_limit_error(exc):
+                self._limiter.on_throttled()
+            raise
+
     def embed_batch(self, texts: Sequence[str]) -> list[list[float]]:
         """R: Generate embeddings for multiple texts (document ingestion mode)."""
         if not texts:
             return []
 
+        batches = list(_batched(texts, self._batch_limit))
+        batch_results = map_ordered(
+            self._embed_document_batch,
+            batches,
+            max_workers=self._limiter.max_concurrency,
+            thread_name_prefix="embed-batch",
+        )
+
         results: list[list[float]] = []
-        batch_count = 0
-        for batch in _batched(texts, self._batch_limit):
-            results.extend(self._embed(contents=batch, task_type=self.TASK_DOCUMENT))
-            batch_count += 1
+        for vectors in batch_results:
+            results.extend(vectors)
+        batch_count = len(batches)
 
         logger.info(
             "GoogleEmbeddingService: Embedded texts",
@@ -128,6 +153,13 @@ class GoogleEmbeddingService(EmbeddingService):
         )
         return results
 
+    def _embed_document_batch(self, batch: list[str]) -> list[list[float]]:
+        """R: One provider batch under a concurrency slot (retries included)."""
+        with self._limiter.slot():
+            vectors = self._embed(contents=batch, task_type=self.TASK_DOCUMENT)
+        self._limiter.on_success()
+        return vectors
+
     def embed_query(self, query: str) -> list[float]:
         """R: Generate embedding for a single query (search mode)."""
         if not (query or "").strip():
@@ -186,6 +218,11 @@ class GoogleEmbeddingService(EmbeddingService):
 
         return vectors
 
+    @property
+    def batch_limit(self) -> int:
+        """R: Provider batch size (used to split cache misses into batches)."""
+        return self._batch_limit
+
     @property
     def model_id(self) -> str:
         """R: Return model identifier for cache key composition."""
@@ -9,6 +9,7 @@ Responsibilities:
   - Construir authorization URL con scopes de Google Drive.
   - Intercambiar authorization code por tokens (via Google token endpoint).
   - Obtener email del usuario desde Google userinfo.
+  - Refrescar access_token informando su vigencia (expires_in) para cachearlo.
 
 Collaborators:
   - domain.connectors.OAuthPort, OAuthTokenResponse
@@ -21,7 +22,7 @@ from __future__ import annotations
 import httpx
 
 from ...crosscutting.logger import logger
-from ...domain.connectors import OAuthTokenResponse
+from ...domain.connectors import OAuthAccessToken, OAuthTokenResponse
 
 # Google OAuth endpoints
 _GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
@@ -119,6 +120,10 @@ class GoogleOAuthAdapter:
 
     def refresh_access_token(self, refresh_token: str) -> str:
         """Refresca el access_token usando un refresh_token almacenado."""
+        return self.refresh_access_token_with_expiry(refresh_token).access_token
+
+    def refresh_access_token_with_expiry(self, refresh_token: str) -> OAuthAccessToken:
+        """Refresca el access_token y devuelve también su vigencia (segundos)."""
         try:
             resp = httpx.post(
                 _GOOGLE_TOKEN_URL,
@@ -132,7 +137,10 @@ class GoogleOAuthAdapter:
             )
             resp.raise_for_status()
             data = resp.json()
-            return data["access_token"]
+            return OAuthAccessToken(
+                access_token=data["access_token"],
+                expires_in=int(data.get("expires_in", 3600)),
+            )
         except httpx.HTTPStatusError as exc:
             logger.error(
                 "google oauth refresh failed",
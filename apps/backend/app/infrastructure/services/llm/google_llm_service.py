@@ -44,13 +44,23 @@ Collaborators:
   - retry.create_retry_decorator: resiliencia
 Constraints:
   - Streaming: si el error ocurre a mitad de stream, NO se reintenta (no se puede reemitir tokens ya enviados)
+  - Streaming: nunca bloquea el event loop (cliente async del SDK o bridge a thread)
   - Respuestas en español (por prompt/policy)
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import AsyncGenerator, List, Optional, Protocol
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+)
 
 from google import genai
 
@@ -61,6 +71,9 @@ from ....domain.services import LLMService
 from ...prompts import PromptLoader, get_prompt_loader
 from ..retry import create_retry_decorator
 
+# R: Sentinel para detectar fin del iterador sync consumido desde un thread.
+_STREAM_END = object()
+
 
 class ContextBuilderPort(Protocol):
     """
@@ -130,6 +143,15 @@ class GoogleLLMService(LLMService):
         self._generate_content = decorator(self._client.models.generate_content)
         self._create_stream = decorator(self._client.models.generate_content_stream)
 
+        # R: Cliente async del SDK (client.aio). Si no existe (clientes fake/legacy),
+        #     el stream sync se consume desde un thread para no bloquear el loop.
+        aio_models = getattr(getattr(self._client, "aio", None), "models", None)
+        self._create_stream_async = (
+            decorator(aio_models.generate_content_stream)
+            if aio_models is not None
+            else None
+        )
+
         logger.info(
             "GoogleLLMService initialized",
             extra={
@@ -290,11 +312,8 @@ class GoogleLLMService(LLMService):
         prompt = self._build_prompt(query=query, context=context)
 
         try:
-            # R: Creamos stream con retry (errores transitorios al iniciar)
-            stream_iter = self._create_stream(model=self._model_id, contents=prompt)
-
-            # R: Emitimos texto a medida que llega (chunk.text).
-            for piece in stream_iter:
+            # R: Emitimos texto a medida que llega (chunk.text), sin bloquear el loop.
+            async for piece in self._open_stream(prompt):
                 text = getattr(piece, "text", None)
                 if text:
                     yield text
@@ -320,3 +339,36 @@ class GoogleLLMService(LLMService):
                 },
             )
             raise LLMError("Failed to stream response") from exc
+
+    async def _open_stream(self, prompt: str) -> AsyncIterator[Any]:
+        """
+        R: Abre el stream del provider como iterador async.
+
+        Estrategia:
+          - Preferido: `client.aio` (HTTP async nativo del SDK).
+          - Fallback: stream sync consumido pieza a pieza vía `asyncio.to_thread`.
+        En ambos casos sólo la creación del stream pasa por retry.
+        """
+        if self._create_stream_async is not None:
+            stream = await self._create_stream_async(
+                model=self._model_id, contents=prompt
+            )
+            async for piece in stream:
+                yield piece
+            return
+
+        # R: El SDK sync puede hacer IO tanto al crear el stream como en cada next().
+        stream_iter = await asyncio.to_thread(
+            self._create_stream, model=self._model_id, contents=prompt
+        )
+        async for piece in _iterate_in_thread(iter(stream_iter)):
+            yield piece
+
+
+async def _iterate_in_thread(iterator: Iterator[Any]) -> AsyncIterator[Any]:
+    """R: Bridge iterador sync → async: cada next() bloqueante corre en un thread."""
+    while True:
+        piece = await asyncio.to_thread(next, iterator, _STREAM_END)
+        if piece is _STREAM_END:
+            return
+        yield piece
@@ -33,6 +33,7 @@ CRC (Component Card)
 Component: retry helper
 Responsibilities:
   - Decidir qué errores son reintentables
+  - Detectar rate limiting (para reducir concurrencia)
   - Proveer un decorator estándar (tenacity) con backoff+jitter
   - Loguear intentos y contexto útil para debugging/observabilidad
 Collaborators:
@@ -187,6 +188,24 @@ def is_transient_error(exception: BaseException) -> bool:
     return False
 
 
+def is_rate_limit_error(exception: BaseException) -> bool:
+    """R: Detecta rate limiting del provider (429 / quota / resource exhausted).
+
+    Se usa para bajar concurrencia (ver concurrency.AdaptiveConcurrencyLimiter);
+    el retry en sí lo sigue decidiendo is_transient_error().
+    """
+    if get_http_status_code(exception) == 429:
+        return True
+
+    if "resourceexhausted" in type(exception).__name__.lower():
+        return True
+
+    message = str(exception).lower()
+    return any(
+        p in message for p in ("rate limit", "too many requests", "quota exceeded")
+    )
+
+
 def _extract_request_id(retry_state: RetryCallState) -> Optional[str]:
     """R: Extrae request_id/correlation_id de kwargs para observabilidad.
 
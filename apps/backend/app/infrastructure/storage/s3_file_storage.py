@@ -22,16 +22,18 @@ Decisiones de diseño (Senior):
   - Lazy import de boto3/botocore para mejorar cold start.
   - Mapeo explícito de errores (ClientError -> StorageError).
   - upload acepta bytes o BinaryIO para evitar OOM con archivos grandes.
+  - Multipart acotado (TransferConfig): memoria por upload ≈ parte × concurrencia.
 ===============================================================================
 """
 
 from __future__ import annotations
 
+import tempfile
 from dataclasses import dataclass
 from typing import BinaryIO, Optional, Union
 
 from ...crosscutting.logger import logger
-from ...domain.services import FileStoragePort
+from ...domain.services import FileStoragePort, StoredObjectInfo
 from .errors import (
     StorageConfigurationError,
     StorageError,
@@ -49,6 +51,10 @@ class S3Config:
     Nota:
       - endpoint_url permite MinIO u otros S3 compatibles.
       - region puede omitirse en MinIO.
+      - multipart_*: tamaño de parte y partes en vuelo para uploads por stream
+        (y para las descargas por rangos de open_stream).
+      - download_spool_bytes: hasta este tamaño open_stream queda en memoria;
+        por encima se vuelca a un archivo temporal en disco.
     """
 
     bucket: str
@@ -56,6 +62,9 @@ class S3Config:
     secret_key: str
     region: Optional[str] = None
     endpoint_url: Optional[str] = None
+    multipart_chunk_bytes: int = 8 * 1024 * 1024
+    multipart_max_concurrency: int = 2
+    download_spool_bytes: int = 8 * 1024 * 1024
 
 
 class S3FileStorageAdapter(FileStoragePort):
@@ -65,8 +74,11 @@ class S3FileStorageAdapter(FileStoragePort):
     Implementa:
       - upload_file
       - download_file
+      - open_stream
       - delete_file
       - generate_presigned_url
+      - generate_presigned_upload_url
+      - head_file
     """
 
     def __init__(self, config: S3Config, *, client=None) -> None:
@@ -144,11 +156,17 @@ class S3FileStorageAdapter(FileStoragePort):
 
             # Caso 2: stream (BinaryIO) -> upload_fileobj
             # ExtraArgs es el mecanismo recomendado para ContentType.
+            # Config acota el buffer: partes de multipart_chunk_bytes, pocas en vuelo.
+            kwargs = {}
+            transfer_config = self._transfer_config()
+            if transfer_config is not None:
+                kwargs["Config"] = transfer_config
             self._client.upload_fileobj(
                 Fileobj=content,
                 Bucket=self._bucket,
                 Key=key,
                 ExtraArgs={"ContentType": effective_ct},
+                **kwargs,
             )
 
         except Exception as exc:
@@ -159,8 +177,7 @@ class S3FileStorageAdapter(FileStoragePort):
         Descarga el objeto completo a memoria.
 
         Nota:
-          - Para casos extremadamente grandes podrías agregar download_stream()
-            (pero tu port de dominio hoy retorna bytes).
+          - Para archivos grandes usar open_stream() (memoria acotada).
         """
         self._require_key(key)
 
@@ -177,6 +194,36 @@ class S3FileStorageAdapter(FileStoragePort):
         except Exception as exc:
             raise self._map_storage_error(exc, key=key, action="download") from exc
 
+    def open_stream(self, key: str) -> BinaryIO:
+        """
+        Descarga el objeto por rangos a un SpooledTemporaryFile rebobinado.
+
+        - download_fileobj usa GETs por rango (mismo TransferConfig del upload):
+          nunca hay un `bytes` con el archivo completo en memoria.
+        - Memoria acotada: por encima de download_spool_bytes el spool pasa a disco.
+        - El caller cierra el stream (context manager).
+        """
+        self._require_key(key)
+
+        spool = tempfile.SpooledTemporaryFile(
+            max_size=max(0, int(self._config.download_spool_bytes))
+        )
+        kwargs = {}
+        transfer_config = self._transfer_config()
+        if transfer_config is not None:
+            kwargs["Config"] = transfer_config
+
+        try:
+            self._client.download_fileobj(
+                Bucket=self._bucket, Key=key, Fileobj=spool, **kwargs
+            )
+        except Exception as exc:
+            spool.close()
+            raise self._map_storage_error(exc, key=key, action="download") from exc
+
+        spool.seek(0)
+        return spool
+
     def delete_file(self, key: str) -> None:
         """
         Borra el objeto.
@@ -230,10 +277,78 @@ class S3FileStorageAdapter(FileStoragePort):
         except Exception as exc:
             raise self._map_storage_error(exc, key=key, action="presign") from exc
 
+    def generate_presigned_upload_url(
+        self,
+        key: str,
+        *,
+        content_type: str,
+        expires_in_seconds: int = 900,
+    ) -> str:
+        """
+        Genera una URL firmada (PUT) para que el cliente suba directo al storage.
+
+        Nota:
+          - ContentType queda firmado: el cliente debe enviar el mismo header.
+          - El backend valida el objeto con head_file() al completar.
+        """
+        self._require_key(key)
+
+        if expires_in_seconds <= 0:
+            expires_in_seconds = 900
+
+        try:
+            url = self._client.generate_presigned_url(
+                ClientMethod="put_object",
+                Params={
+                    "Bucket": self._bucket,
+                    "Key": key,
+                    "ContentType": content_type,
+                },
+                ExpiresIn=int(expires_in_seconds),
+            )
+            return str(url)
+        except Exception as exc:
+            raise self._map_storage_error(
+                exc, key=key, action="presign_upload"
+            ) from exc
+
+    def head_file(self, key: str) -> StoredObjectInfo | None:
+        """Metadata del objeto (tamaño / content-type); None si no existe."""
+        self._require_key(key)
+
+        try:
+            response = self._client.head_object(Bucket=self._bucket, Key=key)
+        except Exception as exc:
+            error = self._map_storage_error(exc, key=key, action="head")
+            if isinstance(error, StorageNotFoundError):
+                return None
+            raise error from exc
+
+        return StoredObjectInfo(
+            size_bytes=int(response.get("ContentLength") or 0),
+            content_type=response.get("ContentType"),
+        )
+
     # =========================================================================
     # Helpers privados (Clean / DRY)
     # =========================================================================
 
+    def _transfer_config(self):
+        """TransferConfig del multipart (None si boto3 no está disponible)."""
+        try:
+            from boto3.s3.transfer import TransferConfig
+        except Exception:
+            return None
+        # S3 exige partes de al menos 5MB (salvo la última).
+        chunk = max(5 * 1024 * 1024, int(self._config.multipart_chunk_bytes))
+        concurrency = max(1, int(self._config.multipart_max_concurrency))
+        return TransferConfig(
+            multipart_threshold=chunk,
+            multipart_chunksize=chunk,
+            max_concurrency=concurrency,
+            use_threads=concurrency > 1,
+        )
+
     @staticmethod
     def _require_key(key: str) -> None:
         if not (key or "").strip():
@@ -1,12 +1,20 @@
 """Utilidades de texto (chunking)."""
 
-from .chunker import SimpleTextChunker, chunk_fragments, chunk_text
+from .chunker import (
+    SimpleTextChunker,
+    chunk_fragments,
+    chunk_text,
+    iter_chunk_text,
+    iter_fragments,
+)
 from .models import ChunkFragment
 from .structured_chunker import StructuredTextChunker
 
 __all__ = [
     "chunk_text",
     "chunk_fragments",
+    "iter_chunk_text",
+    "iter_fragments",
     "SimpleTextChunker",
     "StructuredTextChunker",
     "ChunkFragment",
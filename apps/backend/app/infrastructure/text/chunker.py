@@ -12,6 +12,7 @@ Responsabilidades:
   - Exponer:
       * chunk_text(...) -> list[str] (compatibilidad)
       * chunk_fragments(...) -> list[ChunkFragment] (salida rica)
+      * iter_chunk_text / iter_fragments (generadores, memoria acotada)
       * SimpleTextChunker (servicio)
 
 Colaboradores:
@@ -19,22 +20,44 @@ Colaboradores:
 
 Decisiones senior:
   - Guard clauses + validación de parámetros (fail-fast).
-  - Límite de chunks para evitar bombas de memoria.
+  - Generadores: los chunks salen a medida que se cortan (sin listas
+    intermedias ni segunda pasada), así que no hace falta un tope de chunks.
+  - Un solo regex precompilado busca el mejor separador de cada ventana.
   - Post-proceso: merge de “micro-chunks” finales cuando conviene.
 ===============================================================================
 """
 
 from __future__ import annotations
 
-from typing import Final
+import re
+from typing import Final, Iterator
 
 from .models import ChunkFragment
 
 # Separadores en orden de prioridad (mejor a peor).
 _SEPARATORS: Final[list[str]] = ["\n\n", "\n", ". ", "; ", ", ", " "]
 
-# Guardrail: evita generar miles de chunks por inputs patológicos.
-_DEFAULT_MAX_CHUNKS: Final[int] = 2000
+
+def _compile_split_pattern(*, at_text_end: bool) -> re.Pattern[str]:
+    """
+    Un solo regex para todos los separadores (alternativas en orden de prioridad).
+
+    - `.*` greedy => la ÚLTIMA ocurrencia del separador dentro de la ventana.
+    - La alternación prueba cada separador completo antes del siguiente
+      (equivale a un rfind por separador, pero en una sola pasada de C).
+    - La ventana termina en target+2: un separador debe EMPEZAR en <= target,
+      así que los de 1 carácter no pueden terminar justo en el borde (?!\Z),
+      salvo cuando el borde es el fin del texto.
+    """
+    alternatives = []
+    for sep in _SEPARATORS:
+        guard = "(?!\\Z)" if len(sep) == 1 and not at_text_end else ""
+        alternatives.append(f".*{re.escape(sep)}{guard}")
+    return re.compile("|".join(alternatives), re.DOTALL)
+
+
+_SPLIT_PATTERN: Final[re.Pattern[str]] = _compile_split_pattern(at_text_end=False)
+_SPLIT_PATTERN_AT_END: Final[re.Pattern[str]] = _compile_split_pattern(at_text_end=True)
 
 
 def _find_best_split(text: str, target: int, window: int = 120) -> int:
@@ -42,7 +65,8 @@ def _find_best_split(text: str, target: int, window: int = 120) -> int:
     Encuentra el mejor punto de corte cerca de `target`.
 
     Estrategia:
-      - Buscar hacia atrás dentro de una ventana y elegir el último separador.
+      - Buscar hacia atrás dentro de una ventana y elegir el último separador
+        de mayor prioridad.
       - Si no encuentra nada, cortar exacto en `target`.
 
     Devuelve:
@@ -51,145 +75,196 @@ def _find_best_split(text: str, target: int, window: int = 120) -> int:
     if target >= len(text):
         return len(text)
 
-    start = max(0, target - window)
-    end = min(len(text), target + window)
-    region = text[start:end]
+    # Sin copiar la región: el regex trabaja sobre [pos, endpos) del texto.
+    end = target + 2
+    pattern = _SPLIT_PATTERN
+    if end > len(text):
+        end = len(text)
+        pattern = _SPLIT_PATTERN_AT_END
 
-    rel_target = target - start
+    match = pattern.match(text, max(0, target - window), end)
+    return match.end() if match else target
 
-    for sep in _SEPARATORS:
-        pos = region.rfind(sep, 0, rel_target + len(sep))
-        if pos != -1:
-            return start + pos + len(sep)
 
-    return target
+def _merge_pair(previous: str, tail: str) -> str:
+    """Mergea un chunk de cola demasiado chico con el anterior."""
+    return (previous.rstrip() + "\n\n" + tail.lstrip()).strip()
 
 
-def _merge_small_tail(chunks: list[str], *, min_tail_chars: int) -> list[str]:
+def _validate_params(chunk_size: int, overlap: int, max_chunks: int | None) -> None:
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size debe ser > 0. got={chunk_size}")
+    if overlap < 0:
+        raise ValueError(f"overlap debe ser >= 0. got={overlap}")
+    if overlap >= chunk_size:
+        raise ValueError("overlap debe ser menor a chunk_size.")
+    if max_chunks is not None and max_chunks <= 0:
+        raise ValueError("max_chunks debe ser > 0.")
+
+
+def _iter_spans(
+    raw: str, *, chunk_size: int, overlap: int
+) -> Iterator[tuple[int, int]]:
     """
-    Si el último chunk es demasiado chico, lo mergea con el anterior (si existe).
+    Genera (start, end) de cada pieza sobre `raw` (ya stripeado).
 
-    Esto reduce fragmentación y mejora contexto para embeddings.
+    Costo lineal: cada corte mira solo su ventana, sin slices intermedios.
     """
-    if len(chunks) < 2:
-        return chunks
+    length = len(raw)
+    start = 0
+    while start < length:
+        end_target = start + chunk_size
+        if end_target >= length:
+            yield start, length
+            return
 
-    last = chunks[-1]
-    if len(last) >= min_tail_chars:
-        return chunks
+        split_at = _find_best_split(raw, end_target)
+        yield start, split_at
 
-    merged = chunks[:-2] + [(chunks[-2].rstrip() + "\n\n" + last.lstrip()).strip()]
-    return merged
+        # Avanza con overlap, evitando loops por split muy chico.
+        start = max(start + 1, split_at - overlap)
 
 
-def chunk_fragments(
+def iter_fragments(
     text: str,
     *,
     chunk_size: int = 900,
     overlap: int = 120,
     context_window: int = 80,
-    max_chunks: int = _DEFAULT_MAX_CHUNKS,
-) -> list[ChunkFragment]:
+    max_chunks: int | None = None,
+) -> Iterator[ChunkFragment]:
     """
-    Parte el texto en fragmentos con overlap y metadata.
+    Parte el texto en fragmentos con overlap y metadata, de forma incremental.
 
     Importante:
-      - Este es el “motor” real. `chunk_text` es solo un wrapper.
+      - Este es el “motor” real: `chunk_fragments` y `chunk_text` lo envuelven.
+      - Memoria acotada: retiene un solo fragmento pendiente para completar su
+        `next_context` cuando se conoce el siguiente (lookahead de 1).
+      - Sin tope por defecto; `max_chunks` (opcional) corta la generación.
     """
+    _validate_params(chunk_size, overlap, max_chunks)
+
     raw = (text or "").strip()
     if not raw:
-        return []
+        return
 
-    if chunk_size <= 0:
-        raise ValueError(f"chunk_size debe ser > 0. got={chunk_size}")
-    if overlap < 0:
-        raise ValueError(f"overlap debe ser >= 0. got={overlap}")
-    if overlap >= chunk_size:
-        raise ValueError("overlap debe ser menor a chunk_size.")
-    if max_chunks <= 0:
-        raise ValueError("max_chunks debe ser > 0.")
+    pending: ChunkFragment | None = None
+    prev_content = ""
+    idx = 0
+    for start, end in _iter_spans(raw, chunk_size=chunk_size, overlap=overlap):
+        piece = raw[start:end].strip()
+        if not piece:
+            continue
+        if max_chunks is not None and idx >= max_chunks:
+            break
 
-    # Caso corto: un fragmento único.
-    if len(raw) <= chunk_size:
-        return [
-            ChunkFragment(
-                content=raw,
-                index=0,
-                start=0,
-                end=len(raw),
+        if pending is not None:
+            yield _with_context(
+                pending,
+                prev_content=prev_content,
+                next_content=piece,
+                context_window=context_window,
             )
-        ]
+            prev_content = pending.content
 
-    fragments: list[ChunkFragment] = []
-    start = 0
-    idx = 0
+        pending = ChunkFragment(content=piece, index=idx, start=start, end=end)
+        idx += 1
 
-    while start < len(raw):
-        if idx >= max_chunks:
-            # Guardrail duro: mejor truncar que caer por memoria.
-            # (Si querés, acá se puede levantar excepción tipada.)
-            break
+    if pending is not None:
+        yield _with_context(
+            pending,
+            prev_content=prev_content,
+            next_content="",
+            context_window=context_window,
+        )
 
-        end_target = start + chunk_size
-        if end_target >= len(raw):
-            piece = raw[start:].strip()
-            if piece:
-                fragments.append(
-                    ChunkFragment(content=piece, index=idx, start=start, end=len(raw))
-                )
-            break
 
-        split_at = _find_best_split(raw, end_target)
-        piece = raw[start:split_at].strip()
+def _with_context(
+    fragment: ChunkFragment,
+    *,
+    prev_content: str,
+    next_content: str,
+    context_window: int,
+) -> ChunkFragment:
+    return ChunkFragment(
+        content=fragment.content,
+        index=fragment.index,
+        start=fragment.start,
+        end=fragment.end,
+        prev_context=prev_content[-context_window:] if prev_content else "",
+        next_context=next_content[:context_window],
+        section=fragment.section,
+        kind=fragment.kind,
+    )
 
-        if piece:
-            fragments.append(
-                ChunkFragment(content=piece, index=idx, start=start, end=split_at)
-            )
-            idx += 1
 
-        # Avanza con overlap, evitando loops por split muy chico.
-        start = max(start + 1, split_at - overlap)
+def chunk_fragments(
+    text: str,
+    *,
+    chunk_size: int = 900,
+    overlap: int = 120,
+    context_window: int = 80,
+    max_chunks: int | None = None,
+) -> list[ChunkFragment]:
+    """
+    Parte el texto en fragmentos con overlap y metadata (lista materializada).
 
-    # Enriquecer vecindad (prev/next context) para quien lo necesite.
-    for i, frag in enumerate(fragments):
-        prev_ctx = ""
-        next_ctx = ""
-
-        if i > 0:
-            prev_ctx = fragments[i - 1].content[-context_window:]
-
-        if i + 1 < len(fragments):
-            next_ctx = fragments[i + 1].content[:context_window]
-
-        fragments[i] = ChunkFragment(
-            content=frag.content,
-            index=frag.index,
-            start=frag.start,
-            end=frag.end,
-            prev_context=prev_ctx,
-            next_context=next_ctx,
-            section=frag.section,
-            kind=frag.kind,
+    Ver `iter_fragments` para la versión incremental.
+    """
+    return list(
+        iter_fragments(
+            text,
+            chunk_size=chunk_size,
+            overlap=overlap,
+            context_window=context_window,
+            max_chunks=max_chunks,
         )
+    )
 
-    return fragments
 
-
-def chunk_text(text: str, chunk_size: int = 900, overlap: int = 120) -> list[str]:
+def iter_chunk_text(
+    text: str, chunk_size: int = 900, overlap: int = 120
+) -> Iterator[str]:
     """
-    Wrapper de compatibilidad: devuelve list[str].
+    Versión incremental de `chunk_text` (mismo output, memoria acotada).
 
-    Mantiene contrato actual, pero internamente usa fragmentos ricos.
+    Retiene un chunk para poder mergear la cola si queda muy chica.
     """
-    fragments = chunk_fragments(text, chunk_size=chunk_size, overlap=overlap)
-    chunks = [f.content for f in fragments]
+    _validate_params(chunk_size, overlap, None)
+
+    raw = (text or "").strip()
+    if not raw:
+        return
 
-    # Mejora: si el último chunk es muy chico, mergearlo.
     # Heurística: “muy chico” = menos del 25% de chunk_size
-    chunks = _merge_small_tail(chunks, min_tail_chars=max(80, int(chunk_size * 0.25)))
+    min_tail_chars = max(80, int(chunk_size * 0.25))
+
+    previous: str | None = None
+    pending: str | None = None
+    for start, end in _iter_spans(raw, chunk_size=chunk_size, overlap=overlap):
+        piece = raw[start:end].strip()
+        if not piece:
+            continue
+        if previous is not None:
+            yield previous
+        previous, pending = pending, piece
+
+    if pending is None:
+        return
+    if previous is None:
+        yield pending
+    elif len(pending) < min_tail_chars:
+        yield _merge_pair(previous, pending)
+    else:
+        yield previous
+        yield pending
 
-    return chunks
+
+def chunk_text(text: str, chunk_size: int = 900, overlap: int = 120) -> list[str]:
+    """
+    Wrapper de compatibilidad: devuelve list[str].
+    """
+    return list(iter_chunk_text(text, chunk_size=chunk_size, overlap=overlap))
 
 
 class SimpleTextChunker:
@@ -214,3 +289,7 @@ class SimpleTextChunker:
 
     def chunk(self, text: str) -> list[str]:
         return chunk_text(text, chunk_size=self.chunk_size, overlap=self.overlap)
+
+    def iter_chunks(self, text: str) -> Iterator[str]:
+        """Igual que `chunk()`, pero incremental."""
+        return iter_chunk_text(text, chunk_size=self.chunk_size, overlap=self.overlap)
@@ -54,6 +54,7 @@ MARKDOWN_HEADER = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
 LIST_ITEM = re.compile(r"^[\s]*[-*+]\s+", re.MULTILINE)
 CODE_BLOCK = re.compile(r"```[\s\S]*?```", re.MULTILINE)
 PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+CODE_PLACEHOLDER = re.compile(r"\x00CODE_(\d+)\x00")
 
 
 def chunk_semantically(
@@ -134,10 +135,14 @@ def chunk_semantically(
         # Simple paragraph-based splitting
         chunks.extend(_split_section(text_without_code, None, max_chunk_size))
 
-    # Restore code blocks
-    for i, chunk in enumerate(chunks):
-        for j, code in enumerate(code_blocks):
-            chunk.content = chunk.content.replace(f"\x00CODE_{j}\x00", code)
+    # Restore code blocks (one pass per chunk instead of one per code block)
+    if code_blocks:
+
+        def restore_code(match):
+            return code_blocks[int(match.group(1))]
+
+        for chunk in chunks:
+            chunk.content = CODE_PLACEHOLDER.sub(restore_code, chunk.content)
 
     return chunks
 
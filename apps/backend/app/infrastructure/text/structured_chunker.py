@@ -32,6 +32,7 @@ from typing import Final
 _CODE_BLOCK: Final[re.Pattern] = re.compile(r"```[\s\S]*?```", re.MULTILINE)
 _MD_HEADER: Final[re.Pattern] = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
 _PARAGRAPH_BREAK: Final[re.Pattern] = re.compile(r"\n\s*\n")
+_CODE_PLACEHOLDER: Final[re.Pattern] = re.compile(r"\x00CODE_(\d+)\x00")
 
 
 @dataclass(frozen=True)
@@ -82,12 +83,11 @@ class StructuredTextChunker:
         for s in sections:
             packed.extend(self._pack_section(s))
 
-        # 4) Restaurar bloques de código.
-        restored: list[str] = []
-        for c in packed:
-            for i, block in enumerate(code_blocks):
-                c = c.replace(f"\x00CODE_{i}\x00", block)
-            restored.append(c.strip())
+        # 4) Restaurar bloques de código (una pasada por chunk, no una por bloque).
+        def _restore_code(m: re.Match) -> str:
+            return code_blocks[int(m.group(1))]
+
+        restored = [_CODE_PLACEHOLDER.sub(_restore_code, c).strip() for c in packed]
 
         # 5) Aplicar overlap final (opcional) para no perder continuidad.
         return self._apply_overlap(restored)
@@ -60,7 +60,13 @@ ALLOWED_MIME_TYPES: set[str] = {
 }
 
 # Filtros válidos para listados de documentos
-ALLOWED_DOCUMENT_STATUSES: set[str] = {"PENDING", "PROCESSING", "READY", "FAILED"}
+ALLOWED_DOCUMENT_STATUSES: set[str] = {
+    "UPLOADING",
+    "PENDING",
+    "PROCESSING",
+    "READY",
+    "FAILED",
+}
 ALLOWED_DOCUMENT_SORTS: set[str] = {
     "created_at_desc",
     "created_at_asc",
@@ -7,8 +7,14 @@ Name:
     Documents Router
 
 Responsibilities:
-    - Endpoints HTTP para documentos (list/get/delete/upload/reprocess/ingest).
+    - Endpoints HTTP para documentos (list/get/status/delete/upload/reprocess/ingest).
+    - Stream SSE de transiciones de status por workspace (fan-out por proceso,
+      reconexión con Last-Event-ID) en lugar de polling por documento.
     - Validaciones de borde (MIME, límites de tamaño, metadata JSON).
+    - Upload en streaming: el archivo spooleado se pasa como stream (sin
+      cargarlo entero en memoria del proceso API).
+    - Upload directo a storage: URL PUT presignada + endpoint de completion
+      (los bytes no pasan por el proceso API).
     - Mapeo de DocumentError -> RFC7807.
     - Enforce de workspace activo antes de operar.
     - Auditoría best-effort.
@@ -24,15 +30,25 @@ Collaborators:
 from __future__ import annotations
 
 import json
-from typing import Any
+import os
+from typing import Any, BinaryIO
 from uuid import UUID
 
 from app.application.usecases import (
+    CompletePresignedUploadInput,
+    CompletePresignedUploadUseCase,
+    CreatePresignedUploadInput,
+    CreatePresignedUploadUseCase,
     DeleteDocumentUseCase,
     DocumentError,
     DocumentErrorCode,
+    GetDocumentProcessingStatusInput,
+    GetDocumentProcessingStatusUseCase,
     GetDocumentUseCase,
     GetWorkspaceUseCase,
+    IngestBatchItem,
+    IngestDocumentBatchInput,
+    IngestDocumentBatchUseCase,
     IngestDocumentInput,
     IngestDocumentUseCase,
     ListDocumentsUseCase,
@@ -46,15 +62,21 @@ from app.application.usecases import (
 from app.audit import emit_audit_event
 from app.container import (
     get_audit_repository,
+    get_complete_presigned_upload_use_case,
+    get_create_presigned_upload_use_case,
     get_delete_document_use_case,
+    get_document_status_broadcaster,
+    get_get_document_processing_status_use_case,
     get_get_document_use_case,
     get_get_workspace_use_case,
+    get_ingest_document_batch_use_case,
     get_ingest_document_use_case,
     get_list_documents_use_case,
     get_reprocess_document_use_case,
     get_upload_document_use_case,
 )
 from app.crosscutting.config import get_settings
+from app.crosscutting.streaming import stream_event_batches
 from app.crosscutting.error_responses import (
     conflict,
     forbidden,
@@ -75,17 +97,21 @@ from app.identity.dual_auth import (
     require_principal,
 )
 from app.identity.rbac import Permission
-from fastapi import APIRouter, Depends, File, Form, UploadFile
+from fastapi import APIRouter, Depends, File, Form, Header, Request, UploadFile
+from starlette.concurrency import run_in_threadpool
 
 from ..schemas.documents import (
     DeleteDocumentRes,
     DocumentDetailRes,
     DocumentsListRes,
+    DocumentStatusRes,
     DocumentSummaryRes,
     IngestBatchReq,
     IngestBatchRes,
     IngestTextReq,
     IngestTextRes,
+    PresignedUploadReq,
+    PresignedUploadRes,
     ReprocessDocumentRes,
     UploadDocumentRes,
 )
@@ -214,6 +240,21 @@ async def _read_upload_bytes(file: UploadFile) -> bytes:
     return content
 
 
+def _upload_stream(file: UploadFile) -> BinaryIO:
+    """
+    Stream del archivo ya spooleado por Starlette (memoria/disco), sin leerlo.
+
+    El tamaño se valida con seek/tell; el use case hashea y sube por bloques.
+    """
+    stream = file.file
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+    if size > _settings.max_upload_bytes:
+        raise payload_too_large(max_size=f"{_settings.max_upload_bytes} bytes")
+    return stream
+
+
 @router.post(
     "/workspaces/{workspace_id}/documents/{document_id}/reprocess",
     response_model=ReprocessDocumentRes,
@@ -291,6 +332,54 @@ def list_workspace_documents(
     )
 
 
+def _can_access_status_event(event: Any, principal: Principal | None) -> bool:
+    """Mismas reglas que can_access_document, con los campos que trae el evento."""
+    return can_access_document(
+        Document(
+            id=event.document_id,
+            title="",
+            workspace_id=event.workspace_id,
+            uploaded_by_user_id=event.uploaded_by_user_id,
+            allowed_roles=list(event.allowed_roles),
+        ),
+        principal,
+    )
+
+
+# R: Declarado antes de /documents/{document_id} ("events" no es un UUID).
+@router.get("/workspaces/{workspace_id}/documents/events", tags=["documents"])
+async def stream_workspace_document_events(
+    workspace_id: UUID,
+    request: Request,
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    broadcaster=Depends(get_document_status_broadcaster),
+    workspace_use_case: GetWorkspaceUseCase = Depends(get_get_workspace_use_case),
+    principal: Principal | None = Depends(require_principal(Permission.DOCUMENTS_READ)),
+    _role: None = Depends(require_employee_or_admin()),
+):
+    if broadcaster is None:
+        raise service_unavailable("Document status stream")
+
+    actor = _to_workspace_actor(principal)
+    await run_in_threadpool(
+        _require_active_workspace, workspace_id, workspace_use_case, actor
+    )
+
+    subscription = broadcaster.subscribe(
+        workspace_id,
+        last_event_id=last_event_id,
+        accept=lambda event: _can_access_status_event(event, principal),
+    )
+    return stream_event_batches(
+        subscription,
+        request,
+        event="status",
+        batch_window_s=_settings.document_status_stream_batch_ms / 1000,
+        max_batch=_settings.document_status_stream_max_batch,
+        heartbeat_s=_settings.document_status_stream_heartbeat_seconds,
+    )
+
+
 @router.get(
     "/workspaces/{workspace_id}/documents/{document_id}",
     response_model=DocumentDetailRes,
@@ -325,6 +414,52 @@ def get_workspace_document(
     return _to_document_detail(result.document)
 
 
+@router.get(
+    "/workspaces/{workspace_id}/documents/{document_id}/status",
+    response_model=DocumentStatusRes,
+    tags=["documents"],
+)
+def get_workspace_document_status(
+    workspace_id: UUID,
+    document_id: UUID,
+    use_case: GetDocumentProcessingStatusUseCase = Depends(
+        get_get_document_processing_status_use_case
+    ),
+    workspace_use_case: GetWorkspaceUseCase = Depends(get_get_workspace_use_case),
+    principal: Principal | None = Depends(require_principal(Permission.DOCUMENTS_READ)),
+    _role: None = Depends(require_employee_or_admin()),
+):
+    actor = _to_workspace_actor(principal)
+    _require_active_workspace(workspace_id, workspace_use_case, actor)
+
+    result = use_case.execute(
+        GetDocumentProcessingStatusInput(
+            workspace_id=workspace_id,
+            document_id=document_id,
+            actor=actor,
+        )
+    )
+    if result.error is not None:
+        if isinstance(result.error, WorkspaceError):
+            _raise_workspace_error(result.error, workspace_id=workspace_id)
+        _raise_document_error(result.error, document_id=document_id)
+    if result.document is None:
+        raise not_found("Document", str(document_id))
+
+    if not can_access_document(result.document, principal):
+        raise forbidden("No tenés permisos para acceder a este documento")
+
+    return DocumentStatusRes(
+        id=document_id,
+        status=result.status,
+        error_message=result.error_message,
+        chunks_done=result.chunks_done,
+        chunks_total=result.chunks_total,
+        progress=result.progress,
+        updated_at=result.updated_at,
+    )
+
+
 @router.delete(
     "/workspaces/{workspace_id}/documents/{document_id}",
     response_model=DeleteDocumentRes,
@@ -391,14 +526,20 @@ async def upload_workspace_document(
     actor = _to_workspace_actor(principal)
     _require_active_workspace(workspace_id, workspace_use_case, actor)
 
-    content = await _read_upload_bytes(file)
+    content: bytes | BinaryIO
+    if _settings.upload_streaming_enabled:
+        content = _upload_stream(file)
+    else:
+        content = await _read_upload_bytes(file)
     md = _parse_metadata(metadata)
 
     doc_title = (title or "").strip() or (file.filename or "documento")
     if len(doc_title) > _settings.max_title_chars:
         doc_title = doc_title[: _settings.max_title_chars]
 
-    result = use_case.execute(
+    # R: Hash + upload a storage son IO bloqueante: fuera del event loop.
+    result = await run_in_threadpool(
+        use_case.execute,
         UploadDocumentInput(
             workspace_id=workspace_id,
             actor=actor,
@@ -411,7 +552,7 @@ async def upload_workspace_document(
             uploaded_by_user_id=(
                 principal.user.user_id if principal and principal.user else None
             ),
-        )
+        ),
     )
     if result.error is not None:
         _raise_document_error(result.error)
@@ -433,6 +574,119 @@ async def upload_workspace_document(
     )
 
 
+@router.post(
+    "/workspaces/{workspace_id}/documents/uploads",
+    response_model=PresignedUploadRes,
+    status_code=201,
+    tags=["documents"],
+)
+def create_presigned_upload(
+    workspace_id: UUID,
+    req: PresignedUploadReq,
+    use_case: CreatePresignedUploadUseCase = Depends(
+        get_create_presigned_upload_use_case
+    ),
+    workspace_use_case: GetWorkspaceUseCase = Depends(get_get_workspace_use_case),
+    principal: Principal | None = Depends(
+        require_principal(Permission.DOCUMENTS_CREATE)
+    ),
+    _role: None = Depends(require_employee_or_admin()),
+):
+    """
+    Inicia un upload directo a storage.
+
+    El cliente hace PUT del archivo a `upload_url` (con `required_headers`)
+    y luego llama a `/upload-complete` para encolar el procesamiento.
+    """
+    if req.mime_type not in _ALLOWED_MIME_TYPES:
+        raise unsupported_media(f"Tipo de archivo no soportado: {req.mime_type}")
+    if req.size_bytes > _settings.max_upload_bytes:
+        raise payload_too_large(max_size=f"{_settings.max_upload_bytes} bytes")
+
+    actor = _to_workspace_actor(principal)
+    _require_active_workspace(workspace_id, workspace_use_case, actor)
+
+    result = use_case.execute(
+        CreatePresignedUploadInput(
+            workspace_id=workspace_id,
+            actor=actor,
+            title=req.title[: _settings.max_title_chars],
+            file_name=req.file_name,
+            mime_type=req.mime_type,
+            size_bytes=req.size_bytes,
+            source=req.source,
+            metadata=req.metadata,
+            uploaded_by_user_id=(
+                principal.user.user_id if principal and principal.user else None
+            ),
+        )
+    )
+    if result.error is not None:
+        _raise_document_error(result.error)
+
+    return PresignedUploadRes(
+        document_id=result.document_id,
+        upload_url=result.upload_url,
+        storage_key=result.storage_key,
+        expires_in_seconds=result.expires_in_seconds,
+        required_headers={"Content-Type": req.mime_type},
+    )
+
+
+@router.post(
+    "/workspaces/{workspace_id}/documents/{document_id}/upload-complete",
+    response_model=UploadDocumentRes,
+    status_code=202,
+    tags=["documents"],
+)
+def complete_presigned_upload(
+    workspace_id: UUID,
+    document_id: UUID,
+    use_case: CompletePresignedUploadUseCase = Depends(
+        get_complete_presigned_upload_use_case
+    ),
+    workspace_use_case: GetWorkspaceUseCase = Depends(get_get_workspace_use_case),
+    principal: Principal | None = Depends(
+        require_principal(Permission.DOCUMENTS_CREATE)
+    ),
+    _role: None = Depends(require_employee_or_admin()),
+    audit_repo: AuditEventRepository | None = Depends(get_audit_repository),
+):
+    """Confirma un upload directo: verifica el objeto (HEAD) y encola."""
+    actor = _to_workspace_actor(principal)
+    _require_active_workspace(workspace_id, workspace_use_case, actor)
+
+    result = use_case.execute(
+        CompletePresignedUploadInput(
+            workspace_id=workspace_id,
+            document_id=document_id,
+            actor=actor,
+        )
+    )
+    if result.error is not None:
+        _raise_document_error(result.error)
+
+    emit_audit_event(
+        audit_repo,
+        action="document.upload",
+        principal=principal,
+        workspace_id=workspace_id,
+        target_id=result.document_id,
+        metadata={
+            "mime_type": result.mime_type or "",
+            "file_name": result.file_name or "",
+            "direct_upload": True,
+        },
+    )
+
+    return UploadDocumentRes(
+        document_id=result.document_id,
+        status=result.status,
+        file_name=result.file_name or "",
+        mime_type=result.mime_type or "",
+    )
+
+
 @router.post(
     "/workspaces/{workspace_id}/ingest/text",
     response_model=IngestTextRes,
@@ -475,7 +729,7 @@ def ingest_workspace_text(
 def ingest_workspace_batch(
     workspace_id: UUID,
     req: IngestBatchReq,
-    use_case: IngestDocumentUseCase = Depends(get_ingest_document_use_case),
+    use_case: IngestDocumentBatchUseCase = Depends(get_ingest_document_batch_use_case),
     workspace_use_case: GetWorkspaceUseCase = Depends(get_get_workspace_use_case),
     principal: Principal | None = Depends(
         require_principal(Permission.DOCUMENTS_CREATE)
@@ -485,20 +739,28 @@ def ingest_workspace_batch(
     actor = _to_workspace_actor(principal)
     _require_active_workspace(workspace_id, workspace_use_case, actor)
 
+    batch = use_case.execute(
+        IngestDocumentBatchInput(
+            workspace_id=workspace_id,
+            actor=actor,
+            documents=[
+                IngestBatchItem(
+                    title=doc.title,
+                    text=doc.text,
+                    source=doc.source,
+                    metadata=doc.metadata,
+                )
+                for doc in req.documents
+            ],
+        )
+    )
+    if batch.error is not None:
+        _raise_document_error(batch.error)
+
     results: list[IngestTextRes] = []
     total_chunks = 0
 
-    for doc in req.documents:
-        r = use_case.execute(
-            IngestDocumentInput(
-                workspace_id=workspace_id,
-                actor=actor,
-                title=doc.title,
-                text=doc.text,
-                source=doc.source,
-                metadata=doc.metadata,
-            )
-        )
+    for r in batch.results:
         if r.error is not None:
             _raise_document_error(r.error)
         results.append(
@@ -55,7 +55,7 @@ from app.crosscutting.error_responses import (
 )
 from app.crosscutting.metrics import record_hybrid_retrieval
 from app.crosscutting.streaming import stream_answer
-from app.domain.entities import ConversationMessage
+from app.domain.entities import ConversationMessage, Workspace
 from app.domain.repositories import ConversationRepository
 from app.domain.services import LLMService
 from app.domain.workspace_policy import WorkspaceActor
@@ -66,6 +66,7 @@ from app.identity.dual_auth import (
 )
 from app.identity.rbac import Permission
 from fastapi import APIRouter, Depends, Request
+from starlette.concurrency import run_in_threadpool
 
 from ..schemas.query import AskReq, AskRes, Match, QueryReq, QueryRes
 
@@ -117,7 +118,12 @@ def _require_active_workspace(
     workspace_id: UUID,
     use_case: GetWorkspaceUseCase,
     actor: WorkspaceActor | None,
-) -> None:
+) -> Workspace:
+    """
+    Resuelve (una sola vez por request) el workspace activo y legible.
+
+    El workspace devuelto se pasa a los use cases para que no lo re-resuelvan.
+    """
     result = use_case.execute(workspace_id, actor=actor)
     if result.error is not None:
         _raise_workspace_error(result.error, workspace_id=workspace_id)
@@ -125,6 +131,7 @@ def _require_active_workspace(
         raise service_unavailable("Workspace")
     if result.workspace.is_archived:
         raise validation_error("El workspace está archivado")
+    return result.workspace
 
 
 def _resolve_conversation_id(
@@ -157,7 +164,7 @@ def query_workspace(
     _role: None = Depends(require_employee_or_admin()),
 ):
     actor = _to_workspace_actor(principal)
-    _require_active_workspace(workspace_id, workspace_use_case, actor)
+    workspace = _require_active_workspace(workspace_id, workspace_use_case, actor)
 
     result = use_case.execute(
         SearchChunksInput(
@@ -166,6 +173,7 @@ def query_workspace(
             actor=actor,
             top_k=req.top_k,
             use_mmr=req.use_mmr,
+            workspace=workspace,
         )
     )
     if result.error is not None:
@@ -201,7 +209,16 @@ def ask_workspace(
     _role: None = Depends(require_employee_or_admin()),
 ):
     actor = _to_workspace_actor(principal)
-    _require_active_workspace(workspace_id, workspace_use_case, actor)
+
+    # R: El embedding del query arranca (tras validar query/top_k) en paralelo
+    #    con la resolución de acceso; si el acceso se deniega, se descarta.
+    query_embedding = use_case.prefetch_query_embedding(req.query, top_k=req.top_k)
+    try:
+        workspace = _require_active_workspace(workspace_id, workspace_use_case, actor)
+    except Exception:
+        if query_embedding is not None:
+            query_embedding.discard()
+        raise
 
     conv_id = _resolve_conversation_id(conversation_repo, req.conversation_id)
     history = conversation_repo.get_messages(
@@ -217,6 +234,8 @@ def ask_workspace(
             llm_query=llm_query,
             top_k=req.top_k,
             use_mmr=req.use_mmr,
+            workspace=workspace,
+            query_embedding=query_embedding,
         )
     )
     if result.error is not None:
@@ -264,16 +283,24 @@ async def ask_stream_workspace(
     _role: None = Depends(require_employee_or_admin()),
 ):
     actor = _to_workspace_actor(principal)
-    _require_active_workspace(workspace_id, workspace_use_case, actor)
 
-    search = use_case.execute(
+    # R: Endpoint async: los use cases son sync (DB + embeddings), así que se
+    #    despachan al threadpool para no bloquear el event loop mientras otros
+    #    streams están emitiendo tokens.
+    workspace = await run_in_threadpool(
+        _require_active_workspace, workspace_id, workspace_use_case, actor
+    )
+
+    search = await run_in_threadpool(
+        use_case.execute,
         SearchChunksInput(
             query=req.query,
             workspace_id=workspace_id,
             actor=actor,
             top_k=req.top_k,
             use_mmr=req.use_mmr,
-        )
+            workspace=workspace,
+        ),
     )
     if search.error is not None:
         _raise_document_error(search.error)
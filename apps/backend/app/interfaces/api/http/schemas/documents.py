@@ -27,7 +27,13 @@ from pydantic import BaseModel, Field, field_validator
 
 _settings = get_settings()
 
-ALLOWED_DOCUMENT_STATUSES: set[str] = {"PENDING", "PROCESSING", "READY", "FAILED"}
+ALLOWED_DOCUMENT_STATUSES: set[str] = {
+    "UPLOADING",
+    "PENDING",
+    "PROCESSING",
+    "READY",
+    "FAILED",
+}
 ALLOWED_DOCUMENT_SORTS: set[str] = {
     "created_at_desc",
     "created_at_asc",
@@ -64,6 +70,25 @@ class IngestTextReq(BaseModel):
         return v.strip() if v else None
 
 
+class PresignedUploadReq(BaseModel):
+    """Iniciar upload directo a storage (URL PUT presignada)."""
+
+    title: Annotated[
+        str,
+        Field(..., min_length=1, max_length=_settings.max_title_chars),
+    ]
+    file_name: Annotated[str, Field(..., min_length=1, max_length=255)]
+    mime_type: str
+    size_bytes: Annotated[int, Field(..., gt=0)]
+    source: str | None = Field(default=None, max_length=_settings.max_source_chars)
+    metadata: dict[str, Any] = Field(default_factory=dict)
+
+    @field_validator("title", "file_name")
+    @classmethod
+    def strip_required(cls, v: str) -> str:
+        return v.strip()
+
+
 class IngestBatchReq(BaseModel):
     """Batch de documentos (ingesta texto)."""
 
@@ -140,6 +165,18 @@ class DocumentDetailRes(DocumentSummaryRes):
     storage_key: str | None = None
 
 
+class DocumentStatusRes(BaseModel):
+    """Estado de procesamiento (liviano, para polling / barra de progreso)."""
+
+    id: UUID
+    status: str | None = None
+    error_message: str | None = None
+    chunks_done: int | None = None
+    chunks_total: int | None = None
+    progress: float | None = None
+    updated_at: datetime | None = None
+
+
 class DocumentsListRes(BaseModel):
     """Response de listados."""
 
@@ -162,6 +199,16 @@ class UploadDocumentRes(BaseModel):
     mime_type: str
 
 
+class PresignedUploadRes(BaseModel):
+    """Response de upload directo: URL PUT + documento reservado (UPLOADING)."""
+
+    document_id: UUID
+    upload_url: str
+    storage_key: str
+    expires_in_seconds: int
+    required_headers: dict[str, str]
+
+
 class ReprocessDocumentRes(BaseModel):
     """Response de reprocess."""
 
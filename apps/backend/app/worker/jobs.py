@@ -9,6 +9,8 @@ Responsabilidades:
   - Construir el caso de uso con dependencias inyectadas desde el contenedor.
   - Emitir logs/métricas/tracing con contexto consistente.
   - Garantizar limpieza de contexto al finalizar (éxito o fallo).
+  - Aplicar el tope de jobs en vuelo por workspace (defer si está lleno).
+  - Vencer uploads directos (presigned) que nunca se completaron.
 
 Patrones aplicados:
   - Command (Job): función pura como comando a ejecutar por el worker.
@@ -17,9 +19,11 @@ Patrones aplicados:
 
 Colaboradores:
   - application.usecases.ingestion.ProcessUploadedDocumentUseCase
+  - application.usecases.ingestion.ExpirePresignedUploadUseCase
   - container.get_* (repositorio, storage, extractor, chunker, embeddings)
   - crosscutting.metrics (record_worker_processed/failed, observe_worker_duration)
   - crosscutting.tracing.span
+  - infrastructure.queue.fairness (WorkspaceConcurrencyLimiter / defer_job)
   - context (request_id_var, http_method_var, http_path_var, clear_context)
 ===============================================================================
 """
@@ -27,11 +31,14 @@ Colaboradores:
 from __future__ import annotations
 
 import time
+from typing import Any
 from uuid import UUID
 
 from rq import get_current_job
 
 from ..application.usecases.ingestion import (
+    ExpirePresignedUploadInput,
+    ExpirePresignedUploadUseCase,
     ProcessUploadedDocumentInput,
     ProcessUploadedDocumentUseCase,
 )
@@ -51,6 +58,7 @@ from ..crosscutting.metrics import (
     record_worker_processed,
 )
 from ..crosscutting.tracing import span
+from ..infrastructure.queue import WorkspaceConcurrencyLimiter, defer_job
 
 
 def _parse_uuid(value: str, *, field_name: str, job_id: str | None) -> UUID | None:
@@ -89,16 +97,57 @@ def _build_use_case() -> ProcessUploadedDocumentUseCase:
         enable_2tier_retrieval=settings.enable_2tier_retrieval,
         node_group_size=settings.node_group_size,
         node_text_max_chars=settings.node_text_max_chars,
+        node_embedding_strategy=settings.node_embedding_strategy,
+        enable_pipeline=settings.ingest_pipeline_enabled,
+        pipeline_batch_size=settings.ingest_pipeline_batch_size,
+        pipeline_queue_size=settings.ingest_pipeline_queue_size,
+        stream_downloads=settings.worker_stream_downloads_enabled,
+        checkpoint_enabled=settings.ingest_checkpoint_enabled,
     )
 
 
-def process_document_job(document_id: str, workspace_id: str) -> None:
+def _workspace_limiter(job) -> WorkspaceConcurrencyLimiter | None:
+    """Limiter por workspace (None si no hay tope o el job no corre bajo RQ)."""
+    limit = get_settings().worker_workspace_max_concurrency
+    if job is None or limit <= 0:
+        return None
+    return WorkspaceConcurrencyLimiter(
+        job.connection,
+        max_per_workspace=limit,
+        lease_seconds=float(job.timeout or 900),
+    )
+
+
+def _defer_job(job, *, workspace_id: UUID) -> Any:
+    """
+    Difiere el job sin ocupar el worker: retorna el `rq.Retry` que RQ usa
+    para re-agendar el mismo job (mismo id) al final de su carril.
+    """
+    delay = get_settings().worker_workspace_defer_seconds
+    retry = defer_job(job, delay_seconds=delay)
+    logger.info(
+        "Worker job diferido: workspace en su tope de concurrencia",
+        extra={
+            "job_id": job.id,
+            "workspace_id": str(workspace_id),
+            "queue": job.origin,
+            "delay_seconds": delay,
+        },
+    )
+    return retry
+
+
+def process_document_job(document_id: str, workspace_id: str) -> Any:
     """
     Job RQ: procesa un documento previamente subido.
 
     Contrato:
       - document_id/workspace_id llegan como string (RQ serializa argumentos).
       - Si el job explota, RQ aplica reintentos (configurado en el enqueue).
+      - El job_id se conserva entre reintentos: con checkpoint, el retry
+        reanuda la corrida que quedó en PROCESSING (timeout/crash).
+      - Si el workspace está en su tope, retorna un `rq.Retry`: RQ re-agenda
+        este mismo job (requiere el scheduler de RQ en el worker).
     """
     job = get_current_job()
     job_id = getattr(job, "id", None)
@@ -111,6 +160,8 @@ def process_document_job(document_id: str, workspace_id: str) -> None:
     start = time.perf_counter()
     status = "UNKNOWN"
     chunks_created = 0
+    limiter: WorkspaceConcurrencyLimiter | None = None
+    ws_uuid: UUID | None = None
 
     try:
         doc_uuid = _parse_uuid(document_id, field_name="document_id", job_id=job_id)
@@ -122,6 +173,13 @@ def process_document_job(document_id: str, workspace_id: str) -> None:
             record_worker_failed()
             return
 
+        # R: Fairness: un workspace no puede ocupar todos los workers.
+        limiter = _workspace_limiter(job)
+        if limiter is not None and not limiter.try_acquire(ws_uuid, job_id or ""):
+            limiter = None
+            status = "DEFERRED"
+            return _defer_job(job, workspace_id=ws_uuid)
+
         logger.info(
             "Worker job iniciado",
             extra={
@@ -142,7 +200,9 @@ def process_document_job(document_id: str, workspace_id: str) -> None:
             },
         ):
             result = use_case.execute(
-                ProcessUploadedDocumentInput(document_id=doc_uuid, workspace_id=ws_uuid)
+                ProcessUploadedDocumentInput(
+                    document_id=doc_uuid, workspace_id=ws_uuid, job_id=job_id
+                )
             )
 
         status = result.status
@@ -163,6 +223,9 @@ def process_document_job(document_id: str, workspace_id: str) -> None:
         raise
 
     finally:
+        if limiter is not None and ws_uuid is not None:
+            limiter.release(ws_uuid, job_id or "")
+
         duration = time.perf_counter() - start
         record_worker_processed(status)
         if status == "FAILED":
@@ -184,4 +247,32 @@ def process_document_job(document_id: str, workspace_id: str) -> None:
         clear_context()
 
 
-__all__ = ["process_document_job"]
+def expire_presigned_upload_job(document_id: str, workspace_id: str) -> bool:
+    """
+    Job RQ (agendado con enqueue_in al crear el upload directo): si el
+    documento sigue UPLOADING al vencer la URL + gracia, pasa a FAILED y se
+    borra el objeto parcial. Idempotente (CAS).
+    """
+    job_id = getattr(get_current_job(), "id", None)
+    request_id_var.set(job_id or document_id)
+    http_method_var.set("WORKER")
+    http_path_var.set("rq.expire_presigned_upload_job")
+
+    try:
+        doc_uuid = _parse_uuid(document_id, field_name="document_id", job_id=job_id)
+        ws_uuid = _parse_uuid(workspace_id, field_name="workspace_id", job_id=job_id)
+        if not doc_uuid or not ws_uuid:
+            return False
+
+        use_case = ExpirePresignedUploadUseCase(
+            repository=get_document_repository(),
+            storage=get_file_storage(),
+        )
+        return use_case.execute(
+            ExpirePresignedUploadInput(document_id=doc_uuid, workspace_id=ws_uuid)
+        )
+    finally:
+        clear_context()
+
+
+__all__ = ["expire_presigned_upload_job", "process_document_job"]
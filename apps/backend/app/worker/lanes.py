@@ -0,0 +1,133 @@
+"""
+===============================================================================
+TARJETA CRC — worker/lanes.py (Drenado ponderado de carriles de prioridad)
+===============================================================================
+
+Responsabilidades:
+  - Definir el orden en que un worker consulta los carriles
+    (interactive / reprocess / connector) con pesos configurables.
+  - Evitar starvation: con todos los carriles con backlog, cada carril
+    recibe una fracción de dequeues proporcional a su peso.
+  - Ofrecer la variante en proceso (rq.SimpleWorker, sin fork por job) para
+    los hijos del supervisor: recursos de larga vida (pool de extracción de
+    PDF, archivos de métricas por PID) sobreviven entre jobs.
+
+Patrones aplicados:
+  - Smooth Weighted Round-Robin (estilo nginx): reparte turnos de forma
+    intercalada (6:3:1 → I I R I C I R I I R ...) en vez de ráfagas.
+  - Hook de RQ: `Worker.reorder_queues` se invoca tras cada dequeue;
+    el orden resultante es el que usa el próximo BLPOP multi-cola.
+
+Colaboradores:
+  - rq.Worker / rq.SimpleWorker
+  - infrastructure.queue.job_paths (QUEUE_LANES / lane_queue_name)
+===============================================================================
+"""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, Sequence
+
+from rq import Queue, SimpleWorker, Worker
+
+from ..infrastructure.queue.job_paths import QUEUE_LANES, lane_queue_name
+
+
+class WeightedLaneScheduler:
+    """R: Orden de consulta de carriles por Smooth Weighted Round-Robin."""
+
+    def __init__(self, weights: Mapping[str, int]) -> None:
+        if not weights:
+            raise ValueError("weights cannot be empty")
+        if any(w <= 0 for w in weights.values()):
+            raise ValueError("lane weights must be > 0")
+        self._weights = dict(weights)
+        self._total = sum(self._weights.values())
+        self._current = {lane: 0 for lane in self._weights}
+
+    def next_order(self) -> list[str]:
+        """Devuelve los carriles en el orden del próximo turno (el elegido primero)."""
+        for lane, weight in self._weights.items():
+            self._current[lane] += weight
+        chosen = max(self._weights, key=lambda lane: self._current[lane])
+        self._current[chosen] -= self._total
+        rest = sorted(
+            (lane for lane in self._weights if lane != chosen),
+            key=lambda lane: self._current[lane],
+            reverse=True,
+        )
+        return [chosen, *rest]
+
+
+class _WeightedLaneMixin:
+    """Reordena las colas del worker con WeightedLaneScheduler tras cada dequeue."""
+
+    def __init__(
+        self,
+        queues: Sequence[Queue],
+        *args: Any,
+        lane_weights: Mapping[str, int],
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(queues, *args, **kwargs)
+        self._queue_by_name = {queue.name: queue for queue in self.queues}
+        self._scheduler = WeightedLaneScheduler(
+            {queue.name: lane_weights.get(queue.name, 1) for queue in self.queues}
+        )
+        self._apply_next_order()
+
+    def _apply_next_order(self) -> None:
+        self._ordered_queues = [
+            self._queue_by_name[name] for name in self._scheduler.next_order()
+        ]
+
+    def reorder_queues(self, reference_queue: Queue) -> None:
+        self._apply_next_order()
+
+
+class WeightedLaneWorker(_WeightedLaneMixin, Worker):
+    """RQ Worker con carriles ponderados; cada job corre en un work-horse (fork)."""
+
+
+class InProcessWeightedLaneWorker(_WeightedLaneMixin, SimpleWorker):
+    """
+    R: Carriles ponderados ejecutando cada job en el propio proceso.
+
+    Para hijos del supervisor: si un job tumba el proceso, el supervisor lo
+    reinicia (el aislamiento lo da el proceso hijo, no un fork por job).
+    """
+
+
+def build_lane_worker(
+    redis_conn: Any,
+    base_queue_name: str,
+    weights: Mapping[str, int],
+    *,
+    in_process: bool = False,
+) -> WeightedLaneWorker | InProcessWeightedLaneWorker:
+    """
+    Crea un worker que consume todos los carriles de `base_queue_name`.
+
+    in_process=True => InProcessWeightedLaneWorker (sin fork por job).
+    """
+    queues = [
+        Queue(name=lane_queue_name(base_queue_name, lane), connection=redis_conn)
+        for lane in QUEUE_LANES
+    ]
+    worker_class = InProcessWeightedLaneWorker if in_process else WeightedLaneWorker
+    return worker_class(
+        queues,
+        connection=redis_conn,
+        lane_weights={
+            lane_queue_name(base_queue_name, lane): weights.get(lane, 1)
+            for lane in QUEUE_LANES
+        },
+    )
+
+
+__all__ = [
+    "InProcessWeightedLaneWorker",
+    "WeightedLaneScheduler",
+    "WeightedLaneWorker",
+    "build_lane_worker",
+]
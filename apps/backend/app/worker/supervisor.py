@@ -0,0 +1,207 @@
+"""
+===============================================================================
+TARJETA CRC — worker/supervisor.py (Supervisor multi-proceso del Worker)
+===============================================================================
+
+Responsabilidades:
+  - Lanzar N procesos hijos que consumen la misma cola (un RQ Worker c/u).
+  - Reiniciar hijos que mueren inesperadamente (con backoff).
+  - Drenar en forma ordenada: SIGTERM a cada hijo (warm shutdown de RQ:
+    termina el job en curso) y kill solo al vencer el timeout de drenado.
+  - Reportar estado (configurados / vivos / reinicios) para /healthz y /readyz.
+
+Patrones aplicados:
+  - Supervisor (process manager): el padre no consume jobs; solo supervisa
+    y sirve el HTTP operativo compartido.
+  - Spawn context: cada hijo arranca con un intérprete limpio (sin heredar
+    pool de BD, sockets ni threads del padre).
+  - Process group propio por hijo: Ctrl+C en terminal llega solo al padre,
+    que reenvía UNA señal (evita el "cold shutdown" de RQ por doble señal).
+
+Colaboradores:
+  - worker.worker (target de cada hijo + bootstrap del padre)
+  - crosscutting.metrics.mark_process_dead (modo multiproceso de Prometheus)
+===============================================================================
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from typing import Any, Callable, Final, Sequence
+
+from ..crosscutting.logger import logger
+from ..crosscutting.metrics import mark_process_dead
+
+_POLL_SECONDS: Final[float] = 0.5
+
+
+def per_process_pool_sizes(
+    min_size: int, max_size: int, processes: int
+) -> tuple[int, int]:
+    """
+    Reparte el presupuesto de conexiones (db_pool_max_size) entre procesos.
+
+    - max por proceso: max_size // processes (mínimo 1).
+    - min por proceso: nunca mayor que el max por proceso.
+    """
+    per_process_max = max(1, max_size // max(1, processes))
+    return max(1, min(min_size, per_process_max)), per_process_max
+
+
+def _child_entry(target: Callable[..., Any], args: Sequence[Any]) -> None:
+    """Entry point del hijo: grupo de procesos propio y luego el target."""
+    try:
+        os.setpgrp()
+    except OSError:
+        pass
+    target(*args)
+
+
+class WorkerSupervisor:
+    """
+    R: Mantiene `processes` hijos vivos ejecutando `target(*args)`.
+
+    Uso:
+        supervisor = WorkerSupervisor(target, processes=4, args=(config,))
+        supervisor.install_signal_handlers()  # solo desde el main thread
+        supervisor.run()                      # bloquea hasta request_stop()
+    """
+
+    def __init__(
+        self,
+        target: Callable[..., Any],
+        *,
+        processes: int,
+        args: Sequence[Any] = (),
+        drain_timeout_seconds: float = 60.0,
+        restart_backoff_seconds: float = 1.0,
+        poll_interval_seconds: float = _POLL_SECONDS,
+    ) -> None:
+        if processes <= 0:
+            raise ValueError("processes must be > 0")
+        self._target = target
+        self._args = tuple(args)
+        self._processes = processes
+        self._drain_timeout = max(0.0, drain_timeout_seconds)
+        self._restart_backoff = max(0.0, restart_backoff_seconds)
+        self._poll = poll_interval_seconds
+        self._ctx = multiprocessing.get_context("spawn")
+        self._children: list[multiprocessing.process.BaseProcess | None] = [
+            None
+        ] * processes
+        self._restart_at: list[float] = [0.0] * processes
+        self._restarts = 0
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def status(self) -> dict[str, int]:
+        """R: Estado para health/readiness (sin bloquear al supervisor)."""
+        with self._lock:
+            alive = sum(1 for p in self._children if p is not None and p.is_alive())
+            return {
+                "configured": self._processes,
+                "alive": alive,
+                "restarts": self._restarts,
+            }
+
+    def request_stop(self) -> None:
+        """R: Pide el drenado; run() retorna cuando terminan los hijos."""
+        self._stop.set()
+
+    def install_signal_handlers(self) -> None:
+        """R: SIGTERM/SIGINT → drenado ordenado (llamar desde el main thread)."""
+
+        def _handler(signum: int, _frame: Any) -> None:
+            logger.info("Worker supervisor: señal recibida", extra={"signal": signum})
+            self.request_stop()
+
+        signal.signal(signal.SIGTERM, _handler)
+        signal.signal(signal.SIGINT, _handler)
+
+    def run(self) -> None:
+        """Arranca los hijos, los supervisa y drena al recibir stop."""
+        for index in range(self._processes):
+            self._start_child(index)
+
+        try:
+            while not self._stop.wait(self._poll):
+                self._reap_and_restart()
+        finally:
+            self._drain()
+
+    def _start_child(self, index: int) -> None:
+        process = self._ctx.Process(
+            target=_child_entry,
+            args=(self._target, self._args),
+            name=f"rag-worker-{index}",
+        )
+        process.start()
+        with self._lock:
+            self._children[index] = process
+        logger.info(
+            "Worker process started",
+            extra={"worker_index": index, "pid": process.pid},
+        )
+
+    def _reap_and_restart(self) -> None:
+        now = time.monotonic()
+        for index, process in enumerate(self._children):
+            if process is not None and process.is_alive():
+                continue
+
+            if process is not None:
+                process.join(timeout=0)
+                mark_process_dead(process.pid)
+                logger.warning(
+                    "Worker process exited unexpectedly",
+                    extra={
+                        "worker_index": index,
+                        "pid": process.pid,
+                        "exitcode": process.exitcode,
+                    },
+                )
+                with self._lock:
+                    self._children[index] = None
+                self._restart_at[index] = now + self._restart_backoff
+
+            if now >= self._restart_at[index] and not self._stop.is_set():
+                with self._lock:
+                    self._restarts += 1
+                self._start_child(index)
+
+    def _drain(self) -> None:
+        """SIGTERM a todos, espera hasta drain_timeout y mata a los rezagados."""
+        alive = [p for p in self._children if p is not None and p.is_alive()]
+        logger.info(
+            "Worker supervisor draining",
+            extra={"alive": len(alive), "drain_timeout_seconds": self._drain_timeout},
+        )
+        for process in alive:
+            try:
+                os.kill(process.pid, signal.SIGTERM)
+            except OSError:
+                pass
+
+        deadline = time.monotonic() + self._drain_timeout
+        for process in alive:
+            process.join(timeout=max(0.0, deadline - time.monotonic()))
+
+        for process in alive:
+            if process.is_alive():
+                logger.warning(
+                    "Worker process did not drain in time; killing",
+                    extra={"pid": process.pid},
+                )
+                process.kill()
+                process.join()
+
+        for process in self._children:
+            if process is not None:
+                mark_process_dead(process.pid)
+
+
+__all__ = ["WorkerSupervisor", "per_process_pool_sizes"]
@@ -7,6 +7,11 @@ Responsabilidades:
   - Levantar un proceso RQ Worker consumiendo una cola (documents por defecto).
   - Inicializar dependencias del proceso: Redis + pool de BD.
   - Exponer HTTP liviano de health/ready/metrics para orquestadores.
+  - Consumir los carriles de prioridad (interactive / reprocess / connector)
+    en orden ponderado (lanes.WeightedLaneWorker).
+  - Modo supervisor (WORKER_PROCESSES > 1): N procesos consumiendo la cola
+    en proceso (sin fork por job), un único HTTP operativo y métricas
+    Prometheus agregadas entre procesos.
   - Apagar recursos de forma segura y consistente.
 
 Patrones aplicados:
@@ -17,23 +22,36 @@ Patrones aplicados:
 Colaboradores:
   - crosscutting.config.get_settings
   - infrastructure.db.pool.init_pool / close_pool
-  - redis.Redis + rq.Worker
+  - redis.Redis + rq.Worker / rq.SimpleWorker (lanes.build_lane_worker)
   - worker_server.start_worker_http_server
+  - supervisor.WorkerSupervisor (modo multi-proceso)
 ===============================================================================
 """
 
 from __future__ import annotations
 
+import glob
 import os
+import tempfile
+from typing import Final
 
 from redis import Redis
-from rq import Queue, Worker
 
 from ..crosscutting.config import get_settings
 from ..crosscutting.logger import logger
+from ..crosscutting.metrics import set_queue_lane_sampler
 from ..infrastructure.db.pool import close_pool, init_pool
+from ..infrastructure.queue import sample_lane_backlog
+from .lanes import build_lane_worker
+from .supervisor import WorkerSupervisor, per_process_pool_sizes
+from .worker_health import set_process_status_provider
 from .worker_server import start_worker_http_server
 
+_MULTIPROC_ENV: Final[str] = "PROMETHEUS_MULTIPROC_DIR"
+_DEFAULT_MULTIPROC_DIR: Final[str] = os.path.join(
+    tempfile.gettempdir(), "rag-worker-metrics"
+)
+
 
 def _get_env_int(name: str, default: int) -> int:
     """Lee un entero desde env con fallback seguro."""
@@ -44,6 +62,15 @@ def _get_env_int(name: str, default: int) -> int:
         return default
 
 
+def _get_env_float(name: str, default: float) -> float:
+    """Lee un float desde env con fallback seguro."""
+    raw = os.getenv(name, str(default)).strip()
+    try:
+        return float(raw)
+    except Exception:
+        return default
+
+
 def _build_redis_connection(redis_url: str) -> Redis:
     """
     Crea conexión Redis con timeouts razonables para worker.
@@ -59,6 +86,126 @@ def _build_redis_connection(redis_url: str) -> Redis:
     )
 
 
+def _lane_weights() -> dict[str, int]:
+    """Pesos de drenado por carril (Settings)."""
+    settings = get_settings()
+    return {
+        "interactive": settings.queue_lane_weight_interactive,
+        "reprocess": settings.queue_lane_weight_reprocess,
+        "connector": settings.queue_lane_weight_connector,
+    }
+
+
+def _register_lane_metrics(redis_conn: Redis, queue_name: str) -> None:
+    """Profundidad/antigüedad por carril, muestreadas en cada scrape de /metrics."""
+    set_queue_lane_sampler(lambda: sample_lane_backlog(redis_conn, queue_name))
+
+
+def _prepare_multiprocess_metrics_dir() -> str:
+    """
+    Directorio compartido de métricas (prometheus_client multiprocess).
+
+    - Respeta PROMETHEUS_MULTIPROC_DIR si viene definido; si no, usa un
+      directorio fijo bajo el tmp del sistema (no uno nuevo por arranque).
+    - Se limpia al arrancar (archivos de una ejecución previa distorsionan counters).
+    - Los hijos ejecutan los jobs en proceso: un set de archivos por hijo, no
+      por job (solo un reinicio de hijo suma archivos de un PID nuevo).
+    - Se setea en el entorno ANTES de lanzar hijos: cada hijo (spawn) importa
+      prometheus_client ya en modo multiproceso.
+    """
+    path = os.getenv(_MULTIPROC_ENV, "").strip() or _DEFAULT_MULTIPROC_DIR
+    os.makedirs(path, exist_ok=True)
+    for stale in glob.glob(os.path.join(path, "*.db")):
+        try:
+            os.remove(stale)
+        except OSError:
+            pass
+    os.environ[_MULTIPROC_ENV] = path
+    return path
+
+
+def consume_queue(
+    redis_url: str,
+    queue_name: str,
+    database_url: str,
+    db_pool_min_size: int,
+    db_pool_max_size: int,
+) -> None:
+    """
+    Loop de consumo de un proceso hijo (modo supervisor).
+
+    Cada hijo tiene su propia conexión Redis y su propio pool de BD.
+    RQ maneja SIGTERM como warm shutdown (termina el job en curso).
+    Los jobs corren en este proceso (sin work-horse por job): el pool de
+    extracción de PDF y los archivos de métricas viven lo que vive el hijo.
+    """
+    redis_conn = _build_redis_connection(redis_url)
+    init_pool(
+        database_url=database_url,
+        min_size=db_pool_min_size,
+        max_size=db_pool_max_size,
+    )
+    try:
+        worker = build_lane_worker(
+            redis_conn, queue_name, _lane_weights(), in_process=True
+        )
+        # R: Scheduler de RQ: re-encola jobs diferidos por fairness (lock
+        #    por cola: uno solo entre todos los workers lo ejecuta).
+        worker.work(with_scheduler=True)
+    finally:
+        close_pool()
+
+
+def _run_supervisor(
+    *,
+    redis_url: str,
+    queue_name: str,
+    http_port: int,
+    processes: int,
+) -> None:
+    """Modo multi-proceso: el padre supervisa hijos y sirve el HTTP compartido."""
+    settings = get_settings()
+    metrics_dir = _prepare_multiprocess_metrics_dir()
+    pool_min, pool_max = per_process_pool_sizes(
+        settings.db_pool_min_size, settings.db_pool_max_size, processes
+    )
+
+    supervisor = WorkerSupervisor(
+        consume_queue,
+        processes=processes,
+        args=(redis_url, queue_name, settings.database_url, pool_min, pool_max),
+        drain_timeout_seconds=_get_env_float("WORKER_DRAIN_TIMEOUT_SECONDS", 60.0),
+    )
+    set_process_status_provider(supervisor.status)
+    _register_lane_metrics(_build_redis_connection(redis_url), queue_name)
+
+    server = None
+    try:
+        server = start_worker_http_server(http_port)
+        logger.info(
+            "Worker supervisor arrancando",
+            extra={
+                "queue": queue_name,
+                "http_port": http_port,
+                "processes": processes,
+                "db_pool_min_per_process": pool_min,
+                "db_pool_max_per_process": pool_max,
+                "metrics_dir": metrics_dir,
+            },
+        )
+        supervisor.install_signal_handlers()
+        supervisor.run()
+    finally:
+        set_process_status_provider(None)
+        try:
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+        except Exception:
+            pass
+        logger.info("Worker supervisor apagado")
+
+
 def main() -> None:
     settings = get_settings()
 
@@ -68,6 +215,7 @@ def main() -> None:
 
     queue_name = os.getenv("DOCUMENT_QUEUE_NAME", "documents").strip() or "documents"
     http_port = _get_env_int("WORKER_HTTP_PORT", 8001)
+    processes = max(1, _get_env_int("WORKER_PROCESSES", 1))
 
     # R: Redis (fail-fast si no responde).
     redis_conn = _build_redis_connection(redis_url)
@@ -77,6 +225,15 @@ def main() -> None:
         logger.error("Redis no disponible para worker", extra={"error": str(exc)})
         raise SystemExit("Redis no disponible.")
 
+    if processes > 1:
+        _run_supervisor(
+            redis_url=redis_url,
+            queue_name=queue_name,
+            http_port=http_port,
+            processes=processes,
+        )
+        return
+
     # R: Pool DB (fail-fast si no inicializa).
     init_pool(
         database_url=settings.database_url,
@@ -100,11 +257,13 @@ def main() -> None:
             },
         )
 
-        queue = Queue(name=queue_name, connection=redis_conn)
-        worker = Worker([queue], connection=redis_conn)
+        _register_lane_metrics(redis_conn, queue_name)
+        worker = build_lane_worker(redis_conn, queue_name, _lane_weights())
 
         # R: Loop principal del worker.
-        worker.work(with_scheduler=False)
+        # R: Scheduler de RQ: re-encola jobs diferidos por fairness (lock
+        #    por cola: uno solo entre todos los workers lo ejecuta).
+        worker.work(with_scheduler=True)
 
     except KeyboardInterrupt:
         logger.info("Worker detenido por señal (KeyboardInterrupt)")
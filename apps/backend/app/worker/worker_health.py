@@ -7,6 +7,7 @@ Responsabilidades:
   - Verificar conectividad de Redis y Postgres para readiness del worker.
   - Entregar payloads simples para /readyz y /healthz.
   - Exponer CLI de healthcheck para contenedores (exit code 0/1).
+  - Incluir estado de procesos hijos cuando corre en modo supervisor.
 
 Patrones aplicados:
   - Fail-safe diagnostics: nunca lanzar excepciones al caller; devolver estado.
@@ -23,7 +24,7 @@ from __future__ import annotations
 
 import json
 import time
-from typing import Any
+from typing import Any, Callable, Optional
 
 import psycopg
 from redis import Redis
@@ -33,6 +34,17 @@ from ..crosscutting.logger import logger
 
 _START_TIME = time.time()
 
+# R: Estado de procesos hijos (solo modo supervisor; None en modo simple).
+_process_status_provider: Optional[Callable[[], dict[str, int]]] = None
+
+
+def set_process_status_provider(
+    provider: Optional[Callable[[], dict[str, int]]],
+) -> None:
+    """Registra (o limpia) el proveedor de estado de procesos del supervisor."""
+    global _process_status_provider
+    _process_status_provider = provider
+
 
 def _check_db(database_url: str) -> bool:
     """Chequea DB con timeout corto."""
@@ -71,16 +83,22 @@ def readiness_payload() -> dict[str, Any]:
     """
     Readiness:
       - ok si Redis y DB están conectados.
+      - en modo supervisor, además al menos un proceso hijo vivo.
     """
     settings = get_settings()
     db_ok = _check_db(settings.database_url)
     redis_ok = _check_redis(settings.redis_url or "")
 
-    return {
+    payload: dict[str, Any] = {
         "ok": bool(db_ok and redis_ok),
         "db": "connected" if db_ok else "disconnected",
         "redis": "connected" if redis_ok else "disconnected",
     }
+    if _process_status_provider is not None:
+        processes = _process_status_provider()
+        payload["processes"] = processes
+        payload["ok"] = bool(payload["ok"] and processes.get("alive", 0) > 0)
+    return payload
 
 
 def health_payload() -> dict[str, Any]:
@@ -88,10 +106,13 @@ def health_payload() -> dict[str, Any]:
     Health:
       - proceso vivo (no valida dependencias).
     """
-    return {
+    payload: dict[str, Any] = {
         "ok": True,
         "uptime_seconds": int(time.time() - _START_TIME),
     }
+    if _process_status_provider is not None:
+        payload["processes"] = _process_status_provider()
+    return payload
 
 
 def main() -> None:
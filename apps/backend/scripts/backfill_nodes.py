@@ -0,0 +1,112 @@
+"""
+===============================================================================
+TARJETA CRC - apps/backend/scripts/backfill_nodes.py (Backfill de nodos 2-tier)
+===============================================================================
+Responsabilidades:
+  - Construir nodos de 2-tier retrieval para documentos ya procesados.
+  - Derivar el vector de cada nodo de los embeddings de sus chunks
+    (mean | length_weighted): cero llamadas al proveedor de embeddings.
+  - Reportar documentos procesados / sin chunks / fallidos.
+
+Colaboradores:
+  - app.container (repositorios configurados por Settings)
+  - app.application.usecases.ingestion.BackfillNodesUseCase
+
+Invariantes:
+  - Requiere DATABASE_URL.
+  - Idempotente: reemplaza los nodos previos de cada documento.
+===============================================================================
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from uuid import UUID
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from app.application.usecases.ingestion import (  # noqa: E402
+    BackfillNodesInput,
+    BackfillNodesUseCase,
+)
+from app.container import (  # noqa: E402
+    get_document_repository,
+    get_workspace_repository,
+)
+from app.crosscutting.config import get_settings  # noqa: E402
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Build 2-tier nodes from stored chunk embeddings"
+    )
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--workspace-id", type=UUID, action="append")
+    target.add_argument("--all-workspaces", action="store_true")
+    parser.add_argument("--document-id", type=UUID, action="append")
+    parser.add_argument(
+        "--strategy",
+        choices=["mean", "length_weighted"],
+        default=None,
+        help="Default: NODE_EMBEDDING_STRATEGY si no es provider, si no length_weighted",
+    )
+    parser.add_argument("--dry-run", action="store_true")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    if not os.getenv("DATABASE_URL"):
+        raise SystemExit("DATABASE_URL is required to backfill nodes.")
+
+    settings = get_settings()
+    strategy = args.strategy or (
+        settings.node_embedding_strategy
+        if settings.node_embedding_strategy != "provider"
+        else "length_weighted"
+    )
+
+    if args.all_workspaces:
+        workspace_ids = [
+            ws.id
+            for ws in get_workspace_repository().list_workspaces(include_archived=True)
+        ]
+    else:
+        workspace_ids = args.workspace_id
+
+    use_case = BackfillNodesUseCase(
+        get_document_repository(),
+        group_size=settings.node_group_size,
+        max_chars=settings.node_text_max_chars,
+        embedding_strategy=strategy,
+    )
+
+    failed = 0
+    for workspace_id in workspace_ids:
+        result = use_case.execute(
+            BackfillNodesInput(
+                workspace_id=workspace_id,
+                document_ids=args.document_id,
+                dry_run=args.dry_run,
+            )
+        )
+        failed += len(result.failed_document_ids)
+        print(
+            f"workspace={workspace_id} strategy={strategy} "
+            f"documents={result.documents_processed} "
+            f"skipped={result.documents_skipped} "
+            f"nodes={result.nodes_created} "
+            f"failed={len(result.failed_document_ids)}"
+            + (" (dry-run)" if args.dry_run else "")
+        )
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+===============================================================================
+SCRIPT: Chunker Micro-Benchmark
+===============================================================================
+
+Name:
+    Chunker Micro-Benchmark
+
+Qué hace:
+    - Genera un corpus sintético determinístico (prosa + headers markdown +
+      bloques de código) del tamaño pedido.
+    - Mide el throughput (MB/s) de SimpleTextChunker, StructuredTextChunker y
+      semantic_chunk_text sobre el mismo texto.
+
+Uso:
+    python scripts/bench_chunkers.py --size-mb 4 --repeat 3
+
+Notas:
+    - Reporta el mejor tiempo de `--repeat` corridas (menos ruido).
+    - Puro CPU: no requiere DB, Redis ni storage.
+===============================================================================
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+# Permite ejecutar el script sin instalar el paquete.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.infrastructure.text import (  # noqa: E402
+    SimpleTextChunker,
+    StructuredTextChunker,
+)
+from app.infrastructure.text.semantic_chunker import semantic_chunk_text  # noqa: E402
+
+_WORDS = (
+    "lorem ipsum dolor sit amet, consectetur. adipiscing; elit sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua."
+).split()
+
+
+def build_corpus(size_chars: int, *, seed: int = 0) -> str:
+    """Texto markdown sintético de ~size_chars caracteres."""
+    rng = random.Random(seed)
+    parts: list[str] = []
+    total = 0
+    section = 0
+    while total < size_chars:
+        if section % 8 == 0:
+            block = f"## Sección {section}"
+        elif section % 5 == 0:
+            block = "```python\nprint('hola')\nx = 1\n```"
+        else:
+            block = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(20, 140)))
+        parts.append(block)
+        total += len(block) + 2
+        section += 1
+    return "\n\n".join(parts)
+
+
+def _measure(
+    fn: Callable[[str], list[str]], text: str, repeat: int
+) -> tuple[float, int]:
+    best = float("inf")
+    chunks = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        chunks = len(fn(text))
+        best = min(best, time.perf_counter() - started)
+    return best, chunks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Chunker throughput (MB/s)")
+    parser.add_argument("--size-mb", type=float, default=4.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--chunk-size", type=int, default=900)
+    parser.add_argument("--overlap", type=int, default=120)
+    args = parser.parse_args()
+
+    text = build_corpus(int(args.size_mb * 1024 * 1024))
+    size_mb = len(text.encode("utf-8")) / (1024 * 1024)
+
+    chunkers: dict[str, Callable[[str], list[str]]] = {
+        "SimpleTextChunker": SimpleTextChunker(args.chunk_size, args.overlap).chunk,
+        "StructuredTextChunker": StructuredTextChunker(
+            args.chunk_size, args.overlap
+        ).chunk,
+        "semantic_chunk_text": lambda t: semantic_chunk_text(t, args.chunk_size),
+    }
+
+    print(f"corpus: {size_mb:.2f} MB, repeat={args.repeat}")
+    for name, fn in chunkers.items():
+        seconds, chunks = _measure(fn, text, args.repeat)
+        print(
+            f"{name:<24} {size_mb / seconds:8.1f} MB/s  "
+            f"{seconds * 1000:8.1f} ms  chunks={chunks}"
+        )
+
+
+if __name__ == "__main__":
+    main()
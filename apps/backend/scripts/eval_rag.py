@@ -7,6 +7,8 @@ Responsibilities:
   - Embed corpus chunks and queries using the configured EmbeddingService.
   - Perform cosine-similarity retrieval in-memory (no DB required).
   - Calculate MRR, Recall@k, Hit@1, NDCG@k.
+  - Optionally compare 2-tier node embedding strategies (provider re-embed vs
+    chunk-embedding centroids) on node-level retrieval.
   - Export a JSON report to stdout or file.
 
 Usage:
@@ -14,6 +16,7 @@ Usage:
     python scripts/eval_rag.py --top-k 10          # custom k
     python scripts/eval_rag.py --out report.json   # write to file
     python scripts/eval_rag.py --verbose            # show per-query results
+    python scripts/eval_rag.py --node-strategies    # + node strategy comparison
 
 Environment:
     FAKE_EMBEDDINGS=1  (default) — deterministic, no API key needed
@@ -342,6 +345,106 @@ def run_evaluation(
     return report
 
 
+# ---------------------------------------------------------------------------
+# Node embedding strategies (2-tier retrieval)
+# ---------------------------------------------------------------------------
+
+
+class _CountingEmbeddingService:
+    """Wrapper that counts texts sent to the provider."""
+
+    def __init__(self, inner) -> None:
+        self._inner = inner
+        self.texts_embedded = 0
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        self.texts_embedded += len(texts)
+        return self._inner.embed_batch(texts)
+
+
+def run_node_strategy_comparison(
+    corpus_path: Path,
+    queries_path: Path,
+    top_k: int = 5,
+    chunk_size: int = 120,
+    overlap: int = 20,
+    group_size: int = 2,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Node-level retrieval quality per node embedding strategy.
+
+    Chunks are embedded once (shared); each strategy then builds its node
+    vectors and queries retrieve nodes -> documents. `provider_texts` counts
+    the extra texts each strategy sends to the embedding provider.
+    """
+    from uuid import NAMESPACE_URL, uuid5
+
+    from app.application.node_builder import NODE_EMBEDDING_STRATEGIES, build_nodes
+    from app.domain.entities import Chunk
+    from app.infrastructure.services import FakeEmbeddingService
+    from eval.metrics import hit_at_1 as calc_hit_at_1
+    from eval.metrics import mean_reciprocal_rank, ndcg_at_k
+    from eval.metrics import recall_at_k as calc_recall_at_k
+
+    corpus = load_corpus(corpus_path)
+    queries = load_queries(queries_path)
+    embed_svc = FakeEmbeddingService()
+
+    doc_chunks: Dict[str, List[Chunk]] = {}
+    for doc in corpus:
+        texts = _chunk_text(doc.content, chunk_size=chunk_size, overlap=overlap)
+        embeddings = embed_svc.embed_batch(texts)
+        doc_chunks[doc.doc_id] = [
+            Chunk(content=text, embedding=emb, chunk_index=i)
+            for i, (text, emb) in enumerate(zip(texts, embeddings))
+        ]
+    query_embeddings = [embed_svc.embed_query(gq.query) for gq in queries]
+    all_relevant = [set(gq.relevant_docs) for gq in queries]
+
+    comparison: Dict[str, Dict[str, float]] = {}
+    for strategy in sorted(NODE_EMBEDDING_STRATEGIES):
+        provider = _CountingEmbeddingService(embed_svc)
+        index = InMemoryVectorIndex()
+        for doc_id, chunks in doc_chunks.items():
+            nodes = build_nodes(
+                document_id=uuid5(NAMESPACE_URL, doc_id),
+                workspace_id=uuid5(NAMESPACE_URL, "eval"),
+                chunks=chunks,
+                embedding_service=provider,
+                group_size=group_size,
+                embedding_strategy=strategy,
+            )
+            for node in nodes:
+                index.add(
+                    IndexedChunk(
+                        doc_id=doc_id,
+                        chunk_index=node.node_index,
+                        content=node.node_text,
+                        embedding=node.embedding,
+                    )
+                )
+
+        all_retrieved: List[List[str]] = []
+        for query_embedding in query_embeddings:
+            retrieved: List[str] = []
+            for node, _score in index.search(query_embedding, top_k=top_k):
+                if node.doc_id not in retrieved:
+                    retrieved.append(node.doc_id)
+            all_retrieved.append(retrieved)
+
+        comparison[strategy] = {
+            "mrr": round(mean_reciprocal_rank(all_retrieved, all_relevant), 4),
+            f"recall@{top_k}": round(
+                calc_recall_at_k(all_retrieved, all_relevant, k=top_k), 4
+            ),
+            "hit@1": round(calc_hit_at_1(all_retrieved, all_relevant), 4),
+            f"ndcg@{top_k}": round(ndcg_at_k(all_retrieved, all_relevant, k=top_k), 4),
+            "nodes": index.size,
+            "provider_texts": provider.texts_embedded,
+        }
+    return comparison
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -380,6 +483,11 @@ def main() -> None:
         action="store_true",
         help="Show per-query results on stderr",
     )
+    parser.add_argument(
+        "--node-strategies",
+        action="store_true",
+        help="Also compare 2-tier node embedding strategies (node-level retrieval)",
+    )
     args = parser.parse_args()
 
     t0 = time.perf_counter()
@@ -401,6 +509,12 @@ def main() -> None:
         "metrics": report.metrics,
         "per_query": report.per_query,
     }
+    if args.node_strategies:
+        report_dict["node_strategies"] = run_node_strategy_comparison(
+            corpus_path=args.corpus,
+            queries_path=args.queries,
+            top_k=args.top_k,
+        )
 
     output = json.dumps(report_dict, indent=2, ensure_ascii=False)
 
@@ -424,6 +538,12 @@ def main() -> None:
     for name, value in report.metrics.items():
         print(f"  {name:>12s}: {value:.4f}", file=sys.stderr)
     print(f"  {'elapsed':>12s}: {elapsed:.2f}s", file=sys.stderr)
+    for strategy, values in report_dict.get("node_strategies", {}).items():
+        print(
+            f"  node[{strategy}]: mrr={values['mrr']:.4f} "
+            f"hit@1={values['hit@1']:.4f} provider_texts={values['provider_texts']}",
+            file=sys.stderr,
+        )
     print(f"{'=' * 50}", file=sys.stderr)
 
 
@@ -68,6 +68,16 @@ def pytest_configure(config) -> None:
     )
 
 
+@pytest.fixture(autouse=True)
+def _reset_auth_cache():
+    """Aísla el cache de auth entre tests (los tests mockean get_user_by_id)."""
+    from app.identity.auth_cache import reset_auth_cache
+
+    reset_auth_cache()
+    yield
+    reset_auth_cache()
+
+
 # ============================================================================
 # Domain Entity Fixtures
 # ============================================================================
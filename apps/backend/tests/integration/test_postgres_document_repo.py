@@ -1059,6 +1059,100 @@ class TestPostgresVectorIndexType:
             )
 
 
+@pytest.mark.integration
+class TestPostgresDocumentRepositoryChunkDedup:
+    """Workspace dedup mode: shared embeddings + collapse before top_k."""
+
+    def _chunks(self, doc_id: UUID, workspace_id: UUID, texts: list[str]):
+        from app.application.content_hash import compute_content_hash
+
+        return [
+            Chunk(
+                content=text,
+                embedding=[0.1 + i / 100] * 768,
+                document_id=doc_id,
+                chunk_index=i,
+                content_hash=compute_content_hash(workspace_id, text),
+            )
+            for i, text in enumerate(texts)
+        ]
+
+    def test_identical_chunks_share_one_embedding_and_collapse(
+        self, db_repository, db_conn, cleanup_test_data, workspace_context
+    ):
+        workspace_id = workspace_context["workspace_id"]
+        db_conn.execute(
+            "UPDATE workspaces SET chunk_dedup_enabled = true WHERE id = %s",
+            (workspace_id,),
+        )
+        try:
+            doc_ids = [uuid4(), uuid4()]
+            cleanup_test_data.extend(doc_ids)
+            for doc_id in doc_ids:
+                doc = Document(id=doc_id, title="Dedup", workspace_id=workspace_id)
+                db_repository.save_document_with_chunks(
+                    doc,
+                    self._chunks(doc_id, workspace_id, ["Legal footer", "Body"]),
+                )
+
+            shared = db_conn.execute(
+                "SELECT COUNT(*) FROM chunk_embeddings WHERE workspace_id = %s",
+                (workspace_id,),
+            ).fetchone()[0]
+            assert shared == 2
+
+            results = db_repository.find_similar_chunks(
+                embedding=[0.1] * 768, top_k=10, workspace_id=workspace_id
+            )
+            assert sorted(c.content for c in results) == ["Body", "Legal footer"]
+            assert all(len(c.embedding) == 768 for c in results)
+        finally:
+            db_conn.execute(
+                "UPDATE workspaces SET chunk_dedup_enabled = false WHERE id = %s",
+                (workspace_id,),
+            )
+
+    def test_legacy_duplicates_still_return_top_k(
+        self, db_repository, db_conn, cleanup_test_data, workspace_context
+    ):
+        """Filas pre-dedup con mismo content_hash no recortan el top_k."""
+        workspace_id = workspace_context["workspace_id"]
+
+        def axis(i: int, weight: float = 1.0) -> list[float]:
+            vec = [0.0] * 768
+            vec[0] = 1.0
+            vec[i] = weight
+            return vec
+
+        # R: Se guardan con dedup apagado (embedding propio), luego se activa.
+        doc_ids = [uuid4() for _ in range(5)]
+        cleanup_test_data.extend(doc_ids)
+        for n, doc_id in enumerate(doc_ids):
+            chunks = self._chunks(doc_id, workspace_id, ["Legal footer", f"Body {n}"])
+            chunks[0].embedding = axis(1, 0.0)
+            chunks[1].embedding = axis(n + 2, 0.1)
+            db_repository.save_document_with_chunks(
+                Document(id=doc_id, title="Legacy", workspace_id=workspace_id),
+                chunks,
+            )
+        db_conn.execute(
+            "UPDATE workspaces SET chunk_dedup_enabled = true WHERE id = %s",
+            (workspace_id,),
+        )
+        try:
+            results = db_repository.find_similar_chunks(
+                embedding=axis(1, 0.0), top_k=3, workspace_id=workspace_id
+            )
+
+            assert len(results) == 3
+            assert [c.content for c in results].count("Legal footer") == 1
+        finally:
+            db_conn.execute(
+                "UPDATE workspaces SET chunk_dedup_enabled = false WHERE id = %s",
+                (workspace_id,),
+            )
+
+
 # Note: Additional tests for:
 # - Statement timeout behavior (requires long-running query simulation)
 # - Connection recovery after pool exhaustion
@@ -0,0 +1,235 @@
+"""
+Name: SSE Streaming Writer Tests
+
+Responsibilities:
+  - Validate token coalescing by size and by time
+  - Ensure the sources/token/done event contract is preserved
+  - Validate disconnect checks are timer-based (not per token)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from uuid import uuid4
+
+import pytest
+from app.crosscutting.streaming import _coalesce_tokens, _generate_sse
+from app.domain.entities import Chunk
+
+pytestmark = pytest.mark.unit
+
+
+class _Request:
+    def __init__(self, *, disconnected: bool = False):
+        self.disconnected = disconnected
+        self.checks = 0
+
+    async def is_disconnected(self) -> bool:
+        self.checks += 1
+        return self.disconnected
+
+
+class _LLM:
+    def __init__(self, tokens: list[str], *, delay: float = 0.0):
+        self._tokens = tokens
+        self._delay = delay
+
+    async def generate_stream(self, query, chunks):
+        for token in self._tokens:
+            if self._delay:
+                await asyncio.sleep(self._delay)
+            yield token
+
+
+class _ConversationRepo:
+    def __init__(self):
+        self.messages = []
+
+    def append_message(self, conversation_id, message):
+        self.messages.append((conversation_id, message))
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+def _parse(events: list[str]) -> list[tuple[str, dict]]:
+    parsed = []
+    for raw in events:
+        lines = raw.strip().split("\n")
+        parsed.append((lines[0][len("event: ") :], json.loads(lines[1][6:])))
+    return parsed
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_by_size():
+    frames = [
+        f
+        async for f in _coalesce_tokens(
+            _aiter(["ab", "cd", "ef", "g"]), flush_interval_s=60, flush_max_chars=4
+        )
+    ]
+
+    assert frames == ["abcd", "efg"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_by_time_while_provider_is_idle():
+    async def slow_tokens():
+        yield "a"
+        yield "b"
+        await asyncio.sleep(0.2)
+        yield "c"
+
+    frames = [
+        f
+        async for f in _coalesce_tokens(
+            slow_tokens(), flush_interval_s=0.02, flush_max_chars=1000
+        )
+    ]
+
+    # R: "ab" se emite por timer aunque el provider tarde en mandar "c".
+    assert frames == ["ab", "c"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_disabled_passes_tokens_through():
+    frames = [
+        f
+        async for f in _coalesce_tokens(
+            _aiter(["a", "", "b"]), flush_interval_s=0, flush_max_chars=10
+        )
+    ]
+
+    assert frames == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_uses_a_single_reader_task():
+    baseline = len(asyncio.all_tasks())
+    seen_tasks = set()
+
+    async def tokens():
+        for i in range(50):
+            seen_tasks.add(asyncio.current_task())
+            assert len(asyncio.all_tasks()) <= baseline + 1
+            yield f"t{i}"
+
+    frames = [
+        f
+        async for f in _coalesce_tokens(
+            tokens(), flush_interval_s=60, flush_max_chars=8
+        )
+    ]
+
+    assert "".join(frames) == "".join(f"t{i}" for i in range(50))
+    assert len(seen_tasks) == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesce_closes_upstream_when_consumer_stops():
+    closed = asyncio.Event()
+
+    async def endless():
+        try:
+            while True:
+                yield "x"
+                await asyncio.sleep(0)
+        finally:
+            closed.set()
+
+    frames = _coalesce_tokens(endless(), flush_interval_s=60, flush_max_chars=2)
+    assert await frames.__anext__() == "xx"
+    await frames.aclose()
+
+    assert closed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_coalesce_propagates_upstream_errors():
+    async def failing():
+        yield "a"
+        raise RuntimeError("provider down")
+
+    with pytest.raises(RuntimeError, match="provider down"):
+        async for _ in _coalesce_tokens(
+            failing(), flush_interval_s=60, flush_max_chars=100
+        ):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_generate_sse_keeps_event_contract_and_full_answer():
+    tokens = [f"t{i} " for i in range(200)]
+    repo = _ConversationRepo()
+
+    events = [
+        e
+        async for e in _generate_sse(
+            "q",
+            [Chunk(content="ctx", embedding=[], chunk_id=uuid4())],
+            _LLM(tokens),
+            _Request(),
+            "conv-1",
+            repo,
+            flush_interval_s=60,
+            flush_max_chars=64,
+        )
+    ]
+    parsed = _parse(events)
+
+    assert parsed[0][0] == "sources"
+    assert parsed[-1][0] == "done"
+    token_events = [data["token"] for name, data in parsed if name == "token"]
+    assert 1 < len(token_events) < len(tokens)
+    assert "".join(token_events) == "".join(tokens)
+    assert parsed[-1][1]["answer"] == "".join(tokens)
+    assert repo.messages[0][1].content == "".join(tokens)
+
+
+@pytest.mark.asyncio
+async def test_generate_sse_checks_disconnect_on_timer_not_per_token():
+    request = _Request()
+
+    events = [
+        e
+        async for e in _generate_sse(
+            "q",
+            [],
+            _LLM(["x"] * 50),
+            request,
+            None,
+            None,
+            flush_interval_s=0,
+            flush_max_chars=1,
+            disconnect_check_interval_s=60,
+        )
+    ]
+
+    assert sum(1 for e in events if e.startswith("event: token")) == 50
+    assert request.checks == 0
+
+
+@pytest.mark.asyncio
+async def test_generate_sse_stops_when_client_disconnects():
+    request = _Request(disconnected=True)
+
+    events = [
+        e
+        async for e in _generate_sse(
+            "q",
+            [],
+            _LLM(["x"] * 5),
+            request,
+            None,
+            None,
+            flush_interval_s=0,
+            flush_max_chars=1,
+            disconnect_check_interval_s=0,
+        )
+    ]
+
+    assert [e.split("\n")[0] for e in events] == ["event: sources"]
+    assert request.checks == 1
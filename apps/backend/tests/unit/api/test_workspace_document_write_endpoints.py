@@ -415,6 +415,7 @@ def test_workspace_reprocess_allows_owner_employee(monkeypatch):
             )
 
     assert response.status_code == 202
+    repo.clear_processing_checkpoint.assert_called_once()
 
 
 def test_workspace_reprocess_denies_viewer_employee(monkeypatch):
@@ -18,8 +18,10 @@ Notes:
   - Mark with @pytest.mark.unit
 """
 
+import time
 import pytest
 from datetime import datetime, timezone
+from unittest.mock import MagicMock
 from uuid import uuid4
 
 from app.application.reranker import RerankResult, RerankerMode
@@ -795,3 +797,137 @@ class TestAnswerQueryUseCaseEdgeCases:
         mock_embedding_service.embed_query.assert_called_once_with(long_query)
         assert result.error is None
         assert result.result.answer == "Answer"
+
+
+class _SlowWorkspaceRepo(_WorkspaceRepo):
+    def __init__(self, workspace: Workspace, delay: float):
+        super().__init__(workspace)
+        self._delay = delay
+        self.calls = 0
+
+    def get_workspace(self, workspace_id):
+        self.calls += 1
+        time.sleep(self._delay)
+        return super().get_workspace(workspace_id)
+
+
+@pytest.mark.unit
+class TestAnswerQuerySpeculativeEmbedding:
+    """Embedding especulativo en paralelo con la resolución de acceso."""
+
+    def _use_case(self, workspace_repo, embedding_service, mock_repository, llm):
+        return AnswerQueryUseCase(
+            repository=mock_repository,
+            workspace_repository=workspace_repo,
+            acl_repository=_ACL_REPO,
+            embedding_service=embedding_service,
+            llm_service=llm,
+            context_builder=_ContextBuilderStub(),
+        )
+
+    def test_embedding_overlaps_workspace_resolution(
+        self, mock_repository, mock_embedding_service, mock_llm_service
+    ):
+        delay = 0.2
+        workspace_repo = _SlowWorkspaceRepo(_WORKSPACE, delay)
+
+        def slow_embed(query):
+            time.sleep(delay)
+            return [0.5] * 768
+
+        mock_embedding_service.embed_query.side_effect = slow_embed
+        use_case = self._use_case(
+            workspace_repo, mock_embedding_service, mock_repository, mock_llm_service
+        )
+
+        started = time.perf_counter()
+        result = use_case.execute(
+            AnswerQueryInput(query="q", workspace_id=_WORKSPACE.id, actor=_ACTOR)
+        )
+        elapsed = time.perf_counter() - started
+
+        assert result.error is None
+        assert "access_ms" in result.result.metadata
+        # R: En serie serían ~2*delay; solapados, ~delay.
+        assert elapsed < delay * 1.75
+        assert result.result.metadata["embed_ms"] < delay * 1000 * 0.75
+
+    def test_prefetched_embedding_and_resolved_workspace_are_reused(
+        self, mock_repository, mock_embedding_service, mock_llm_service
+    ):
+        workspace_repo = _SlowWorkspaceRepo(_WORKSPACE, 0)
+        use_case = self._use_case(
+            workspace_repo, mock_embedding_service, mock_repository, mock_llm_service
+        )
+
+        prefetch = use_case.prefetch_query_embedding("q", top_k=5)
+        result = use_case.execute(
+            AnswerQueryInput(
+                query="q",
+                workspace_id=_WORKSPACE.id,
+                actor=_ACTOR,
+                workspace=_WORKSPACE,
+                query_embedding=prefetch,
+            )
+        )
+
+        assert result.error is None
+        assert workspace_repo.calls == 0
+        mock_embedding_service.embed_query.assert_called_once_with("q")
+
+    def test_denied_access_discards_speculative_embedding(
+        self, mock_repository, mock_embedding_service, mock_llm_service
+    ):
+        private = Workspace(
+            id=uuid4(),
+            name="Private",
+            visibility=WorkspaceVisibility.PRIVATE,
+            owner_user_id=uuid4(),
+        )
+        employee = WorkspaceActor(user_id=uuid4(), role=UserRole.EMPLOYEE)
+        prefetch = MagicMock()
+        use_case = self._use_case(
+            _WorkspaceRepo(private),
+            mock_embedding_service,
+            mock_repository,
+            mock_llm_service,
+        )
+
+        result = use_case.execute(
+            AnswerQueryInput(
+                query="q",
+                workspace_id=private.id,
+                actor=employee,
+                query_embedding=prefetch,
+            )
+        )
+
+        assert result.error.code == DocumentErrorCode.FORBIDDEN
+        prefetch.discard.assert_called_once()
+        prefetch.result.assert_not_called()
+        mock_repository.find_similar_chunks.assert_not_called()
+
+    @pytest.mark.parametrize("query,top_k", [("   ", 5), ("q", 0)])
+    def test_invalid_request_does_not_start_prefetch(
+        self, query, top_k, mock_repository, mock_embedding_service, mock_llm_service
+    ):
+        use_case = self._use_case(
+            _WorkspaceRepo(_WORKSPACE),
+            mock_embedding_service,
+            mock_repository,
+            mock_llm_service,
+        )
+
+        assert use_case.prefetch_query_embedding(query, top_k=top_k) is None
+        use_case.execute(
+            AnswerQueryInput(
+                query=query, workspace_id=_WORKSPACE.id, actor=_ACTOR, top_k=top_k
+            )
+        )
+
+        mock_embedding_service.embed_query.assert_not_called()
+
+
+class _ContextBuilderStub:
+    def build(self, chunks):
+        return "\n".join(c.content for c in chunks), len(chunks)
@@ -0,0 +1,110 @@
+"""
+Name: Backfill Nodes Use Case Tests
+
+Responsibilities:
+  - Verify nodes are rebuilt from stored chunks without provider calls
+  - Verify documents without chunks are skipped and failures are isolated
+  - Verify pagination over READY documents and dry-run mode
+  - Verify ndarray embeddings (as read back through pgvector) are accepted
+"""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from app.application.usecases.ingestion import (
+    BackfillNodesInput,
+    BackfillNodesUseCase,
+)
+from app.domain.entities import Chunk, Document
+
+pytestmark = pytest.mark.unit
+
+_WS_ID = uuid4()
+
+
+def _document() -> Document:
+    return Document(id=uuid4(), title="Doc", workspace_id=_WS_ID, status="READY")
+
+
+def _chunks(count: int) -> list[Chunk]:
+    return [
+        Chunk(content=f"chunk {i}", embedding=[1.0, float(i)], chunk_index=i)
+        for i in range(count)
+    ]
+
+
+def _use_case(repo: MagicMock, strategy: str = "mean") -> BackfillNodesUseCase:
+    return BackfillNodesUseCase(
+        repo, group_size=2, max_chars=100, embedding_strategy=strategy
+    )
+
+
+def test_backfill_replaces_nodes_from_stored_chunks():
+    doc, empty = _document(), _document()
+    repo = MagicMock()
+    repo.list_documents.return_value = [doc, empty]
+    repo.find_chunks_by_node_spans.side_effect = lambda spans, **_: (
+        _chunks(5) if spans[0][0] == doc.id else []
+    )
+
+    result = _use_case(repo).execute(BackfillNodesInput(workspace_id=_WS_ID))
+
+    assert (result.documents_processed, result.documents_skipped) == (1, 1)
+    assert result.nodes_created == 3
+    assert repo.list_documents.call_args.kwargs["status"] == "READY"
+    repo.delete_nodes_for_document.assert_called_once_with(doc.id, workspace_id=_WS_ID)
+    saved = repo.save_nodes.call_args.args[1]
+    assert [(n.span_start, n.span_end) for n in saved] == [(0, 1), (2, 3), (4, 4)]
+    assert all(len(n.embedding) == 2 for n in saved)
+
+
+def test_backfill_accepts_ndarray_embeddings_from_storage():
+    doc = _document()
+    repo = MagicMock()
+    repo.list_documents.return_value = [doc]
+    repo.find_chunks_by_node_spans.return_value = [
+        Chunk(
+            content=f"chunk {i}",
+            embedding=np.asarray([1.0, float(i)], dtype=np.float32),
+            chunk_index=i,
+        )
+        for i in range(4)
+    ]
+
+    result = _use_case(repo).execute(BackfillNodesInput(workspace_id=_WS_ID))
+
+    assert result.failed_document_ids == []
+    assert result.nodes_created == 2
+    saved = repo.save_nodes.call_args.args[1]
+    assert all(isinstance(n.embedding, list) for n in saved)
+
+
+def test_backfill_isolates_failures_and_supports_dry_run():
+    broken, ok = _document(), _document()
+    repo = MagicMock()
+    repo.get_document.side_effect = lambda document_id, **_: (
+        broken if document_id == broken.id else ok
+    )
+    repo.find_chunks_by_node_spans.side_effect = lambda spans, **_: (
+        [Chunk(content="x", embedding=[], chunk_index=0)]
+        if spans[0][0] == broken.id
+        else _chunks(2)
+    )
+
+    result = _use_case(repo, "length_weighted").execute(
+        BackfillNodesInput(
+            workspace_id=_WS_ID, document_ids=[broken.id, ok.id], dry_run=True
+        )
+    )
+
+    assert result.failed_document_ids == [broken.id]
+    assert result.documents_processed == 1
+    repo.save_nodes.assert_not_called()
+    repo.list_documents.assert_not_called()
+
+
+def test_backfill_rejects_provider_strategy():
+    with pytest.raises(ValueError):
+        _use_case(MagicMock(), "provider")
@@ -0,0 +1,204 @@
+"""
+Name: Chunk Embedding Reuse Tests
+
+Responsibilities:
+  - Validate that only new/changed chunks reach the embedding provider
+  - Validate that vectors from another embedding model are never reused
+  - Ensure reprocess embeds BEFORE deleting the previous chunks
+"""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from app.application.content_hash import compute_chunk_hash
+from app.application.usecases import (
+    ProcessUploadedDocumentInput,
+    ProcessUploadedDocumentUseCase,
+)
+from app.application.usecases.ingestion.chunk_embedding_reuse import (
+    embed_chunks_with_reuse,
+)
+from app.domain.entities import Document
+
+pytestmark = pytest.mark.unit
+
+_MODEL = "model-a"
+
+
+def _hash(workspace_id, text: str, model: str = _MODEL) -> str:
+    return compute_chunk_hash(workspace_id, text, embedding_model=model)
+
+
+def _embedder(model: str = _MODEL) -> MagicMock:
+    service = MagicMock()
+    service.model_id = model
+    return service
+
+
+def test_reuses_known_hashes_and_embeds_only_changed_chunks():
+    workspace_id = uuid4()
+    repo = MagicMock()
+    repo.find_chunk_embeddings_by_hash.return_value = {
+        _hash(workspace_id, "same"): [0.5] * 3,
+    }
+    embedding_service = _embedder()
+    embedding_service.embed_batch.return_value = [[0.9] * 3]
+
+    result = embed_chunks_with_reuse(
+        repository=repo,
+        embedding_service=embedding_service,
+        workspace_id=workspace_id,
+        chunks_text=["same", "changed"],
+    )
+
+    embedding_service.embed_batch.assert_called_once_with(["changed"])
+    assert result.embeddings == [[0.5] * 3, [0.9] * 3]
+    assert result.reused == 1
+    assert result.computed == 1
+    assert result.content_hashes == [
+        _hash(workspace_id, "same"),
+        _hash(workspace_id, "changed"),
+    ]
+
+
+def test_vectors_from_another_model_are_not_reused():
+    workspace_id = uuid4()
+    old_model_hash = _hash(workspace_id, "same", model="model-old")
+    repo = MagicMock()
+    repo.find_chunk_embeddings_by_hash.side_effect = lambda ws, hashes: {
+        h: [0.5] for h in hashes if h == old_model_hash
+    }
+    embedding_service = _embedder()
+    embedding_service.embed_batch.return_value = [[0.9]]
+
+    result = embed_chunks_with_reuse(
+        repository=repo,
+        embedding_service=embedding_service,
+        workspace_id=workspace_id,
+        chunks_text=["same"],
+    )
+
+    embedding_service.embed_batch.assert_called_once_with(["same"])
+    assert result.embeddings == [[0.9]]
+    assert result.content_hashes == [_hash(workspace_id, "same")]
+
+
+def test_duplicate_chunks_are_embedded_once():
+    repo = MagicMock()
+    repo.find_chunk_embeddings_by_hash.return_value = {}
+    embedding_service = _embedder()
+    embedding_service.embed_batch.return_value = [[0.1], [0.2]]
+
+    result = embed_chunks_with_reuse(
+        repository=repo,
+        embedding_service=embedding_service,
+        workspace_id=uuid4(),
+        chunks_text=["a", "b", "a"],
+    )
+
+    embedding_service.embed_batch.assert_called_once_with(["a", "b"])
+    assert result.embeddings == [[0.1], [0.2], [0.1]]
+    assert result.computed == 2
+    assert result.reused == 1
+
+
+def test_all_chunks_known_skips_provider():
+    workspace_id = uuid4()
+    repo = MagicMock()
+    repo.find_chunk_embeddings_by_hash.return_value = {
+        _hash(workspace_id, "x"): [0.3],
+    }
+    embedding_service = _embedder()
+
+    result = embed_chunks_with_reuse(
+        repository=repo,
+        embedding_service=embedding_service,
+        workspace_id=workspace_id,
+        chunks_text=["x"],
+    )
+
+    embedding_service.embed_batch.assert_not_called()
+    assert result.embeddings == [[0.3]]
+
+
+def test_lookup_failure_falls_back_to_embedding_everything():
+    repo = MagicMock()
+    repo.find_chunk_embeddings_by_hash.side_effect = RuntimeError("db down")
+    embedding_service = _embedder()
+    embedding_service.embed_batch.return_value = [[0.1], [0.2]]
+
+    result = embed_chunks_with_reuse(
+        repository=repo,
+        embedding_service=embedding_service,
+        workspace_id=uuid4(),
+        chunks_text=["a", "b"],
+    )
+
+    embedding_service.embed_batch.assert_called_once_with(["a", "b"])
+    assert result.reused == 0
+
+
+def test_batch_size_mismatch_raises():
+    repo = MagicMock()
+    repo.find_chunk_embeddings_by_hash.return_value = {}
+    embedding_service = _embedder()
+    embedding_service.embed_batch.return_value = [[0.1]]
+
+    with pytest.raises(RuntimeError):
+        embed_chunks_with_reuse(
+            repository=repo,
+            embedding_service=embedding_service,
+            workspace_id=uuid4(),
+            chunks_text=["a", "b"],
+        )
+
+
+def test_reprocess_looks_up_embeddings_before_deleting_chunks():
+    doc = Document(
+        id=uuid4(),
+        workspace_id=uuid4(),
+        title="Doc",
+        source=None,
+        metadata={},
+        file_name="file.pdf",
+        mime_type="application/pdf",
+        storage_key="documents/1/file.pdf",
+        uploaded_by_user_id=None,
+        status="PENDING",
+    )
+    calls: list[str] = []
+    repo = MagicMock()
+    repo.get_document.return_value = doc
+    repo.transition_document_status.side_effect = [True, True]
+    repo.find_chunk_embeddings_by_hash.side_effect = lambda *_: (
+        calls.append("lookup") or {_hash(doc.workspace_id, "old"): [0.4]}
+    )
+    repo.delete_chunks_for_document.side_effect = lambda *_, **__: calls.append(
+        "delete"
+    )
+    storage = MagicMock()
+    storage.download_file.return_value = b"data"
+    extractor = MagicMock()
+    extractor.extract_text.return_value = "old new"
+    chunker = MagicMock()
+    chunker.chunk.return_value = ["old", "new"]
+    embedding_service = _embedder()
+    embedding_service.embed_batch.return_value = [[0.7]]
+
+    result = ProcessUploadedDocumentUseCase(
+        repository=repo,
+        storage=storage,
+        extractor=extractor,
+        chunker=chunker,
+        embedding_service=embedding_service,
+    ).execute(
+        ProcessUploadedDocumentInput(document_id=doc.id, workspace_id=doc.workspace_id)
+    )
+
+    assert result.status == "READY"
+    assert calls == ["lookup", "delete"]
+    embedding_service.embed_batch.assert_called_once_with(["new"])
+    saved = repo.save_chunks.call_args[0][1]
+    assert [c.embedding for c in saved] == [[0.4], [0.7]]
+    assert saved[0].content_hash == _hash(doc.workspace_id, "old")
@@ -8,6 +8,8 @@ Responsibilities:
     - Validar DeleteConnectorSourceUseCase (happy path, no encontrado, cross-ws).
     - Validar SyncConnectorSourceUseCase (full implementation con fakes).
     - Validar sync update-aware: CREATE, UPDATE, SKIP_UNCHANGED scenarios.
+    - Validar sync concurrente: mismos contadores, duplicados en serie.
+    - Validar reuso de access_token por cuenta (un refresh para N sources).
 
 Collaborators:
     - FakeConnectorSourceRepository
@@ -18,6 +20,7 @@ Collaborators:
 
 from __future__ import annotations
 
+import threading
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
@@ -37,6 +40,7 @@ from app.application.usecases.connectors.list_connector_sources import (
 from app.application.usecases.connectors.sync_connector_source import (
     SyncConnectorSourceUseCase,
 )
+from app.infrastructure.services.access_token_cache import AccessTokenCache
 from app.domain.connectors import (
     ConnectorAccount,
     ConnectorDelta,
@@ -44,6 +48,7 @@ from app.domain.connectors import (
     ConnectorProvider,
     ConnectorSource,
     ConnectorSourceStatus,
+    OAuthAccessToken,
 )
 from app.domain.entities import Document, Workspace, WorkspaceVisibility
 
@@ -359,6 +364,7 @@ class FakeOAuthPort:
 
     def __init__(self, *, refresh_error: str | None = None):
         self._refresh_error = refresh_error
+        self.refresh_count = 0
 
     def build_authorization_url(self, *, state: str, redirect_uri: str) -> str:
         return "https://fake"
@@ -369,8 +375,14 @@ class FakeOAuthPort:
     def refresh_access_token(self, refresh_token: str) -> str:
         if self._refresh_error:
             raise ValueError(self._refresh_error)
+        self.refresh_count += 1
         return "fresh-access-token"
 
+    def refresh_access_token_with_expiry(self, refresh_token: str):
+        return OAuthAccessToken(
+            access_token=self.refresh_access_token(refresh_token), expires_in=3600
+        )
+
 
 class FakeConnectorAccountRepository:
     def __init__(self):
@@ -488,6 +500,8 @@ def _make_sync_uc(
     encryption=None,
     oauth_port=None,
     drive_client=None,
+    max_concurrency=1,
+    token_cache=None,
 ):
     """Helper para construir SyncConnectorSourceUseCase con fakes."""
     if account_repo is None:
@@ -516,6 +530,8 @@ def _make_sync_uc(
         encryption=encryption,
         oauth_port=oauth_port,
         drive_client_factory=lambda _token: drive_client or FakeDriveClient(),
+        max_concurrency=max_concurrency,
+        token_cache=token_cache,
     )
 
 
@@ -1225,3 +1241,224 @@ class TestContentHash:
         doc = doc_repo.get_by_external_source_id(workspace.id, "gdrive:hf1")
         assert doc is not None
         assert doc.content_hash == expected_hash
+
+
+# ===========================================================================
+# Sync concurrente
+# ===========================================================================
+
+
+class FakeDriveClientBarrier(FakeDriveClient):
+    """Drive client cuyas descargas solo avanzan si hay `parties` en vuelo."""
+
+    def __init__(self, files, *, parties: int, failing_ids: set[str] | None = None):
+        super().__init__(files=files)
+        self._barrier = threading.Barrier(parties, timeout=5)
+        self._failing_ids = failing_ids or set()
+
+    def fetch_file_content(self, file_id, *, mime_type=""):
+        from app.infrastructure.services.google_drive_client import (
+            ConnectorTransientError,
+        )
+
+        self._barrier.wait()
+        if file_id in self._failing_ids:
+            raise ConnectorTransientError("HTTP 503 after 4 attempts", 503)
+        return super().fetch_file_content(file_id, mime_type=mime_type)
+
+
+class TestConcurrentSync:
+    """Tests para descargas en paralelo (max_concurrency > 1)."""
+
+    def test_downloads_run_in_parallel_with_same_stats(
+        self, workspace, workspace_repo, connector_repo
+    ):
+        create_uc = CreateConnectorSourceUseCase(
+            connector_repo=connector_repo,
+            workspace_repo=workspace_repo,
+        )
+        r = create_uc.execute(
+            CreateConnectorSourceInput(workspace_id=workspace.id, folder_id="par")
+        )
+        files = [
+            ConnectorFile(file_id=f"f{i}", name=f"doc{i}.txt", mime_type="text/plain")
+            for i in range(4)
+        ] + [ConnectorFile(file_id="img", name="a.png", mime_type="image/png")]
+        # Barrier(4): con ejecución secuencial la primera descarga nunca avanza.
+        client = FakeDriveClientBarrier(files, parties=4, failing_ids={"f3"})
+        doc_repo = FakeDocumentRepository()
+
+        sync_uc = _make_sync_uc(
+            workspace,
+            connector_repo,
+            workspace_repo,
+            document_repo=doc_repo,
+            drive_client=client,
+            max_concurrency=4,
+        )
+        result = sync_uc.execute(workspace.id, r.source.id)
+
+        assert result.error is None
+        assert result.stats.files_found == 5
+        assert result.stats.files_ingested == 3
+        assert result.stats.files_skipped == 1
+        assert result.stats.files_errored == 1
+        assert connector_repo.get(r.source.id).status == ConnectorSourceStatus.ACTIVE
+        assert doc_repo.get_by_external_source_id(workspace.id, "gdrive:f3") is None
+
+    def test_duplicate_file_entries_processed_in_order(
+        self, workspace, workspace_repo, connector_repo
+    ):
+        """El mismo file_id dos veces en el delta no crea dos documentos."""
+        create_uc = CreateConnectorSourceUseCase(
+            connector_repo=connector_repo,
+            workspace_repo=workspace_repo,
+        )
+        r = create_uc.execute(
+            CreateConnectorSourceInput(workspace_id=workspace.id, folder_id="dup")
+        )
+        modified = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        files = [
+            ConnectorFile(
+                file_id="same",
+                name="a.txt",
+                mime_type="text/plain",
+                modified_time=modified,
+            ),
+            ConnectorFile(file_id="other", name="b.txt", mime_type="text/plain"),
+            ConnectorFile(
+                file_id="same",
+                name="a.txt",
+                mime_type="text/plain",
+                modified_time=modified,
+            ),
+        ]
+        doc_repo = FakeDocumentRepository()
+
+        sync_uc = _make_sync_uc(
+            workspace,
+            connector_repo,
+            workspace_repo,
+            document_repo=doc_repo,
+            drive_client=FakeDriveClient(files=files),
+            max_concurrency=4,
+        )
+        result = sync_uc.execute(workspace.id, r.source.id)
+
+        assert result.stats.files_ingested == 2
+        assert result.stats.files_skipped == 1
+        assert len(doc_repo._docs) == 2
+
+    def test_invalid_max_concurrency_rejected(self, connector_repo):
+        with pytest.raises(ValueError):
+            SyncConnectorSourceUseCase(
+                connector_repo=connector_repo,
+                account_repo=FakeConnectorAccountRepository(),
+                document_repo=FakeDocumentRepository(),
+                encryption=FakeTokenEncryption(),
+                oauth_port=FakeOAuthPort(),
+                max_concurrency=0,
+            )
+
+
+# ===========================================================================
+# Reuso de access_token (cache por cuenta)
+# ===========================================================================
+
+
+class FakeDriveClientUnauthorized(FakeDriveClient):
+    """get_delta responde 401 (token revocado)."""
+
+    def get_delta(self, folder_id, *, cursor=None):
+        from app.infrastructure.services.google_drive_client import (
+            ConnectorPermanentError,
+        )
+
+        raise ConnectorPermanentError("HTTP 401", status_code=401)
+
+
+def _create_sources(workspace, workspace_repo, connector_repo, count: int):
+    create_uc = CreateConnectorSourceUseCase(
+        connector_repo=connector_repo,
+        workspace_repo=workspace_repo,
+    )
+    return [
+        create_uc.execute(
+            CreateConnectorSourceInput(workspace_id=workspace.id, folder_id=f"tc-{i}")
+        ).source.id
+        for i in range(count)
+    ]
+
+
+class TestAccessTokenReuse:
+    """N sources de una misma cuenta => un solo refresh."""
+
+    def test_sources_of_same_account_share_one_refresh(
+        self, workspace, workspace_repo, connector_repo
+    ):
+        source_ids = _create_sources(workspace, workspace_repo, connector_repo, 3)
+        oauth_port = FakeOAuthPort()
+        sync_uc = _make_sync_uc(
+            workspace,
+            connector_repo,
+            workspace_repo,
+            oauth_port=oauth_port,
+            token_cache=AccessTokenCache(),
+        )
+
+        for source_id in source_ids:
+            assert sync_uc.execute(workspace.id, source_id).error is None
+
+        assert oauth_port.refresh_count == 1
+
+    def test_without_cache_refreshes_every_sync(
+        self, workspace, workspace_repo, connector_repo
+    ):
+        source_ids = _create_sources(workspace, workspace_repo, connector_repo, 2)
+        oauth_port = FakeOAuthPort()
+        sync_uc = _make_sync_uc(
+            workspace, connector_repo, workspace_repo, oauth_port=oauth_port
+        )
+
+        for source_id in source_ids:
+            sync_uc.execute(workspace.id, source_id)
+
+        assert oauth_port.refresh_count == 2
+
+    def test_unauthorized_delta_invalidates_cached_token(
+        self, workspace, workspace_repo, connector_repo
+    ):
+        (source_id,) = _create_sources(workspace, workspace_repo, connector_repo, 1)
+        oauth_port = FakeOAuthPort()
+        cache = AccessTokenCache()
+        failing_uc = _make_sync_uc(
+            workspace,
+            connector_repo,
+            workspace_repo,
+            oauth_port=oauth_port,
+            token_cache=cache,
+            drive_client=FakeDriveClientUnauthorized(),
+        )
+
+        assert failing_uc.execute(workspace.id, source_id).error is not None
+        assert failing_uc.execute(workspace.id, source_id).error is not None
+
+        assert oauth_port.refresh_count == 2
+
+    def test_refresh_failure_with_cache_keeps_error_semantics(
+        self, workspace, workspace_repo, connector_repo
+    ):
+        (source_id,) = _create_sources(workspace, workspace_repo, connector_repo, 1)
+        sync_uc = _make_sync_uc(
+            workspace,
+            connector_repo,
+            workspace_repo,
+            oauth_port=FakeOAuthPort(refresh_error="token revoked"),
+            token_cache=AccessTokenCache(),
+        )
+
+        result = sync_uc.execute(workspace.id, source_id)
+
+        assert result.error.code == ConnectorErrorCode.VALIDATION_ERROR
+        assert "token revoked" in result.error.message
+        assert connector_repo.get(source_id).status == ConnectorSourceStatus.ERROR
@@ -5,6 +5,7 @@ Responsibilities:
   - Verify normalize_text handles NFC, trim, whitespace collapse
   - Verify normalize_text preserves case (NO lowercase)
   - Verify compute_content_hash is deterministic and workspace-scoped
+  - Verify compute_chunk_hash is scoped by embedding model
   - Verify compute_file_hash is deterministic and workspace-scoped
   - Verify output format (hex string, 64 chars)
 """
@@ -16,6 +17,7 @@ from uuid import UUID
 
 import pytest
 from app.application.content_hash import (
+    compute_chunk_hash,
     compute_content_hash,
     compute_file_hash,
     normalize_text,
@@ -96,6 +98,28 @@ class TestComputeContentHash:
         assert h1 != h2
 
 
+# ---------------------------------------------------------------------------
+# compute_chunk_hash
+# ---------------------------------------------------------------------------
+
+
+class TestComputeChunkHash:
+    def test_different_model_different_hash(self):
+        h1 = compute_chunk_hash(_WS1, "same content", embedding_model="model-a")
+        h2 = compute_chunk_hash(_WS1, "same content", embedding_model="model-b")
+        assert h1 != h2
+
+    def test_whitespace_variants_produce_same_hash(self):
+        h1 = compute_chunk_hash(_WS1, "hello   world", embedding_model="m")
+        h2 = compute_chunk_hash(_WS1, "hello\t\nworld", embedding_model="m")
+        assert h1 == h2
+
+    def test_different_workspace_different_hash(self):
+        h1 = compute_chunk_hash(_WS1, "same content", embedding_model="m")
+        h2 = compute_chunk_hash(_WS2, "same content", embedding_model="m")
+        assert h1 != h2
+
+
 # ---------------------------------------------------------------------------
 # compute_file_hash
 # ---------------------------------------------------------------------------
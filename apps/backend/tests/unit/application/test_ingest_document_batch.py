@@ -0,0 +1,140 @@
+"""
+Name: Ingest Document Batch Unit Tests
+
+Responsibilities:
+  - Verify one dedup query and one embed_batch call across documents
+  - Verify bulk persistence and per-document results in input order
+  - Verify in-batch and workspace dedup
+  - Verify per-document fallback when the bulk save fails
+"""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+from uuid import UUID, uuid4
+
+import pytest
+from app.application.content_hash import compute_content_hash
+from app.application.usecases import (
+    DocumentErrorCode,
+    IngestBatchItem,
+    IngestDocumentBatchInput,
+    IngestDocumentBatchUseCase,
+)
+from app.domain.entities import Document, Workspace, WorkspaceVisibility
+from app.domain.workspace_policy import WorkspaceActor
+from app.identity.users import UserRole
+
+pytestmark = pytest.mark.unit
+
+_WS_ID = UUID("00000000-0000-0000-0000-000000000001")
+_ACTOR = WorkspaceActor(
+    user_id=UUID("00000000-0000-0000-0000-000000000002"),
+    role=UserRole.ADMIN,
+)
+
+
+class _WorkspaceRepo:
+    def get_workspace(self, workspace_id: UUID):
+        return Workspace(
+            id=workspace_id, name="Test WS", visibility=WorkspaceVisibility.PRIVATE
+        )
+
+
+def _use_case(repo: Mock, embedding: Mock) -> IngestDocumentBatchUseCase:
+    chunker = Mock()
+    chunker.chunk.side_effect = lambda text: text.split()
+    return IngestDocumentBatchUseCase(
+        repository=repo,
+        workspace_repository=_WorkspaceRepo(),
+        embedding_service=embedding,
+        chunker=chunker,
+    )
+
+
+def _input(*texts: str) -> IngestDocumentBatchInput:
+    return IngestDocumentBatchInput(
+        workspace_id=_WS_ID,
+        actor=_ACTOR,
+        documents=[
+            IngestBatchItem(title=f"Doc {i}", text=t) for i, t in enumerate(texts)
+        ],
+    )
+
+
+def _embedding() -> Mock:
+    embedding = Mock()
+    embedding.embed_batch.side_effect = lambda texts: [[0.1] * 768 for _ in texts]
+    return embedding
+
+
+def test_embeds_all_chunks_in_one_call_and_saves_in_bulk():
+    repo = Mock()
+    repo.get_documents_by_content_hashes.return_value = {}
+    embedding = _embedding()
+
+    result = _use_case(repo, embedding).execute(_input("a b", "c", "d e f"))
+
+    assert result.error is None
+    assert [r.chunks_created for r in result.results] == [2, 1, 3]
+    embedding.embed_batch.assert_called_once_with(["a", "b", "c", "d", "e", "f"])
+    repo.get_documents_by_content_hashes.assert_called_once()
+    repo.save_documents_with_chunks.assert_called_once()
+    repo.save_document_with_chunks.assert_not_called()
+
+    items = repo.save_documents_with_chunks.call_args[0][0]
+    assert [doc.id for doc, _, _ in items] == [r.document_id for r in result.results]
+    assert [[c.content for c in chunks] for _, chunks, _ in items] == [
+        ["a", "b"],
+        ["c"],
+        ["d", "e", "f"],
+    ]
+
+
+def test_workspace_and_in_batch_duplicates_are_not_reingested():
+    existing = Document(id=uuid4(), title="Old", workspace_id=_WS_ID)
+    repo = Mock()
+    repo.get_documents_by_content_hashes.return_value = {
+        compute_content_hash(_WS_ID, "old text"): existing
+    }
+    embedding = _embedding()
+
+    result = _use_case(repo, embedding).execute(
+        _input("old text", "new text", "new text")
+    )
+
+    first, second, third = result.results
+    assert first.document_id == existing.id and first.chunks_created == 0
+    assert second.chunks_created == 2
+    assert third.document_id == second.document_id and third.chunks_created == 0
+    embedding.embed_batch.assert_called_once_with(["new", "text"])
+
+
+def test_embedding_failure_is_reported_per_document():
+    repo = Mock()
+    repo.get_documents_by_content_hashes.return_value = {}
+    embedding = Mock()
+    embedding.embed_batch.side_effect = RuntimeError("provider down")
+
+    result = _use_case(repo, embedding).execute(_input("a", "b"))
+
+    assert [r.error.code for r in result.results] == [
+        DocumentErrorCode.SERVICE_UNAVAILABLE,
+        DocumentErrorCode.SERVICE_UNAVAILABLE,
+    ]
+    repo.save_documents_with_chunks.assert_not_called()
+
+
+def test_bulk_save_failure_falls_back_to_per_document_saves():
+    existing = Document(id=uuid4(), title="Raced", workspace_id=_WS_ID)
+    repo = Mock()
+    repo.get_documents_by_content_hashes.return_value = {}
+    repo.save_documents_with_chunks.side_effect = RuntimeError("unique violation")
+    repo.save_document_with_chunks.side_effect = [None, RuntimeError("unique")]
+    repo.get_document_by_content_hash.return_value = existing
+
+    result = _use_case(repo, _embedding()).execute(_input("a", "b"))
+
+    assert result.results[0].chunks_created == 1
+    assert result.results[1].document_id == existing.id
+    assert repo.save_document_with_chunks.call_count == 2
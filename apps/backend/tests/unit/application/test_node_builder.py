@@ -8,13 +8,15 @@ Responsibilities:
   - Verify embed_batch called once (efficiency).
   - Verify empty chunks returns empty.
   - Verify smoke test with FakeEmbeddingService.
+  - Verify centroid strategies derive node vectors without provider calls.
 """
 
+import math
 from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
-from app.application.node_builder import build_nodes
+from app.application.node_builder import build_nodes, centroid_embedding
 from app.domain.entities import Chunk
 from app.domain.services import EmbeddingService
 
@@ -134,3 +136,40 @@ class TestNodeBuilder:
         for node in nodes:
             assert len(node.embedding) == 768
             assert node.node_text  # non-empty
+
+
+class TestCentroidStrategies:
+    def test_mean_strategy_skips_provider_and_normalizes(self):
+        chunks = [
+            Chunk(content="a", embedding=[1.0, 0.0], chunk_index=0),
+            Chunk(content="b", embedding=[0.0, 1.0], chunk_index=1),
+        ]
+        embed_svc = _mock_embed_service()
+
+        nodes = build_nodes(
+            _DOC_ID, _WS_ID, chunks, embed_svc, group_size=2, embedding_strategy="mean"
+        )
+
+        embed_svc.embed_batch.assert_not_called()
+        assert nodes[0].embedding == pytest.approx([math.sqrt(0.5), math.sqrt(0.5)])
+
+    def test_length_weighted_favours_longer_chunks(self):
+        chunks = [
+            Chunk(content="x" * 300, embedding=[1.0, 0.0], chunk_index=0),
+            Chunk(content="x" * 100, embedding=[0.0, 1.0], chunk_index=1),
+        ]
+
+        vector = centroid_embedding(chunks, weighted=True)
+
+        assert vector[0] > vector[1]
+        assert math.hypot(*vector) == pytest.approx(1.0)
+
+    def test_centroid_requires_chunk_embeddings(self):
+        chunks = [Chunk(content="a", embedding=[], chunk_index=0)]
+
+        with pytest.raises(ValueError):
+            build_nodes(_DOC_ID, _WS_ID, chunks, None, embedding_strategy="mean")
+
+    def test_provider_strategy_requires_embedding_service(self):
+        with pytest.raises(ValueError):
+            build_nodes(_DOC_ID, _WS_ID, [_make_chunk(0)], None)
@@ -0,0 +1,296 @@
+"""
+Name: Presigned Upload Unit Tests
+
+Responsibilities:
+  - Verify create reserves an UPLOADING document and returns a signed PUT URL
+  - Verify completion HEADs the object and enqueues processing
+  - Verify invalid objects are rejected (FAILED + delete) and retries are idempotent
+  - Verify abandoned uploads expire (UPLOADING -> FAILED + delete) via a scheduled job
+  - Verify the worker computes the deferred dedup hash and flags duplicates
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.application.content_hash import compute_file_hash
+from app.application.usecases.documents.document_results import DocumentErrorCode
+from app.application.usecases.ingestion.presigned_upload import (
+    CompletePresignedUploadInput,
+    CompletePresignedUploadUseCase,
+    CreatePresignedUploadInput,
+    CreatePresignedUploadUseCase,
+    ExpirePresignedUploadInput,
+    ExpirePresignedUploadUseCase,
+)
+from app.application.usecases.ingestion.process_uploaded_document import (
+    ProcessUploadedDocumentInput,
+    ProcessUploadedDocumentUseCase,
+)
+from app.domain.entities import Document, Workspace, WorkspaceVisibility
+from app.domain.services import StoredObjectInfo
+from app.domain.workspace_policy import WorkspaceActor
+from app.identity.users import UserRole
+
+pytestmark = pytest.mark.unit
+
+_WS_ID = UUID("00000000-0000-0000-0000-000000000001")
+_ACTOR = WorkspaceActor(
+    user_id=UUID("00000000-0000-0000-0000-000000000002"),
+    role=UserRole.ADMIN,
+)
+_PDF = "application/pdf"
+_MAX = 1024
+
+
+def _workspace_repo() -> MagicMock:
+    repo = MagicMock()
+    repo.get_workspace.return_value = Workspace(
+        id=_WS_ID, name="Test WS", visibility=WorkspaceVisibility.PRIVATE
+    )
+    return repo
+
+
+def _uploading_doc(status: str = "UPLOADING") -> Document:
+    doc_id = uuid4()
+    return Document(
+        id=doc_id,
+        title="Direct",
+        workspace_id=_WS_ID,
+        file_name="a.pdf",
+        mime_type=_PDF,
+        storage_key=f"documents/{doc_id}/a.pdf",
+        status=status,
+    )
+
+
+def _complete(doc: Document, storage: MagicMock, queue: MagicMock | None = None):
+    repo = MagicMock()
+    repo.get_document.return_value = doc
+    repo.transition_document_status.return_value = True
+    use_case = CompletePresignedUploadUseCase(
+        repository=repo,
+        workspace_repository=_workspace_repo(),
+        storage=storage,
+        queue=queue or MagicMock(),
+        max_upload_bytes=_MAX,
+    )
+    result = use_case.execute(
+        CompletePresignedUploadInput(
+            workspace_id=_WS_ID, document_id=doc.id, actor=_ACTOR
+        )
+    )
+    return result, repo
+
+
+def test_create_reserves_uploading_document_and_signs_put():
+    repo = MagicMock()
+    storage = MagicMock()
+    storage.generate_presigned_upload_url.return_value = "https://s3/put"
+    queue = MagicMock()
+    use_case = CreatePresignedUploadUseCase(
+        repository=repo,
+        workspace_repository=_workspace_repo(),
+        storage=storage,
+        queue=queue,
+        max_upload_bytes=_MAX,
+        expires_in_seconds=300,
+    )
+
+    result = use_case.execute(
+        CreatePresignedUploadInput(
+            workspace_id=_WS_ID,
+            actor=_ACTOR,
+            title="Doc",
+            file_name="a.pdf",
+            mime_type=_PDF,
+            size_bytes=100,
+        )
+    )
+
+    assert result.error is None
+    assert result.upload_url == "https://s3/put"
+    assert result.storage_key == f"documents/{result.document_id}/a.pdf"
+    saved = repo.save_document.call_args.args[0]
+    assert saved.content_hash is None
+    assert repo.update_document_file_metadata.call_args.kwargs["status"] == "UPLOADING"
+    storage.generate_presigned_upload_url.assert_called_once_with(
+        result.storage_key, content_type=_PDF, expires_in_seconds=300
+    )
+    # R: El vencimiento se agenda con la vida de la URL + gracia.
+    queue.schedule_upload_expiry.assert_called_once_with(
+        result.document_id, workspace_id=_WS_ID, delay_seconds=300 + 300
+    )
+
+
+def test_create_fails_reservation_when_expiry_cannot_be_scheduled():
+    repo = MagicMock()
+    storage = MagicMock()
+    queue = MagicMock()
+    queue.schedule_upload_expiry.side_effect = RuntimeError("redis down")
+    use_case = CreatePresignedUploadUseCase(
+        repository=repo,
+        workspace_repository=_workspace_repo(),
+        storage=storage,
+        queue=queue,
+        max_upload_bytes=_MAX,
+    )
+
+    result = use_case.execute(
+        CreatePresignedUploadInput(
+            workspace_id=_WS_ID,
+            actor=_ACTOR,
+            title="Doc",
+            file_name="a.pdf",
+            mime_type=_PDF,
+            size_bytes=100,
+        )
+    )
+
+    assert result.error.code == DocumentErrorCode.SERVICE_UNAVAILABLE
+    kwargs = repo.transition_document_status.call_args.kwargs
+    assert kwargs["from_statuses"] == ["UPLOADING"]
+    assert kwargs["to_status"] == "FAILED"
+    storage.generate_presigned_upload_url.assert_not_called()
+
+
+def test_create_rejects_declared_size_over_limit():
+    repo = MagicMock()
+    use_case = CreatePresignedUploadUseCase(
+        repository=repo,
+        workspace_repository=_workspace_repo(),
+        storage=MagicMock(),
+        queue=MagicMock(),
+        max_upload_bytes=_MAX,
+    )
+
+    result = use_case.execute(
+        CreatePresignedUploadInput(
+            workspace_id=_WS_ID,
+            actor=_ACTOR,
+            title="Doc",
+            file_name="a.pdf",
+            mime_type=_PDF,
+            size_bytes=_MAX + 1,
+        )
+    )
+
+    assert result.error.code == DocumentErrorCode.VALIDATION_ERROR
+    repo.save_document.assert_not_called()
+
+
+def test_complete_verifies_object_and_enqueues():
+    doc = _uploading_doc()
+    storage = MagicMock()
+    storage.head_file.return_value = StoredObjectInfo(size_bytes=10, content_type=_PDF)
+    queue = MagicMock()
+
+    result, repo = _complete(doc, storage, queue)
+
+    assert result.error is None
+    assert result.status == "PENDING"
+    assert repo.transition_document_status.call_args.kwargs["from_statuses"] == [
+        "UPLOADING"
+    ]
+    queue.enqueue_document_processing.assert_called_once_with(
+        doc.id, workspace_id=_WS_ID
+    )
+
+
+def test_complete_rejects_mismatched_object():
+    doc = _uploading_doc()
+    storage = MagicMock()
+    storage.head_file.return_value = StoredObjectInfo(
+        size_bytes=10, content_type="text/html"
+    )
+    queue = MagicMock()
+
+    result, repo = _complete(doc, storage, queue)
+
+    assert result.error.code == DocumentErrorCode.VALIDATION_ERROR
+    assert repo.transition_document_status.call_args.kwargs["to_status"] == "FAILED"
+    storage.delete_file.assert_called_once_with(doc.storage_key)
+    queue.enqueue_document_processing.assert_not_called()
+
+
+def test_complete_is_idempotent_after_enqueue():
+    doc = _uploading_doc(status="PENDING")
+    storage = MagicMock()
+    queue = MagicMock()
+
+    result, _ = _complete(doc, storage, queue)
+
+    assert result.error is None
+    assert result.status == "PENDING"
+    storage.head_file.assert_not_called()
+    queue.enqueue_document_processing.assert_not_called()
+
+
+def test_expire_fails_abandoned_upload_and_deletes_object():
+    doc = _uploading_doc()
+    repo = MagicMock()
+    repo.transition_document_status.return_value = True
+    repo.get_document.return_value = doc
+    storage = MagicMock()
+
+    expired = ExpirePresignedUploadUseCase(repository=repo, storage=storage).execute(
+        ExpirePresignedUploadInput(workspace_id=_WS_ID, document_id=doc.id)
+    )
+
+    assert expired is True
+    kwargs = repo.transition_document_status.call_args.kwargs
+    assert kwargs["from_statuses"] == ["UPLOADING"]
+    assert kwargs["to_status"] == "FAILED"
+    storage.delete_file.assert_called_once_with(doc.storage_key)
+
+
+def test_expire_leaves_completed_upload_untouched():
+    doc = _uploading_doc(status="PENDING")
+    repo = MagicMock()
+    repo.transition_document_status.return_value = False
+    storage = MagicMock()
+
+    expired = ExpirePresignedUploadUseCase(repository=repo, storage=storage).execute(
+        ExpirePresignedUploadInput(workspace_id=_WS_ID, document_id=doc.id)
+    )
+
+    assert expired is False
+    storage.delete_file.assert_not_called()
+
+
+def test_worker_flags_duplicate_direct_upload():
+    content = b"%PDF-same-bytes"
+    doc = _uploading_doc(status="PENDING")
+    original = _uploading_doc(status="READY")
+    repo = MagicMock()
+    repo.get_document.return_value = doc
+    repo.transition_document_status.return_value = True
+    repo.set_document_content_hash.return_value = False
+    repo.get_document_by_content_hash.return_value = original
+    storage = MagicMock()
+    storage.download_file.return_value = content
+    extractor = MagicMock()
+    use_case = ProcessUploadedDocumentUseCase(
+        repository=repo,
+        storage=storage,
+        extractor=extractor,
+        chunker=MagicMock(),
+        embedding_service=MagicMock(),
+    )
+
+    output = use_case.execute(
+        ProcessUploadedDocumentInput(document_id=doc.id, workspace_id=_WS_ID)
+    )
+
+    assert output.status == "FAILED"
+    repo.set_document_content_hash.assert_called_once_with(
+        doc.id,
+        workspace_id=_WS_ID,
+        content_hash=compute_file_hash(_WS_ID, content),
+    )
+    last = repo.transition_document_status.call_args.kwargs
+    assert last["error_message"] == f"Duplicate of document {original.id}"
+    extractor.extract_text.assert_not_called()
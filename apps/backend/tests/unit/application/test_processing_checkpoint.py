@@ -0,0 +1,224 @@
+"""
+Name: Checkpointed Processing Tests
+
+Responsibilities:
+  - Verify each batch is saved together with its progress checkpoint
+  - Verify a failed run keeps committed batches and the retry resumes
+  - Verify a retried job can take over its own PROCESSING run
+  - Verify a checkpoint with a different fingerprint is discarded
+  - Verify resumed 2-tier runs derive nodes from stored (ndarray) embeddings
+"""
+
+from unittest.mock import MagicMock
+from uuid import uuid4, uuid5
+
+import numpy as np
+import pytest
+from app.application.usecases import (
+    ProcessUploadedDocumentInput,
+    ProcessUploadedDocumentUseCase,
+)
+from app.application.usecases.ingestion.process_uploaded_document import (
+    _processing_fingerprint,
+)
+from app.domain.entities import Chunk, Document
+
+pytestmark = pytest.mark.unit
+
+_TEXT = "uno dos tres cuatro cinco"
+
+
+def _document(**overrides) -> Document:
+    values = dict(
+        id=uuid4(),
+        workspace_id=uuid4(),
+        title="Doc",
+        file_name="file.pdf",
+        mime_type="application/pdf",
+        storage_key="documents/1/file.pdf",
+        status="PENDING",
+        content_hash="hash",
+    )
+    values.update(overrides)
+    return Document(**values)
+
+
+def _use_case(doc: Document, repo: MagicMock, embedding_service: MagicMock, **options):
+    repo.get_document.return_value = doc
+    repo.transition_document_status.return_value = True
+    repo.find_chunk_embeddings_by_hash.return_value = {}
+    storage = MagicMock()
+    storage.download_file.return_value = b"pdf"
+    extractor = MagicMock()
+    extractor.extract_text.return_value = _TEXT
+    chunker = MagicMock()
+    chunker.chunk.side_effect = lambda text: text.split()
+    return ProcessUploadedDocumentUseCase(
+        repository=repo,
+        storage=storage,
+        extractor=extractor,
+        chunker=chunker,
+        embedding_service=embedding_service,
+        pipeline_batch_size=2,
+        pipeline_queue_size=1,
+        checkpoint_enabled=True,
+        **options,
+    )
+
+
+def _embedder() -> MagicMock:
+    service = MagicMock()
+    service.embed_batch.side_effect = lambda texts: [[0.1]] * len(texts)
+    return service
+
+
+def _fingerprint(content_hash: str = "hash") -> str:
+    return _processing_fingerprint(content_hash, MagicMock(), MagicMock())
+
+
+def _run(
+    doc: Document, repo: MagicMock, embedder: MagicMock, job_id="job-1", **options
+):
+    return _use_case(doc, repo, embedder, **options).execute(
+        ProcessUploadedDocumentInput(
+            document_id=doc.id, workspace_id=doc.workspace_id, job_id=job_id
+        )
+    )
+
+
+def test_batches_commit_progress_with_known_total():
+    doc = _document()
+    repo = MagicMock()
+
+    result = _run(doc, repo, _embedder())
+
+    assert result.status == "READY"
+    assert result.chunks_created == 5
+    progress = [call.kwargs["checkpoint"] for call in repo.save_chunks.call_args_list]
+    assert [(p.chunks_done, p.chunks_total) for p in progress] == [
+        (2, 5),
+        (4, 5),
+        (5, 5),
+    ]
+    assert {p.owner for p in progress} == {"job-1"}
+    assert {p.fingerprint for p in progress} == {_fingerprint()}
+    final = repo.save_processing_checkpoint.call_args.args[1]
+    assert final.run_id is None
+    assert (final.chunks_done, final.chunks_total) == (5, 5)
+
+
+def test_failed_run_keeps_committed_batches_and_retry_resumes():
+    doc = _document()
+    repo = MagicMock()
+    repo.save_chunks.side_effect = [None, RuntimeError("worker died")]
+
+    failed = _run(doc, repo, _embedder())
+
+    assert failed.status == "FAILED"
+    repo.delete_chunks_for_document.assert_not_called()
+    committed = repo.save_chunks.call_args_list[0].kwargs["checkpoint"]
+
+    resumed_doc = _document(
+        id=doc.id,
+        workspace_id=doc.workspace_id,
+        status="FAILED",
+        processing_run_id=committed.run_id,
+        processing_chunks_done=committed.chunks_done,
+        processing_chunks_total=5,
+        processing_fingerprint=committed.fingerprint,
+    )
+    retry_repo = MagicMock()
+    embedder = _embedder()
+
+    result = _run(resumed_doc, retry_repo, embedder)
+
+    assert result.status == "READY"
+    assert result.chunks_created == 3
+    embedded = [t for call in embedder.embed_batch.call_args_list for t in call[0][0]]
+    assert embedded == ["tres", "cuatro", "cinco"]
+    saved = [c for call in retry_repo.save_chunks.call_args_list for c in call[0][1]]
+    assert [c.chunk_index for c in saved] == [2, 3, 4]
+    keep = list(
+        retry_repo.delete_chunks_for_document.call_args.kwargs["keep_chunk_ids"]
+    )
+    assert keep == [uuid5(committed.run_id, str(i)) for i in range(5)]
+    assert keep[2:] == [c.chunk_id for c in saved]
+
+
+def test_retried_job_takes_over_its_own_processing_run():
+    run_id = uuid4()
+    doc = _document(
+        status="PROCESSING",
+        processing_run_id=run_id,
+        processing_owner="job-1",
+        processing_chunks_done=4,
+        processing_fingerprint=_fingerprint(),
+    )
+    repo = MagicMock()
+
+    other = _run(doc, MagicMock(), _embedder(), job_id="job-2")
+    result = _run(doc, repo, _embedder(), job_id="job-1")
+
+    assert other.status == "PROCESSING"
+    assert result.status == "READY"
+    assert result.chunks_created == 1
+    repo.transition_document_status.assert_called_once()
+    assert repo.transition_document_status.call_args.kwargs["to_status"] == "READY"
+
+
+def test_checkpoint_with_other_fingerprint_restarts_from_zero():
+    run_id = uuid4()
+    doc = _document(
+        status="FAILED",
+        processing_run_id=run_id,
+        processing_chunks_done=4,
+        processing_chunks_total=5,
+        processing_fingerprint=_fingerprint("previous-file-hash"),
+    )
+    repo = MagicMock()
+    embedder = _embedder()
+
+    result = _run(doc, repo, embedder)
+
+    assert result.status == "READY"
+    assert result.chunks_created == 5
+    started = repo.save_processing_checkpoint.call_args_list[0].args[1]
+    assert started.run_id not in (None, run_id)
+    assert started.fingerprint == _fingerprint()
+    embedded = [t for call in embedder.embed_batch.call_args_list for t in call[0][0]]
+    assert embedded == _TEXT.split()
+
+
+def test_resumed_run_builds_nodes_from_ndarray_embeddings():
+    run_id = uuid4()
+    doc = _document(
+        status="FAILED",
+        processing_run_id=run_id,
+        processing_chunks_done=2,
+        processing_chunks_total=5,
+        processing_fingerprint=_fingerprint(),
+    )
+    repo = MagicMock()
+    # R: pgvector devuelve np.ndarray al releer los chunks de la corrida.
+    repo.find_chunks_by_node_spans.return_value = [
+        Chunk(
+            content=word,
+            embedding=np.asarray([0.1, 0.2], dtype=np.float32),
+            chunk_index=index,
+        )
+        for index, word in enumerate(_TEXT.split())
+    ]
+
+    result = _run(
+        doc,
+        repo,
+        _embedder(),
+        enable_2tier_retrieval=True,
+        node_group_size=2,
+        node_embedding_strategy="mean",
+    )
+
+    assert result.status == "READY"
+    nodes = repo.save_nodes.call_args.args[1]
+    assert [(n.span_start, n.span_end) for n in nodes] == [(0, 1), (2, 3), (4, 4)]
+    assert all(isinstance(n.embedding, list) for n in nodes)
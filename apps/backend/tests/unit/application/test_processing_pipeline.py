@@ -0,0 +1,159 @@
+"""
+Name: Processing Pipeline Tests
+
+Responsibilities:
+  - Validate incremental chunking and indexed batching
+  - Validate bounded pipeline ordering and error propagation
+  - Validate pipelined ProcessUploadedDocumentUseCase (READY / FAILED)
+"""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from app.application.usecases import (
+    ProcessUploadedDocumentInput,
+    ProcessUploadedDocumentUseCase,
+)
+from app.application.usecases.ingestion.processing_pipeline import (
+    iter_chunks_incremental,
+    iter_indexed_batches,
+    run_bounded_pipeline,
+)
+from app.domain.entities import Document
+
+pytestmark = pytest.mark.unit
+
+
+def _document() -> Document:
+    return Document(
+        id=uuid4(),
+        workspace_id=uuid4(),
+        title="Doc",
+        source=None,
+        metadata={},
+        file_name="file.pdf",
+        mime_type="application/pdf",
+        storage_key="documents/1/file.pdf",
+        uploaded_by_user_id=None,
+        status="PENDING",
+    )
+
+
+class _WindowChunker:
+    """Chunker determinístico: ventanas fijas sin overlap."""
+
+    def chunk(self, text: str) -> list[str]:
+        return [text[i : i + 40] for i in range(0, len(text), 40)]
+
+
+def test_incremental_chunking_reconstructs_full_text():
+    pages = [f"Página {i}. " + "texto " * 30 for i in range(6)]
+
+    chunks = list(iter_chunks_incremental(_WindowChunker(), pages, buffer_chars=200))
+
+    assert "".join(chunks) == "\n\n".join(pages)
+    assert all(len(c) <= 40 for c in chunks)
+
+
+def test_incremental_chunking_flushes_oversized_single_chunk():
+    chunker = MagicMock()
+    chunker.chunk.side_effect = lambda text: [text]
+
+    chunks = list(iter_chunks_incremental(chunker, ["a" * 30] * 3, buffer_chars=10))
+
+    assert chunks == ["a" * 30, "a" * 30, "a" * 30]
+
+
+def test_indexed_batches_carry_start_index():
+    batches = list(iter_indexed_batches(["a", "b", "c", "d", "e"], 2))
+
+    assert batches == [(0, ["a", "b"]), (2, ["c", "d"]), (4, ["e"])]
+
+
+def test_indexed_batches_skip_keeps_absolute_indexes():
+    batches = list(iter_indexed_batches(["a", "b", "c", "d", "e"], 2, skip=3))
+
+    assert batches == [(3, ["d", "e"])]
+
+
+def test_bounded_pipeline_preserves_order():
+    out: list[int] = []
+
+    run_bounded_pipeline(range(20), [lambda x: x * 2, out.append], queue_size=1)
+
+    assert out == [x * 2 for x in range(20)]
+
+
+def test_bounded_pipeline_propagates_stage_error():
+    def _boom(item: int) -> int:
+        if item == 3:
+            raise RuntimeError("stage failed")
+        return item
+
+    with pytest.raises(RuntimeError, match="stage failed"):
+        run_bounded_pipeline(range(1000), [_boom, lambda _: None], queue_size=1)
+
+
+def _use_case(doc: Document, repo: MagicMock, embedding_service: MagicMock):
+    repo.get_document.return_value = doc
+    repo.transition_document_status.return_value = True
+    repo.find_chunk_embeddings_by_hash.return_value = {}
+    storage = MagicMock()
+    storage.download_file.return_value = b"pdf"
+    extractor = MagicMock()
+    extractor.iter_text.return_value = iter(["uno dos", "tres cuatro cinco"])
+    chunker = MagicMock()
+    chunker.chunk.side_effect = lambda text: text.split()
+    return ProcessUploadedDocumentUseCase(
+        repository=repo,
+        storage=storage,
+        extractor=extractor,
+        chunker=chunker,
+        embedding_service=embedding_service,
+        enable_pipeline=True,
+        pipeline_batch_size=2,
+        pipeline_queue_size=1,
+    )
+
+
+def test_pipelined_processing_saves_batches_and_replaces_old_chunks():
+    doc = _document()
+    repo = MagicMock()
+    embedding_service = MagicMock()
+    embedding_service.embed_batch.side_effect = lambda texts: [[0.1]] * len(texts)
+
+    result = _use_case(doc, repo, embedding_service).execute(
+        ProcessUploadedDocumentInput(document_id=doc.id, workspace_id=doc.workspace_id)
+    )
+
+    assert result.status == "READY"
+    assert result.chunks_created == 5
+    saved = [c for call in repo.save_chunks.call_args_list for c in call[0][1]]
+    assert [c.content for c in saved] == ["uno", "dos", "tres", "cuatro", "cinco"]
+    assert [c.chunk_index for c in saved] == [0, 1, 2, 3, 4]
+    assert repo.save_chunks.call_count == 3
+
+    keep = repo.delete_chunks_for_document.call_args.kwargs["keep_chunk_ids"]
+    assert list(keep) == [c.chunk_id for c in saved]
+    assert repo.transition_document_status.call_args.kwargs["to_status"] == "READY"
+
+
+def test_pipelined_processing_failure_cleans_up_and_marks_failed():
+    doc = _document()
+    repo = MagicMock()
+    repo.save_chunks.side_effect = [None, RuntimeError("db down")]
+    embedding_service = MagicMock()
+    embedding_service.embed_batch.side_effect = lambda texts: [[0.1]] * len(texts)
+
+    result = _use_case(doc, repo, embedding_service).execute(
+        ProcessUploadedDocumentInput(document_id=doc.id, workspace_id=doc.workspace_id)
+    )
+
+    assert result.status == "FAILED"
+    repo.delete_chunks_for_document.assert_called_once_with(
+        doc.id, workspace_id=doc.workspace_id
+    )
+    last_transition = repo.transition_document_status.call_args.kwargs
+    assert last_transition["to_status"] == "FAILED"
+    assert "db down" in last_transition["error_message"]
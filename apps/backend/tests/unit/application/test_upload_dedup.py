@@ -6,15 +6,17 @@ Responsibilities:
   - Verify new file uploads normally with content_hash persisted
   - Verify cross-workspace isolation (same file bytes, different workspace)
   - Verify race condition recovery (save fails, re-read returns existing)
+  - Verify streaming uploads hash by chunks and upload the rewound stream
 """
 
 from __future__ import annotations
 
+import io
 from unittest.mock import MagicMock, Mock
 from uuid import UUID, uuid4
 
 import pytest
-from app.application.content_hash import compute_file_hash
+from app.application.content_hash import compute_file_hash, compute_file_hash_stream
 from app.application.usecases.ingestion.upload_document import (
     UploadDocumentInput,
     UploadDocumentUseCase,
@@ -174,3 +176,33 @@ class TestUploadDedup:
         h1 = compute_file_hash(_WS_ID, _FILE_BYTES)
         h2 = compute_file_hash(_WS_ID_2, _FILE_BYTES)
         assert h1 != h2
+
+    def test_streaming_hash_matches_bytes_hash(self):
+        """Chunked hashing yields the same digest as the in-memory hash."""
+        stream = io.BytesIO(_FILE_BYTES * 50)
+
+        streamed = compute_file_hash_stream(_WS_ID, stream, chunk_size=7)
+
+        assert streamed == compute_file_hash(_WS_ID, _FILE_BYTES * 50)
+
+    def test_stream_content_is_hashed_and_uploaded_from_start(
+        self,
+        mock_repository,
+    ):
+        """Stream input: dedup hash from a first pass, upload gets the rewound stream."""
+        mock_repository.get_document_by_content_hash.return_value = None
+        storage = MagicMock()
+        uploaded: list[bytes] = []
+        storage.upload_file.side_effect = lambda key, content, ct: uploaded.append(
+            content.read()
+        )
+        uc = _build_use_case(mock_repository, storage, MagicMock(), _workspace())
+        stream = io.BytesIO(_FILE_BYTES)
+        stream.seek(3)
+
+        result = uc.execute(_upload_input(content=stream))
+
+        assert result.error is None
+        assert uploaded == [_FILE_BYTES]
+        saved_doc = mock_repository.save_document.call_args[0][0]
+        assert saved_doc.content_hash == compute_file_hash(_WS_ID, _FILE_BYTES)
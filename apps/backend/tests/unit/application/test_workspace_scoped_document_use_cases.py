@@ -4,6 +4,7 @@ Name: Workspace-scoped Document Use Case Tests
 Responsibilities:
   - Verify workspace permission checks for document use cases
   - Ensure cross-workspace access is denied
+  - Verify document status exposes processing progress
 """
 
 from uuid import uuid4
@@ -13,6 +14,10 @@ import pytest
 from app.application.usecases.documents.get_document import GetDocumentUseCase
 from app.application.usecases.documents.list_documents import ListDocumentsUseCase
 from app.application.usecases.documents.document_results import DocumentErrorCode
+from app.application.usecases.ingestion.get_document_status import (
+    GetDocumentProcessingStatusInput,
+    GetDocumentProcessingStatusUseCase,
+)
 from app.domain.entities import Document, Workspace, WorkspaceVisibility
 from app.domain.workspace_policy import WorkspaceActor
 from app.identity.users import UserRole
@@ -108,3 +113,37 @@ def test_get_document_denies_cross_workspace_access():
 
     assert result.error is not None
     assert result.error.code == DocumentErrorCode.NOT_FOUND
+
+
+@pytest.mark.unit
+def test_get_document_status_reports_checkpoint_progress():
+    workspace = Workspace(
+        id=uuid4(), name="Workspace", visibility=WorkspaceVisibility.PRIVATE
+    )
+    document = Document(
+        id=uuid4(),
+        workspace_id=workspace.id,
+        title="Doc",
+        status="PROCESSING",
+        processing_chunks_done=30,
+        processing_chunks_total=120,
+    )
+    actor = WorkspaceActor(user_id=uuid4(), role=UserRole.ADMIN)
+
+    use_case = GetDocumentProcessingStatusUseCase(
+        document_repository=_DocumentRepo(document),
+        workspace_repository=_WorkspaceRepo(workspace),
+        acl_repository=_AclRepo(),
+    )
+
+    result = use_case.execute(
+        GetDocumentProcessingStatusInput(
+            workspace_id=workspace.id, document_id=document.id, actor=actor
+        )
+    )
+
+    assert result.error is None
+    assert result.status == "PROCESSING"
+    assert (result.chunks_done, result.chunks_total) == (30, 120)
+    assert result.progress == pytest.approx(0.25)
+    assert result.document is document
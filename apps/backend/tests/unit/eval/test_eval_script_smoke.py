@@ -5,6 +5,7 @@ Responsibilities:
   - Verify eval_rag.run_evaluation produces a valid report.
   - Verify report structure has expected fields and sane values.
   - Verify deterministic output (same dataset → same scores).
+  - Verify the node strategy comparison reports every strategy.
 """
 
 import json
@@ -95,3 +96,20 @@ class TestEvalScriptSmoke:
         output = json.dumps(report_dict)
         parsed = json.loads(output)
         assert parsed["metrics"] == eval_report.metrics
+
+
+def test_node_strategy_comparison_reports_provider_cost():
+    from scripts.eval_rag import run_node_strategy_comparison
+
+    comparison = run_node_strategy_comparison(
+        corpus_path=_DATASET_DIR / "corpus.jsonl",
+        queries_path=_DATASET_DIR / "golden_queries.jsonl",
+        top_k=5,
+    )
+
+    assert set(comparison) == {"provider", "mean", "length_weighted"}
+    assert comparison["provider"]["provider_texts"] == comparison["provider"]["nodes"]
+    assert comparison["mean"]["provider_texts"] == 0
+    assert comparison["length_weighted"]["provider_texts"] == 0
+    for values in comparison.values():
+        assert 0.0 <= values["mrr"] <= 1.0
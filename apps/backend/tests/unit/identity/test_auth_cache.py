@@ -0,0 +1,154 @@
+"""
+Name: Auth Cache Tests
+
+Responsibilities:
+  - Validate verified-token caching (no re-decode until exp)
+  - Validate user lookup caching by user_id with TTL
+  - Ensure user writes invalidate the cached user (deactivation is immediate)
+  - Ensure the user repo invalidates via the injected port (no identity import)
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import jwt
+import pytest
+from app.crosscutting.error_responses import AppHTTPException
+from app.identity.auth_cache import AuthCache, invalidate_cached_user
+from app.identity.auth_users import (
+    create_access_token,
+    decode_access_token,
+    get_current_user,
+    hash_password,
+)
+from app.identity.users import User, UserRole
+
+pytestmark = pytest.mark.unit
+
+
+def _settings(secret: str = "test-secret"):
+    return SimpleNamespace(
+        jwt_secret=secret,
+        jwt_access_ttl_minutes=30,
+        jwt_cookie_name="access_token",
+        jwt_cookie_secure=False,
+    )
+
+
+def _user(*, is_active: bool = True, user_id=None) -> User:
+    return User(
+        id=user_id or uuid4(),
+        email="user@example.com",
+        password_hash=hash_password("secret"),
+        role=UserRole.EMPLOYEE,
+        is_active=is_active,
+    )
+
+
+def test_verified_token_is_not_decoded_twice():
+    settings = _settings()
+    token, _ = create_access_token(_user(), settings=settings)
+
+    with patch("app.identity.auth_users.jwt.decode", wraps=jwt.decode) as decode:
+        first = decode_access_token(token, settings=settings)
+        second = decode_access_token(token, settings=settings)
+
+    assert first == second
+    assert first.expires_at is not None
+    assert decode.call_count == 1
+
+
+def test_token_cache_is_keyed_by_secret():
+    token, _ = create_access_token(_user(), settings=_settings("secret-a"))
+    decode_access_token(token, settings=_settings("secret-a"))
+
+    with pytest.raises(AppHTTPException):
+        decode_access_token(token, settings=_settings("secret-b"))
+
+
+def test_token_entry_expires_at_exp():
+    clock = SimpleNamespace(now=1000.0)
+    cache = AuthCache(clock=lambda: clock.now)
+    cache.put_token("tok", "s", "payload", expires_at=1010.0)
+
+    assert cache.get_token("tok", "s") == "payload"
+    clock.now = 1010.0
+    assert cache.get_token("tok", "s") is None
+
+
+def test_current_user_is_cached_by_user_id():
+    settings = _settings()
+    user = _user()
+    token, _ = create_access_token(user, settings=settings)
+
+    with patch("app.identity.auth_users.get_auth_settings", return_value=settings):
+        with patch(
+            "app.identity.auth_users.get_user_by_id", return_value=user
+        ) as get_user:
+            assert get_current_user(token) == user
+            assert get_current_user(token) == user
+
+    assert get_user.call_count == 1
+
+
+def test_user_invalidation_propagates_deactivation():
+    settings = _settings()
+    user = _user()
+    inactive = _user(is_active=False, user_id=user.id)
+    token, _ = create_access_token(user, settings=settings)
+
+    with patch("app.identity.auth_users.get_auth_settings", return_value=settings):
+        with patch("app.identity.auth_users.get_user_by_id", return_value=user):
+            get_current_user(token)
+        invalidate_cached_user(user.id)
+        with patch("app.identity.auth_users.get_user_by_id", return_value=inactive):
+            with pytest.raises(AppHTTPException) as exc:
+                get_current_user(token)
+
+    assert exc.value.status_code == 403
+
+
+def test_user_entry_expires_after_ttl():
+    clock = SimpleNamespace(now=0.0)
+    cache = AuthCache(user_ttl_seconds=30, clock=lambda: clock.now)
+    user = _user()
+    cache.put_user(user, epoch=cache.user_epoch)
+
+    assert cache.get_user(user.id) is user
+    clock.now = 31.0
+    assert cache.get_user(user.id) is None
+
+
+def test_load_started_before_invalidation_is_not_cached():
+    cache = AuthCache()
+    user = _user()
+    epoch = cache.user_epoch
+    cache.invalidate_user(user.id)
+    cache.put_user(user, epoch=epoch)
+
+    assert cache.get_user(user.id) is None
+
+
+def test_zero_ttl_disables_user_cache():
+    cache = AuthCache(user_ttl_seconds=0)
+    user = _user()
+    cache.put_user(user, epoch=cache.user_epoch)
+
+    assert cache.get_user(user.id) is None
+
+
+def test_user_repository_write_invalidates_through_injected_port():
+    from app.identity.auth_cache import get_auth_cache
+    from app.infrastructure.repositories.postgres import user as user_repo
+
+    cache = get_auth_cache()
+    user = _user()
+    cache.put_user(user, epoch=cache.user_epoch)
+
+    with patch.object(user_repo, "_fetchone", return_value=None):
+        user_repo.set_user_active(user.id, False)
+
+    assert cache.get_user(user.id) is None
@@ -0,0 +1,104 @@
+"""
+Name: Extraction Cache Tests
+
+Responsibilities:
+  - Verify identical bytes skip parsing (extract_text and iter_text)
+  - Verify keys change with parser options but not with parallelism settings
+  - Verify the disk backend evicts least recently used blobs
+  - Verify cache failures degrade to a parse (best-effort)
+"""
+
+import io
+from unittest.mock import MagicMock
+
+import pytest
+from app.infrastructure.parsers.contracts import ExtractedText, ParserOptions
+from app.infrastructure.parsers.document_text_extractor import (
+    SimpleDocumentTextExtractor,
+)
+from app.infrastructure.parsers.extraction_cache import (
+    DiskExtractionCacheBackend,
+    ExtractionCache,
+)
+from app.infrastructure.parsers.registry import ParserRegistry
+
+pytestmark = pytest.mark.unit
+
+_MIME = "application/x-test"
+
+
+def _extractor(tmp_path, parser, options: ParserOptions | None = None):
+    options = options or ParserOptions()
+    registry = ParserRegistry()
+    registry.register(_MIME, lambda: parser)
+    cache = ExtractionCache(
+        DiskExtractionCacheBackend(str(tmp_path), max_bytes=1024 * 1024),
+        options=options,
+    )
+    return SimpleDocumentTextExtractor(registry=registry, options=options, cache=cache)
+
+
+def test_extract_text_hits_cache_for_identical_bytes(tmp_path):
+    parser = MagicMock(spec=["parse"])
+    parser.parse.return_value = ExtractedText(content="texto extraído")
+    extractor = _extractor(tmp_path, parser)
+
+    first = extractor.extract_text(_MIME, b"same-bytes")
+    second = extractor.extract_text(_MIME, io.BytesIO(b"same-bytes"))
+
+    assert first == second == "texto extraído"
+    parser.parse.assert_called_once()
+
+
+def test_iter_text_caches_pages_only_after_full_iteration(tmp_path):
+    parser = MagicMock(spec=["parse", "iter_pages"])
+    parser.iter_pages.side_effect = lambda content, options: iter(["p1", "p2"])
+    extractor = _extractor(tmp_path, parser)
+
+    partial = extractor.iter_text(_MIME, b"pdf")
+    next(partial)
+    partial.close()
+    assert list(extractor.iter_text(_MIME, b"pdf")) == ["p1", "p2"]
+    assert list(extractor.iter_text(_MIME, b"pdf")) == ["p1", "p2"]
+
+    assert parser.iter_pages.call_count == 2
+
+
+def test_cache_key_depends_on_output_affecting_options_only():
+    backend = MagicMock()
+    base = ExtractionCache(backend, options=ParserOptions())
+    parallel = ExtractionCache(backend, options=ParserOptions(pdf_parallel_workers=4))
+    limited = ExtractionCache(backend, options=ParserOptions(max_chars=10))
+
+    key = base.key_for(_MIME, b"x", mode="text")
+
+    assert parallel.key_for(_MIME, b"x", mode="text") == key
+    assert limited.key_for(_MIME, b"x", mode="text") != key
+    assert base.key_for(_MIME, b"x", mode="pages") != key
+    assert base.key_for(_MIME, b"y", mode="text") != key
+
+
+def test_disk_backend_evicts_least_recently_used(tmp_path):
+    backend = DiskExtractionCacheBackend(str(tmp_path), max_bytes=10)
+
+    backend.set("a", b"123456")
+    backend.set("b", b"123456")
+
+    assert backend.get("a") is None
+    assert backend.get("b") == b"123456"
+
+
+def test_backend_errors_fall_back_to_parsing():
+    backend = MagicMock()
+    backend.get.side_effect = RuntimeError("storage down")
+    backend.set.side_effect = RuntimeError("storage down")
+    parser = MagicMock(spec=["parse"])
+    parser.parse.return_value = ExtractedText(content="ok")
+    registry = ParserRegistry()
+    registry.register(_MIME, lambda: parser)
+    extractor = SimpleDocumentTextExtractor(
+        registry=registry,
+        cache=ExtractionCache(backend, options=ParserOptions()),
+    )
+
+    assert extractor.extract_text(_MIME, b"bytes") == "ok"
@@ -0,0 +1,163 @@
+"""
+Name: PDF Parallel Extraction Tests
+
+Responsibilities:
+  - Verify parallel extraction matches serial output (order + page offsets)
+  - Verify max_pages / max_chars limits in parallel mode
+  - Verify forked children (rq work-horses) fall back to serial extraction
+  - Verify the worker job path uses the pool under the in-process lane worker
+"""
+
+import io
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from app.crosscutting.config import get_settings
+from app.domain.entities import Document
+from app.infrastructure.parsers.contracts import ParserOptions
+from app.infrastructure.parsers import pdf_parser
+from app.infrastructure.parsers.pdf_parser import PdfParser
+from app.worker.jobs import process_document_job
+from app.worker.lanes import build_lane_worker
+
+pytestmark = pytest.mark.unit
+
+pypdf = pytest.importorskip("pypdf")
+from pypdf.generic import (  # noqa: E402
+    DecodedStreamObject,
+    DictionaryObject,
+    NameObject,
+)
+
+_PARALLEL = {"pdf_parallel_workers": 2, "pdf_parallel_min_pages": 2}
+
+
+def _make_pdf(texts: list[str]) -> bytes:
+    writer = pypdf.PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for text in texts:
+        page = writer.add_blank_page(width=300, height=100)
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 12 Tf 10 50 Td ({text}) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(stream)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="module")
+def pdf_bytes() -> bytes:
+    return _make_pdf([f"Page {i}" for i in range(8)])
+
+
+def test_parallel_matches_serial_with_page_offsets(pdf_bytes):
+    serial = PdfParser().parse(pdf_bytes, options=ParserOptions())
+    parallel = PdfParser().parse(pdf_bytes, options=ParserOptions(**_PARALLEL))
+
+    assert parallel.content == serial.content
+    assert parallel.metadata == serial.metadata
+    offsets = parallel.metadata["page_offsets"]
+    assert [o["page"] for o in offsets] == list(range(8))
+    assert parallel.content[offsets[3]["start"] : offsets[3]["end"]] == "Page 3"
+
+
+def test_parallel_honors_max_pages_and_max_chars(pdf_bytes):
+    by_pages = PdfParser().parse(
+        pdf_bytes, options=ParserOptions(max_pages=3, **_PARALLEL)
+    )
+    by_chars = PdfParser().parse(
+        pdf_bytes, options=ParserOptions(max_chars=15, **_PARALLEL)
+    )
+
+    assert by_pages.content == "Page 0\nPage 1\nPage 2"
+    assert by_pages.warnings == ["PDF truncado por max_pages=3"]
+    assert by_chars.content == "Page 0\nPage 1\nP"
+    assert by_chars.was_truncated
+    assert by_chars.metadata["page_offsets"][-1] == {"page": 2, "start": 14, "end": 15}
+
+
+def test_forked_child_extracts_serially(pdf_bytes, monkeypatch):
+    for name in ("_pool", "_pool_workers", "_pool_lock", "_forked_child"):
+        monkeypatch.setattr(pdf_parser, name, getattr(pdf_parser, name))
+    pdf_parser._after_fork_in_child()
+
+    def _no_pool(workers):
+        raise AssertionError("no pool in a forked child")
+
+    monkeypatch.setattr(pdf_parser, "_get_pool", _no_pool)
+
+    result = PdfParser().parse(pdf_bytes, options=ParserOptions(**_PARALLEL))
+
+    assert (
+        result.content == PdfParser().parse(pdf_bytes, options=ParserOptions()).content
+    )
+
+
+def test_worker_job_extracts_in_parallel_under_in_process_worker(
+    pdf_bytes, monkeypatch
+):
+    fakeredis = pytest.importorskip("fakeredis")
+    monkeypatch.setattr(pdf_parser, "_pool", None)
+    settings = get_settings().model_copy(
+        update={"pdf_parallel_workers": 2, "pdf_parallel_min_pages": 2}
+    )
+    doc = Document(
+        id=uuid4(),
+        workspace_id=uuid4(),
+        title="Doc",
+        file_name="file.pdf",
+        mime_type="application/pdf",
+        storage_key="documents/1/file.pdf",
+        status="PENDING",
+        content_hash="hash",
+    )
+    repo = MagicMock()
+    repo.get_document.return_value = doc
+    repo.transition_document_status.return_value = True
+    repo.find_chunk_embeddings_by_hash.return_value = {}
+    storage = MagicMock()
+    storage.download_file.return_value = pdf_bytes
+    storage.open_stream.side_effect = lambda key: io.BytesIO(pdf_bytes)
+    chunker = MagicMock()
+    chunker.chunk.side_effect = lambda text: text.split("\n")
+    embeddings = MagicMock()
+    embeddings.embed_batch.side_effect = lambda texts: [[0.1]] * len(texts)
+
+    redis_conn = fakeredis.FakeStrictRedis()
+    worker = build_lane_worker(redis_conn, "documents", {}, in_process=True)
+    job = worker.queues[0].enqueue(
+        process_document_job, str(doc.id), str(doc.workspace_id)
+    )
+    try:
+        with (
+            patch("app.container.get_settings", return_value=settings),
+            patch("app.worker.jobs.get_document_repository", return_value=repo),
+            patch("app.worker.jobs.get_file_storage", return_value=storage),
+            patch("app.worker.jobs.get_text_chunker", return_value=chunker),
+            patch("app.worker.jobs.get_embedding_service", return_value=embeddings),
+        ):
+            worker.work(burst=True)
+
+        assert job.is_finished
+        assert pdf_parser._pool is not None
+        statuses = [
+            c.kwargs["to_status"]
+            for c in repo.transition_document_status.call_args_list
+        ]
+        assert statuses[-1] == "READY"
+        embedded = [t for c in embeddings.embed_batch.call_args_list for t in c[0][0]]
+        assert embedded == [f"Page {i}" for i in range(8)]
+    finally:
+        pdf_parser._reset_pool()
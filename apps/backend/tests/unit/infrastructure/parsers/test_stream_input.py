@@ -0,0 +1,54 @@
+"""
+Name: Parser Stream Input Tests
+
+Responsibilities:
+  - Verify parsers accept seekable streams (spooled temp files) besides bytes
+  - Verify the stream is rewound before parsing
+"""
+
+import tempfile
+
+import pytest
+from app.infrastructure.parsers.contracts import ParserOptions
+from app.infrastructure.parsers.docx_parser import DocxParser
+from app.infrastructure.parsers.pdf_parser import PdfParser
+from app.infrastructure.parsers.registry import TextParser
+
+pytestmark = pytest.mark.unit
+
+
+def _spool(data: bytes):
+    spool = tempfile.SpooledTemporaryFile(max_size=16)
+    spool.write(data)
+    return spool  # sin rebobinar: el parser debe hacer seek(0)
+
+
+def test_text_parser_reads_stream():
+    with _spool("hola mundo".encode()) as stream:
+        result = TextParser().parse(stream, options=ParserOptions())
+
+    assert result.content == "hola mundo"
+
+
+def test_docx_parser_reads_stream():
+    docx = pytest.importorskip("docx")
+    document = docx.Document()
+    document.add_paragraph("Contenido del DOCX")
+
+    with tempfile.SpooledTemporaryFile(max_size=16) as stream:
+        document.save(stream)
+        result = DocxParser().parse(stream, options=ParserOptions())
+
+    assert result.content == "Contenido del DOCX"
+
+
+def test_pdf_parser_reads_stream():
+    pypdf = pytest.importorskip("pypdf")
+    writer = pypdf.PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+
+    with tempfile.SpooledTemporaryFile(max_size=16) as stream:
+        writer.write(stream)
+        result = PdfParser().parse(stream, options=ParserOptions())
+
+    assert result.page_count == 1
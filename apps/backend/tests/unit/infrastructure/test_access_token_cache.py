@@ -0,0 +1,183 @@
+"""
+Name: Access Token Cache Unit Tests
+
+Responsibilities:
+  - Validate reuso del token hasta expiración menos margen (reloj fake)
+  - Validate coalescing: N threads concurrentes => un solo refresh
+  - Validate que los fallos no se cacheen e invalidate()
+  - Validate nivel compartido (Redis fake): hit entre instancias, token cifrado
+"""
+
+import threading
+
+import pytest
+from app.domain.connectors import OAuthAccessToken
+from app.infrastructure.services.access_token_cache import AccessTokenCache
+
+pytestmark = pytest.mark.unit
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Refresher:
+    def __init__(self, *, expires_in: int = 3600, error: Exception | None = None):
+        self.calls = 0
+        self.expires_in = expires_in
+        self.error = error
+
+    def __call__(self) -> OAuthAccessToken:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return OAuthAccessToken(
+            access_token=f"token-{self.calls}", expires_in=self.expires_in
+        )
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class _FakeEncryption:
+    def encrypt(self, plaintext: str) -> str:
+        return f"ENC:{plaintext}"
+
+    def decrypt(self, ciphertext: str) -> str:
+        return ciphertext.removeprefix("ENC:")
+
+
+def test_reuses_token_until_expiry_minus_margin():
+    clock = _Clock()
+    refresh = _Refresher(expires_in=3600)
+    cache = AccessTokenCache(margin_seconds=300, clock=clock)
+
+    assert cache.get_or_refresh("acct", refresh) == "token-1"
+    clock.now += 3299
+    assert cache.get_or_refresh("acct", refresh) == "token-1"
+    assert refresh.calls == 1
+
+    clock.now += 1
+    assert cache.get_or_refresh("acct", refresh) == "token-2"
+    assert refresh.calls == 2
+
+
+def test_keys_are_independent():
+    refresh = _Refresher()
+    cache = AccessTokenCache()
+
+    cache.get_or_refresh("a", refresh)
+    cache.get_or_refresh("b", refresh)
+
+    assert refresh.calls == 2
+
+
+def test_concurrent_callers_share_a_single_refresh():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_refresh():
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return OAuthAccessToken(access_token="shared", expires_in=3600)
+
+    cache = AccessTokenCache()
+    results: list[str] = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(cache.get_or_refresh("acct", slow_refresh))
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    assert started.wait(timeout=5)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(calls) == 1
+    assert results == ["shared"] * 8
+
+
+def test_failed_refresh_is_not_cached():
+    cache = AccessTokenCache()
+    failing = _Refresher(error=ValueError("revoked"))
+
+    with pytest.raises(ValueError, match="revoked"):
+        cache.get_or_refresh("acct", failing)
+
+    ok = _Refresher()
+    assert cache.get_or_refresh("acct", ok) == "token-1"
+    assert ok.calls == 1
+
+
+def test_invalidate_forces_refresh():
+    refresh = _Refresher()
+    cache = AccessTokenCache()
+    cache.get_or_refresh("acct", refresh)
+
+    cache.invalidate("acct")
+
+    assert cache.get_or_refresh("acct", refresh) == "token-2"
+
+
+def test_short_lived_token_is_not_reused():
+    refresh = _Refresher(expires_in=60)
+    cache = AccessTokenCache(margin_seconds=300)
+
+    cache.get_or_refresh("acct", refresh)
+    cache.get_or_refresh("acct", refresh)
+
+    assert refresh.calls == 2
+
+
+def test_shared_level_serves_other_instances_encrypted():
+    clock = _Clock()
+    redis = _FakeRedis()
+    worker_a = AccessTokenCache(
+        redis_client=redis, encryption=_FakeEncryption(), clock=clock
+    )
+    worker_b = AccessTokenCache(
+        redis_client=redis, encryption=_FakeEncryption(), clock=clock
+    )
+    refresh = _Refresher()
+
+    assert worker_a.get_or_refresh("acct", refresh) == "token-1"
+    assert worker_b.get_or_refresh("acct", refresh) == "token-1"
+    assert refresh.calls == 1
+
+    (stored,) = redis.data.values()
+    assert "ENC:token-1" in stored
+    assert "acct" not in "".join(redis.data)
+
+    worker_b.invalidate("acct")
+    assert redis.data == {}
+
+
+def test_redis_requires_encryption():
+    with pytest.raises(ValueError):
+        AccessTokenCache(redis_client=_FakeRedis())
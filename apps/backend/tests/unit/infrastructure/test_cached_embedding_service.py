@@ -72,3 +72,24 @@ class TestCachingEmbeddingService:
 
         assert results == [[3.0], [3.0]]
         assert provider.batch_calls == [["dup"]]
+
+    def test_embed_batch_concurrent_misses_are_sliced_and_ordered(self, monkeypatch):
+        monkeypatch.setenv("EMBEDDING_CACHE_BACKEND", "memory")
+        monkeypatch.delenv("REDIS_URL", raising=False)
+
+        provider = FakeEmbeddingService()
+        provider.batch_limit = 2
+        cache = EmbeddingCache()
+        service = CachingEmbeddingService(
+            provider=provider, cache=cache, max_concurrency=3
+        )
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+        results = service.embed_batch(texts)
+
+        assert results == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        assert sorted(provider.batch_calls) == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+        key = build_embedding_cache_key(
+            provider.model_id, "eeeee", "retrieval_document"
+        )
+        assert cache.get(key) == [5.0]
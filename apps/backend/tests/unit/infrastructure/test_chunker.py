@@ -16,13 +16,18 @@ Notes:
   - Mark with @pytest.mark.unit
 """
 
+from itertools import islice, pairwise
+
 import pytest
 
 from app.infrastructure.text.chunker import (
-    chunk_text,
     SimpleTextChunker,
     _find_best_split,
+    chunk_fragments,
+    chunk_text,
+    iter_fragments,
 )
+from app.infrastructure.text.structured_chunker import StructuredTextChunker
 
 
 @pytest.mark.unit
@@ -176,6 +181,80 @@ class TestFindBestSplit:
 
         assert result == 10  # No separator, return target
 
+    def test_find_split_ignores_separator_after_target(self):
+        """R: Separators must start at or before target (same as rfind)."""
+        text = "AAAAAAAAAA\nBBBBBBBBBB"
+
+        assert _find_best_split(text, target=9, window=5) == 9
+        assert _find_best_split(text, target=10, window=5) == 11
+
+    def test_find_split_prefers_last_occurrence_of_best_separator(self):
+        """R: Should pick the last paragraph break even with later spaces."""
+        text = "aa\n\nbb\n\n\ncc dd ee"
+
+        assert _find_best_split(text, target=14, window=20) == 9
+
+
+@pytest.mark.unit
+class TestIterFragments:
+    """Test suite for the incremental fragment generator."""
+
+    def test_no_truncation_beyond_previous_cap(self):
+        """R: Long texts are fully chunked (no silent max_chunks cut)."""
+        text = "word " * 30000
+
+        fragments = chunk_fragments(text, chunk_size=50, overlap=0)
+
+        assert len(fragments) > 2000
+        assert fragments[-1].end == len(text.strip())
+
+    def test_yields_incrementally(self):
+        """R: First fragments are available without chunking the whole text."""
+        first = list(
+            islice(iter_fragments("x" * 10_000_000, chunk_size=100, overlap=10), 2)
+        )
+
+        assert [f.index for f in first] == [0, 1]
+        assert first[0].next_context == first[1].content[:80]
+
+    def test_neighbour_context(self):
+        """R: prev/next context come from adjacent fragments."""
+        text = "alpha beta gamma delta epsilon zeta eta theta iota kappa"
+
+        fragments = chunk_fragments(text, chunk_size=20, overlap=0, context_window=5)
+
+        assert fragments[0].prev_context == ""
+        assert fragments[-1].next_context == ""
+        for prev, nxt in pairwise(fragments):
+            assert nxt.prev_context == prev.content[-5:]
+            assert prev.next_context == nxt.content[:5]
+
+    def test_optional_max_chunks(self):
+        """R: max_chunks still limits output when explicitly requested."""
+        fragments = chunk_fragments("A" * 1000, chunk_size=100, overlap=0, max_chunks=3)
+
+        assert [f.index for f in fragments] == [0, 1, 2]
+        assert fragments[-1].next_context == ""
+
+    def test_chunker_iter_chunks_matches_chunk(self):
+        """R: The incremental API returns the same chunks (incl. tail merge)."""
+        chunker = SimpleTextChunker(chunk_size=100, overlap=20)
+        text = "Sample text. " * 60 + "end"
+
+        assert list(chunker.iter_chunks(text)) == chunker.chunk(text)
+
+
+@pytest.mark.unit
+def test_structured_chunker_restores_many_code_blocks():
+    """R: Every code block placeholder is restored with its own block."""
+    blocks = [f"```\nprint({i})\n```" for i in range(12)]
+    text = "\n\n".join(blocks)
+
+    chunks = StructuredTextChunker(max_chunk_size=60, overlap=0).chunk(text)
+
+    assert "\x00" not in "".join(chunks)
+    assert "\n\n".join(chunks) == text
+
 
 @pytest.mark.unit
 class TestSimpleTextChunker:
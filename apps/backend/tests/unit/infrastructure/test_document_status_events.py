@@ -0,0 +1,246 @@
+"""
+Name: Document Status Events Unit Tests
+
+Responsibilities:
+  - Validate fan-out por workspace, filtro de acceso y batching del hub
+  - Validate replay por Last-Event-ID y reset (id desconocido / overflow / gap)
+  - Validate que transition_document_status publique con pg_notify (sin DB)
+"""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from app.infrastructure.events import (
+    DOCUMENT_STATUS_CHANNEL,
+    DocumentStatusBroadcaster,
+    DocumentStatusEvent,
+)
+from app.infrastructure.repositories.postgres.document import (
+    PostgresDocumentRepository,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class _FakeListener:
+    def __init__(self, on_payload, on_gap):
+        self.on_payload = on_payload
+        self.on_gap = on_gap
+        self.started = False
+        self.stopped = False
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.stopped = True
+
+
+def _broadcaster(**kwargs) -> tuple[DocumentStatusBroadcaster, list[_FakeListener]]:
+    listeners: list[_FakeListener] = []
+
+    def factory(on_payload, on_gap):
+        listener = _FakeListener(on_payload, on_gap)
+        listeners.append(listener)
+        return listener
+
+    return DocumentStatusBroadcaster(factory, **kwargs), listeners
+
+
+def _event(workspace_id, status="READY", **kwargs) -> DocumentStatusEvent:
+    return DocumentStatusEvent(
+        workspace_id=workspace_id, document_id=uuid4(), status=status, **kwargs
+    )
+
+
+async def _batch(subscription, **kwargs):
+    params = {"window_s": 0, "max_events": 100, "timeout_s": 0.05}
+    params.update(kwargs)
+    return await subscription.next_batch(**params)
+
+
+def test_payload_roundtrip_keeps_access_fields():
+    event = _event(
+        uuid4(),
+        status="FAILED",
+        error_message="boom",
+        uploaded_by_user_id=uuid4(),
+        allowed_roles=("admin",),
+    )
+
+    assert DocumentStatusEvent.from_payload(event.to_payload()) == event
+    assert set(event.to_client_dict()) == {
+        "id",
+        "document_id",
+        "status",
+        "error_message",
+    }
+
+
+@pytest.mark.asyncio
+async def test_fan_out_only_to_same_workspace_and_single_listener():
+    broadcaster, listeners = _broadcaster()
+    ws_a, ws_b = uuid4(), uuid4()
+    sub_a1 = broadcaster.subscribe(ws_a)
+    sub_a2 = broadcaster.subscribe(ws_a)
+    sub_b = broadcaster.subscribe(ws_b)
+
+    event = _event(ws_a)
+    broadcaster.publish(event)
+
+    assert len(listeners) == 1 and listeners[0].started
+    for sub in (sub_a1, sub_a2):
+        batch = await _batch(sub)
+        assert [e["id"] for e in batch.events] == [event.id]
+        assert batch.last_event_id == event.id
+    assert await _batch(sub_b) is None
+
+    sub_a1.close()
+    sub_a2.close()
+    sub_b.close()
+    assert broadcaster.subscriber_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_respects_max_events():
+    broadcaster, _ = _broadcaster()
+    ws = uuid4()
+    sub = broadcaster.subscribe(ws)
+    events = [_event(ws) for _ in range(5)]
+    for event in events:
+        broadcaster.publish(event)
+
+    first = await _batch(sub, max_events=3)
+    second = await _batch(sub, max_events=3)
+
+    assert [e["id"] for e in first.events] == [e.id for e in events[:3]]
+    assert [e["id"] for e in second.events] == [e.id for e in events[3:]]
+
+
+@pytest.mark.asyncio
+async def test_accept_filter_drops_inaccessible_events():
+    broadcaster, _ = _broadcaster()
+    ws = uuid4()
+    sub = broadcaster.subscribe(ws, accept=lambda e: e.status != "FAILED")
+
+    broadcaster.publish(_event(ws, status="FAILED"))
+    ok = _event(ws, status="READY")
+    broadcaster.publish(ok)
+
+    batch = await _batch(sub)
+    assert [e["id"] for e in batch.events] == [ok.id]
+
+
+@pytest.mark.asyncio
+async def test_last_event_id_replays_missed_events():
+    broadcaster, _ = _broadcaster()
+    ws = uuid4()
+    seen, missed_1, other_ws, missed_2 = (
+        _event(ws),
+        _event(ws),
+        _event(uuid4()),
+        _event(ws),
+    )
+    for event in (seen, missed_1, other_ws, missed_2):
+        broadcaster.publish(event)
+
+    sub = broadcaster.subscribe(ws, last_event_id=seen.id)
+
+    batch = await _batch(sub)
+    assert not batch.reset
+    assert [e["id"] for e in batch.events] == [missed_1.id, missed_2.id]
+
+
+@pytest.mark.asyncio
+async def test_unknown_last_event_id_resets():
+    broadcaster, _ = _broadcaster(replay_size=2)
+    ws = uuid4()
+    evicted = _event(ws)
+    for event in (evicted, _event(ws), _event(ws)):
+        broadcaster.publish(event)
+
+    sub = broadcaster.subscribe(ws, last_event_id=evicted.id)
+
+    batch = await _batch(sub)
+    assert batch.reset
+    assert batch.events == []
+
+
+@pytest.mark.asyncio
+async def test_queue_overflow_resets_slow_client():
+    broadcaster, _ = _broadcaster(queue_size=2)
+    ws = uuid4()
+    sub = broadcaster.subscribe(ws)
+    for _ in range(3):
+        broadcaster.publish(_event(ws))
+
+    batch = await _batch(sub)
+    assert batch.reset
+    assert batch.events == []
+
+
+@pytest.mark.asyncio
+async def test_upstream_gap_resets_subscribers_and_history():
+    broadcaster, listeners = _broadcaster()
+    ws = uuid4()
+    old = _event(ws)
+    broadcaster.publish(old)
+    sub = broadcaster.subscribe(ws)
+
+    broadcaster.reset_all()
+
+    assert (await _batch(sub)).reset
+    late = broadcaster.subscribe(ws, last_event_id=old.id)
+    assert (await _batch(late)).reset
+
+    broadcaster.close()
+    assert listeners[0].stopped
+
+
+def test_transition_publishes_notify_in_same_connection():
+    pool = MagicMock()
+    conn = pool.connection.return_value.__enter__.return_value
+    user_id = uuid4()
+    conn.execute.return_value.fetchone.return_value = (user_id, ["admin"])
+    repo = PostgresDocumentRepository(pool=pool, publish_status_events=True)
+    workspace_id, document_id = uuid4(), uuid4()
+
+    updated = repo.transition_document_status(
+        document_id,
+        workspace_id=workspace_id,
+        from_statuses=["PENDING"],
+        to_status="PROCESSING",
+    )
+
+    assert updated is True
+    update_sql = conn.execute.call_args_list[0].args[0]
+    assert "RETURNING uploaded_by_user_id, allowed_roles" in update_sql
+    notify_sql, (channel, payload) = conn.execute.call_args_list[1].args
+    assert "pg_notify" in notify_sql
+    assert channel == DOCUMENT_STATUS_CHANNEL
+    event = DocumentStatusEvent.from_payload(payload)
+    assert (event.workspace_id, event.document_id, event.status) == (
+        workspace_id,
+        document_id,
+        "PROCESSING",
+    )
+    assert event.uploaded_by_user_id == user_id
+    assert event.allowed_roles == ("admin",)
+
+
+def test_transition_skips_notify_when_no_row_updated():
+    pool = MagicMock()
+    conn = pool.connection.return_value.__enter__.return_value
+    conn.execute.return_value.fetchone.return_value = None
+    repo = PostgresDocumentRepository(pool=pool, publish_status_events=True)
+
+    updated = repo.transition_document_status(
+        uuid4(),
+        workspace_id=uuid4(),
+        from_statuses=["PENDING"],
+        to_status="PROCESSING",
+    )
+
+    assert updated is False
+    assert conn.execute.call_count == 1
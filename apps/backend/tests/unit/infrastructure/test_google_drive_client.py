@@ -9,6 +9,8 @@ Responsibilities:
     - Validar streaming download con hashing SHA-256 incremental.
     - Validar max file size guard (ConnectorFileTooLargeError).
     - Validar timeout/connect error → retry.
+    - Validar que un 429 pause a todos los threads (Retry-After compartido).
+    - Validar pool HTTP compartido: token por request, métricas por endpoint.
     - Verificar que logs no contienen tokens.
 
 Collaborators:
@@ -29,6 +31,8 @@ from app.infrastructure.services.google_drive_client import (
     ConnectorPermanentError,
     ConnectorTransientError,
     GoogleDriveClient,
+    _ConnectionTrace,
+    build_http_client,
 )
 
 pytestmark = pytest.mark.unit
@@ -89,7 +93,7 @@ class TestRetryBackoff:
             return resp
 
         client = _make_client()
-        with patch("httpx.request", side_effect=mock_request):
+        with patch.object(httpx.Client, "request", side_effect=mock_request):
             resp = client._request_with_retry("GET", _BASE, params={"q": "test"})
         assert resp.status_code == 200
         assert call_count == 2
@@ -109,7 +113,7 @@ class TestRetryBackoff:
             return resp
 
         client = _make_client()
-        with patch("httpx.request", side_effect=mock_request):
+        with patch.object(httpx.Client, "request", side_effect=mock_request):
             resp = client._request_with_retry("GET", _BASE)
         assert resp.status_code == 200
 
@@ -128,7 +132,7 @@ class TestRetryBackoff:
 
         client = _make_client(retry_max_attempts=2)
         with (
-            patch("httpx.request", side_effect=mock_request),
+            patch.object(httpx.Client, "request", side_effect=mock_request),
             pytest.raises(ConnectorTransientError),
         ):
             client._request_with_retry("GET", _BASE)
@@ -145,12 +149,139 @@ class TestRetryBackoff:
             return httpx.Response(200, content=b'{"files":[]}')
 
         client = _make_client()
-        with patch("httpx.request", side_effect=mock_request):
+        with patch.object(httpx.Client, "request", side_effect=mock_request):
             resp = client._request_with_retry("GET", _BASE)
         assert resp.status_code == 200
         assert call_count == 3
 
 
+# ---------------------------------------------------------------------------
+# Rate limiting compartido (sync concurrente)
+# ---------------------------------------------------------------------------
+
+
+class _FakeClock:
+    """Reloj monotónico falso: sleep() avanza el tiempo sin esperar."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock():
+    clock = _FakeClock()
+    with (
+        patch(
+            "app.infrastructure.services.concurrency.time.monotonic",
+            side_effect=clock.monotonic,
+        ),
+        patch(
+            "app.infrastructure.services.concurrency.time.sleep",
+            side_effect=clock.sleep,
+        ),
+    ):
+        yield clock
+
+
+class TestSharedRateLimit:
+    """Un 429 reduce la concurrencia y pausa a todos los threads del cliente."""
+
+    def test_429_defers_shared_gate_and_halves_concurrency(self, fake_clock):
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "7"}),
+            httpx.Response(200, content=b'{"files":[]}'),
+        ]
+
+        client = _make_client(retry_max_delay_s=60.0, max_concurrency=4)
+        with patch.object(httpx.Client, "request", side_effect=responses):
+            resp = client._request_with_retry("GET", _BASE)
+
+        assert resp.status_code == 200
+        assert client._limiter.limit == 2
+        # La espera la hace el gate compartido (no un sleep local del thread).
+        assert fake_clock.sleeps == [7.0]
+
+    def test_pending_pause_delays_other_requests(self, fake_clock):
+        """Otro thread que llega durante la pausa espera lo que falta."""
+        client = _make_client(max_concurrency=4)
+        client._rate_limit_gate.defer(5.0)
+        fake_clock.now += 2.0
+
+        with patch.object(httpx.Client, "request", return_value=httpx.Response(200)):
+            client._request_with_retry("GET", _BASE)
+            client._request_with_retry("GET", _BASE)
+
+        assert fake_clock.sleeps == [3.0]
+
+
+# ---------------------------------------------------------------------------
+# Pool HTTP compartido
+# ---------------------------------------------------------------------------
+
+
+class TestSharedHttpPool:
+    """Un httpx.Client por proceso; el token viaja en cada request."""
+
+    def test_token_injected_per_request_not_in_pool(self):
+        seen: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers["Authorization"])
+            return httpx.Response(200, json={"files": []})
+
+        pool = httpx.Client(transport=httpx.MockTransport(handler))
+        first = _make_client(http_client=pool)
+        second = GoogleDriveClient("other-token", http_client=pool)
+
+        first.list_files("folder")
+        second.list_files("folder")
+
+        assert seen == [f"Bearer {_TOKEN}", "Bearer other-token"]
+        assert "Authorization" not in pool.headers
+
+    def test_latency_and_reuse_recorded_by_endpoint(self):
+        pool = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, json={"files": [], "startPageToken": "t1"}
+                )
+            )
+        )
+        client = _make_client(http_client=pool, max_file_bytes=1024 * 1024)
+
+        with patch(
+            "app.infrastructure.services.google_drive_client.observe_connector_http_request"
+        ) as observe:
+            client.get_delta("folder")
+            client.fetch_file_content("f1", mime_type="text/plain")
+
+        endpoints = [c.args[1] for c in observe.call_args_list]
+        assert endpoints == ["files.list", "changes.getStartPageToken", "download"]
+        assert all(c.kwargs["reused_connection"] for c in observe.call_args_list)
+
+    def test_trace_detects_new_connection(self):
+        trace = _ConnectionTrace()
+        trace("http11.send_request_headers.started", {})
+        assert trace.new_connection is False
+        trace("connection.connect_tcp.started", {})
+        assert trace.new_connection is True
+
+    def test_build_falls_back_to_http1_without_h2(self):
+        # Sin el fallback, httpx.Client(http2=True) lanza ImportError.
+        with patch.dict("sys.modules", {"h2": None}):
+            client = build_http_client(http2=True, max_connections=3)
+        assert isinstance(client, httpx.Client)
+        client.close()
+
+
 # ---------------------------------------------------------------------------
 # Permanent Errors
 # ---------------------------------------------------------------------------
@@ -170,7 +301,7 @@ class TestPermanentErrors:
 
         client = _make_client()
         with (
-            patch("httpx.request", side_effect=mock_request),
+            patch.object(httpx.Client, "request", side_effect=mock_request),
             pytest.raises(ConnectorPermanentError) as exc_info,
         ):
             client._request_with_retry("GET", _BASE)
@@ -186,7 +317,7 @@ class TestPermanentErrors:
 
         client = _make_client()
         with (
-            patch("httpx.request", side_effect=mock_request),
+            patch.object(httpx.Client, "request", side_effect=mock_request),
             pytest.raises(ConnectorPermanentError) as exc_info,
         ):
             client._request_with_retry("GET", _BASE)
@@ -200,7 +331,7 @@ class TestPermanentErrors:
 
         client = _make_client()
         with (
-            patch("httpx.request", side_effect=mock_request),
+            patch.object(httpx.Client, "request", side_effect=mock_request),
             pytest.raises(ConnectorPermanentError),
         ):
             client._request_with_retry("GET", _BASE)
@@ -223,7 +354,7 @@ class TestStreamingDownload:
             return httpx.Response(200, content=content)
 
         client = _make_client(max_file_bytes=1024 * 1024)
-        with patch("httpx.stream") as mock_ctx:
+        with patch.object(httpx.Client, "stream") as mock_ctx:
             # Simular context manager de httpx.stream
             mock_response = httpx.Response(200, content=content)
             mock_ctx.return_value.__enter__ = lambda self: mock_response
@@ -239,7 +370,7 @@ class TestStreamingDownload:
 
         client = _make_client(max_file_bytes=1024)  # 1KB limit
 
-        with patch("httpx.stream") as mock_ctx:
+        with patch.object(httpx.Client, "stream") as mock_ctx:
             mock_response = httpx.Response(200, content=large_content)
             mock_ctx.return_value.__enter__ = lambda self: mock_response
             mock_ctx.return_value.__exit__ = lambda self, *args: None
@@ -255,7 +386,7 @@ class TestStreamingDownload:
         content = b"exported text"
 
         client = _make_client(max_file_bytes=1024 * 1024)
-        with patch("httpx.stream") as mock_ctx:
+        with patch.object(httpx.Client, "stream") as mock_ctx:
             mock_response = httpx.Response(200, content=content)
             mock_ctx.return_value.__enter__ = lambda self: mock_response
             mock_ctx.return_value.__exit__ = lambda self, *args: None
@@ -293,7 +424,7 @@ class TestNoTokenLeak:
             timeout_s=1,
         )
         with (
-            patch("httpx.request", side_effect=mock_request),
+            patch.object(httpx.Client, "request", side_effect=mock_request),
             pytest.raises(ConnectorPermanentError) as exc_info,
         ):
             client._request_with_retry("GET", _BASE)
@@ -315,7 +446,7 @@ class TestNoTokenLeak:
             timeout_s=1,
         )
         with (
-            patch("httpx.request", side_effect=mock_request),
+            patch.object(httpx.Client, "request", side_effect=mock_request),
             pytest.raises(ConnectorTransientError) as exc_info,
         ):
             client._request_with_retry("GET", _BASE)
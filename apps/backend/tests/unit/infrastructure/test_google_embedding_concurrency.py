@@ -0,0 +1,108 @@
+"""
+Name: Google Embedding Concurrency Unit Tests
+
+Responsibilities:
+  - Validate concurrent batch dispatch with ordered reassembly
+  - Validate adaptive concurrency limiter (AIMD) on rate limiting
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from app.crosscutting.exceptions import EmbeddingError
+from app.infrastructure.services.concurrency import AdaptiveConcurrencyLimiter
+from app.infrastructure.services.google_embedding_service import (
+    GoogleEmbeddingService,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class _RateLimited(Exception):
+    code = 429
+
+
+def _response(contents: list[str]) -> SimpleNamespace:
+    return SimpleNamespace(
+        embeddings=[SimpleNamespace(values=[float(len(text))]) for text in contents]
+    )
+
+
+def _service(client: MagicMock, **kwargs) -> GoogleEmbeddingService:
+    return GoogleEmbeddingService(
+        client=client,
+        batch_limit=2,
+        expected_dimensions=None,
+        retry_decorator=lambda fn: fn,
+        **kwargs,
+    )
+
+
+def test_embed_batch_dispatches_concurrently_and_preserves_order():
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _embed_content(*, model, contents, config):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        # R: Lotes tempranos más lentos: fuerza completado fuera de orden.
+        time.sleep(0.05 if len(contents[0]) < 3 else 0.01)
+        with lock:
+            in_flight -= 1
+        return _response(contents)
+
+    client = MagicMock()
+    client.models.embed_content.side_effect = _embed_content
+    service = _service(client, max_concurrency=3)
+    texts = ["a" * n for n in range(1, 11)]
+
+    vectors = service.embed_batch(texts)
+
+    assert vectors == [[float(n)] for n in range(1, 11)]
+    assert client.models.embed_content.call_count == 5
+    assert 1 < peak <= 3
+
+
+def test_embed_batch_propagates_batch_error():
+    client = MagicMock()
+    client.models.embed_content.side_effect = [
+        _response(["a", "b"]),
+        ValueError("bad request"),
+        _response(["e"]),
+    ]
+    service = _service(client, max_concurrency=1)
+
+    with pytest.raises(EmbeddingError):
+        service.embed_batch(["a", "b", "c", "d", "e"])
+
+
+def test_rate_limited_call_lowers_concurrency():
+    client = MagicMock()
+    client.models.embed_content.side_effect = _RateLimited("too many requests")
+    service = _service(client, max_concurrency=4)
+
+    with pytest.raises(EmbeddingError):
+        service.embed_batch(["a", "b"])
+
+    assert service._limiter.limit == 2
+
+
+def test_limiter_halves_on_throttle_and_recovers_gradually():
+    limiter = AdaptiveConcurrencyLimiter(4)
+
+    limiter.on_throttled()
+    limiter.on_throttled()
+    limiter.on_throttled()
+    assert limiter.limit == 1
+
+    limiter.on_success()
+    assert limiter.limit == 2
+    limiter.on_success()
+    limiter.on_success()
+    assert limiter.limit == 3
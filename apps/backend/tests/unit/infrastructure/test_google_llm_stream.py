@@ -0,0 +1,147 @@
+"""
+Name: GoogleLLMService Streaming Tests
+
+Responsibilities:
+  - Validate generate_stream consumes the SDK async client when available
+  - Validate the thread-backed bridge for sync-only clients
+  - Ensure concurrent streams do not block the event loop
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from app.crosscutting.exceptions import LLMError
+from app.domain.entities import Chunk
+from app.infrastructure.services.llm.google_llm_service import GoogleLLMService
+
+pytestmark = pytest.mark.unit
+
+_CHUNKS = [Chunk(content="Contexto A", embedding=[])]
+
+
+class _ContextBuilder:
+    def build(self, chunks):
+        return "\n".join(c.content for c in chunks), len(chunks)
+
+
+def _prompt_loader():
+    loader = MagicMock()
+    loader.version = "v-test"
+    loader.format.side_effect = lambda context, query: f"{context}|{query}"
+    return loader
+
+
+def _service(client) -> GoogleLLMService:
+    return GoogleLLMService(
+        client=client,
+        prompt_loader=_prompt_loader(),
+        context_builder=_ContextBuilder(),
+        retry_decorator=lambda fn: fn,
+    )
+
+
+def _sync_client(pieces: list[str], *, delay: float = 0.0):
+    def generate_content_stream(*, model, contents):
+        for text in pieces:
+            time.sleep(delay)
+            yield SimpleNamespace(text=text)
+
+    return SimpleNamespace(
+        models=SimpleNamespace(
+            generate_content=MagicMock(),
+            generate_content_stream=generate_content_stream,
+        )
+    )
+
+
+def _async_client(pieces: list[str]):
+    async def generate_content_stream(*, model, contents):
+        async def _iter():
+            for text in pieces:
+                yield SimpleNamespace(text=text)
+
+        return _iter()
+
+    sync_models = SimpleNamespace(
+        generate_content=MagicMock(),
+        generate_content_stream=MagicMock(side_effect=AssertionError("sync used")),
+    )
+    return SimpleNamespace(
+        models=sync_models,
+        aio=SimpleNamespace(
+            models=SimpleNamespace(generate_content_stream=generate_content_stream)
+        ),
+    )
+
+
+async def _collect(service: GoogleLLMService) -> list[str]:
+    return [token async for token in service.generate_stream("q", _CHUNKS)]
+
+
+@pytest.mark.asyncio
+async def test_stream_prefers_sdk_async_client():
+    service = _service(_async_client(["Hola", "", " mundo"]))
+
+    assert await _collect(service) == ["Hola", " mundo"]
+
+
+@pytest.mark.asyncio
+async def test_stream_bridges_sync_client_through_thread():
+    service = _service(_sync_client(["a", "b", "c"]))
+
+    assert await _collect(service) == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_stream_wraps_provider_errors():
+    def failing_stream(*, model, contents):
+        yield SimpleNamespace(text="ok")
+        raise RuntimeError("boom")
+
+    client = SimpleNamespace(
+        models=SimpleNamespace(
+            generate_content=MagicMock(), generate_content_stream=failing_stream
+        )
+    )
+
+    with pytest.raises(LLMError):
+        await _collect(_service(client))
+
+
+@pytest.mark.asyncio
+async def test_blocking_sdk_stream_does_not_stall_event_loop():
+    service = _service(_sync_client(["x"] * 4, delay=0.05))
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        await _collect(service)
+    finally:
+        ticker_task.cancel()
+
+    # R: Con el stream bloqueando el loop, el ticker no avanzaría (~0 ticks).
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_streams_do_not_serialize():
+    services = [_service(_sync_client(["x"] * 3, delay=0.1)) for _ in range(4)]
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(_collect(s) for s in services))
+    elapsed = time.perf_counter() - started
+
+    assert all(r == ["x", "x", "x"] for r in results)
+    # R: En serie serían ~1.2s; concurrentes ~0.3s.
+    assert elapsed < 0.9
@@ -0,0 +1,131 @@
+"""
+Name: Postgres Chunk Dedup Unit Tests
+
+Responsibilities:
+  - Validate chunk rows in dedup vs. non-dedup workspaces (no DB)
+  - Validate GC of shared embeddings after deleting a document's chunks
+  - Validate vector search over-fetches until top_k survive the dedup collapse
+"""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from app.domain.entities import Chunk
+from app.infrastructure.repositories.postgres.document import (
+    PostgresDocumentRepository,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _chunk(index: int, content_hash: str | None) -> Chunk:
+    return Chunk(
+        content=f"chunk {index}",
+        embedding=[0.1] * 768,
+        chunk_index=index,
+        content_hash=content_hash,
+    )
+
+
+def _conn(*, dedup: bool, shared: list[tuple] | None = None) -> MagicMock:
+    conn = MagicMock()
+    settings_result = MagicMock()
+    settings_result.fetchone.return_value = ("spanish", dedup)
+    shared_result = MagicMock()
+    shared_result.fetchall.return_value = shared or []
+    conn.execute.side_effect = [settings_result, shared_result]
+    return conn
+
+
+def test_rows_keep_own_embedding_when_dedup_disabled():
+    conn = _conn(dedup=False)
+    repo = PostgresDocumentRepository(pool=MagicMock())
+
+    rows = repo._build_chunk_rows(
+        conn, uuid4(), uuid4(), [_chunk(0, "h1"), _chunk(1, "h1")]
+    )
+
+    assert [r[4] for r in rows] == [[0.1] * 768, [0.1] * 768]
+    assert [r[7] for r in rows] == [None, None]
+    conn.cursor.assert_not_called()
+
+
+def test_rows_reference_shared_embedding_when_dedup_enabled():
+    shared_id = uuid4()
+    conn = _conn(dedup=True, shared=[("h1", shared_id)])
+    repo = PostgresDocumentRepository(pool=MagicMock())
+
+    rows = repo._build_chunk_rows(
+        conn,
+        uuid4(),
+        uuid4(),
+        [_chunk(0, "h1"), _chunk(1, "h1"), _chunk(2, None)],
+    )
+
+    # Un solo upsert por hash único.
+    cursor = conn.cursor.return_value.__enter__.return_value
+    upserted = cursor.executemany.call_args[0][1]
+    assert [r[2] for r in upserted] == ["h1"]
+
+    assert [r[4] for r in rows] == [None, None, [0.1] * 768]
+    assert [r[7] for r in rows] == [shared_id, shared_id, None]
+
+
+def test_delete_chunks_collects_orphan_shared_embeddings():
+    shared_id = uuid4()
+    pool = MagicMock()
+    conn = pool.connection.return_value.__enter__.return_value
+    conn.execute.return_value.fetchall.return_value = [(shared_id,), (shared_id,)]
+    repo = PostgresDocumentRepository(pool=pool)
+
+    deleted = repo.delete_chunks_for_document(uuid4(), workspace_id=uuid4())
+
+    assert deleted == 2
+    gc_sql, gc_params = conn.execute.call_args_list[-1][0]
+    assert "DELETE FROM chunk_embeddings" in gc_sql
+    assert gc_params[1] == [shared_id]
+
+
+def _search_row(index: int, own_count: int) -> tuple:
+    return (
+        uuid4(),
+        uuid4(),
+        "Doc",
+        None,
+        index,
+        f"chunk {index}",
+        [0.1] * 768,
+        {},
+        0.9,
+        own_count,
+    )
+
+
+def test_vector_search_refetches_when_duplicates_collapse_below_top_k():
+    pool = MagicMock()
+    conn = pool.connection.return_value.__enter__.return_value
+    # 1ra pasada: `own` saturado (own_count == fetch_k) pero el colapso dejó 2.
+    first, second = MagicMock(), MagicMock()
+    first.fetchall.return_value = [_search_row(i, 12) for i in range(2)]
+    second.fetchall.return_value = [_search_row(i, 20) for i in range(3)]
+    conn.execute.side_effect = [first, second]
+    repo = PostgresDocumentRepository(pool=pool)
+
+    results = repo.find_similar_chunks([0.1] * 768, 3, workspace_id=uuid4())
+
+    assert len(results) == 3
+    fetches = [c.args[1]["fetch_k"] for c in conn.execute.call_args_list]
+    assert fetches == [12, 48]
+
+
+def test_vector_search_does_not_refetch_when_candidates_are_exhausted():
+    pool = MagicMock()
+    conn = pool.connection.return_value.__enter__.return_value
+    conn.execute.return_value.fetchall.return_value = [_search_row(0, 5)]
+    repo = PostgresDocumentRepository(pool=pool)
+
+    results = repo.find_similar_chunks([0.1] * 768, 3, workspace_id=uuid4())
+
+    assert len(results) == 1
+    assert conn.execute.call_count == 1
@@ -25,6 +25,7 @@ import pytest
 from unittest.mock import Mock, patch
 
 from app.infrastructure.services.retry import (
+    is_rate_limit_error,
     is_transient_error,
     get_http_status_code,
     create_retry_decorator,
@@ -123,6 +124,23 @@ class TestIsTransientError:
         assert is_transient_error(exc) is True
 
 
+class TestIsRateLimitError:
+    """Tests for rate limit detection (drives adaptive concurrency)."""
+
+    def test_http_429_is_rate_limit(self):
+        exc = Exception("boom")
+        exc.code = 429
+        assert is_rate_limit_error(exc) is True
+
+    def test_quota_message_is_rate_limit(self):
+        assert is_rate_limit_error(Exception("Quota exceeded for model")) is True
+
+    def test_server_error_is_not_rate_limit(self):
+        exc = Exception("boom")
+        exc.code = 503
+        assert is_rate_limit_error(exc) is False
+
+
 class TestCreateRetryDecorator:
     """Tests for retry decorator creation."""
 
@@ -6,6 +6,7 @@ Responsibilities:
   - Avoid real network calls (mocked client)
 """
 
+import io
 from unittest.mock import MagicMock
 
 import pytest
@@ -44,6 +45,20 @@ def test_upload_file_uses_put_object():
     )
 
 
+def test_upload_stream_uses_bounded_multipart():
+    mock_client = MagicMock()
+    adapter = _make_adapter_with_mock_client(mock_client)
+    stream = io.BytesIO(b"data")
+
+    adapter.upload_file("doc.pdf", stream, "application/pdf")
+
+    kwargs = mock_client.upload_fileobj.call_args.kwargs
+    assert kwargs["Fileobj"] is stream
+    assert kwargs["ExtraArgs"] == {"ContentType": "application/pdf"}
+    assert kwargs["Config"].multipart_chunksize == 8 * 1024 * 1024
+    assert kwargs["Config"].max_concurrency == 2
+
+
 def test_delete_file_uses_delete_object():
     mock_client = MagicMock()
     adapter = _make_adapter_with_mock_client(mock_client)
@@ -72,3 +87,54 @@ def test_download_file_uses_get_object():
         Key="doc.pdf",
     )
     mock_body.read.assert_called_once()
+
+
+def test_presigned_upload_url_signs_put_with_content_type():
+    mock_client = MagicMock()
+    mock_client.generate_presigned_url.return_value = "https://minio/put"
+    adapter = _make_adapter_with_mock_client(mock_client)
+
+    url = adapter.generate_presigned_upload_url(
+        "doc.pdf", content_type="application/pdf", expires_in_seconds=120
+    )
+
+    assert url == "https://minio/put"
+    mock_client.generate_presigned_url.assert_called_once_with(
+        ClientMethod="put_object",
+        Params={"Bucket": "bucket", "Key": "doc.pdf", "ContentType": "application/pdf"},
+        ExpiresIn=120,
+    )
+
+
+def test_head_file_returns_info_or_none_when_missing():
+    from botocore.exceptions import ClientError
+
+    mock_client = MagicMock()
+    mock_client.head_object.return_value = {
+        "ContentLength": 42,
+        "ContentType": "application/pdf",
+    }
+    adapter = _make_adapter_with_mock_client(mock_client)
+
+    info = adapter.head_file("doc.pdf")
+
+    assert (info.size_bytes, info.content_type) == (42, "application/pdf")
+
+    mock_client.head_object.side_effect = ClientError(
+        {"Error": {"Code": "404"}}, "HeadObject"
+    )
+    assert adapter.head_file("missing.pdf") is None
+
+
+def test_open_stream_downloads_by_ranges_into_rewound_spool():
+    mock_client = MagicMock()
+    mock_client.download_fileobj.side_effect = lambda **kw: kw["Fileobj"].write(b"data")
+    adapter = _make_adapter_with_mock_client(mock_client)
+
+    with adapter.open_stream("doc.pdf") as stream:
+        assert stream.read() == b"data"
+
+    kwargs = mock_client.download_fileobj.call_args.kwargs
+    assert (kwargs["Bucket"], kwargs["Key"]) == ("bucket", "doc.pdf")
+    assert kwargs["Config"].max_concurrency == 2
+    mock_client.get_object.assert_not_called()
@@ -0,0 +1,197 @@
+"""
+Name: Workspace/ACL Cache Tests
+
+Responsibilities:
+  - Validate cross-request LRU + TTL caching of get_workspace / list_workspace_acl
+  - Validate request-scoped memoization when the shared layer is disabled
+  - Ensure writes (update/archive/replace ACL) invalidate both layers
+  - Ensure callers receive defensive copies
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from app.crosscutting.request_cache import get_request_cache, request_cache_scope
+from app.domain.entities import Workspace, WorkspaceVisibility
+from app.infrastructure.repositories import (
+    CachedWorkspaceAclRepository,
+    CachedWorkspaceRepository,
+    InMemoryWorkspaceAclRepository,
+    InMemoryWorkspaceRepository,
+    WorkspaceAccessCache,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingWorkspaceRepo(InMemoryWorkspaceRepository):
+    def __init__(self):
+        super().__init__()
+        self.get_calls = 0
+
+    def get_workspace(self, workspace_id):
+        self.get_calls += 1
+        return super().get_workspace(workspace_id)
+
+
+class _CountingAclRepo(InMemoryWorkspaceAclRepository):
+    def __init__(self):
+        super().__init__()
+        self.list_calls = 0
+
+    def list_workspace_acl(self, workspace_id):
+        self.list_calls += 1
+        return super().list_workspace_acl(workspace_id)
+
+
+def _seed(inner: InMemoryWorkspaceRepository) -> Workspace:
+    return inner.create_workspace(
+        Workspace(
+            id=uuid4(),
+            name="Ops",
+            visibility=WorkspaceVisibility.PRIVATE,
+            owner_user_id=uuid4(),
+            allowed_roles=["admin"],
+        )
+    )
+
+
+def test_get_workspace_hits_cache_until_ttl_expires():
+    clock = _Clock()
+    inner = _CountingWorkspaceRepo()
+    workspace = _seed(inner)
+    repo = CachedWorkspaceRepository(
+        inner, WorkspaceAccessCache(ttl_seconds=5, clock=clock)
+    )
+
+    assert repo.get_workspace(workspace.id).name == "Ops"
+    assert repo.get_workspace(workspace.id).name == "Ops"
+    assert inner.get_calls == 1
+
+    clock.now = 6.0
+    repo.get_workspace(workspace.id)
+    assert inner.get_calls == 2
+
+
+def test_missing_workspace_is_not_cached():
+    inner = _CountingWorkspaceRepo()
+    repo = CachedWorkspaceRepository(inner, WorkspaceAccessCache(ttl_seconds=5))
+    missing = uuid4()
+
+    assert repo.get_workspace(missing) is None
+    assert repo.get_workspace(missing) is None
+    assert inner.get_calls == 2
+
+
+def test_returned_workspace_is_a_defensive_copy():
+    inner = _CountingWorkspaceRepo()
+    workspace = _seed(inner)
+    repo = CachedWorkspaceRepository(inner, WorkspaceAccessCache(ttl_seconds=5))
+
+    first = repo.get_workspace(workspace.id)
+    first.allowed_roles.append("employee")
+    first.name = "mutated"
+
+    second = repo.get_workspace(workspace.id)
+    assert second.allowed_roles == ["admin"]
+    assert second.name == "Ops"
+
+
+def test_update_and_archive_invalidate_workspace():
+    inner = _CountingWorkspaceRepo()
+    workspace = _seed(inner)
+    repo = CachedWorkspaceRepository(inner, WorkspaceAccessCache(ttl_seconds=60))
+
+    repo.get_workspace(workspace.id)
+    repo.update_workspace(workspace.id, visibility=WorkspaceVisibility.ORG_READ)
+    assert repo.get_workspace(workspace.id).visibility == WorkspaceVisibility.ORG_READ
+
+    repo.archive_workspace(workspace.id)
+    assert repo.get_workspace(workspace.id).is_archived
+    assert inner.get_calls == 3
+
+
+def test_replace_acl_invalidates_and_returns_copies():
+    inner = _CountingAclRepo()
+    repo = CachedWorkspaceAclRepository(inner, WorkspaceAccessCache(ttl_seconds=60))
+    workspace_id, user_a, user_b = uuid4(), uuid4(), uuid4()
+    inner.replace_workspace_acl(workspace_id, [user_a])
+
+    acl = repo.list_workspace_acl(workspace_id)
+    acl.append(uuid4())
+    assert repo.list_workspace_acl(workspace_id) == [user_a]
+    assert inner.list_calls == 1
+
+    repo.replace_workspace_acl(workspace_id, [user_a, user_b])
+    assert repo.list_workspace_acl(workspace_id) == [user_a, user_b]
+    assert inner.list_calls == 2
+
+
+def test_lru_evicts_least_recently_used():
+    inner = _CountingWorkspaceRepo()
+    first, second, third = _seed(inner), _seed(inner), _seed(inner)
+    cache = WorkspaceAccessCache(ttl_seconds=60, max_entries=2)
+    repo = CachedWorkspaceRepository(inner, cache)
+
+    repo.get_workspace(first.id)
+    repo.get_workspace(second.id)
+    repo.get_workspace(first.id)  # first pasa a ser el más reciente
+    repo.get_workspace(third.id)  # evicta second
+    assert len(cache) == 2
+
+    inner.get_calls = 0
+    repo.get_workspace(first.id)
+    repo.get_workspace(second.id)
+    assert inner.get_calls == 1
+
+
+def test_request_scope_memoizes_when_shared_layer_disabled():
+    inner = _CountingWorkspaceRepo()
+    workspace = _seed(inner)
+    repo = CachedWorkspaceRepository(inner, WorkspaceAccessCache(ttl_seconds=0))
+
+    with request_cache_scope():
+        repo.get_workspace(workspace.id)
+        repo.get_workspace(workspace.id)
+    assert inner.get_calls == 1
+    assert get_request_cache() is None
+
+    with request_cache_scope():
+        repo.get_workspace(workspace.id)
+    assert inner.get_calls == 2
+
+
+def test_write_inside_request_invalidates_request_layer():
+    inner = _CountingWorkspaceRepo()
+    workspace = _seed(inner)
+    repo = CachedWorkspaceRepository(inner, WorkspaceAccessCache(ttl_seconds=0))
+
+    with request_cache_scope():
+        repo.get_workspace(workspace.id)
+        repo.update_workspace(workspace.id, name="Renamed")
+        assert repo.get_workspace(workspace.id).name == "Renamed"
+
+
+def test_load_started_before_invalidation_is_not_published():
+    inner = _CountingWorkspaceRepo()
+    workspace = _seed(inner)
+    cache = WorkspaceAccessCache(ttl_seconds=60)
+
+    def stale_loader():
+        value = inner.get_workspace(workspace.id)
+        # R: Una escritura concurrente invalida mientras el load está en vuelo.
+        cache.invalidate(("workspace", workspace.id))
+        return value
+
+    cache.get_or_load(("workspace", workspace.id), stale_loader)
+    assert len(cache) == 0
@@ -0,0 +1,235 @@
+"""
+Name: Queue Lanes & Workspace Fairness Tests
+
+Responsibilities:
+  - Verify weighted lane ordering (no starvation, proportional turns)
+  - Verify the in-process lane worker runs jobs without forking per job
+  - Verify the RQ adapter routes each priority to its lane queue
+  - Verify jobs are deferred (same job id, no sleep) when the workspace is at its cap
+  - Verify the adapter schedules presigned upload expiry (enqueue_in)
+  - Verify backlog age survives deferrals (first enqueue kept in meta)
+  - Verify a real worker reschedules a deferred job instead of finishing it
+  - Verify per-lane backlog metrics are exported
+"""
+
+import os
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from rq import Retry, get_current_job
+
+from app.crosscutting import metrics
+from app.domain.services import ProcessingPriority
+from app.infrastructure.queue import rq_queue
+from app.infrastructure.queue.fairness import (
+    FIRST_ENQUEUED_AT_META,
+    defer_job,
+    sample_lane_backlog,
+)
+from app.infrastructure.queue.job_paths import lane_queue_name
+from app.worker.jobs import process_document_job
+from app.worker.lanes import WeightedLaneScheduler, build_lane_worker
+
+pytestmark = pytest.mark.unit
+
+
+def test_weighted_scheduler_gives_turns_in_proportion_to_weights():
+    scheduler = WeightedLaneScheduler(
+        {"interactive": 6, "reprocess": 3, "connector": 1}
+    )
+
+    firsts = [scheduler.next_order()[0] for _ in range(100)]
+
+    assert Counter(firsts) == {"interactive": 60, "reprocess": 30, "connector": 10}
+    # Intercalado: el carril de mayor peso nunca acapara 10 turnos seguidos.
+    assert "connector" in firsts[:10]
+
+
+def test_weighted_scheduler_always_lists_every_lane():
+    scheduler = WeightedLaneScheduler({"a": 1, "b": 1})
+
+    assert sorted(scheduler.next_order()) == ["a", "b"]
+
+
+def _job_pid() -> int:
+    return os.getpid()
+
+
+def _deferring_job() -> Retry:
+    return defer_job(get_current_job(), delay_seconds=60)
+
+
+def test_in_process_lane_worker_runs_jobs_in_its_own_process():
+    fakeredis = pytest.importorskip("fakeredis")
+    redis_conn = fakeredis.FakeStrictRedis()
+    worker = build_lane_worker(
+        redis_conn, "documents", {"interactive": 2}, in_process=True
+    )
+    queue = worker.queues[0]
+    jobs = [queue.enqueue(_job_pid) for _ in range(3)]
+
+    worker.work(burst=True)
+
+    assert [job.return_value() for job in jobs] == [os.getpid()] * 3
+
+
+def test_rq_adapter_routes_priority_to_lane_queue(monkeypatch):
+    queues: dict[str, MagicMock] = {}
+
+    def _queue(name, connection):
+        queues[name] = MagicMock(name=name)
+        queues[name].name = name
+        queues[name].enqueue.return_value = SimpleNamespace(id=f"job-{name}")
+        return queues[name]
+
+    fake_rq = SimpleNamespace(Queue=_queue, Retry=MagicMock())
+    monkeypatch.setattr(rq_queue, "_lazy_import_rq", lambda: fake_rq)
+    adapter = rq_queue.RQDocumentProcessingQueue(
+        redis=MagicMock(), config=rq_queue.RQQueueConfig(queue_name="documents")
+    )
+
+    interactive = adapter.enqueue_document_processing(uuid4(), workspace_id=uuid4())
+    reprocess = adapter.enqueue_document_processing(
+        uuid4(), workspace_id=uuid4(), priority=ProcessingPriority.REPROCESS
+    )
+
+    assert interactive == "job-documents"
+    assert reprocess == "job-documents.reprocess"
+    assert lane_queue_name("documents", "connector") in queues
+    queues["documents.connector"].enqueue.assert_not_called()
+
+
+def test_rq_adapter_schedules_upload_expiry(monkeypatch):
+    queue = MagicMock()
+    queue.enqueue_in.return_value = SimpleNamespace(id="expiry-1")
+    fake_rq = SimpleNamespace(Queue=lambda name, connection: queue, Retry=MagicMock())
+    monkeypatch.setattr(rq_queue, "_lazy_import_rq", lambda: fake_rq)
+    adapter = rq_queue.RQDocumentProcessingQueue(
+        redis=MagicMock(), config=rq_queue.RQQueueConfig()
+    )
+    document_id = uuid4()
+
+    job_id = adapter.schedule_upload_expiry(
+        document_id, workspace_id=uuid4(), delay_seconds=1200
+    )
+
+    assert job_id == "expiry-1"
+    delay, path = queue.enqueue_in.call_args.args
+    assert delay == timedelta(seconds=1200)
+    assert path == "app.worker.jobs.expire_presigned_upload_job"
+    assert queue.enqueue_in.call_args.kwargs["args"][0] == str(document_id)
+
+
+def _job(origin: str = "documents") -> SimpleNamespace:
+    return SimpleNamespace(
+        id="job-1",
+        origin=origin,
+        meta={},
+        enqueued_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        save_meta=MagicMock(),
+    )
+
+
+def _run_job(limiter: MagicMock, job: SimpleNamespace) -> MagicMock:
+    use_case = MagicMock()
+    use_case.execute.return_value = SimpleNamespace(status="READY", chunks_created=1)
+    with (
+        patch("app.worker.jobs.get_current_job", return_value=job),
+        patch("app.worker.jobs._workspace_limiter", return_value=limiter),
+        patch("app.worker.jobs._build_use_case", return_value=use_case),
+        patch("app.worker.jobs.time.sleep") as sleep,
+    ):
+        use_case.returned = process_document_job(str(uuid4()), str(uuid4()))
+    use_case.sleep = sleep
+    return use_case
+
+
+def test_job_is_deferred_when_workspace_is_at_cap():
+    limiter = MagicMock()
+    limiter.try_acquire.return_value = False
+    job = _job("documents.connector")
+
+    use_case = _run_job(limiter, job)
+
+    use_case.execute.assert_not_called()
+    limiter.release.assert_not_called()
+    # R: Mismo job re-agendado por RQ (Retry), sin dormir en el worker.
+    assert isinstance(use_case.returned, Retry)
+    assert use_case.returned.intervals == [2]
+    use_case.sleep.assert_not_called()
+    assert job.meta[FIRST_ENQUEUED_AT_META] == job.enqueued_at.isoformat()
+
+
+def test_worker_reschedules_deferred_job_with_same_id():
+    fakeredis = pytest.importorskip("fakeredis")
+    redis_conn = fakeredis.FakeStrictRedis()
+    worker = build_lane_worker(redis_conn, "documents", {}, in_process=True)
+    queue = worker.queues[0]
+    job = queue.enqueue(_deferring_job)
+
+    worker.work(burst=True)
+
+    job.refresh()
+    assert job.get_status() == "scheduled"
+    assert job.id in queue.scheduled_job_registry.get_job_ids()
+    assert FIRST_ENQUEUED_AT_META in job.meta
+
+
+def test_repeated_deferral_keeps_first_enqueue_time():
+    job = _job()
+    defer_job(job, delay_seconds=0.5)
+    first = job.meta[FIRST_ENQUEUED_AT_META]
+    job.enqueued_at = datetime(2026, 1, 2, tzinfo=timezone.utc)
+
+    retry = defer_job(job, delay_seconds=0.5)
+
+    assert job.meta[FIRST_ENQUEUED_AT_META] == first
+    assert retry.intervals == [1]
+
+
+def test_lane_backlog_age_uses_first_enqueue_of_deferred_job():
+    queue = MagicMock(count=1)
+    queue.get_job_ids.return_value = ["job-1"]
+    head = SimpleNamespace(
+        enqueued_at=datetime.now(timezone.utc),
+        meta={
+            FIRST_ENQUEUED_AT_META: (
+                datetime.now(timezone.utc) - timedelta(seconds=600)
+            ).isoformat()
+        },
+    )
+    with (
+        patch("rq.Queue", return_value=queue),
+        patch("rq.job.Job.fetch", return_value=head),
+    ):
+        samples = sample_lane_backlog(MagicMock(), "documents")
+
+    assert all(age >= 599 for _, _, age in samples)
+
+
+def test_job_releases_workspace_slot_after_processing():
+    limiter = MagicMock()
+    limiter.try_acquire.return_value = True
+    use_case = _run_job(limiter, _job())
+
+    use_case.execute.assert_called_once()
+    assert use_case.returned is None
+    limiter.release.assert_called_once()
+
+
+def test_lane_backlog_is_exported_in_metrics():
+    if not metrics.is_prometheus_available():
+        pytest.skip("prometheus_client no instalado")
+    metrics.set_queue_lane_sampler(lambda: [("interactive", 4, 12.5)])
+    try:
+        body, _ = metrics.get_metrics_response()
+    finally:
+        metrics.set_queue_lane_sampler(None)
+
+    text = body.decode()
+    assert 'rag_queue_depth{lane="interactive"} 4.0' in text
+    assert 'rag_queue_oldest_job_age_seconds{lane="interactive"} 12.5' in text
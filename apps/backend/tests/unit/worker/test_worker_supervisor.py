@@ -0,0 +1,129 @@
+"""
+Name: Worker Supervisor Unit Tests
+
+Responsibilities:
+  - Verify per-process DB pool sizing
+  - Verify children are started, restarted and drained on stop
+  - Verify process status is exposed in health/readiness payloads
+  - Verify /metrics aggregation in multiprocess mode
+  - Verify the metrics dir is reused across starts and cleaned of stale files
+"""
+
+import threading
+import time
+
+import pytest
+
+from app.crosscutting import metrics
+from app.worker import worker, worker_health
+from app.worker.supervisor import WorkerSupervisor, per_process_pool_sizes
+
+pytestmark = pytest.mark.unit
+
+
+def _wait_for(predicate, timeout: float = 20.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@pytest.mark.parametrize(
+    ("min_size", "max_size", "processes", "expected"),
+    [
+        (2, 10, 1, (2, 10)),
+        (2, 10, 4, (2, 2)),
+        (5, 10, 4, (2, 2)),
+        (1, 3, 8, (1, 1)),
+    ],
+)
+def test_pool_sizes_split_the_connection_budget(
+    min_size, max_size, processes, expected
+):
+    assert per_process_pool_sizes(min_size, max_size, processes) == expected
+
+
+def test_supervisor_starts_children_and_drains_on_stop():
+    supervisor = WorkerSupervisor(
+        time.sleep,
+        processes=2,
+        args=(60,),
+        drain_timeout_seconds=5.0,
+        poll_interval_seconds=0.05,
+    )
+    runner = threading.Thread(target=supervisor.run)
+    runner.start()
+    try:
+        assert _wait_for(lambda: supervisor.status()["alive"] == 2)
+    finally:
+        supervisor.request_stop()
+        runner.join(timeout=30)
+
+    assert not runner.is_alive()
+    assert supervisor.status()["alive"] == 0
+    assert supervisor.status()["restarts"] == 0
+
+
+def test_supervisor_restarts_children_that_exit():
+    supervisor = WorkerSupervisor(
+        time.sleep,
+        processes=1,
+        args=(0,),
+        restart_backoff_seconds=0.0,
+        poll_interval_seconds=0.05,
+    )
+    runner = threading.Thread(target=supervisor.run)
+    runner.start()
+    try:
+        assert _wait_for(lambda: supervisor.status()["restarts"] >= 2)
+    finally:
+        supervisor.request_stop()
+        runner.join(timeout=30)
+
+    assert not runner.is_alive()
+
+
+def test_readiness_requires_a_live_child(monkeypatch):
+    monkeypatch.setattr(worker_health, "_check_db", lambda _url: True)
+    monkeypatch.setattr(worker_health, "_check_redis", lambda _url: True)
+    status = {"configured": 2, "alive": 0, "restarts": 3}
+    worker_health.set_process_status_provider(lambda: status)
+    try:
+        not_ready = worker_health.readiness_payload()
+        status["alive"] = 1
+        ready = worker_health.readiness_payload()
+        health = worker_health.health_payload()
+    finally:
+        worker_health.set_process_status_provider(None)
+
+    assert not_ready["ok"] is False
+    assert ready["ok"] is True
+    assert health["processes"]["restarts"] == 3
+
+
+def test_metrics_response_aggregates_multiprocess_dir(monkeypatch, tmp_path):
+    if not metrics.is_prometheus_available():
+        pytest.skip("prometheus_client no instalado")
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+    body, content_type = metrics.get_metrics_response()
+
+    assert isinstance(body, bytes)
+    assert content_type.startswith("text/plain")
+
+
+def test_metrics_dir_is_reused_and_cleaned_on_start(monkeypatch, tmp_path):
+    default_dir = tmp_path / "metrics"
+    monkeypatch.setattr(worker, "_DEFAULT_MULTIPROC_DIR", str(default_dir))
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+
+    first = worker._prepare_multiprocess_metrics_dir()
+    (default_dir / "counter_123.db").write_bytes(b"stale")
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR")
+    second = worker._prepare_multiprocess_metrics_dir()
+
+    assert first == second == str(default_dir)
+    assert list(default_dir.iterdir()) == []
+    assert [p.name for p in tmp_path.iterdir()] == ["metrics"]